@@ -13,6 +13,7 @@ NAV_ITEMS = [
     ("pages/6_holdings_watch.py", "📌 보유종목 관찰"),
     ("pages/7_pullback.py", "📉 눌림목 스캐너"),
     ("pages/8_trade_journal.py", "📝 매매일지"),
+    ("pages/9_api_metrics.py", "📡 API 텔레메트리"),
 ]
 
 # Streamlit 기본 네비게이션 강제 숨김 CSS
@@ -37,10 +37,8 @@ with st.sidebar:
 @st.cache_data(ttl=3600)
 def _load_stock_names():
     try:
-        from src.config.app_config import MAPPING_FILE
-        if MAPPING_FILE and MAPPING_FILE.exists():
-            df = pd.read_csv(MAPPING_FILE, dtype={'code': str})
-            return {str(r['code']).zfill(6): r['name'] for _, r in df.iterrows()}
+        from src.adapters.symbol_master import get_symbol_master
+        return get_symbol_master().names()
     except Exception:
         pass
     return {}
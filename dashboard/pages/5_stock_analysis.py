@@ -386,15 +386,8 @@ with col1:
             name = h.get("stock_name", "") if h else ""
             if not name:
                 try:
-                    from src.config.app_config import MAPPING_FILE
-                    if MAPPING_FILE and MAPPING_FILE.exists():
-                        import csv
-                        with open(MAPPING_FILE, "r", encoding="utf-8") as f:
-                            reader = csv.DictReader(f)
-                            for row in reader:
-                                if str(row.get("code", "")).zfill(6) == rp_code:
-                                    name = row.get("name", "")
-                                    break
+                    from src.adapters.symbol_master import get_symbol_master
+                    name = get_symbol_master().name(rp_code, "")
                 except Exception:
                     pass
 
@@ -842,7 +835,22 @@ with tab2:
                             vp_df[_vc] = pd.to_numeric(vp_df[_vc], errors="coerce")
                     vp_df = vp_df.dropna(subset=["high", "low", "close", "volume"])
                     vp_df = vp_df[vp_df["low"] > 0]
-                    vp = calc_volume_profile(vp_df, current_price=float(last["close"]), n_days=60, n_bands=10)
+                    # 스크리닝이 저장한 당일 키움 매물대(ka10025)가 있으면 우선 사용 (API 호출 없음)
+                    if code:
+                        from src.config.settings import settings
+                        from src.adapters.volume_profile_cache import load_cached_rows
+                        from src.domain.volume_profile import calc_volume_profile_from_kiwoom
+                        _vp_cfg = settings.vp
+                        _vp_rows = load_cached_rows(code, (_vp_cfg.cycle, _vp_cfg.bands, _vp_cfg.cur_entry))
+                        if _vp_rows:
+                            vp = calc_volume_profile_from_kiwoom(
+                                {"prps_cnctr": _vp_rows}, current_price=float(last["close"]),
+                                n_days=_vp_cfg.cycle, cur_entry=_vp_cfg.cur_entry, stock_code=code,
+                            )
+                            if vp.tag == "데이터부족":
+                                vp = None
+                    if vp is None:
+                        vp = calc_volume_profile(vp_df, current_price=float(last["close"]), n_days=60, n_bands=10)
                     if vp and vp.poc_price:
                         fig.add_hline(y=vp.poc_price, line_color="#ff6b6b", line_dash="dot",
                                       annotation_text=f"최다 거래가 {vp.poc_price:,.0f}", row=1, col=1)
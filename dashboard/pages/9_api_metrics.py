@@ -0,0 +1,167 @@
+"""📡 키움 API 텔레메트리
+
+스크리닝 실행별 api-id 지연(p50/p95/p99), 재시도, 429/5xx, 응답 바이트,
+Circuit Breaker 차단 (api_metrics 테이블)
+"""
+
+import os
+import sys
+import json
+import streamlit as st
+
+# ── 경로 설정 ──
+_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+if os.getenv("STREAMLIT_SERVER_HEADLESS", "").lower() == "true":
+    os.environ.setdefault("DASHBOARD_ONLY", "true")
+
+from dashboard.components.sidebar import render_sidebar_nav
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import plotly.graph_objects as go
+    HAS_PLOTLY = True
+except ImportError:
+    HAS_PLOTLY = False
+
+st.set_page_config(page_title="API 텔레메트리", page_icon="📡", layout="wide")
+
+with st.sidebar:
+    render_sidebar_nav()
+
+st.title("📡 키움 API 텔레메트리")
+st.caption("스크리닝 실행별 api-id 지연/재시도/429 집계 — Rate Limit 조정과 느린 단계 확인용")
+
+
+# ── DB 연결 ──
+try:
+    from src.adapters.api_telemetry import LATENCY_BUCKETS_MS
+    from src.infrastructure.repository import get_api_metrics_repository
+    repo = get_api_metrics_repository()
+except Exception as e:
+    st.error(f"api_metrics 로드 실패: {e}")
+    st.stop()
+
+if pd is None:
+    st.error("pandas가 필요합니다.")
+    st.stop()
+
+
+@st.cache_data(ttl=60)
+def _load_runs(limit: int) -> list:
+    return repo.get_runs(limit)
+
+
+@st.cache_data(ttl=60)
+def _load_run(run_id: str) -> list:
+    return repo.get_run(run_id)
+
+
+runs = _load_runs(60)
+if not runs:
+    st.info("저장된 텔레메트리가 없습니다. 스크리닝이 한 번 실행되면 표시됩니다.")
+    st.stop()
+
+# ── 실행 선택 ──
+col1, col2 = st.columns([1, 3])
+with col1:
+    run_type = st.radio("실행", ["전체", "main", "preview"], horizontal=True)
+filtered = [r for r in runs if run_type == "전체" or r["run_type"] == run_type]
+if not filtered:
+    st.info("해당 실행 기록이 없습니다.")
+    st.stop()
+with col2:
+    run_id = st.selectbox(
+        "실행 ID", [r["run_id"] for r in filtered],
+        format_func=lambda rid: next(
+            f"{r['run_id']}  ·  {r['calls']}회, 429 {r['status_429']}, 5xx {r['status_5xx']}"
+            for r in filtered if r["run_id"] == rid
+        ),
+    )
+
+rows = _load_run(run_id)
+df = pd.DataFrame(rows)
+
+# ── 요약 지표 ──
+total_calls = int(df["calls"].sum())
+m1, m2, m3, m4, m5 = st.columns(5)
+m1.metric("호출", f"{total_calls:,}")
+m2.metric("재시도", f"{int(df['retries'].sum()):,}")
+m3.metric("429", f"{int(df['status_429'].sum()):,}")
+m4.metric("5xx", f"{int(df['status_5xx'].sum()):,}")
+m5.metric("응답", f"{df['bytes'].sum() / 1024 / 1024:.1f} MB")
+if int(df["circuit_trips"].sum()):
+    st.warning(f"🔴 Circuit Breaker 차단 {int(df['circuit_trips'].sum())}회")
+
+# ── 단계 × api-id 표 ──
+st.subheader("단계 × api-id")
+columns = {
+    "stage": "단계", "api_id": "api-id", "calls": "호출", "p50_ms": "p50(ms)",
+    "p95_ms": "p95(ms)", "p99_ms": "p99(ms)", "max_ms": "max(ms)",
+    "latency_avg_ms": "평균(ms)", "retries": "재시도", "status_429": "429",
+    "status_5xx": "5xx", "timeouts": "타임아웃", "network_errors": "네트워크",
+    "circuit_trips": "차단", "bytes": "바이트",
+}
+table = df[list(columns)].rename(columns=columns)
+table["단계"] = table["단계"].replace("", "(기타)")
+st.dataframe(table, use_container_width=True, hide_index=True)
+
+# ── 단계별 호출 시간 합계 (느린 단계 찾기) ──
+df["latency_total_sec"] = df["latency_avg_ms"] * df["calls"] / 1000
+by_stage = df.groupby("stage", as_index=False)[["calls", "latency_total_sec"]].sum()
+by_stage["stage"] = by_stage["stage"].replace("", "(기타)")
+
+col1, col2 = st.columns(2)
+with col1:
+    st.subheader("단계별 누적 응답 시간")
+    if HAS_PLOTLY:
+        fig = go.Figure(go.Bar(x=by_stage["stage"], y=by_stage["latency_total_sec"]))
+        fig.update_layout(height=320, yaxis_title="초", margin=dict(t=10, b=10))
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.bar_chart(by_stage.set_index("stage")["latency_total_sec"])
+
+# ── 지연 히스토그램 ──
+with col2:
+    st.subheader("지연 히스토그램")
+    api_id = st.selectbox("api-id", sorted(df["api_id"].unique()))
+    buckets = None
+    for hist in df[df["api_id"] == api_id]["histogram_json"]:
+        counts = json.loads(hist or "[]")
+        if buckets is None:
+            buckets = counts
+        else:
+            buckets = [a + b for a, b in zip(buckets, counts)]
+    labels = [f"≤{int(b)}" for b in LATENCY_BUCKETS_MS] + [f">{int(LATENCY_BUCKETS_MS[-1])}"]
+    if buckets:
+        hist_df = pd.DataFrame({"ms": labels[:len(buckets)], "count": buckets})
+        if HAS_PLOTLY:
+            fig = go.Figure(go.Bar(x=hist_df["ms"], y=hist_df["count"]))
+            fig.update_layout(height=320, xaxis_title="ms", margin=dict(t=10, b=10))
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.bar_chart(hist_df.set_index("ms")["count"])
+
+# ── 추이 ──
+st.subheader("실행별 추이")
+trend_api = st.selectbox("추이 api-id", sorted(df["api_id"].unique()), key="trend_api")
+trend = pd.DataFrame(repo.get_trend(trend_api, days=30, run_type=None if run_type == "전체" else run_type))
+if not trend.empty:
+    if HAS_PLOTLY:
+        fig = go.Figure()
+        for col in ("p50_ms", "p95_ms", "p99_ms"):
+            fig.add_trace(go.Scatter(x=trend["run_id"], y=trend[col], mode="lines+markers", name=col))
+        fig.add_trace(go.Bar(x=trend["run_id"], y=trend["status_429"], name="429", yaxis="y2", opacity=0.4))
+        fig.update_layout(
+            height=360, yaxis_title="ms", margin=dict(t=10, b=10),
+            yaxis2=dict(overlaying="y", side="right", title="429"),
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.line_chart(trend.set_index("run_id")[["p50_ms", "p95_ms", "p99_ms"]])
@@ -20,6 +20,7 @@ ClosingBell v9.1 (키움 REST API)
     python main.py --run-test   # 테스트 (알림X)
     python main.py --check 종목코드  # 특정 종목 점수 확인 (예: --check 005930)
     python main.py --validate   # 설정 검증
+    python main.py --replay 실행ID  # 실행 스냅샷 재채점 + 기록 결과 비교 (API 호출 없음)
 """
 
 import sys
@@ -55,6 +56,7 @@ from src.cli.commands import (
     run_auto_fill,
     run_pipeline,
     run_holdings_analysis_cli,
+    run_replay_cli,
 )
 
 from src.services.screener_service import run_screening, ScreenerService
@@ -490,7 +492,7 @@ def check_stock(stock_code: str):
     from src.config.constants import MIN_DAILY_DATA_COUNT
     
     client = get_kiwoom_client()
-    calculator = ScoreCalculatorV5()
+    calculator = ScoreCalculatorV5(vectorized=settings.screening.vectorized_scoring)
     
     try:
         # 1. 종목명 조회
@@ -583,6 +585,7 @@ def main():
     parser.add_argument('--check', type=str, metavar='CODE', help='특정 종목 점수 확인 (예: --check 074610)')
     parser.add_argument('--analyze', type=str, metavar='CODE', help='Generate analysis report (e.g. --analyze 005930)')
     parser.add_argument('--full', action='store_true', help='Include full broker history in analysis report')
+    parser.add_argument('--replay', type=str, metavar='RUN_ID', help='실행 스냅샷 재채점 + 기록 결과 비교 (예: --replay 20260116-150000-main)')
     
     # v6.0 옵션
     parser.add_argument('--backfill', type=int, metavar='DAYS', help='과거 N일 데이터 백필 (TOP5 + 유목민)')
@@ -611,6 +614,12 @@ def main():
         logging.basicConfig(level=logging.ERROR)
         run_analyze(args.analyze, full=args.full)
         return
+    
+    # --replay 는 저장된 스냅샷만 사용 (API 키/DB 초기화 불필요)
+    if args.replay:
+        logging.basicConfig(level=logging.WARNING)
+        run_replay_cli(args.replay)
+        return
 
     if args.healthcheck:
         init_logging()
@@ -0,0 +1,274 @@
+"""
+키움 API 적응형 Rate 제어 (AIMD)
+
+책임:
+- 정상 응답이 이어지면 초당 호출 수를 가산 증가 (약 1초 분량 정상 응답마다 +increase)
+- 429/5xx 응답 시 배수 감소 (tr_id + 전역 동시, 짧은 시간 내 연속 감소는 1회로 취급)
+- 목표보다 느린 응답은 증가 보류 (지연 증가 = 서버 포화 신호)
+- tr_id별 수렴값을 .cache/에 저장하여 다음 실행이 이어서 시작
+
+적용 대상은 RateLimiter의 전역 버킷("*")과 api-id별 하위 버킷이다.
+고정 간격(API_CALL_INTERVAL)은 첫 실행의 초기값으로만 쓰인다.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from src.config.settings import settings, CACHE_DIR
+from src.adapters.rate_limiter import RateLimiter, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_KEY = "*"
+STATE_PATH = CACHE_DIR / "kiwoom_rate_state.json"
+
+
+@dataclass
+class RateState:
+    """tr_id별 AIMD 상태"""
+    rate: float
+    clean: int = 0              # 현재 단계에서 연속 정상 응답 수
+    throttles: int = 0          # 누적 감소 횟수
+    latency_ewma: float = 0.0   # 응답시간 지수이동평균 (초)
+    last_decrease: float = float("-inf")  # 마지막 감소 시각 (monotonic, 저장 안 함)
+
+
+class AdaptiveRateController:
+    """AIMD 컨트롤러 (스레드 안전)
+
+    - on_success(): 정상 응답 보고 → 필요 시 가산 증가
+    - on_throttle(): 429/5xx 보고 → 배수 감소
+    변경된 속도는 즉시 RateLimiter에 반영된다.
+    """
+
+    DECREASE_COOLDOWN = 1.0  # 초 - 감소 직전에 이미 나간 요청들의 429는 한 번으로 취급
+    PERSIST_INTERVAL = 30.0  # 초 - 증가분 저장 최소 간격 (감소는 즉시 저장)
+    LATENCY_ALPHA = 0.2
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        min_rate: float = 1.0,
+        max_rate: float = 20.0,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        latency_target: float = 1.5,
+        burst: float = 1.0,
+        state_path: Optional[Path] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < decrease < 1:
+            raise ValueError(f"decrease는 0과 1 사이여야 합니다: {decrease}")
+        self._limiter = limiter
+        self.min_rate = max(0.1, float(min_rate))
+        self.max_rate = max(self.min_rate, float(max_rate))
+        self.increase = float(increase)
+        self.decrease = float(decrease)
+        self.latency_target = float(latency_target)
+        self.burst = max(1.0, float(burst))
+        self.state_path = Path(state_path) if state_path else None
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._states: Dict[str, RateState] = {}
+        self._dirty = False
+        self._last_saved = clock()
+
+        self._load()
+        if GLOBAL_KEY not in self._states:
+            self._states[GLOBAL_KEY] = RateState(rate=self._clamp(limiter.rate))
+        self._limiter.set_rate(self._states[GLOBAL_KEY].rate)
+        for key, state in self._states.items():
+            if key != GLOBAL_KEY:
+                self._limiter.set_api_limit(key, state.rate, self.burst)
+
+    # ========================================
+    # 상태
+    # ========================================
+    def _clamp(self, rate: float) -> float:
+        return min(self.max_rate, max(self.min_rate, float(rate)))
+
+    def _state(self, tr_id: str) -> RateState:
+        """tr_id 상태 (없으면 현재 하위 예산 또는 전역 속도로 시작)"""
+        state = self._states.get(tr_id)
+        if state is None:
+            initial = self._limiter.snapshot().get(tr_id, self._states[GLOBAL_KEY].rate)
+            state = self._states[tr_id] = RateState(rate=self._clamp(initial))
+            self._limiter.set_api_limit(tr_id, state.rate, self.burst)
+        return state
+
+    def _targets(self, tr_id: str):
+        """피드백 적용 대상 [(키, 상태)] - tr_id 상태를 전역 변경 전에 먼저 만든다"""
+        targets = [(GLOBAL_KEY, self._states[GLOBAL_KEY])]
+        if tr_id and tr_id != GLOBAL_KEY:
+            targets.append((tr_id, self._state(tr_id)))
+        return targets
+
+    def _apply(self, key: str, state: RateState) -> None:
+        if key == GLOBAL_KEY:
+            self._limiter.set_rate(state.rate)
+        else:
+            self._limiter.set_api_limit(key, state.rate, self.burst)
+
+    # ========================================
+    # 피드백
+    # ========================================
+    def on_success(self, tr_id: str, latency: float = 0.0) -> None:
+        """정상 응답 보고"""
+        with self._lock:
+            for key, state in self._targets(tr_id):
+                if latency > 0:
+                    state.latency_ewma = (
+                        latency if state.latency_ewma <= 0
+                        else state.latency_ewma + self.LATENCY_ALPHA * (latency - state.latency_ewma)
+                    )
+                if self.latency_target > 0 and latency > self.latency_target:
+                    state.clean = 0  # 느린 응답 → 증가 보류
+                    continue
+                state.clean += 1
+                # 현재 속도로 약 1초 분량의 정상 응답이 모이면 한 단계 증가
+                if state.clean >= max(1, int(state.rate)) and state.rate < self.max_rate:
+                    state.rate = self._clamp(state.rate + self.increase)
+                    state.clean = 0
+                    self._apply(key, state)
+                    self._dirty = True
+                    logger.debug(f"Rate 증가 {key}: {state.rate:.1f}회/초")
+            should_save = self._dirty and self._clock() - self._last_saved >= self.PERSIST_INTERVAL
+        if should_save:
+            self.save()
+
+    def on_throttle(self, tr_id: str, status_code: int = 429) -> None:
+        """429/5xx 응답 보고 (tr_id와 전역 속도 동시 감소)"""
+        now = self._clock()
+        changed = []
+        with self._lock:
+            for key, state in self._targets(tr_id):
+                state.clean = 0
+                if now - state.last_decrease < self.DECREASE_COOLDOWN:
+                    continue
+                state.rate = self._clamp(state.rate * self.decrease)
+                state.throttles += 1
+                state.last_decrease = now
+                self._apply(key, state)
+                changed.append(f"{key} {state.rate:.1f}")
+            if changed:
+                self._dirty = True
+        if changed:
+            logger.warning(f"Rate 감소 (HTTP {status_code}): {', '.join(changed)}회/초")
+            self.save()
+
+    def retry_delay(self, tr_id: str, retry_count: int) -> float:
+        """재시도 전 대기시간 (감소된 속도 기준, 최대 기존 지수 백오프)"""
+        rate = self.effective_rate(tr_id)
+        return min(float(2 ** retry_count), max(0.1, (retry_count + 1) / rate))
+
+    # ========================================
+    # 조회
+    # ========================================
+    def effective_rate(self, tr_id: str = "") -> float:
+        """tr_id의 실효 속도 (전역과 하위 예산 중 작은 값)"""
+        with self._lock:
+            rate = self._states[GLOBAL_KEY].rate
+            state = self._states.get(tr_id)
+            return min(rate, state.rate) if state else rate
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """키별 상태 (로그/헬스체크용)"""
+        with self._lock:
+            return {
+                key: {
+                    "rate": round(s.rate, 2),
+                    "throttles": s.throttles,
+                    "latency_ms": round(s.latency_ewma * 1000, 1),
+                }
+                for key, s in self._states.items()
+            }
+
+    def format_rates(self) -> str:
+        """로그용 한 줄 요약 ("전역 9.5/s, ka10081 6.0/s ...")"""
+        snap = self.snapshot()
+        parts = [f"전역 {snap[GLOBAL_KEY]['rate']:.1f}/s"]
+        parts += [
+            f"{key} {s['rate']:.1f}/s"
+            for key, s in sorted(snap.items()) if key != GLOBAL_KEY
+        ]
+        return ", ".join(parts)
+
+    # ========================================
+    # 저장 / 복원
+    # ========================================
+    def _load(self) -> None:
+        if not self.state_path or not self.state_path.exists():
+            return
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for key, item in data.get("rates", {}).items():
+                self._states[key] = RateState(
+                    rate=self._clamp(item["rate"]),
+                    throttles=int(item.get("throttles", 0)),
+                )
+            logger.debug(f"Rate 상태 복원: {len(self._states)}개 ({self.state_path.name})")
+        except Exception as e:
+            logger.warning(f"Rate 상태 파일 읽기 실패: {e}")
+
+    def save(self) -> None:
+        """현재 상태 저장 (임시 파일 → 교체)"""
+        if not self.state_path:
+            return
+        with self._lock:
+            data = {
+                "updated_at": datetime.now().isoformat(timespec="seconds"),
+                "rates": {
+                    key: {"rate": round(s.rate, 3), "throttles": s.throttles}
+                    for key, s in self._states.items()
+                },
+            }
+            self._dirty = False
+            self._last_saved = self._clock()
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.state_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, self.state_path)
+        except Exception as e:
+            logger.warning(f"Rate 상태 파일 저장 실패: {e}")
+
+
+# ============================================================
+# 싱글톤
+# ============================================================
+_controller_instance: Optional[AdaptiveRateController] = None
+_controller_lock = threading.Lock()
+
+
+def get_rate_controller() -> Optional[AdaptiveRateController]:
+    """프로세스 공용 AIMD 컨트롤러 (KIWOOM_ADAPTIVE_RATE=false면 None)"""
+    global _controller_instance
+    cfg = settings.kiwoom
+    if not cfg.adaptive_rate:
+        return None
+    if _controller_instance is None:
+        with _controller_lock:
+            if _controller_instance is None:
+                _controller_instance = AdaptiveRateController(
+                    limiter=get_rate_limiter(),
+                    min_rate=cfg.adaptive_min_rate,
+                    max_rate=cfg.adaptive_ceiling,
+                    increase=cfg.adaptive_increase,
+                    decrease=cfg.adaptive_decrease,
+                    latency_target=cfg.adaptive_latency_target,
+                    burst=cfg.rate_burst,
+                    state_path=STATE_PATH,
+                )
+                atexit.register(_controller_instance.save)
+                logger.info(f"적응형 Rate 제어: {_controller_instance.format_rates()}")
+    return _controller_instance
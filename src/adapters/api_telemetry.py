@@ -0,0 +1,280 @@
+"""
+키움 API 텔레메트리 (api-id별 지연/재시도/오류 집계)
+
+책임:
+- HTTP 시도마다 (단계, api-id)별로 호출 수, 응답 바이트, 재시도,
+  429/5xx/타임아웃/네트워크 오류, Circuit Breaker 차단 전환 횟수 집계
+- 지연은 고정 구간(ms) 히스토그램으로 보관 → p50/p95/p99 근사
+  (표본을 쌓지 않으므로 메모리는 호출 수와 무관)
+- 스냅샷 차이(since)로 실행 단위 통계 계산 (백그라운드 호출과 같은 객체를 공유해도 됨)
+
+단계는 contextvars로 전달한다 (telemetry_stage 블록 안의 호출, submit_with_context로
+넘긴 작업 스레드의 호출 포함).
+"""
+
+import contextvars
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 지연 히스토그램 구간 상한 (ms), 마지막 구간은 그 이상 전부
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    10, 20, 50, 100, 150, 200, 300, 500, 750, 1000, 1500, 2000, 3000, 5000, 10000,
+)
+
+_current_stage: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "kiwoom_telemetry_stage", default="",
+)
+
+
+@contextmanager
+def telemetry_stage(name: str) -> Iterator[None]:
+    """블록 안의 키움 호출을 name 단계로 집계"""
+    token = _current_stage.set(name)
+    try:
+        yield
+    finally:
+        _current_stage.reset(token)
+
+
+def current_stage() -> str:
+    return _current_stage.get()
+
+
+@dataclass
+class ApiStats:
+    """(단계, api-id) 하나의 누적 통계"""
+    calls: int = 0
+    retries: int = 0
+    status_429: int = 0
+    status_5xx: int = 0
+    timeouts: int = 0
+    network_errors: int = 0
+    circuit_trips: int = 0
+    bytes: int = 0
+    latency_sum: float = 0.0  # 초
+    latency_max: float = 0.0  # 초
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    @property
+    def errors(self) -> int:
+        return self.status_429 + self.status_5xx + self.timeouts + self.network_errors
+
+    @property
+    def timed(self) -> int:
+        """지연이 기록된 호출 수"""
+        return sum(self.buckets)
+
+    @property
+    def latency_avg_ms(self) -> float:
+        return self.latency_sum / self.timed * 1000 if self.timed else 0.0
+
+    def add_latency(self, seconds: float) -> None:
+        ms = seconds * 1000
+        idx = len(LATENCY_BUCKETS_MS)
+        for i, upper in enumerate(LATENCY_BUCKETS_MS):
+            if ms <= upper:
+                idx = i
+                break
+        self.buckets[idx] += 1
+        self.latency_sum += seconds
+        self.latency_max = max(self.latency_max, seconds)
+
+    def percentile_ms(self, q: float) -> float:
+        """히스토그램 근사 백분위 (구간 안은 선형 보간, 최대값을 넘지 않음)"""
+        total = self.timed
+        if not total:
+            return 0.0
+        rank = q * total
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            if count and seen + count >= rank:
+                lower = LATENCY_BUCKETS_MS[i - 1] if i > 0 else 0.0
+                upper = LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else self.latency_max * 1000
+                value = lower + (upper - lower) * (rank - seen) / count
+                return min(value, self.latency_max * 1000)
+            seen += count
+        return self.latency_max * 1000
+
+    def copy(self) -> "ApiStats":
+        return ApiStats(
+            self.calls, self.retries, self.status_429, self.status_5xx, self.timeouts,
+            self.network_errors, self.circuit_trips, self.bytes, self.latency_sum,
+            self.latency_max, list(self.buckets),
+        )
+
+    def minus(self, other: "ApiStats") -> "ApiStats":
+        """self - other
+
+        latency_max는 차이를 구할 수 없으므로 증가분 히스토그램에서 가장 높은 구간의
+        상한으로 근사한다 (self.latency_max를 넘지 않음) → 이전 실행의 최대 지연이 섞이지 않음.
+        """
+        buckets = [a - b for a, b in zip(self.buckets, other.buckets)]
+        top = max((i for i, count in enumerate(buckets) if count > 0), default=None)
+        if top is None:
+            latency_max = 0.0
+        elif top < len(LATENCY_BUCKETS_MS):
+            latency_max = min(LATENCY_BUCKETS_MS[top] / 1000, self.latency_max)
+        else:
+            latency_max = self.latency_max
+        return ApiStats(
+            self.calls - other.calls,
+            self.retries - other.retries,
+            self.status_429 - other.status_429,
+            self.status_5xx - other.status_5xx,
+            self.timeouts - other.timeouts,
+            self.network_errors - other.network_errors,
+            self.circuit_trips - other.circuit_trips,
+            self.bytes - other.bytes,
+            self.latency_sum - other.latency_sum,
+            latency_max,
+            buckets,
+        )
+
+    def to_row(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "status_429": self.status_429,
+            "status_5xx": self.status_5xx,
+            "timeouts": self.timeouts,
+            "network_errors": self.network_errors,
+            "circuit_trips": self.circuit_trips,
+            "bytes": self.bytes,
+            "latency_avg_ms": round(self.latency_avg_ms, 1),
+            "p50_ms": round(self.percentile_ms(0.50), 1),
+            "p95_ms": round(self.percentile_ms(0.95), 1),
+            "p99_ms": round(self.percentile_ms(0.99), 1),
+            "max_ms": round(self.latency_max * 1000, 1),
+        }
+
+
+StatsKey = Tuple[str, str]  # (stage, api-id)
+Snapshot = Dict[StatsKey, ApiStats]
+
+
+class ApiTelemetry:
+    """프로세스 공용 api-id별 집계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[StatsKey, ApiStats] = {}
+
+    def _entry(self, tr_id: str) -> ApiStats:
+        key = (_current_stage.get(), tr_id)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = ApiStats()
+        return stats
+
+    # ========================================
+    # 기록
+    # ========================================
+    def record_response(
+        self,
+        tr_id: str,
+        status_code: int,
+        latency: float,
+        nbytes: int = 0,
+        retry: bool = False,
+    ) -> None:
+        """HTTP 응답 한 건 (재시도 응답 포함)"""
+        with self._lock:
+            stats = self._entry(tr_id)
+            stats.calls += 1
+            stats.bytes += nbytes
+            stats.add_latency(latency)
+            if retry:
+                stats.retries += 1
+            if status_code == 429:
+                stats.status_429 += 1
+            elif status_code >= 500:
+                stats.status_5xx += 1
+
+    def record_error(self, tr_id: str, kind: str, retry: bool = False) -> None:
+        """응답 없이 끝난 시도 (kind: 'timeout' / 'network')"""
+        with self._lock:
+            stats = self._entry(tr_id)
+            stats.calls += 1
+            if retry:
+                stats.retries += 1
+            if kind == "timeout":
+                stats.timeouts += 1
+            else:
+                stats.network_errors += 1
+
+    def record_circuit_trip(self, tr_id: str) -> None:
+        """Circuit Breaker가 닫힘 → 열림으로 바뀐 호출"""
+        with self._lock:
+            self._entry(tr_id).circuit_trips += 1
+
+    # ========================================
+    # 조회
+    # ========================================
+    def snapshot(self) -> Snapshot:
+        with self._lock:
+            return {key: stats.copy() for key, stats in self._stats.items()}
+
+    def since(self, start: Optional[Snapshot]) -> Snapshot:
+        """start 스냅샷 이후 증가분 (호출이 없던 항목은 제외)"""
+        current = self.snapshot()
+        if not start:
+            return current
+        delta = {}
+        for key, stats in current.items():
+            diff = stats.minus(start[key]) if key in start else stats
+            if diff.calls or diff.circuit_trips:
+                delta[key] = diff
+        return delta
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    @staticmethod
+    def by_api(snapshot: Snapshot) -> Dict[str, ApiStats]:
+        """단계 구분 없이 api-id별 합계"""
+        merged: Dict[str, ApiStats] = {}
+        for (_, tr_id), stats in snapshot.items():
+            total = merged.get(tr_id)
+            if total is None:
+                merged[tr_id] = stats.copy()
+                continue
+            for name in ("calls", "retries", "status_429", "status_5xx", "timeouts",
+                         "network_errors", "circuit_trips", "bytes", "latency_sum"):
+                setattr(total, name, getattr(total, name) + getattr(stats, name))
+            total.latency_max = max(total.latency_max, stats.latency_max)
+            total.buckets = [a + b for a, b in zip(total.buckets, stats.buckets)]
+        return merged
+
+    @classmethod
+    def format_stats(cls, snapshot: Snapshot) -> str:
+        """로그용 한 줄 요약 (api-id별)"""
+        parts = []
+        for tr_id, stats in sorted(cls.by_api(snapshot).items()):
+            text = (
+                f"{tr_id} {stats.calls}회 p50 {stats.percentile_ms(0.5):.0f}ms "
+                f"p95 {stats.percentile_ms(0.95):.0f}ms"
+            )
+            if stats.errors or stats.retries:
+                text += f" (재시도 {stats.retries}, 429 {stats.status_429}, 5xx {stats.status_5xx})"
+            parts.append(text)
+        return ", ".join(parts) if parts else "기록 없음"
+
+
+_telemetry_instance: Optional[ApiTelemetry] = None
+_telemetry_lock = threading.Lock()
+
+
+def get_api_telemetry() -> ApiTelemetry:
+    """프로세스 공용 텔레메트리"""
+    global _telemetry_instance
+    if _telemetry_instance is None:
+        with _telemetry_lock:
+            if _telemetry_instance is None:
+                _telemetry_instance = ApiTelemetry()
+    return _telemetry_instance
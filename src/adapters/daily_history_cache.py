@@ -0,0 +1,197 @@
+"""
+일봉 과거분 당일 캐시 (프리뷰 → 메인 워밍)
+
+책임:
+- 종목별 일봉 중 기준 거래일 이전 봉(과거분)만 기준일 범위로 보관 (메모리는 PriceSeries)
+  (12:30 프리뷰가 받은 시계열을 15:00 메인이 재사용 → 메인은 ka10001로 당일 봉만 조회)
+- .cache/daily_history/YYYYMMDD.json 파일로 유지 (다른 프로세스 실행도 재사용)
+- get 시 hit/miss, put 시 저장 건수 집계
+
+당일 봉(장중 미완성 봉)은 저장하지 않는다. 수정주가 검사(기준가 = 과거분 마지막 종가)는
+호출자(KiwoomRestClient.get_daily_prices_warm)가 한다.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.config.settings import CACHE_DIR
+from src.domain.models import DailyPrice
+from src.domain.price_series import PriceSeries, day_number
+
+logger = logging.getLogger(__name__)
+
+Row = List  # [YYYYMMDD, open, high, low, close, volume, trading_value] (파일 형식)
+
+
+def _to_rows(series: PriceSeries) -> List[Row]:
+    """시계열 → 파일 행 (flush 때만)"""
+    days = np.datetime_as_string(series.dates.astype("datetime64[D]"))
+    return [
+        [d.replace("-", ""), o, h, l, c, v, tv]
+        for d, o, h, l, c, v, tv in zip(
+            days.tolist(), series.open.tolist(), series.high.tolist(), series.low.tolist(),
+            series.close.tolist(), series.volume.tolist(), series.trading_value.tolist(),
+        )
+    ]
+
+
+def _from_rows(rows: Sequence[Row]) -> PriceSeries:
+    """파일 행 → 시계열 (열 단위 일괄 변환)"""
+    days = np.array([f"{r[0][:4]}-{r[0][4:6]}-{r[0][6:8]}" for r in rows], dtype="datetime64[D]")
+    prices = np.array([r[1:6] for r in rows], dtype=np.int64).reshape(-1, 5)
+    trading_value = np.array([r[6] if len(r) > 6 else 0.0 for r in rows], dtype=np.float64)
+    return PriceSeries(days.astype(np.int64), *prices.T, trading_value)
+
+
+class DailyHistoryCache:
+    """기준 거래일 범위의 종목별 과거 일봉 (스레드 안전)"""
+
+    CACHE_DIR = CACHE_DIR / "daily_history"
+    KEEP_DAYS = 3  # 이보다 오래된 파일은 flush 때 삭제
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else self.CACHE_DIR
+        self._lock = threading.Lock()
+        self._day: Optional[date] = None
+        self._series: Dict[str, PriceSeries] = {}
+        self._file_mtime: Optional[float] = None
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def _path(self, day: date) -> Path:
+        return self.cache_dir / f"{day:%Y%m%d}.json"
+
+    def _ensure_day(self, day: date) -> None:
+        """기준일이 바뀌면 비우고, 다른 프로세스가 파일을 갱신했으면 병합 (lock 보유 상태)"""
+        if self._day != day:
+            self._day = day
+            self._series = {}
+            self._file_mtime = None
+            self._dirty = False
+        path = self._path(day)
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return
+        if mtime == self._file_mtime:
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for code, rows in data.get("codes", {}).items():
+                if code not in self._series and rows:
+                    self._series[code] = _from_rows(rows)
+            self._file_mtime = mtime
+        except Exception as e:
+            logger.debug(f"일봉 캐시 로드 실패 ({path.name}): {e}")
+            self._file_mtime = mtime
+
+    def get(self, code: str, day: date, min_bars: int = 1) -> Optional[PriceSeries]:
+        """day 이전 과거분 (min_bars봉 미만이면 None)"""
+        with self._lock:
+            self._ensure_day(day)
+            series = self._series.get(code)
+            if series is None or len(series) < min_bars:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return series
+
+    def put(self, code: str, day: date, prices: Union[PriceSeries, List[DailyPrice]]) -> None:
+        """시계열 중 day 이전 봉만 저장 (더 긴 기존 과거분은 유지)"""
+        series = PriceSeries.from_daily_prices(prices)
+        series = series[:int(np.searchsorted(series.dates, day_number(day)))]
+        if not len(series):
+            return
+        with self._lock:
+            self._ensure_day(day)
+            current = self._series.get(code)
+            if current is not None and len(current) > len(series) and current.dates[-1] == series.dates[-1]:
+                return
+            self._series[code] = series
+            self._dirty = True
+            self.stores += 1
+
+    def invalidate(self, code: str) -> None:
+        """수정주가 이벤트 등으로 과거분이 틀린 종목 제거"""
+        with self._lock:
+            if self._series.pop(code, None) is not None:
+                self._dirty = True
+
+    def flush(self) -> int:
+        """변경분을 파일로 저장 (원자적 교체), 저장한 종목 수 반환"""
+        with self._lock:
+            if not self._dirty or self._day is None:
+                return 0
+            path = self._path(self._day)
+            payload = {
+                "date": self._day.isoformat(),
+                "codes": {code: _to_rows(series) for code, series in self._series.items()},
+            }
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, separators=(",", ":"))
+                os.replace(tmp_path, path)
+                self._file_mtime = path.stat().st_mtime
+                self._dirty = False
+                count = len(self._series)
+            except Exception as e:
+                logger.warning(f"일봉 캐시 저장 실패: {e}")
+                return 0
+            self._prune(self._day)
+        return count
+
+    def _prune(self, day: date) -> None:
+        oldest = day - timedelta(days=self.KEEP_DAYS)
+        for path in self.cache_dir.glob("*.json"):
+            if path.stem < f"{oldest:%Y%m%d}":
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def counters(self) -> Tuple[int, int, int]:
+        """(hits, misses, stores) - 실행 단위 차이 계산용"""
+        with self._lock:
+            return self.hits, self.misses, self.stores
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.stores = 0
+
+    def format_stats(self, since: Optional[Tuple[int, int, int]] = None) -> str:
+        """로그용 요약 (since가 있으면 그 이후 증가분)"""
+        hits, misses, stores = self.counters()
+        if since is not None:
+            hits, misses, stores = hits - since[0], misses - since[1], stores - since[2]
+        total = hits + misses
+        ratio = hits / total if total else 0.0
+        return f"hit {hits}/{total} ({ratio:.0%}), 과거분 저장 {stores}종목"
+
+
+_history_instance: Optional[DailyHistoryCache] = None
+_history_lock = threading.Lock()
+
+
+def get_daily_history_cache() -> DailyHistoryCache:
+    """프로세스 공용 일봉 과거분 캐시"""
+    global _history_instance
+    if _history_instance is None:
+        with _history_lock:
+            if _history_instance is None:
+                _history_instance = DailyHistoryCache()
+    return _history_instance
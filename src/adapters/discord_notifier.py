@@ -35,6 +35,7 @@ from src.domain.models import (
     NotifyResult,
     NotifyChannel,
 )
+from src.utils.http_session import get_http_session
 from src.services.http_utils import mask_text
 
 logger = logging.getLogger(__name__)
@@ -458,7 +459,7 @@ class DiscordNotifier:
             )
         
         try:
-            response = requests.post(
+            response = get_http_session(self.webhook_url).post(
                 self.webhook_url,
                 json=payload,
                 timeout=10,
@@ -0,0 +1,139 @@
+"""
+키움 API 호스트 공용 Rate 버킷 (프로세스 간 공유)
+
+책임:
+- 스케줄러/CLI/대시보드 등 같은 PC의 모든 프로세스가 하나의 토큰 버킷을 나눠 씀
+  (프로세스별 버킷이 합쳐져 같은 앱키로 429가 나는 문제 방지)
+- 상태는 .cache/kiwoom_rate_bucket.bin 고정 크기 레코드, 파일 잠금으로 갱신
+  (src/utils/file_lock.py)
+- 충전 속도는 set_rate() 값을 따르되 상한(max_rate)을 넘지 않음
+  (한 프로세스의 AIMD 감소가 다른 프로세스에도 바로 반영됨)
+- 감소는 DECREASE_HOLD초 동안 유지: 그 사이 다른 프로세스의 더 높은 값은 무시
+  → 동시에 들어온 감소들 중 가장 낮은 값이 남음 (마지막 기록 우선이 아님)
+
+RateLimiter(shared=...)에 연결하면 로컬 버킷과 함께 차감된다.
+"""
+
+import logging
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from src.config.settings import CACHE_DIR
+from src.utils.file_lock import lock_fd, unlock_fd
+
+logger = logging.getLogger(__name__)
+
+BUCKET_PATH = CACHE_DIR / "kiwoom_rate_bucket.bin"
+
+# tokens, updated(epoch 초), rate, held_until(epoch 초, 이 시각까지 증가 무시)
+_RECORD = struct.Struct("<dddd")
+
+
+class HostTokenBucket:
+    """파일 잠금 기반 프로세스 간 토큰 버킷
+
+    시각은 time.time() (프로세스 간 공통 기준)을 쓴다.
+    같은 프로세스의 스레드끼리는 threading.Lock으로, 프로세스끼리는 파일 잠금으로 보호한다.
+    """
+
+    DECREASE_HOLD = 5.0  # 초 - 감소 후 이 시간 동안은 더 높은 set_rate를 무시
+
+    def __init__(
+        self,
+        max_rate: float,
+        burst: float = 1.0,
+        path: Path = BUCKET_PATH,
+        clock: Callable[[], float] = time.time,
+    ):
+        if max_rate <= 0:
+            raise ValueError(f"max_rate는 0보다 커야 합니다: {max_rate}")
+        self.max_rate = float(max_rate)
+        self.capacity = max(1.0, float(burst))
+        self.path = Path(path)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+
+    # ========================================
+    # 파일 레코드
+    # ========================================
+    def _open(self) -> int:
+        if self._fd is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o644)
+        return self._fd
+
+    def _read(self, fd: int, now: float) -> Tuple[float, float, float, float]:
+        os.lseek(fd, 0, os.SEEK_SET)
+        raw = os.read(fd, _RECORD.size)
+        if len(raw) != _RECORD.size:
+            # 새 파일 (또는 손상/이전 형식) → 가득 찬 버킷으로 시작
+            return self.capacity, now, self.max_rate, 0.0
+        tokens, updated, rate, held_until = _RECORD.unpack(raw)
+        if not (rate > 0) or updated > now + 60:
+            return self.capacity, now, self.max_rate, 0.0
+        return tokens, updated, min(rate, self.max_rate), held_until
+
+    def _write(self, fd: int, tokens: float, updated: float, rate: float, held_until: float) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, _RECORD.pack(tokens, updated, rate, held_until))
+
+    def _update(self, fn: Callable[[float, float, float, float], Tuple[float, float, float, object]]):
+        """잠금 → 충전 → fn(tokens, rate, held_until, now) → (tokens, rate, held_until, 반환값) 기록"""
+        with self._lock:
+            fd = self._open()
+            lock_fd(fd, _RECORD.size)
+            try:
+                now = self._clock()
+                tokens, updated, rate, held_until = self._read(fd, now)
+                if now > updated:
+                    tokens = min(self.capacity, tokens + (now - updated) * rate)
+                tokens, rate, held_until, result = fn(tokens, rate, held_until, now)
+                self._write(fd, tokens, max(now, updated), rate, held_until)
+                return result
+            finally:
+                unlock_fd(fd, _RECORD.size)
+
+    # ========================================
+    # 공개 API
+    # ========================================
+    def take(self, tokens: float = 1.0) -> float:
+        """즉시 차감 시도. 성공하면 0, 실패하면 필요한 대기시간(초)"""
+        def _take(available: float, rate: float, held_until: float, now: float):
+            if available >= tokens:
+                return available - tokens, rate, held_until, 0.0
+            return available, rate, held_until, (tokens - available) / rate
+        return self._update(_take)
+
+    def set_rate(self, rate: float) -> None:
+        """호스트 공용 충전 속도 변경 (상한 적용)
+
+        감소는 바로 적용하고 DECREASE_HOLD초 유지한다. 유지 중에는 더 높은 값을 무시하므로
+        여러 프로세스가 거의 동시에 낮추면 가장 낮은 값이 남는다.
+        """
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+        capped = min(float(rate), self.max_rate)
+
+        def _set(available: float, current: float, held_until: float, now: float):
+            if capped < current:
+                return available, capped, now + self.DECREASE_HOLD, None
+            if now < held_until:
+                return available, current, held_until, None
+            return available, capped, held_until, None
+
+        self._update(_set)
+
+    @property
+    def rate(self) -> float:
+        return self._update(lambda available, rate, held_until, now: (available, rate, held_until, rate))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
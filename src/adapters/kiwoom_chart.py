@@ -0,0 +1,93 @@
+"""
+키움 일봉 차트(ka10081) 열 단위 파서
+
+책임:
+- stk_dt_pole_chart_qry 행(최신순) → PriceSeries(시간순) 변환
+- 필드별로 문자열을 한 번에 이어 붙여 NumPy로 일괄 변환
+  (행마다 strptime/int 변환을 하지 않음)
+- 형식이 어긋난 값이 있으면 행 단위 파서로 폴백 (기존 결과와 동일)
+
+값 규칙은 KiwoomRestClient._parse_int와 같다:
+부호(+/-)와 쉼표를 제거한 절대값, 빈 값은 0.
+"""
+
+import logging
+import warnings
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.domain.price_series import PriceSeries, day_number
+
+logger = logging.getLogger(__name__)
+
+CHART_FIELDS = ("open_pric", "high_pric", "low_pric", "cur_prc", "trde_qty")
+_STRIP = str.maketrans("", "", "+-,")
+
+
+def _int_column(rows: Sequence[Dict[str, Any]], key: str) -> Optional[np.ndarray]:
+    """필드 하나 → int64 배열 (형식 오류면 None)"""
+    text = " ".join([str(r.get(key) or "0").strip() or "0" for r in rows]).translate(_STRIP)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        try:
+            values = np.fromstring(text, dtype=np.int64, sep=" ")
+        except ValueError:
+            return None
+    return values if len(values) == len(rows) else None
+
+
+def _day_numbers(yyyymmdd: np.ndarray) -> Optional[np.ndarray]:
+    """YYYYMMDD 정수 배열 → 1970-01-01 기준 일수 배열 (없는 날짜가 있으면 None)"""
+    month = yyyymmdd // 100 % 100
+    day = yyyymmdd % 100
+    if not ((yyyymmdd >= 10000101) & (month >= 1) & (month <= 12) & (day >= 1)).all():
+        return None
+    year_month = (yyyymmdd // 10000 - 1970).astype("datetime64[Y]") + (month - 1).astype("timedelta64[M]")
+    result = year_month.astype("datetime64[D]") + (day - 1).astype("timedelta64[D]")
+    # 2월 30일처럼 다음 달로 넘어간 값 검출
+    if not (result.astype("datetime64[M]") == year_month).all():
+        return None
+    return result.astype(np.int64)
+
+
+def _parse_int(value: Any) -> int:
+    try:
+        return int(str(value).replace(',', '').replace('+', '').replace('-', '').strip())
+    except (ValueError, TypeError):
+        return 0
+
+
+def _parse_rows_scalar(rows: Sequence[Dict[str, Any]], stock_code: str = "") -> PriceSeries:
+    """행 단위 파서 (폴백용, 기존 _parse_chart_rows와 같은 규칙)"""
+    columns: List[List[int]] = [[] for _ in range(6)]
+    for item in reversed(rows):
+        try:
+            dt = datetime.strptime(str(item.get('dt', '')).strip(), '%Y%m%d').date()
+        except (ValueError, TypeError) as e:
+            logger.warning(f"일봉 파싱 오류 ({stock_code}): {e}")
+            continue
+        columns[0].append(day_number(dt))
+        for i, key in enumerate(CHART_FIELDS, start=1):
+            columns[i].append(_parse_int(item.get(key, '0')))
+    return PriceSeries(*(np.array(c, dtype=np.int64) for c in columns))
+
+
+def parse_daily_chart(rows: Sequence[Dict[str, Any]], stock_code: str = "") -> PriceSeries:
+    """ka10081 행(최신순) → PriceSeries(시간순)
+
+    날짜(dt)가 비어 있는 행(상폐/데이터 없음)은 제외한다.
+    """
+    rows = [r for r in rows if str(r.get('dt', '')).strip()]
+    if not rows:
+        return PriceSeries.empty()
+
+    dt = _int_column(rows, 'dt')
+    dates = _day_numbers(dt) if dt is not None else None
+    columns = [_int_column(rows, key) for key in CHART_FIELDS]
+    if dates is None or any(c is None for c in columns):
+        return _parse_rows_scalar(rows, stock_code)
+
+    # 최신순 → 시간순 (뒤집은 뷰)
+    return PriceSeries(dates[::-1], *(c[::-1] for c in columns))
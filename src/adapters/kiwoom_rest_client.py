@@ -7,22 +7,41 @@
 - 현재가/기본정보 조회 (ka10001)
 - 거래대금 상위 조회 (ka10032)
 - 거래량 상위 조회 (ka10030)
-- Rate Limit 핸들링
+- Rate Limit 핸들링 (공용 토큰 버킷 + AIMD 적응형 속도)
 - Circuit Breaker (연속 실패 시 폴백)
+- 진행 중인 동일 요청 병합 (single-flight)
+- api-id별 텔레메트리 (지연 히스토그램, 재시도, 429/5xx, 응답 바이트)
 """
 
+import asyncio
 import json
+import os
+import threading
 import time
 import logging
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Tuple
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Dict, Any, Tuple, Iterator, Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from dataclasses import dataclass
+import numpy as np
 import requests
 from requests.exceptions import RequestException, Timeout
 
-from src.config.settings import settings, BASE_DIR
+from src.config.settings import settings, CACHE_DIR
 from src.domain.models import DailyPrice, StockInfo, CurrentPrice, ScreenerError
+from src.adapters.rate_limiter import RateLimiter, current_priority, get_rate_limiter, submit_with_context
+from src.adapters.adaptive_rate import AdaptiveRateController, get_rate_controller
+from src.adapters.response_cache import ResponseCache, get_response_cache
+from src.adapters.daily_history_cache import DailyHistoryCache, get_daily_history_cache
+from src.adapters.single_flight import SingleFlight, get_single_flight
+from src.adapters.api_telemetry import ApiTelemetry, get_api_telemetry
+from src.adapters.kiwoom_chart import parse_daily_chart
+from src.domain.price_series import PriceSeries, day_number
+from src.utils.http_session import get_http_session
+from src.utils.deadline import Deadline, current_deadline, deadline_scope
+from src.utils.file_lock import file_lock
 
 logger = logging.getLogger(__name__)
 
@@ -39,29 +58,45 @@ class KiwoomErrorCode:
     NETWORK_ERROR = "KIWOOM_005"
     TIMEOUT_ERROR = "KIWOOM_006"
     CIRCUIT_OPEN = "KIWOOM_007"
+    DEADLINE_EXCEEDED = "KIWOOM_008"
 
 
 # ============================================================
 # 토큰 캐시 관리
 # ============================================================
-@dataclass
+@dataclass(frozen=True)
 class TokenCache:
-    """토큰 캐시 데이터"""
+    """토큰 캐시 데이터 (불변 - 메모리 캐시는 참조 교체로 갱신)"""
     token: str
     expires_at: datetime
     
     def is_valid(self, buffer_seconds: int = 300) -> bool:
         """토큰 유효성 확인 (만료 5분 전부터 무효 처리)"""
         return datetime.now() < self.expires_at - timedelta(seconds=buffer_seconds)
+    
+    def remaining_seconds(self) -> float:
+        """만료까지 남은 시간 (초)"""
+        return (self.expires_at - datetime.now()).total_seconds()
 
 
 class TokenManager:
-    """토큰 관리자 - 메모리 + 파일 캐시"""
+    """토큰 관리자 - 메모리 + 파일 캐시
+    
+    - 조회: 메모리 캐시가 유효하면 I/O 없이 반환.
+      파일은 메모리 캐시가 없거나 만료됐을 때, 파일이 바뀐 경우(mtime)에만 다시 읽는다.
+    - 발급: 스레드 잠금 + 파일 잠금 안에서 캐시를 다시 확인한 뒤 발급
+      (동시 호출자/다른 프로세스가 같은 토큰을 중복 발급하지 않음)
+    - 저장: 임시 파일 → os.replace (원자적) 후 메모리 참조 교체
+    """
     
-    CACHE_PATH = BASE_DIR / ".cache" / "kiwoom_token.json"
+    CACHE_PATH = CACHE_DIR / "kiwoom_token.json"
+    LOCK_PATH = CACHE_DIR / "kiwoom_token.lock"
     
     def __init__(self):
         self._memory_cache: Optional[TokenCache] = None
+        self._file_mtime: Optional[float] = None
+        self._issue_lock = threading.Lock()
+        self.issued_count = 0
         self._ensure_cache_dir()
     
     def _ensure_cache_dir(self):
@@ -70,27 +105,37 @@ class TokenManager:
     
     def get_cached_token(self) -> Optional[TokenCache]:
         """캐시된 토큰 조회 (메모리 -> 파일 순서)"""
-        # 1. 메모리 캐시 확인
-        if self._memory_cache and self._memory_cache.is_valid():
-            return self._memory_cache
-        
-        # 2. 파일 캐시 확인
-        if self.CACHE_PATH.exists():
-            try:
-                with open(self.CACHE_PATH, 'r') as f:
-                    data = json.load(f)
-                    expires_at = datetime.fromisoformat(data['expires_at'])
-                    cache = TokenCache(token=data['token'], expires_at=expires_at)
-                    if cache.is_valid():
-                        self._memory_cache = cache
-                        return cache
-            except Exception as e:
-                logger.warning(f"토큰 캐시 파일 읽기 실패: {e}")
+        # 1. 메모리 캐시 확인 (I/O 없음)
+        cache = self._memory_cache
+        if cache and cache.is_valid():
+            return cache
         
+        # 2. 파일 캐시 확인 (다른 프로세스가 갱신했을 수 있음)
+        return self._load_file()
+    
+    def _load_file(self) -> Optional[TokenCache]:
+        try:
+            mtime = self.CACHE_PATH.stat().st_mtime
+        except OSError:
+            return None
+        if mtime == self._file_mtime:
+            return None  # 이미 읽은 파일 (유효하지 않았음)
+        try:
+            with open(self.CACHE_PATH, 'r') as f:
+                data = json.load(f)
+            self._file_mtime = mtime
+            cache = TokenCache(
+                token=data['token'], expires_at=datetime.fromisoformat(data['expires_at'])
+            )
+            if cache.is_valid():
+                self._memory_cache = cache
+                return cache
+        except Exception as e:
+            logger.warning(f"토큰 캐시 파일 읽기 실패: {e}")
         return None
     
-    def save_token(self, token: str, expires_dt: str):
-        """토큰 저장 (메모리 + 파일)
+    def save_token(self, token: str, expires_dt: str) -> TokenCache:
+        """토큰 저장 (파일 → 메모리 순서로 게시)
         
         Args:
             token: 접근 토큰
@@ -105,26 +150,120 @@ class TokenManager:
         
         cache = TokenCache(token=token, expires_at=expires_at)
         
-        # 메모리 캐시
-        self._memory_cache = cache
-        
-        # 파일 캐시
+        # 파일 캐시 (임시 파일 → 교체, 읽는 쪽이 반쯤 쓰인 파일을 보지 않음)
         try:
-            with open(self.CACHE_PATH, 'w') as f:
+            tmp_path = self.CACHE_PATH.with_suffix(".tmp")
+            with open(tmp_path, 'w') as f:
                 json.dump({
                     'token': token,
                     'expires_at': expires_at.isoformat()
                 }, f)
+            os.replace(tmp_path, self.CACHE_PATH)
+            self._file_mtime = self.CACHE_PATH.stat().st_mtime
         except Exception as e:
             logger.warning(f"토큰 캐시 파일 저장 실패: {e}")
+        
+        # 메모리 캐시 (참조 교체)
+        self._memory_cache = cache
+        return cache
+    
+    def issue(
+        self,
+        issue_fn: Callable[[], Tuple[str, str]],
+        min_valid_sec: float = 0.0,
+    ) -> TokenCache:
+        """캐시가 min_valid_sec 이상 유효하면 그대로, 아니면 issue_fn()으로 발급
+        
+        issue_fn: () -> (token, expires_dt)
+        """
+        with self._issue_lock, file_lock(self.LOCK_PATH):
+            cached = self.get_cached_token()
+            if cached and cached.remaining_seconds() > min_valid_sec:
+                return cached
+            token, expires_dt = issue_fn()
+            self.issued_count += 1
+            return self.save_token(token, expires_dt)
     
     def clear(self):
         """캐시 초기화"""
         self._memory_cache = None
+        self._file_mtime = None
         if self.CACHE_PATH.exists():
             self.CACHE_PATH.unlink()
 
 
+class TokenRefresher:
+    """토큰 사전 갱신 (백그라운드 데몬 스레드)
+    
+    만료 lead_sec 전에 새 토큰을 발급해 두어, 스크리닝 중 호출 스레드가
+    au10001 왕복을 기다리지 않게 한다. 실패 시 retry_sec 후 재시도.
+    """
+    
+    def __init__(
+        self,
+        manager: TokenManager,
+        issue_fn: Callable[[], Tuple[str, str]],
+        lead_sec: float = 3600.0,
+        retry_sec: float = 60.0,
+    ):
+        self.manager = manager
+        self.issue_fn = issue_fn
+        self.lead_sec = lead_sec
+        self.retry_sec = retry_sec
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="kiwoom-token-refresh", daemon=True)
+        self._thread.start()
+        logger.info(f"키움 토큰 사전 갱신 시작 (만료 {self.lead_sec / 60:.0f}분 전)")
+    
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+    
+    def kick(self) -> None:
+        """즉시 확인 요청 (토큰이 갱신 구간에 들어섰을 때)"""
+        self._wake.set()
+    
+    def next_wait(self) -> float:
+        """다음 갱신까지 대기 (초, 0이면 지금 갱신)"""
+        cached = self.manager.get_cached_token()
+        if cached is None:
+            return 0.0
+        return max(0.0, cached.remaining_seconds() - self.lead_sec)
+    
+    def refresh_once(self) -> float:
+        """필요하면 갱신하고 다음 대기시간 반환"""
+        wait = self.next_wait()
+        if wait > 0:
+            return wait
+        try:
+            cache = self.manager.issue(self.issue_fn, min_valid_sec=self.lead_sec)
+        except Exception as e:
+            logger.warning(f"키움 토큰 사전 갱신 실패 ({self.retry_sec:.0f}초 후 재시도): {e}")
+            return self.retry_sec
+        logger.info(f"🔑 키움 토큰 사전 갱신 완료, 만료: {cache.expires_at:%Y-%m-%d %H:%M}")
+        # 토큰 수명이 lead_sec보다 짧아도 재발급이 연달아 일어나지 않도록
+        return max(self.retry_sec, cache.remaining_seconds() - self.lead_sec)
+    
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            wait = self.refresh_once()
+            self._wake.wait(wait)
+            self._wake.clear()
+
+
 # ============================================================
 # Circuit Breaker
 # ============================================================
@@ -138,8 +277,9 @@ class CircuitBreaker:
         self.last_failure_time: Optional[datetime] = None
         self.is_open = False
     
-    def record_failure(self):
-        """실패 기록"""
+    def record_failure(self) -> bool:
+        """실패 기록 (이번 실패로 차단이 시작되면 True, half-open 재차단 포함)"""
+        was_open = self.is_open and not self._reset_elapsed()
         self.failure_count += 1
         self.last_failure_time = datetime.now()
         
@@ -149,6 +289,13 @@ class CircuitBreaker:
                 f"🔴 Circuit Breaker OPEN - 연속 {self.failure_count}회 실패, "
                 f"{self.reset_timeout}초 동안 키움 API 호출 스킵"
             )
+            return not was_open
+        return False
+    
+    def _reset_elapsed(self) -> bool:
+        if self.last_failure_time is None:
+            return True
+        return (datetime.now() - self.last_failure_time).total_seconds() >= self.reset_timeout
     
     def record_success(self):
         """성공 기록"""
@@ -163,11 +310,9 @@ class CircuitBreaker:
             return True
         
         # 타임아웃 경과 시 half-open 상태로 전환
-        if self.last_failure_time:
-            elapsed = (datetime.now() - self.last_failure_time).total_seconds()
-            if elapsed >= self.reset_timeout:
-                logger.info("🟡 Circuit Breaker HALF-OPEN - 재시도 허용")
-                return True
+        if self.last_failure_time and self._reset_elapsed():
+            logger.info("🟡 Circuit Breaker HALF-OPEN - 재시도 허용")
+            return True
         
         return False
 
@@ -193,41 +338,158 @@ class KiwoomRestClient:
         'foreign_trade': '/api/dostk/frgnistt',# ka10008 외국인매매동향
 }
     
-    # Rate Limit: 초당 10회 (안전하게 0.12초 간격)
+    # Rate Limit: 초당 10회 (안전하게 0.12초 간격) - 기본값, 실제 예산은 RateLimiter
     API_CALL_INTERVAL = 0.12
     REQUEST_TIMEOUT = 10
     MAX_RETRIES = 2
     
-    def __init__(self):
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        rate_controller: Optional[AdaptiveRateController] = None,
+        single_flight: Optional[SingleFlight] = None,
+        telemetry: Optional[ApiTelemetry] = None,
+        daily_history: Optional[DailyHistoryCache] = None,
+    ):
         self.base_url = settings.kiwoom.base_url
         self.app_key = settings.kiwoom.app_key
         self.secret_key = settings.kiwoom.secret_key
         
         self._token_manager = TokenManager()
+        self._token_refresher = TokenRefresher(
+            self._token_manager, self._issue_token,
+            lead_sec=settings.kiwoom.token_refresh_lead_sec,
+        )
         self._circuit_breaker = CircuitBreaker()
-        self._last_call_time: float = 0
+        # 프로세스 공용 토큰 버킷 (여러 인스턴스/스레드가 같은 예산을 나눠 씀)
+        # AIMD 컨트롤러는 공용 버킷을 쓸 때만 기본 연결 (주입된 버킷은 호출자가 관리)
+        if rate_limiter is None:
+            rate_limiter = get_rate_limiter()
+            if rate_controller is None:
+                rate_controller = get_rate_controller()
+        self._rate_limiter = rate_limiter
+        self._rate_controller = rate_controller
+        # 호스트별 keep-alive 세션 (매 호출 TCP/TLS 핸드셰이크 방지)
+        self._session = get_http_session(self.base_url)
+        # 프로세스 공용 응답 캐시 (일봉/현재가 재조회 방지)
+        self._response_cache = response_cache if response_cache is not None else get_response_cache()
+        # 프로세스 공용 동일 요청 병합 (스레드/인스턴스 간 진행 중 요청 공유)
+        self._single_flight = single_flight if single_flight is not None else get_single_flight()
+        # 프로세스 공용 api-id별 텔레메트리
+        self._telemetry = telemetry if telemetry is not None else get_api_telemetry()
+        # 프로세스 공용 일봉 과거분 캐시 (프리뷰가 받은 과거분 → 메인은 당일 봉만 조회)
+        if daily_history is None and settings.kiwoom.warm_daily_cache:
+            daily_history = get_daily_history_cache()
+        self._daily_history = daily_history
     
     # ========================================
     # Rate Limit
     # ========================================
-    def _wait_for_rate_limit(self):
-        """Rate Limit 대기"""
-        elapsed = time.time() - self._last_call_time
-        if elapsed < self.API_CALL_INTERVAL:
-            time.sleep(self.API_CALL_INTERVAL - elapsed)
-        self._last_call_time = time.time()
+    def _wait_for_rate_limit(self, tr_id: str = "") -> bool:
+        """Rate Limit 대기 (전역 + api-id별 토큰 버킷)
+        
+        시간 예산이 설정돼 있으면 남은 시간까지만 기다린다 (초과 시 False).
+        """
+        deadline = current_deadline()
+        timeout = None
+        if deadline is not None and not deadline.unlimited:
+            timeout = max(0.0, deadline.remaining())
+        return self._rate_limiter.acquire(tr_id, timeout=timeout)
+    
+    def _retry_delay(self, tr_id: str, retry_count: int) -> float:
+        """429/5xx 재시도 대기 (적응형이면 감소된 속도 기준, 아니면 지수 백오프)"""
+        if self._rate_controller is not None:
+            return self._rate_controller.retry_delay(tr_id, retry_count)
+        return float(2 ** retry_count)
+    
+    # ========================================
+    # 텔레메트리
+    # ========================================
+    def _record_failure(self, tr_id: str) -> None:
+        """Circuit Breaker 실패 기록 (차단 전환이면 텔레메트리에 남김)"""
+        if self._circuit_breaker.record_failure():
+            self._telemetry.record_circuit_trip(tr_id)
+    
+    @staticmethod
+    def _response_bytes(response) -> int:
+        content = getattr(response, "content", None)
+        if isinstance(content, (bytes, bytearray)):
+            return len(content)
+        try:
+            return int(response.headers.get("Content-Length", 0))
+        except (AttributeError, TypeError, ValueError):
+            return 0
+    
+    # ========================================
+    # 시간 예산
+    # ========================================
+    @contextmanager
+    def deadline_scope(self, deadline: Optional[Deadline]):
+        """블록 안의 모든 요청에 시간 예산 적용
+        
+        - 요청 타임아웃을 남은 시간으로 단축
+        - 남은 시간보다 긴 재시도 대기는 하지 않음
+        - 예산 소진 후 요청은 DEADLINE_EXCEEDED (recoverable=False)
+        
+        예산은 클라이언트가 아니라 현재 컨텍스트에 걸린다 (src.utils.deadline.deadline_scope):
+        공용 클라이언트를 쓰는 다른 스레드(스케줄러/대시보드 등)에는 적용되지 않고,
+        submit_with_context로 넘긴 작업에는 이어진다.
+        """
+        with deadline_scope(deadline):
+            yield self
+    
+    def _check_deadline(self, endpoint: str) -> None:
+        deadline = current_deadline()
+        if deadline is not None and deadline.expired():
+            raise ScreenerError(
+                KiwoomErrorCode.DEADLINE_EXCEEDED,
+                f"시간 예산 소진 ({deadline.name}): {endpoint}",
+                recoverable=False
+            )
+    
+    def _request_timeout(self) -> float:
+        """요청 타임아웃 (시간 예산이 있으면 남은 시간 이내)"""
+        deadline = current_deadline()
+        if deadline is None or deadline.unlimited:
+            return self.REQUEST_TIMEOUT
+        return max(0.5, min(self.REQUEST_TIMEOUT, deadline.remaining()))
+    
+    def _can_retry(self, retry_count: int, wait_time: float) -> bool:
+        """재시도 가능 여부 (횟수 + 대기 후에도 예산이 남는지)"""
+        if retry_count >= self.MAX_RETRIES:
+            return False
+        deadline = current_deadline()
+        if deadline is not None and deadline.remaining() <= wait_time:
+            logger.warning(f"시간 예산 부족 - 재시도 생략 ({deadline.name})")
+            return False
+        return True
+    
+    def get_effective_rate(self, tr_id: str = "") -> float:
+        """현재 실효 호출 속도 (초당)"""
+        if self._rate_controller is not None:
+            return self._rate_controller.effective_rate(tr_id)
+        return self._rate_limiter.rate
     
     # ========================================
     # 토큰 관리
     # ========================================
     def _get_token(self) -> str:
-        """OAuth 토큰 발급/갱신"""
-        # 1. 캐시 확인
+        """OAuth 토큰 조회 (캐시 우선, 없으면 발급)"""
+        # 1. 캐시 확인 (메모리 적중 시 I/O 없음)
         cached = self._token_manager.get_cached_token()
         if cached:
+            # 갱신 구간이면 백그라운드 갱신만 깨우고 현재 토큰으로 진행
+            if self._token_refresher.running and \
+                    cached.remaining_seconds() <= self._token_refresher.lead_sec:
+                self._token_refresher.kick()
             return cached.token
         
-        # 2. 신규 발급
+        # 2. 신규 발급 (동시 호출자는 잠금 대기 후 발급된 토큰 공유)
+        return self._token_manager.issue(self._issue_token).token
+    
+    def _issue_token(self) -> Tuple[str, str]:
+        """au10001 토큰 발급 → (token, expires_dt)"""
         url = f"{self.base_url}{self.ENDPOINTS['token']}"
         headers = {
             "Content-Type": "application/json;charset=UTF-8",
@@ -240,11 +502,16 @@ class KiwoomRestClient:
         }
         
         try:
-            self._wait_for_rate_limit()
-            response = requests.post(
+            self._wait_for_rate_limit("au10001")
+            started = time.monotonic()
+            response = self._session.post(
                 url, headers=headers, json=body, 
                 timeout=self.REQUEST_TIMEOUT
             )
+            self._telemetry.record_response(
+                "au10001", response.status_code, time.monotonic() - started,
+                self._response_bytes(response),
+            )
             response.raise_for_status()
             
             data = response.json()
@@ -259,11 +526,9 @@ class KiwoomRestClient:
             
             token = data['token']
             expires_dt = data.get('expires_dt', '')
-            
-            self._token_manager.save_token(token, expires_dt)
             logger.info(f"✅ 키움 토큰 발급 성공, 만료: {expires_dt}")
             
-            return token
+            return token, expires_dt
             
         except requests.exceptions.RequestException as e:
             logger.error(f"토큰 발급 네트워크 오류: {e}")
@@ -273,6 +538,11 @@ class KiwoomRestClient:
                 recoverable=True
             )
     
+    def start_token_refresher(self) -> TokenRefresher:
+        """토큰 사전 갱신 스레드 시작 (스케줄러 등 상주 프로세스용, 중복 호출 무시)"""
+        self._token_refresher.start()
+        return self._token_refresher
+    
     # ========================================
     # 공통 요청 래퍼
     # ========================================
@@ -292,9 +562,88 @@ class KiwoomRestClient:
         tr_id: str,
         body: Optional[Dict] = None,
         retry_count: int = 0,
+        use_cache: bool = True,
     ) -> Dict[str, Any]:
-        """API 요청 공통 처리"""
+        """API 요청 공통 처리
         
+        use_cache=True이고 tr_id에 TTL이 설정돼 있으면 공용 응답 캐시를 사용한다.
+        """
+        data, _ = self._request_with_headers(
+            method, endpoint, tr_id, body, retry_count=retry_count, use_cache=use_cache,
+        )
+        return data
+    
+    async def request_async(
+        self,
+        method: str,
+        endpoint: str,
+        tr_id: str,
+        body: Optional[Dict] = None,
+    ) -> Dict[str, Any]:
+        """asyncio용 _request (동일 요청은 같은 루프 안에서 병합 후 작업 스레드에서 실행)"""
+        if self._single_flight is None:
+            return await asyncio.to_thread(self._request, method, endpoint, tr_id, body)
+        return await self._single_flight.do_async(
+            SingleFlight.make_key(endpoint, tr_id, body, priority=current_priority()),
+            lambda: asyncio.to_thread(self._request, method, endpoint, tr_id, body),
+            label=tr_id,
+        )
+    
+    def _request_with_headers(
+        self,
+        method: str,
+        endpoint: str,
+        tr_id: str,
+        body: Optional[Dict] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+        retry_count: int = 0,
+        use_cache: bool = True,
+    ) -> Tuple[Dict[str, Any], Mapping[str, str]]:
+        """API 요청 공통 처리 (응답 본문 + 응답 헤더)
+        
+        재시도/Circuit Breaker/Rate Limit/캐시는 _request와 동일하다.
+        extra_headers는 연속조회(cont-yn/next-key)처럼 요청별 헤더를 덧붙일 때 사용.
+        캐시 적중 시 응답 헤더는 빈 dict.
+        같은 (endpoint, tr_id, body, 우선순위) 요청이 진행 중이면 새로 보내지 않고 그 결과를 함께 받는다.
+        """
+        if use_cache and retry_count == 0:
+            cached = self._response_cache.get(tr_id, body)
+            if cached is not None:
+                return cached, {}
+        
+        if retry_count > 0 or self._single_flight is None:
+            return self._send(method, endpoint, tr_id, body, extra_headers, retry_count, use_cache)
+        
+        # 합류한 호출자는 자기 시간 예산까지만 기다림
+        deadline = current_deadline()
+        timeout = None
+        if deadline is not None and not deadline.unlimited:
+            timeout = max(0.0, deadline.remaining())
+        try:
+            return self._single_flight.do(
+                SingleFlight.make_key(endpoint, tr_id, body, extra_headers, current_priority()),
+                lambda: self._send(method, endpoint, tr_id, body, extra_headers, 0, use_cache),
+                label=tr_id,
+                timeout=timeout,
+            )
+        except FuturesTimeout:
+            raise ScreenerError(
+                KiwoomErrorCode.DEADLINE_EXCEEDED,
+                f"시간 예산 소진 (진행 중인 동일 요청 대기): {endpoint}",
+                recoverable=False
+            )
+    
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        tr_id: str,
+        body: Optional[Dict],
+        extra_headers: Optional[Dict[str, str]],
+        retry_count: int,
+        use_cache: bool,
+    ) -> Tuple[Dict[str, Any], Mapping[str, str]]:
+        """실제 HTTP 요청 (Circuit Breaker → Rate Limit → 전송 → 429/5xx 재시도)"""
         # Circuit Breaker 확인
         if not self._circuit_breaker.can_request():
             raise ScreenerError(
@@ -303,32 +652,52 @@ class KiwoomRestClient:
                 recoverable=True
             )
         
+        self._check_deadline(endpoint)
+        
         url = f"{self.base_url}{endpoint}"
         headers = self._get_headers(tr_id)
+        if extra_headers:
+            headers.update(extra_headers)
         
         try:
-            self._wait_for_rate_limit()
+            if not self._wait_for_rate_limit(tr_id):
+                self._check_deadline(endpoint)
             
+            started = time.monotonic()
             if method.upper() == "POST":
-                response = requests.post(
+                response = self._session.post(
                     url, headers=headers, json=body,
-                    timeout=self.REQUEST_TIMEOUT
+                    timeout=self._request_timeout()
                 )
             else:
-                response = requests.get(
+                response = self._session.get(
                     url, headers=headers, params=body,
-                    timeout=self.REQUEST_TIMEOUT
+                    timeout=self._request_timeout()
                 )
             
+            latency = time.monotonic() - started
+            self._telemetry.record_response(
+                tr_id, response.status_code, latency,
+                self._response_bytes(response), retry=retry_count > 0,
+            )
+            
+            # 429/5xx → 적응형 속도 감소
+            if self._rate_controller is not None and (
+                response.status_code == 429 or response.status_code >= 500
+            ):
+                self._rate_controller.on_throttle(tr_id, response.status_code)
+            
             # 429 Rate Limit
             if response.status_code == 429:
-                if retry_count < self.MAX_RETRIES:
-                    wait_time = 2 ** retry_count
-                    logger.warning(f"Rate Limit 429 - {wait_time}초 후 재시도")
+                wait_time = self._retry_delay(tr_id, retry_count)
+                if self._can_retry(retry_count, wait_time):
+                    logger.warning(f"Rate Limit 429 - {wait_time:.2f}초 후 재시도")
                     time.sleep(wait_time)
-                    return self._request(method, endpoint, tr_id, body, retry_count + 1)
+                    return self._send(
+                        method, endpoint, tr_id, body, extra_headers, retry_count + 1, use_cache,
+                    )
                 else:
-                    self._circuit_breaker.record_failure()
+                    self._record_failure(tr_id)
                     raise ScreenerError(
                         KiwoomErrorCode.RATE_LIMIT,
                         "Rate Limit 초과 - 재시도 실패",
@@ -337,13 +706,15 @@ class KiwoomRestClient:
             
             # 5xx 서버 오류
             if response.status_code >= 500:
-                if retry_count < self.MAX_RETRIES:
-                    wait_time = 2 ** retry_count
-                    logger.warning(f"서버 오류 {response.status_code} - {wait_time}초 후 재시도")
+                wait_time = self._retry_delay(tr_id, retry_count)
+                if self._can_retry(retry_count, wait_time):
+                    logger.warning(f"서버 오류 {response.status_code} - {wait_time:.2f}초 후 재시도")
                     time.sleep(wait_time)
-                    return self._request(method, endpoint, tr_id, body, retry_count + 1)
+                    return self._send(
+                        method, endpoint, tr_id, body, extra_headers, retry_count + 1, use_cache,
+                    )
                 else:
-                    self._circuit_breaker.record_failure()
+                    self._record_failure(tr_id)
                     raise ScreenerError(
                         KiwoomErrorCode.API_ERROR,
                         f"서버 오류: {response.status_code}",
@@ -352,23 +723,30 @@ class KiwoomRestClient:
             
             response.raise_for_status()
             data = response.json()
+            if self._rate_controller is not None:
+                self._rate_controller.on_success(tr_id, latency)
             
             # 응답 코드 검증
             if data.get('return_code', 0) != 0:
                 logger.warning(f"API 응답 오류: {data.get('return_msg', 'Unknown')}")
+            elif use_cache:
+                self._response_cache.put(tr_id, body, data)
             
             self._circuit_breaker.record_success()
-            return data
+            return data, response.headers
             
         except Timeout:
-            self._circuit_breaker.record_failure()
+            self._telemetry.record_error(tr_id, "timeout", retry=retry_count > 0)
+            self._record_failure(tr_id)
             raise ScreenerError(
                 KiwoomErrorCode.TIMEOUT_ERROR,
                 f"요청 타임아웃: {endpoint}",
                 recoverable=True
             )
         except RequestException as e:
-            self._circuit_breaker.record_failure()
+            if getattr(e, "response", None) is None:  # 4xx(raise_for_status)는 응답으로 이미 기록
+                self._telemetry.record_error(tr_id, "network", retry=retry_count > 0)
+            self._record_failure(tr_id)
             raise ScreenerError(
                 KiwoomErrorCode.NETWORK_ERROR,
                 f"네트워크 오류: {e}",
@@ -381,56 +759,237 @@ class KiwoomRestClient:
     def get_daily_prices(
         self, 
         stock_code: str, 
-        count: int = 200
+        count: int = 200,
+        incremental: Optional[bool] = None,
     ) -> List[DailyPrice]:
         """일봉 데이터 조회
         
         Args:
             stock_code: 종목코드 (6자리)
             count: 조회할 일수 (기본 200)
+            incremental: 로컬 OHLCV와 병합하는 증분 모드 (None이면 설정값,
+                False면 당일 과거분 캐시도 쓰지 않고 전체 조회)
             
         Returns:
-            DailyPrice 리스트 (최신순)
+            DailyPrice 리스트 (시간순: 오래된 → 최신)
+        """
+        return self.get_daily_series(stock_code, count, incremental).to_daily_prices()
+    
+    def get_daily_series(
+        self,
+        stock_code: str,
+        count: int = 200,
+        incremental: Optional[bool] = None,
+    ) -> PriceSeries:
+        """일봉 시계열 조회 (열 단위 배열, get_daily_prices와 같은 데이터)
+        
+        캐시/증분/전체 조회 모두 PriceSeries로만 다룬다 (DailyPrice 객체 생성 없음).
         """
-        today = datetime.now().strftime("%Y%m%d")
+        warm, local = self._daily_sources(incremental)
+        series = self._get_daily_series_cached(stock_code, count, warm, local)
+        if series is not None:
+            return series
         
-        body = {
+        series = self._fetch_daily_series(stock_code, count)
+        if warm:
+            self._remember_history(stock_code, series)
+        return series
+    
+    def _daily_sources(self, incremental: Optional[bool]) -> Tuple[bool, bool]:
+        """(당일 과거분 캐시, 로컬 OHLCV 증분) 사용 여부"""
+        if incremental is False:
+            return False, False
+        local = settings.kiwoom.incremental_daily if incremental is None else incremental
+        return self._daily_history is not None, local
+    
+    def _get_daily_series_cached(
+        self,
+        stock_code: str,
+        count: int,
+        warm: bool,
+        local: bool,
+    ) -> Optional[PriceSeries]:
+        """당일 과거분 캐시 → 로컬 OHLCV 증분 순서로 시도 (둘 다 안 되면 None)"""
+        if warm:
+            series = self.get_daily_prices_warm(stock_code, count)
+            if series is not None:
+                return series
+        if not local:
+            return None
+        series = self.get_daily_prices_incremental(stock_code, count)
+        if series is not None and warm:
+            self._remember_history(stock_code, series)
+        return series
+    
+    def _remember_history(self, stock_code: str, series: PriceSeries) -> None:
+        """조회한 시계열의 과거분을 당일 캐시에 보관"""
+        if self._daily_history is not None and len(series):
+            self._daily_history.put(stock_code, self._target_trading_day(), series)
+    
+    def _fetch_daily_series(self, stock_code: str, count: int) -> PriceSeries:
+        """ka10081 1페이지 → 최근 count봉 시계열"""
+        data = self._fetch_daily_chart(stock_code)
+        chart_list = data.get('stk_dt_pole_chart_qry', [])
+        return parse_daily_chart(chart_list[:count], stock_code)
+    
+    @staticmethod
+    def _daily_chart_body(stock_code: str) -> Dict[str, str]:
+        return {
             "stk_cd": stock_code,
-            "base_dt": today,
+            "base_dt": datetime.now().strftime("%Y%m%d"),
             "upd_stkpc_tp": "1",  # 수정주가 적용
         }
-        
-        data = self._request(
+    
+    def _fetch_daily_chart(self, stock_code: str) -> Dict[str, Any]:
+        """ka10081 원본 응답 (최신순 1페이지)"""
+        return self._request(
             "POST",
             self.ENDPOINTS['daily_chart'],
             "ka10081",
-            body
+            self._daily_chart_body(stock_code),
         )
+    
+    # ========================================
+    # 증분 일봉 조회 (로컬 OHLCV + 누락분만 API)
+    # ========================================
+    INCREMENTAL_OVERLAP = 3  # 수정주가 불일치 검사용 겹침 봉 수
+    
+    @staticmethod
+    def _target_trading_day() -> date:
+        """목표 거래일 (오늘이 휴장일이면 직전 거래일)"""
+        from src.utils.market_calendar import last_trading_day
+        return last_trading_day(datetime.now().date())
+    
+    def get_daily_prices_warm(
+        self,
+        stock_code: str,
+        count: int = 200,
+    ) -> Optional[PriceSeries]:
+        """당일 과거분 캐시 + ka10001 당일 봉
         
-        prices = []
+        같은 거래일의 이전 실행(12:30 프리뷰 등)이 받아 둔 과거분이 있으면
+        ka10001 1회로 당일 봉만 만들어 붙인다. 기준가가 과거분 마지막 종가와 다르면
+        (수정주가 이벤트) 캐시를 버리고 None을 돌려준다.
+        응답 캐시에 ka10081 페이지가 살아 있으면 그쪽이 호출 0회라 사용하지 않는다.
+        
+        Returns:
+            PriceSeries (시간순), 캐시가 없거나 부족하면 None (호출자가 다른 경로로 조회)
+        """
+        if self._daily_history is None:
+            return None
+        if self._response_cache.contains("ka10081", self._daily_chart_body(stock_code)):
+            return None
+        target = self._target_trading_day()
+        history = self._daily_history.get(stock_code, target, min_bars=count - 1)
+        if history is None:
+            return None
+        today_bar = self._fetch_today_bar(stock_code, target, int(history.close[-1]))
+        if today_bar is None:
+            self._daily_history.invalidate(stock_code)
+            return None
+        return PriceSeries.concat([history, today_bar]).tail(count)
+    
+    def get_daily_prices_incremental(
+        self,
+        stock_code: str,
+        count: int = 200,
+    ) -> Optional[PriceSeries]:
+        """로컬 OHLCV(ohlcv_kiwoom)와 병합한 일봉 조회
+        
+        - 로컬에 직전 거래일까지 있으면: ka10001 1회로 당일 봉만 생성
+          (기준가 ≠ 로컬 마지막 종가면 수정주가 이벤트로 보고 전체 조회)
+        - 여러 거래일이 비어 있으면: ka10081에서 누락 구간만 파싱해 병합
+          (겹침 구간 종가가 다르면 같은 페이지를 전체 파싱)
+        
+        Returns:
+            PriceSeries (시간순, count봉),
+            로컬 데이터가 부족해 count봉을 채우지 못하면 None (호출자가 전체 조회)
+        """
+        from src.adapters.ohlcv_store import load_local_series
+        from src.config.app_config import OHLCV_DIR
+        from src.utils.market_calendar import is_market_open
+        
+        local = load_local_series(stock_code, count + self.INCREMENTAL_OVERLAP, [OHLCV_DIR])
+        if len(local) < max(count - 1, self.INCREMENTAL_OVERLAP + 1):
+            return None
+        
+        target = self._target_trading_day()
+        
+        last_local = local.date_at(-1)
+        if last_local >= target:
+            end = int(np.searchsorted(local.dates, day_number(target), side="right"))
+            series = local[:end].tail(count)
+            return series if len(series) == count else None
+        
+        # 로컬 마지막 날 ~ 목표일 사이 거래일 수
+        missing = 0
+        d = last_local + timedelta(days=1)
+        while d <= target:
+            if is_market_open(d):
+                missing += 1
+            d += timedelta(days=1)
+        
+        if missing == 1:
+            today_bar = self._fetch_today_bar(stock_code, target, int(local.close[-1]))
+            if today_bar is None:
+                return None
+            return PriceSeries.concat([local, today_bar]).tail(count)
+        
+        # 여러 봉 누락 → ka10081 페이지에서 누락분 + 겹침 구간만 파싱
+        data = self._fetch_daily_chart(stock_code)
         chart_list = data.get('stk_dt_pole_chart_qry', [])
+        overlap_from = local.date_at(-self.INCREMENTAL_OVERLAP).strftime('%Y%m%d')
         
-        for item in chart_list[:count]:
-            try:
-                dt_str = item.get('dt', '').strip()
-                if not dt_str:
-                    continue  # 상폐/데이터없는 종목 스킵
-                # 키움 API 필드명: open_pric, high_pric, low_pric, cur_prc
-                prices.append(DailyPrice(
-                    date=datetime.strptime(dt_str, '%Y%m%d').date(),
-                    open=self._parse_int(item.get('open_pric', '0')),
-                    high=self._parse_int(item.get('high_pric', '0')),
-                    low=self._parse_int(item.get('low_pric', '0')),
-                    close=self._parse_int(item.get('cur_prc', '0')),
-                    volume=self._parse_int(item.get('trde_qty', '0')),
-                ))
-            except (ValueError, TypeError) as e:
-                logger.warning(f"일봉 파싱 오류 ({stock_code}): {e}")
-                continue
+        tail_rows = []
+        for item in chart_list:
+            if item.get('dt', '').strip() < overlap_from:
+                break
+            tail_rows.append(item)
+        fetched = parse_daily_chart(tail_rows, stock_code)
         
-        # ka10081은 최신순(역순) 반환 → 시간순(오래된→최신)으로 정렬
-        prices.reverse()
-        return prices
+        local_tail = local.tail(self.INCREMENTAL_OVERLAP)
+        in_overlap = np.isin(fetched.dates, local_tail.dates)
+        local_close = local_tail.close[np.searchsorted(local_tail.dates, fetched.dates[in_overlap])]
+        if not in_overlap.any() or (fetched.close[in_overlap] != local_close).any():
+            logger.info(f"수정주가 불일치 감지 ({stock_code}) → 전체 일봉 사용")
+            return parse_daily_chart(chart_list[:count], stock_code)
+        
+        merged = PriceSeries.concat([
+            local[:int(np.searchsorted(local.dates, fetched.dates[0]))], fetched,
+        ])
+        if len(merged) < count:
+            return None  # 전체 조회는 응답 캐시의 같은 ka10081 페이지를 다시 쓴다
+        return merged.tail(count)
+    
+    def _fetch_today_bar(
+        self,
+        stock_code: str,
+        target: date,
+        prev_close: int,
+    ) -> Optional[PriceSeries]:
+        """ka10001로 당일 봉 1개짜리 시계열 생성 (기준가가 로컬 종가와 다르면 None)"""
+        data = self._request(
+            "POST",
+            self.ENDPOINTS['stock_info'],
+            "ka10001",
+            {"stk_cd": stock_code},
+        )
+        base_price = self._parse_int(data.get('base_pric', '0'))
+        values = [
+            self._parse_int(data.get(key, '0'))
+            for key in ('open_pric', 'high_pric', 'low_pric', 'cur_prc', 'trde_qty')
+        ]
+        if min(values[:4]) <= 0:
+            return None
+        if base_price != prev_close:
+            logger.info(
+                f"수정주가 불일치 감지 ({stock_code}): 기준가 {base_price} ≠ 로컬 종가 {prev_close}"
+            )
+            return None
+        return PriceSeries(
+            np.array([day_number(target)], dtype=np.int64),
+            *(np.array([v], dtype=np.int64) for v in values),
+        )
     
     # ========================================
     # 현재가/기본정보 조회 (ka10001)
@@ -499,6 +1058,28 @@ class KiwoomRestClient:
         - mrkt_tp: 000(??) / 001(???) / 101(???)
         - stex_tp: 1(KRX) / 2(NXT) / 3(??)
         """
+        body = self._volume_profile_body(
+            cycle_tp, prpscnt, cur_prc_entry, prps_cnctr_rt, stex_tp, mrkt_tp, trde_qty_tp,
+        )
+        data = self._request(
+            "POST",
+            settings.vp.endpoint or self.ENDPOINTS['volume_profile'],
+            tr_id,
+            body,
+        )
+
+        return data
+    
+    @staticmethod
+    def _volume_profile_body(
+        cycle_tp: str,
+        prpscnt: str,
+        cur_prc_entry: str,
+        prps_cnctr_rt: str,
+        stex_tp: str,
+        mrkt_tp: str,
+        trde_qty_tp: str,
+    ) -> Dict[str, str]:
         body = {
             "mrkt_tp": mrkt_tp,
             "prps_cnctr_rt": prps_cnctr_rt,
@@ -509,15 +1090,50 @@ class KiwoomRestClient:
         }
         if str(trde_qty_tp).strip():
             body["trde_qty_tp"] = str(trde_qty_tp)
-
-        data = self._request(
-            "POST",
-            settings.vp.endpoint or self.ENDPOINTS['volume_profile'],
-            tr_id,
-            body,
-        )
-
-        return data
+        return body
+    
+    VP_MARKETS = ("001", "101")  # 전체(000) 조회는 코스피/코스닥으로 나눠 동시 연속조회
+    
+    def get_volume_profile_rows(
+        self,
+        cycle_tp: str = "100",
+        prpscnt: str = "10",
+        cur_prc_entry: str = "0",
+        prps_cnctr_rt: str = "70",
+        stex_tp: str = "3",
+        tr_id: str = "ka10025",
+        mrkt_tp: str = "000",
+        trde_qty_tp: str = "",
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """매물대 연속조회 → 종목코드별 행 (ka10025)
+        
+        get_volume_profile은 첫 페이지만 받는다. 이 메서드는 끝까지 연속조회하고,
+        mrkt_tp=000이면 시장별 연속조회를 스레드로 동시에 돌린다
+        (호출 간격은 공용 Rate Limiter가 제한).
+        """
+        endpoint = settings.vp.endpoint or self.ENDPOINTS['volume_profile']
+        markets = self.VP_MARKETS if mrkt_tp == "000" else (mrkt_tp,)
+        
+        def _fetch_market(market: str) -> List[Dict[str, Any]]:
+            body = self._volume_profile_body(
+                cycle_tp, prpscnt, cur_prc_entry, prps_cnctr_rt, stex_tp, market, trde_qty_tp,
+            )
+            rows: List[Dict[str, Any]] = []
+            for page in self.iter_pages(endpoint, tr_id, body, list_key=None):
+                rows.extend(page)
+            return rows
+        
+        rows_by_code: Dict[str, List[Dict[str, Any]]] = {}
+        with ThreadPoolExecutor(max_workers=len(markets), thread_name_prefix="vp") as executor:
+            futures = [submit_with_context(executor, _fetch_market, m) for m in markets]
+            for future in futures:
+                for item in future.result():
+                    if not isinstance(item, dict):
+                        continue
+                    code = str(item.get("stk_cd", "")).strip()
+                    if code:
+                        rows_by_code.setdefault(code, []).append(item)
+        return rows_by_code
     
     # ========================================
     # ???????? ?? (kt00018)
@@ -545,80 +1161,120 @@ class KiwoomRestClient:
         )
 
     # ========================================
-
+    # 연속조회 (cont-yn / next-key)
+    # ========================================
+    PAGE_RETRIES = 1  # 페이지 단위 추가 재시도 (타임아웃/네트워크 오류 등)
+    
+    def iter_pages(
+        self,
+        endpoint: str,
+        tr_id: str,
+        body: Dict[str, Any],
+        list_key: Optional[str],
+        max_pages: Optional[int] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """연속조회 페이지 반복자 (페이지별 행 리스트를 yield)
+        
+        - list_key가 None이면 응답의 첫 번째 비어 있지 않은 리스트를 행으로 사용
+          (문서/버전마다 키 이름이 다른 TR용)
+        - 요청은 _request 공통 경로를 거친다 (Rate Limit, 429/5xx 재시도, Circuit Breaker)
+        - 복구 가능한 오류는 같은 next-key로 PAGE_RETRIES회 더 시도
+        - 호출자가 반복을 멈추면(break) 다음 페이지는 요청하지 않는다
+        - 실패 시 경고만 남기고 종료 (이미 받은 페이지는 유효)
+        """
+        next_key = ""
+        page = 0
+        while max_pages is None or page < max_pages:
+            extra = {"cont-yn": "Y", "next-key": next_key} if next_key else None
+            attempt = 0
+            while True:
+                try:
+                    data, headers = self._request_with_headers(
+                        "POST", endpoint, tr_id, body, extra_headers=extra, use_cache=False,
+                    )
+                    break
+                except ScreenerError as e:
+                    retryable = e.recoverable and e.code != KiwoomErrorCode.CIRCUIT_OPEN
+                    if not retryable or attempt >= self.PAGE_RETRIES:
+                        logger.warning(f"{tr_id} 연속조회 오류 (page {page + 1}): {e}")
+                        return
+                    attempt += 1
+                    time.sleep(self._retry_delay(tr_id, attempt - 1))
+            
+            if list_key is None:
+                rows = next((v for v in data.values() if isinstance(v, list) and v), [])
+            else:
+                rows = data.get(list_key, [])
+            if not rows:
+                return
+            page += 1
+            yield rows
+            
+            # 연속조회 불가능하면 종료
+            if headers.get("cont-yn", "N") != "Y":
+                return
+            next_key = headers.get("next-key", "")
+            if not next_key:
+                return
+    
+    def _collect_rank_rows(
+        self,
+        tr_id: str,
+        body: Dict[str, Any],
+        list_key: str,
+        parse: Callable[[Dict[str, Any], int], Dict[str, Any]],
+        count: int,
+        stop_when: Optional[Callable[[List[Dict[str, Any]]], bool]] = None,
+    ) -> List[Dict[str, Any]]:
+        """랭킹 연속조회 → 파싱된 행 (count개 또는 stop_when 충족 시 중단)"""
+        results: List[Dict[str, Any]] = []
+        for rows in self.iter_pages(self.ENDPOINTS['rank_info'], tr_id, body, list_key):
+            for item in rows:
+                if len(results) >= count:
+                    break
+                results.append(parse(item, len(results) + 1))
+            if len(results) >= count or (stop_when is not None and stop_when(results)):
+                break
+        return results
+    
+    # ========================================
     # 거래대금 상위 조회 (ka10032) - v7.0 연속조회 지원
     # ========================================
     def get_trading_value_rank(
         self, 
         market_type: str = "0",  # 0:전체, 1:코스피, 2:코스닥
-        count: int = 300
+        count: int = 300,
+        stop_when: Optional[Callable[[List[Dict[str, Any]]], bool]] = None,
     ) -> List[Dict[str, Any]]:
         """거래대금 상위 종목 조회 (연속조회로 최대 300개)
         
         Args:
             market_type: 시장구분 (0:전체, 1:코스피, 2:코스닥)
             count: 조회 개수 (최대 300, 100개 단위 페이지네이션)
+            stop_when: 페이지마다 누적 결과로 호출, True면 다음 페이지 생략
             
         Returns:
             종목 정보 리스트 (trde_prica는 백만원 단위)
         """
-        results = []
-        next_key = ""
-        cont_yn = "N"
-        
-        while len(results) < count:
-            # 헤더 설정 (연속조회 시 cont-yn, next-key 추가)
-            headers = self._get_headers("ka10032")
-            if cont_yn == "Y" and next_key:
-                headers["cont-yn"] = "Y"
-                headers["next-key"] = next_key
-            
-            body = {
-                "mrkt_tp": market_type,
-                "mang_stk_incls": "N",
-                "stex_tp": "K",
-                "sort_tp": "1",
+        body = {
+            "mrkt_tp": market_type,
+            "mang_stk_incls": "N",
+            "stex_tp": "K",
+            "sort_tp": "1",
+        }
+        
+        def parse(item: Dict[str, Any], rank: int) -> Dict[str, Any]:
+            return {
+                'code': item.get('stk_cd', '').replace('A', ''),
+                'name': item.get('stk_nm', ''),
+                'current_price': self._parse_int(item.get('cur_prc', '0')),
+                'change_rate': self._parse_float(item.get('flu_rt', '0')),
+                'volume': self._parse_int(item.get('now_trde_qty', '0')),
+                'trading_value': self._parse_int(item.get('trde_prica', '0')),
+                'rank': rank,
             }
-            
-            # 직접 요청 (연속조회 헤더 처리)
-            try:
-                self._wait_for_rate_limit()
-                url = f"{self.base_url}{self.ENDPOINTS['rank_info']}"
-                response = requests.post(url, headers=headers, json=body, timeout=self.REQUEST_TIMEOUT)
-                response.raise_for_status()
-                data = response.json()
-                
-                # 연속조회 정보 추출
-                cont_yn = response.headers.get("cont-yn", "N")
-                next_key = response.headers.get("next-key", "")
-                
-            except Exception as e:
-                logger.warning(f"거래대금 상위 조회 오류: {e}")
-                break
-            
-            rank_list = data.get('trde_prica_upper', [])
-            if not rank_list:
-                break
-            
-            for item in rank_list:
-                if len(results) >= count:
-                    break
-                code = item.get('stk_cd', '').replace('A', '')
-                results.append({
-                    'code': code,
-                    'name': item.get('stk_nm', ''),
-                    'current_price': self._parse_int(item.get('cur_prc', '0')),
-                    'change_rate': self._parse_float(item.get('flu_rt', '0')),
-                    'volume': self._parse_int(item.get('now_trde_qty', '0')),
-                    'trading_value': self._parse_int(item.get('trde_prica', '0')),
-                    'rank': len(results) + 1,
-                })
-            
-            # 연속조회 불가능하면 종료
-            if cont_yn != "Y":
-                break
         
-        return results
+        return self._collect_rank_rows("ka10032", body, 'trde_prica_upper', parse, count, stop_when)
     
     # ========================================
     # 거래량 상위 조회 (ka10030) - v7.0 연속조회 지원
@@ -626,79 +1282,43 @@ class KiwoomRestClient:
     def get_volume_rank(
         self, 
         market_type: str = "0",
-        count: int = 150
+        count: int = 150,
+        stop_when: Optional[Callable[[List[Dict[str, Any]]], bool]] = None,
     ) -> List[Dict[str, Any]]:
         """거래량 상위 종목 조회 (연속조회로 최대 150개)
         
         Args:
             market_type: 시장구분 (0:전체, 1:코스피, 2:코스닥)
             count: 조회 개수 (최대 150, 100개 단위 페이지네이션)
+            stop_when: 페이지마다 누적 결과로 호출, True면 다음 페이지 생략
             
         Returns:
             종목 정보 리스트
         """
-        results = []
-        next_key = ""
-        cont_yn = "N"
-        
-        while len(results) < count:
-            # 헤더 설정 (연속조회 시 cont-yn, next-key 추가)
-            headers = self._get_headers("ka10030")
-            if cont_yn == "Y" and next_key:
-                headers["cont-yn"] = "Y"
-                headers["next-key"] = next_key
-            
-            body = {
-                "mrkt_tp": market_type,
-                "mang_stk_incls": "N",
-                "stex_tp": "K",
-                "sort_tp": "1",
-                "trde_qty_tp": "1",
-                "trde_prica_tp": "1",
-                "crd_tp": "0",
-                "pric_tp": "0",
-                "mrkt_open_tp": "0",
+        body = {
+            "mrkt_tp": market_type,
+            "mang_stk_incls": "N",
+            "stex_tp": "K",
+            "sort_tp": "1",
+            "trde_qty_tp": "1",
+            "trde_prica_tp": "1",
+            "crd_tp": "0",
+            "pric_tp": "0",
+            "mrkt_open_tp": "0",
+        }
+        
+        def parse(item: Dict[str, Any], rank: int) -> Dict[str, Any]:
+            return {
+                'code': item.get('stk_cd', '').replace('A', ''),
+                'name': item.get('stk_nm', ''),
+                'rank': rank,
+                'volume': self._parse_int(item.get('trde_qty', '0')),
+                'current_price': self._parse_int(item.get('cur_prc', '0')),
+                'change_rate': self._parse_float(item.get('flu_rt', '0')),
+                'trading_value': self._parse_int(item.get('trde_prica', '0')),
             }
-            
-            # 직접 요청 (연속조회 헤더 처리)
-            try:
-                self._wait_for_rate_limit()
-                url = f"{self.base_url}{self.ENDPOINTS['rank_info']}"
-                response = requests.post(url, headers=headers, json=body, timeout=self.REQUEST_TIMEOUT)
-                response.raise_for_status()
-                data = response.json()
-                
-                # 연속조회 정보 추출
-                cont_yn = response.headers.get("cont-yn", "N")
-                next_key = response.headers.get("next-key", "")
-                
-            except Exception as e:
-                logger.warning(f"거래량 상위 조회 오류: {e}")
-                break
-            
-            rank_list = data.get('tdy_trde_qty_upper', [])
-            if not rank_list:
-                break
-            
-            for item in rank_list:
-                if len(results) >= count:
-                    break
-                code = item.get('stk_cd', '').replace('A', '')
-                results.append({
-                    'code': code,
-                    'name': item.get('stk_nm', ''),
-                    'rank': len(results) + 1,
-                    'volume': self._parse_int(item.get('trde_qty', '0')),
-                    'current_price': self._parse_int(item.get('cur_prc', '0')),
-                    'change_rate': self._parse_float(item.get('flu_rt', '0')),
-                    'trading_value': self._parse_int(item.get('trde_prica', '0')),
-                })
-            
-            # 연속조회 불가능하면 종료
-            if cont_yn != "Y":
-                break
         
-        return results
+        return self._collect_rank_rows("ka10030", body, 'tdy_trde_qty_upper', parse, count, stop_when)
     
     # ========================================
     # 유니버스 조회 (거래대금 + 거래량 조합)
@@ -709,27 +1329,45 @@ class KiwoomRestClient:
         min_change_rate: float = 1.0,
         max_change_rate: float = 29.0,
         volume_rank_limit: int = 150,
+        target_count: Optional[int] = None,
     ) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
         """유니버스 조회 (TV200 대체) - v8.0 OR 방식
         
         알고리즘:
-        1) ka10032에서 거래대금 상위 300개 조회
-        2) ka10030에서 거래량 상위 150개 조회
+        1) ka10032에서 거래대금 상위 300개 조회 ┐ 동시 조회
+        2) ka10030에서 거래량 상위 150개 조회   ┘ (공용 Rate Limit 예산 안에서)
         3) 합집합(OR)으로 후보 풀 구성 (중복 제거)
         4) 필터링: 등락률 1~29%
         5) 거래대금 desc 정렬
         
+        Args:
+            target_count: 각 랭킹에서 등락률 조건 통과 종목이 이 수 이상이면
+                다음 페이지 생략 (None이면 끝까지 조회)
+        
         Returns:
             (종목 정보 리스트, 코드→이름 딕셔너리)
         """
         logger.info("📊 키움 유니버스 조회 시작")
         
-        # Step 1: 거래대금 상위 300개 조회
-        trading_value_stocks = self.get_trading_value_rank(market_type="0", count=300)
-        logger.info(f"  [Step1] ka10032 거래대금 상위: {len(trading_value_stocks)}개")
+        stop_when = None
+        if target_count:
+            def stop_when(rows: List[Dict[str, Any]]) -> bool:
+                passed = sum(
+                    1 for r in rows if min_change_rate <= r['change_rate'] <= max_change_rate
+                )
+                return passed >= target_count
         
-        # Step 2: 거래량 상위 150개 조회
-        volume_stocks = self.get_volume_rank(market_type="0", count=volume_rank_limit)
+        # Step 1~2: 거래대금 상위 300개 + 거래량 상위 150개 동시 조회
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="rank") as executor:
+            tv_future = submit_with_context(
+                executor, self.get_trading_value_rank, market_type="0", count=300, stop_when=stop_when,
+            )
+            vol_future = submit_with_context(
+                executor, self.get_volume_rank, market_type="0", count=volume_rank_limit, stop_when=stop_when,
+            )
+            trading_value_stocks = tv_future.result()
+            volume_stocks = vol_future.result()
+        logger.info(f"  [Step1] ka10032 거래대금 상위: {len(trading_value_stocks)}개")
         logger.info(f"  [Step2] ka10030 거래량 상위: {len(volume_stocks)}개")
         
         # Step 3: OR 합집합 (거래대금 기준 + 거래량에만 있는 종목 추가)
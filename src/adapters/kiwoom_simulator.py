@@ -0,0 +1,561 @@
+"""
+키움 REST API 로컬 시뮬레이터 (오프라인 부하/지연 벤치마크용)
+
+책임:
+- KiwoomRestClient.ENDPOINTS 경로를 api-id 헤더로 분기해 응답
+  (au10001, ka10081, ka10001, ka10032/ka10030 연속조회, ka10025, ka10040, ka10014)
+- 데이터: OHLCV CSV 디렉토리 또는 시드 고정 합성 시세
+- 지연(latency/jitter), 429/5xx 확률 주입, 서버측 초당 호출 상한(초과 시 429)
+- api-id별 호출/주입 횟수 집계
+
+실서버와 같은 필드명/부호 규칙(+/- 접두, 백만원 단위 거래대금)을 따르되
+값 자체는 벤치마크용이다. 외부 네트워크는 사용하지 않는다.
+
+사용:
+    DASHBOARD_ONLY=true python -m src.adapters.kiwoom_simulator --port 8900 --latency-ms 30
+    → KIWOOM_BASE_URL=http://127.0.0.1:8900
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+from collections import Counter, deque
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.adapters.kiwoom_rest_client import KiwoomRestClient
+from src.adapters.ohlcv_store import find_ohlcv_file, load_tail_bars
+from src.config.settings import settings
+from src.domain.models import DailyPrice
+from src.utils.market_calendar import is_market_open
+
+logger = logging.getLogger(__name__)
+
+CHART_PAGE_SIZE = 600  # ka10081 한 페이지 봉 수 (실서버와 비슷하게)
+BROKER_NAMES = (
+    "키움증권", "미래에셋증권", "NH투자증권", "한국투자증권",
+    "삼성증권", "KB증권", "모건스탠리", "JP모간", "메릴린치", "신한투자증권",
+)
+
+Response = Tuple[int, Dict[str, Any], Dict[str, str]]
+
+
+def _signed(value: float, sign: float) -> str:
+    """키움 부호 규칙 (+/- 접두, 0은 부호 없음)"""
+    if sign > 0:
+        return f"+{value}"
+    if sign < 0:
+        return f"-{value}"
+    return str(value)
+
+
+def _trading_days(end: date, count: int) -> List[date]:
+    """end 이전(포함) 거래일 count개 (오래된 → 최신)"""
+    days: List[date] = []
+    d = end
+    while len(days) < count:
+        if is_market_open(d):
+            days.append(d)
+        d -= timedelta(days=1)
+    return days[::-1]
+
+
+# ============================================================
+# 시세 데이터
+# ============================================================
+class SimulatedMarket:
+    """시뮬레이터 시세 (CSV 또는 합성, 종목별 일봉은 처음 조회할 때 생성)"""
+
+    def __init__(
+        self,
+        universe_size: int = 300,
+        bars: int = 250,
+        seed: int = 7,
+        ohlcv_dir: Optional[Path] = None,
+        end_date: Optional[date] = None,
+    ):
+        self.bars_count = bars
+        self.seed = seed
+        self.ohlcv_dir = Path(ohlcv_dir) if ohlcv_dir else None
+        self.end_date = end_date or date.today()
+        self._bars: Dict[str, List[DailyPrice]] = {}
+        self._lock = threading.Lock()
+
+        if self.ohlcv_dir is not None:
+            stems = sorted(p.stem.lstrip("A") for p in self.ohlcv_dir.glob("*.csv"))
+            self.codes = [c for c in stems if len(c) == 6 and c.isdigit()][:universe_size]
+        else:
+            self.codes = [f"{900000 + i:06d}" for i in range(universe_size)]
+        self.names = {code: f"시뮬{code}" for code in self.codes}
+        self._markets = {code: "001" if i % 2 == 0 else "101" for i, code in enumerate(self.codes)}
+        self._shares = {
+            code: random.Random(f"{seed}:{code}:shares").randint(5, 200) * 1_000_000
+            for code in self.codes
+        }
+
+    def daily_bars(self, code: str) -> List[DailyPrice]:
+        """일봉 (오래된 → 최신), 없는 종목은 빈 리스트"""
+        bars = self._bars.get(code)
+        if bars is not None:
+            return bars
+        if code not in self.names:
+            return []
+        bars = self._load_csv(code) if self.ohlcv_dir is not None else self._generate(code)
+        with self._lock:
+            return self._bars.setdefault(code, bars)
+
+    def _load_csv(self, code: str) -> List[DailyPrice]:
+        path = find_ohlcv_file(code, [self.ohlcv_dir])
+        return load_tail_bars(path, self.bars_count) if path else []
+
+    def _generate(self, code: str) -> List[DailyPrice]:
+        """시드 고정 랜덤워크 (마지막 봉은 -3% ~ +15%로 당일 상승 종목이 많게)"""
+        rng = random.Random(f"{self.seed}:{code}")
+        days = _trading_days(self.end_date, self.bars_count)
+        close = rng.randint(20, 500) * 100
+        bars: List[DailyPrice] = []
+        for i, d in enumerate(days):
+            ret = rng.uniform(-0.03, 0.15) if i == len(days) - 1 else rng.gauss(0.001, 0.025)
+            prev = close
+            close = max(100, int(prev * (1 + ret)))
+            open_ = max(100, int(prev * (1 + rng.gauss(0, 0.01))))
+            high = max(open_, close) + int(prev * abs(rng.gauss(0, 0.01)))
+            low = max(50, min(open_, close) - int(prev * abs(rng.gauss(0, 0.01))))
+            volume = int(rng.lognormvariate(13, 0.8))
+            bars.append(DailyPrice(
+                date=d, open=open_, high=high, low=low, close=close,
+                volume=volume, trading_value=float(close * volume),
+            ))
+        return bars
+
+    def market_of(self, code: str) -> str:
+        """시장 구분 (001 코스피 / 101 코스닥, 유니버스 순서로 번갈아 배정)"""
+        return self._markets.get(code, "001")
+
+    def quote(self, code: str) -> Optional[Dict[str, Any]]:
+        """최신 봉 기준 시세 (등락률은 전일 종가 대비)"""
+        bars = self.daily_bars(code)
+        if len(bars) < 2:
+            return None
+        today, prev = bars[-1], bars[-2]
+        change_rate = round((today.close - prev.close) / prev.close * 100, 2) if prev.close else 0.0
+        return {
+            "code": code,
+            "bar": today,
+            "prev_close": prev.close,
+            "change_rate": change_rate,
+            "trading_value": today.close * today.volume // 1_000_000,  # 백만원
+            "market_cap": today.close * self._shares[code] // 100_000_000,  # 억원
+        }
+
+
+# ============================================================
+# 시뮬레이터 서버
+# ============================================================
+class KiwoomSimulator:
+    """로컬 키움 REST 서버
+
+    with KiwoomSimulator(latency_ms=20, error_429_rate=0.05) as sim:
+        client.base_url = sim.base_url
+    """
+
+    def __init__(
+        self,
+        market: Optional[SimulatedMarket] = None,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_429_rate: float = 0.0,
+        error_5xx_rate: float = 0.0,
+        max_rps: float = 0.0,
+        page_size: int = 100,
+        seed: int = 7,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.market = market or SimulatedMarket(seed=seed)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_429_rate = error_429_rate
+        self.error_5xx_rate = error_5xx_rate
+        self.max_rps = max_rps
+        self.page_size = page_size
+        self.host = host
+        self.port = port
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._recent: deque = deque()
+        self._calls: Counter = Counter()
+        self._injected: Counter = Counter()
+        self._throttled: Counter = Counter()
+        self._bytes = 0
+        self._tokens_issued = 0
+        self._vp_cache: Dict[Tuple[int, int, str], List[Dict[str, Any]]] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+
+        endpoints = KiwoomRestClient.ENDPOINTS
+        self.routes = {
+            "au10001": (endpoints['token'], self._token),
+            "ka10081": (endpoints['daily_chart'], self._daily_chart),
+            "ka10001": (endpoints['stock_info'], self._stock_info),
+            "ka10032": (endpoints['rank_info'], self._trading_value_rank),
+            "ka10030": (endpoints['rank_info'], self._volume_rank),
+            "ka10040": (endpoints['rank_info'], self._daily_brokers),
+            "ka10025": (settings.vp.endpoint or endpoints['volume_profile'], self._volume_profile),
+            "ka10014": (endpoints['short_selling'], self._short_selling),
+        }
+
+    # ========================================
+    # 수명 주기
+    # ========================================
+    @property
+    def base_url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("시뮬레이터가 시작되지 않음")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "KiwoomSimulator":
+        if self._server is not None:
+            return self
+        server = ThreadingHTTPServer((self.host, self.port), _SimHandler)
+        server.daemon_threads = True
+        server.simulator = self
+        threading.Thread(target=server.serve_forever, name="kiwoom-sim", daemon=True).start()
+        self._server = server
+        logger.info(f"키움 시뮬레이터 시작: {self.base_url} (종목 {len(self.market.codes)}개)")
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "KiwoomSimulator":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ========================================
+    # 통계
+    # ========================================
+    def stats(self) -> Dict[str, Any]:
+        """api-id별 호출 수, 주입한 429/5xx, 상한 초과 429, 응답 바이트"""
+        with self._lock:
+            return {
+                "calls": dict(self._calls),
+                "injected": dict(self._injected),
+                "throttled": dict(self._throttled),
+                "bytes": self._bytes,
+                "tokens_issued": self._tokens_issued,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._calls.clear()
+            self._injected.clear()
+            self._throttled.clear()
+            self._bytes = 0
+            self._tokens_issued = 0
+
+    def _record_bytes(self, size: int) -> None:
+        with self._lock:
+            self._bytes += size
+
+    # ========================================
+    # 요청 처리
+    # ========================================
+    def handle(
+        self,
+        path: str,
+        headers: Dict[str, str],
+        body: Dict[str, Any],
+    ) -> Response:
+        """(상태코드, 응답 본문, 응답 헤더)"""
+        api_id = headers.get("api-id", "")
+        with self._lock:
+            self._calls[api_id] += 1
+            throttled = self._over_rate()
+            roll = self._rng.random()
+            jitter = self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0
+        delay = (self.latency_ms + jitter) / 1000.0
+        if delay > 0:
+            time.sleep(delay)
+
+        if throttled:
+            with self._lock:
+                self._throttled[api_id] += 1
+            return 429, {"return_code": 5, "return_msg": "허용된 요청 개수를 초과하였습니다"}, {}
+        if roll < self.error_429_rate:
+            with self._lock:
+                self._injected["429"] += 1
+            return 429, {"return_code": 5, "return_msg": "허용된 요청 개수를 초과하였습니다"}, {}
+        if roll < self.error_429_rate + self.error_5xx_rate:
+            with self._lock:
+                self._injected["5xx"] += 1
+            return 503, {"return_code": 1, "return_msg": "서버 오류 (시뮬레이터 주입)"}, {}
+
+        route = self.routes.get(api_id)
+        if route is None or route[0] != path:
+            return 404, {"return_code": 1, "return_msg": f"지원하지 않는 요청: {api_id} {path}"}, {}
+        if api_id != "au10001" and not headers.get("authorization", "").startswith("Bearer "):
+            return 401, {"return_code": 3, "return_msg": "인증 토큰 없음"}, {}
+        return route[1](body, headers)
+
+    def _over_rate(self) -> bool:
+        """최근 1초 호출이 max_rps 이상이면 True (잠금 안에서 호출)"""
+        if self.max_rps <= 0:
+            return False
+        now = time.monotonic()
+        while self._recent and now - self._recent[0] >= 1.0:
+            self._recent.popleft()
+        if len(self._recent) >= self.max_rps:
+            return True
+        self._recent.append(now)
+        return False
+
+    def _page(self, rows: List[Dict[str, Any]], headers: Dict[str, str], size: int):
+        """연속조회: next-key는 다음 행 오프셋"""
+        start = 0
+        if headers.get("cont-yn") == "Y":
+            try:
+                start = int(headers.get("next-key") or 0)
+            except ValueError:
+                start = 0
+        end = start + size
+        if end < len(rows):
+            return rows[start:end], {"cont-yn": "Y", "next-key": str(end)}
+        return rows[start:end], {"cont-yn": "N", "next-key": ""}
+
+    # ========================================
+    # api-id별 응답
+    # ========================================
+    def _token(self, body: Dict[str, Any], headers: Dict[str, str]) -> Response:
+        if not body.get("appkey") or not body.get("secretkey"):
+            return 200, {"return_code": 1, "return_msg": "appkey/secretkey 누락"}, {}
+        with self._lock:
+            self._tokens_issued += 1
+            token = f"sim-token-{self._tokens_issued}"
+        expires = (datetime.now() + timedelta(days=1)).strftime("%Y%m%d%H%M%S")
+        return 200, {"return_code": 0, "token": token, "token_type": "bearer", "expires_dt": expires}, {}
+
+    def _daily_chart(self, body: Dict[str, Any], headers: Dict[str, str]) -> Response:
+        code = str(body.get("stk_cd", "")).replace("A", "")
+        base_dt = str(body.get("base_dt", ""))
+        rows = [
+            {
+                "dt": p.date.strftime("%Y%m%d"),
+                "cur_prc": str(p.close),
+                "open_pric": str(p.open),
+                "high_pric": str(p.high),
+                "low_pric": str(p.low),
+                "trde_qty": str(p.volume),
+                "trde_prica": str(p.close * p.volume // 1_000_000),
+            }
+            for p in reversed(self.market.daily_bars(code))
+            if not base_dt or p.date.strftime("%Y%m%d") <= base_dt
+        ]
+        page, cont = self._page(rows, headers, CHART_PAGE_SIZE)
+        return 200, {"return_code": 0, "stk_cd": code, "stk_dt_pole_chart_qry": page}, cont
+
+    def _stock_info(self, body: Dict[str, Any], headers: Dict[str, str]) -> Response:
+        code = str(body.get("stk_cd", "")).replace("A", "")
+        q = self.market.quote(code)
+        if q is None:
+            return 200, {"return_code": 1, "return_msg": f"종목 없음: {code}"}, {}
+        bar, sign = q["bar"], q["bar"].close - q["prev_close"]
+        return 200, {
+            "return_code": 0,
+            "stk_cd": code,
+            "stk_nm": self.market.names[code],
+            "cur_prc": _signed(bar.close, sign),
+            "base_pric": str(q["prev_close"]),
+            "open_pric": _signed(bar.open, bar.open - q["prev_close"]),
+            "high_pric": _signed(bar.high, bar.high - q["prev_close"]),
+            "low_pric": _signed(bar.low, bar.low - q["prev_close"]),
+            "flu_rt": _signed(f"{abs(q['change_rate']):.2f}", sign),
+            "trde_qty": str(bar.volume),
+            "mac": str(q["market_cap"]),
+        }, {}
+
+    def _rank_rows(self, sort_key: str) -> List[Dict[str, Any]]:
+        quotes = [q for q in (self.market.quote(c) for c in self.market.codes) if q]
+        quotes.sort(key=lambda q: q["trading_value"] if sort_key == "value" else q["bar"].volume, reverse=True)
+        rows = []
+        for q in quotes:
+            sign = q["bar"].close - q["prev_close"]
+            rows.append({
+                "stk_cd": f"A{q['code']}",
+                "stk_nm": self.market.names[q["code"]],
+                "cur_prc": _signed(q["bar"].close, sign),
+                "flu_rt": _signed(f"{abs(q['change_rate']):.2f}", sign),
+                "now_trde_qty": str(q["bar"].volume),
+                "trde_qty": str(q["bar"].volume),
+                "trde_prica": str(q["trading_value"]),
+            })
+        return rows
+
+    def _trading_value_rank(self, body: Dict[str, Any], headers: Dict[str, str]) -> Response:
+        page, cont = self._page(self._rank_rows("value"), headers, self.page_size)
+        return 200, {"return_code": 0, "trde_prica_upper": page}, cont
+
+    def _volume_rank(self, body: Dict[str, Any], headers: Dict[str, str]) -> Response:
+        page, cont = self._page(self._rank_rows("volume"), headers, self.page_size)
+        return 200, {"return_code": 0, "tdy_trde_qty_upper": page}, cont
+
+    def _daily_brokers(self, body: Dict[str, Any], headers: Dict[str, str]) -> Response:
+        code = str(body.get("stk_cd", "")).replace("A", "")
+        bars = self.market.daily_bars(code)
+        if not bars:
+            return 200, {"return_code": 1, "return_msg": f"종목 없음: {code}"}, {}
+        rng = random.Random(f"{self.market.seed}:{code}:brokers")
+        volume = bars[-1].volume
+        data: Dict[str, Any] = {"return_code": 0}
+        for side in ("buy", "sel"):
+            for i, name in enumerate(rng.sample(BROKER_NAMES, 5), start=1):
+                qty = int(volume * rng.uniform(0.01, 0.15))
+                data[f"{side}_trde_ori_{i}"] = name
+                data[f"{side}_trde_ori_qty_{i}"] = f"+{qty}" if side == "buy" else f"-{qty}"
+        data["frgn_buy_prsm_sum"] = str(int(volume * rng.uniform(0, 0.1)))
+        data["frgn_sel_prsm_sum"] = str(int(volume * rng.uniform(0, 0.1)))
+        return 200, data, {}
+
+    def _volume_profile(self, body: Dict[str, Any], headers: Dict[str, str]) -> Response:
+        """시장 종목의 매물대 (종목별 cycle_tp일 구간을 prpscnt개로 분할, 행 단위 연속조회)"""
+        cycle = int(body.get("cycle_tp") or 100)
+        n_bands = max(1, int(body.get("prpscnt") or 10))
+        market = str(body.get("mrkt_tp") or "000")
+        with self._lock:
+            items = self._vp_cache.get((cycle, n_bands, market))
+        if items is None:
+            items = []
+            for code in self.market.codes:
+                if market in ("000", self.market.market_of(code)):
+                    items.extend(self._bands_for(code, cycle, n_bands))
+            with self._lock:
+                self._vp_cache[(cycle, n_bands, market)] = items
+        page, cont = self._page(items, headers, self.page_size)
+        return 200, {"return_code": 0, "prps_cnctr": page}, cont
+
+    def _bands_for(self, code: str, cycle: int, n_bands: int) -> List[Dict[str, Any]]:
+        bars = self.market.daily_bars(code)[-cycle:]
+        if not bars:
+            return []
+        low = min(p.low for p in bars)
+        high = max(p.high for p in bars)
+        step = max(1, (high - low) // n_bands + 1)
+        volumes = [0] * n_bands
+        for p in bars:
+            idx = min(n_bands - 1, ((p.high + p.low + p.close) // 3 - low) // step)
+            volumes[idx] += p.volume
+        total = sum(volumes) or 1
+        return [
+            {
+                "stk_cd": code,
+                "prps_pric_strt": str(low + i * step),
+                "prps_pric_end": str(low + (i + 1) * step - 1),
+                "prps_qty": str(vol),
+                "prps_rt": f"{vol / total * 100:.2f}",
+            }
+            for i, vol in enumerate(volumes)
+        ]
+
+    def _short_selling(self, body: Dict[str, Any], headers: Dict[str, str]) -> Response:
+        code = str(body.get("stk_cd", "")).replace("A", "")
+        start, end = str(body.get("strt_dt", "")), str(body.get("end_dt", "99999999"))
+        rng = random.Random(f"{self.market.seed}:{code}:short")
+        rows = []
+        cumulative = 0
+        bars = self.market.daily_bars(code)
+        for prev, p in zip(bars, bars[1:]):
+            short_qty = int(p.volume * rng.uniform(0.0, 0.08))
+            cumulative += short_qty
+            dt = p.date.strftime("%Y%m%d")
+            if not (start <= dt <= end):
+                continue
+            change = (p.close - prev.close) / prev.close * 100 if prev.close else 0.0
+            rows.append({
+                "dt": dt,
+                "close_pric": _signed(p.close, p.close - prev.close),
+                "flu_rt": _signed(f"{abs(change):.2f}", change),
+                "trde_qty": str(p.volume),
+                "shrts_qty": str(short_qty),
+                "trde_wght": f"{short_qty / p.volume * 100 if p.volume else 0:.2f}",
+                "ovr_shrts_qty": str(cumulative),
+                "shrts_avg_pric": str(p.close),
+                "shrts_trde_prica": str(short_qty * p.close // 1000),
+            })
+        return 200, {"return_code": 0, "shrts_trnsn": rows[::-1]}, {}
+
+
+class _SimHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 허용 (클라이언트 세션 풀과 같은 조건)
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        raw = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(raw) if raw else {}
+        except ValueError:
+            body = {}
+        headers = {k.lower(): v for k, v in self.headers.items()}
+        sim: KiwoomSimulator = self.server.simulator
+        status, data, extra = sim.handle(self.path, headers, body)
+
+        payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        sim._record_bytes(len(payload))
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in extra.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="키움 REST API 로컬 시뮬레이터")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--universe", type=int, default=300, help="종목 수")
+    parser.add_argument("--ohlcv-dir", type=Path, default=None, help="CSV 디렉토리 (없으면 합성 시세)")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0, help="429 주입 확률 (0~1)")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="5xx 주입 확률 (0~1)")
+    parser.add_argument("--max-rps", type=float, default=0.0, help="초당 호출 상한 (초과 시 429, 0이면 없음)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    market = SimulatedMarket(universe_size=args.universe, seed=args.seed, ohlcv_dir=args.ohlcv_dir)
+    sim = KiwoomSimulator(
+        market, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_429_rate=args.rate_429, error_5xx_rate=args.rate_5xx,
+        max_rps=args.max_rps, seed=args.seed, host=args.host, port=args.port,
+    ).start()
+    print(f"KIWOOM_BASE_URL={sim.base_url}  (Ctrl+C 종료)")
+    try:
+        while True:
+            time.sleep(60)
+            print(json.dumps(sim.stats(), ensure_ascii=False))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sim.stop()
+
+
+if __name__ == "__main__":
+    main()
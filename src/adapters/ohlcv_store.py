@@ -0,0 +1,94 @@
+"""
+로컬 OHLCV 저장소 (ohlcv_kiwoom/*.csv) 읽기
+
+책임:
+- 종목 CSV의 마지막 N봉만 PriceSeries(또는 DailyPrice 리스트)로 로드 (pandas 미사용, 꼬리만 파싱)
+- 컬럼명 대소문자/날짜 형식(YYYY-MM-DD, YYYYMMDD, 시각 포함) 차이 흡수
+"""
+
+import csv
+import logging
+from collections import deque
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from src.domain.models import DailyPrice
+from src.domain.price_series import PriceSeries, day_number
+
+logger = logging.getLogger(__name__)
+
+_REQUIRED = ("date", "open", "high", "low", "close", "volume")
+
+
+def _parse_date(value: str) -> date:
+    value = value.strip()
+    if len(value) >= 10 and value[4] == "-":
+        return date.fromisoformat(value[:10])
+    return datetime.strptime(value[:8], "%Y%m%d").date()
+
+
+def _to_int(value: str) -> int:
+    return int(float(value.replace(",", "").strip() or 0))
+
+
+def find_ohlcv_file(stock_code: str, dirs: Iterable[Path]) -> Optional[Path]:
+    """종목 CSV 경로 (없으면 None)"""
+    for base in dirs:
+        if not base:
+            continue
+        for name in (f"{stock_code}.csv", f"A{stock_code}.csv"):
+            path = Path(base) / name
+            if path.exists():
+                return path
+    return None
+
+
+def load_tail_series(path: Path, count: int) -> PriceSeries:
+    """CSV 마지막 count봉 로드 → 시계열 (오래된 → 최신, 행마다 DailyPrice를 만들지 않음)"""
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return PriceSeries.empty()
+        columns = [h.strip().lower() for h in header]
+        if columns and columns[0] in ("", "unnamed: 0"):
+            columns[0] = "date"
+        try:
+            idx = [columns.index(name) for name in _REQUIRED]
+        except ValueError:
+            logger.debug(f"OHLCV 컬럼 누락: {path.name} {columns}")
+            return PriceSeries.empty()
+        tail = deque(reader, maxlen=max(1, count))
+
+    values: List[List[int]] = [[] for _ in _REQUIRED]
+    for row in tail:
+        try:
+            d, o, h, l, c, v = (row[i] for i in idx)
+            parsed = (day_number(_parse_date(d)), _to_int(o), _to_int(h), _to_int(l), _to_int(c), _to_int(v))
+        except (ValueError, IndexError):
+            continue
+        for column, value in zip(values, parsed):
+            column.append(value)
+    arrays = [np.array(column, dtype=np.int64) for column in values]
+    order = np.argsort(arrays[0], kind="stable")
+    return PriceSeries(*(a[order] for a in arrays))
+
+
+def load_tail_bars(path: Path, count: int) -> List[DailyPrice]:
+    """CSV 마지막 count봉 로드 (오래된 → 최신)"""
+    return load_tail_series(path, count).to_daily_prices()
+
+
+def load_local_series(stock_code: str, count: int, dirs: Iterable[Path]) -> PriceSeries:
+    """로컬 저장소에서 마지막 count봉 로드 (파일 없거나 실패 시 빈 시계열)"""
+    path = find_ohlcv_file(stock_code, dirs)
+    if path is None:
+        return PriceSeries.empty()
+    try:
+        return load_tail_series(path, count)
+    except Exception as e:
+        logger.debug(f"로컬 OHLCV 로드 실패 ({stock_code}): {e}")
+        return PriceSeries.empty()
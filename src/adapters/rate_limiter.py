@@ -0,0 +1,429 @@
+"""
+키움 API Rate Limiter (토큰 버킷)
+
+책임:
+- 전역 토큰 버킷 (초당 N회 + 버스트 허용)
+- api-id(tr_id)별 하위 예산 (전역 예산과 동시에 차감)
+- 스레드/asyncio 양쪽에서 안전한 대기
+- (선택) 호스트 공용 버킷: 같은 PC의 다른 프로세스와 예산 공유 (host_rate.py)
+- 요청 우선순위 (critical > normal > background): 상위 등급이 대기 중이면
+  하위 등급은 토큰을 가져가지 않고 양보한다. 등급별 대기시간 통계 제공.
+
+사용:
+    limiter = get_rate_limiter()
+    limiter.acquire("ka10081")            # 동기 (ThreadPoolExecutor 포함)
+    await limiter.acquire_async("ka10081")  # asyncio
+
+    with request_priority("background"):  # 이 범위의 키움 호출은 후순위
+        enrich_top5(...)
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from src.config.settings import settings
+from src.adapters.host_rate import HostTokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# 요청 우선순위
+# ============================================================
+PRIORITY_CRITICAL = 0     # 스크리닝/눌림목 스캔 (알림 마감 직결)
+PRIORITY_NORMAL = 1       # 기본값
+PRIORITY_BACKGROUND = 2   # Enrichment/공매도/데이터 갱신 등
+
+PRIORITY_NAMES = {
+    PRIORITY_CRITICAL: "critical",
+    PRIORITY_NORMAL: "normal",
+    PRIORITY_BACKGROUND: "background",
+}
+_PRIORITY_BY_NAME = {name: level for level, name in PRIORITY_NAMES.items()}
+
+_current_priority: contextvars.ContextVar[int] = contextvars.ContextVar(
+    "kiwoom_request_priority", default=PRIORITY_NORMAL,
+)
+
+
+def parse_priority(priority: Union[int, str]) -> int:
+    """'critical' / 0 → 0"""
+    if isinstance(priority, str):
+        try:
+            return _PRIORITY_BY_NAME[priority.strip().lower()]
+        except KeyError:
+            raise ValueError(f"알 수 없는 우선순위: {priority}") from None
+    if priority not in PRIORITY_NAMES:
+        raise ValueError(f"알 수 없는 우선순위: {priority}")
+    return int(priority)
+
+
+def current_priority() -> int:
+    """현재 컨텍스트의 요청 우선순위"""
+    return _current_priority.get()
+
+
+@contextmanager
+def request_priority(priority: Union[int, str]) -> Iterator[int]:
+    """범위 안의 키움 호출 우선순위 지정 (중첩 시 안쪽이 우선)"""
+    token = _current_priority.set(parse_priority(priority))
+    try:
+        yield _current_priority.get()
+    finally:
+        _current_priority.reset(token)
+
+
+def with_priority(priority: Union[int, str]) -> Callable[[Callable], Callable]:
+    """함수 전체를 request_priority 범위로 감싸는 데코레이터"""
+    level = parse_priority(priority)
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with request_priority(level):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def submit_with_context(executor: Executor, fn: Callable, *args, **kwargs) -> Future:
+    """executor.submit + 현재 컨텍스트(우선순위/시간 예산) 전달
+
+    ThreadPoolExecutor 작업 스레드는 contextvars를 물려받지 않으므로
+    풀 안의 키움 호출이 우선순위와 시간 예산(deadline_scope)을 잃지 않도록
+    컨텍스트를 복사해 실행한다.
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+# ============================================================
+# 토큰 버킷
+# ============================================================
+class TokenBucket:
+    """토큰 버킷 (잠금은 호출자가 담당)
+
+    - rate: 초당 충전 토큰 수
+    - capacity: 최대 적립 토큰 수 (버스트 크기)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(capacity))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """tokens 만큼 차감하려면 기다려야 하는 시간 (초, 0이면 즉시 가능)"""
+        self._refill()
+        if self._tokens >= tokens:
+            return 0.0
+        return (tokens - self._tokens) / self.rate
+
+    def consume(self, tokens: float = 1.0) -> None:
+        """토큰 차감 (wait_time() == 0 확인 후 호출)"""
+        self._tokens -= tokens
+
+    def set_rate(self, rate: float) -> None:
+        """충전 속도 변경 (적립된 토큰은 유지)"""
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+        self._refill()
+        self.rate = float(rate)
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+
+# ============================================================
+# Rate Limiter (전역 + api-id별)
+# ============================================================
+class RateLimiter:
+    """전역 버킷 + api-id별 하위 버킷
+
+    한 번의 acquire()는 전역 버킷과 해당 api-id 버킷을 함께 차감한다.
+    두 버킷 모두 여유가 있을 때만 차감하므로 한쪽만 소모되는 일은 없다.
+    잠금은 계산 구간에서만 잡고, 대기(sleep)는 잠금 밖에서 수행한다.
+
+    우선순위: 더 높은 등급의 대기자가 있으면 하위 등급은 토큰이 있어도
+    차감하지 않고 다시 기다린다 (적립된 토큰은 상위 등급 몫).
+
+    shared(호스트 공용 버킷)가 있으면 로컬 버킷에 여유가 있을 때만 공용 버킷을
+    차감하고, 공용 버킷이 비어 있으면 로컬 토큰도 쓰지 않는다.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1.0,
+        api_limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        shared: Optional[HostTokenBucket] = None,
+    ):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._global = TokenBucket(rate, burst, clock)
+        self._shared = shared
+        self._api_buckets: Dict[str, TokenBucket] = {}
+        for api_id, (api_rate, api_burst) in (api_limits or {}).items():
+            self._api_buckets[api_id] = TokenBucket(api_rate, api_burst, clock)
+        # 등급별 대기자 수 / 대기시간 통계 [횟수, 합계(초), 최대(초)]
+        self._waiting: List[int] = [0] * len(PRIORITY_NAMES)
+        self._wait_stats: List[List[float]] = [[0, 0.0, 0.0] for _ in PRIORITY_NAMES]
+
+    @property
+    def rate(self) -> float:
+        return self._global.rate
+
+    def _try_acquire(self, api_id: str, tokens: float, priority: int = PRIORITY_NORMAL) -> float:
+        """즉시 차감 시도. 성공하면 0, 실패하면 필요한 대기시간 반환"""
+        with self._lock:
+            if any(self._waiting[:priority]):
+                # 상위 등급 대기 중 → 토큰 1개 충전 시간만큼 양보
+                return max(self._global.wait_time(tokens), 1.0 / self._global.rate)
+
+            buckets = [self._global]
+            sub = self._api_buckets.get(api_id)
+            if sub is not None:
+                buckets.append(sub)
+
+            wait = max(b.wait_time(tokens) for b in buckets)
+            if wait <= 0 and self._shared is not None:
+                wait = self._take_shared(tokens)
+            if wait <= 0:
+                for b in buckets:
+                    b.consume(tokens)
+            return wait
+
+    def _take_shared(self, tokens: float) -> float:
+        """호스트 공용 버킷 차감 (파일 오류 시 로컬 버킷만 사용)"""
+        try:
+            return self._shared.take(tokens)
+        except OSError as e:
+            logger.warning(f"호스트 공용 Rate 버킷 사용 중단 (로컬 버킷만 사용): {e}")
+            self._shared = None
+            return 0.0
+
+    def try_acquire(
+        self,
+        api_id: str = "",
+        tokens: float = 1.0,
+        priority: Optional[Union[int, str]] = None,
+    ) -> bool:
+        """대기 없이 차감 시도"""
+        level = current_priority() if priority is None else parse_priority(priority)
+        return self._try_acquire(api_id, tokens, level) <= 0
+
+    def _set_waiting(self, priority: int, delta: int) -> None:
+        with self._lock:
+            self._waiting[priority] += delta
+
+    def _record_wait(self, priority: int, waited: float) -> None:
+        with self._lock:
+            stats = self._wait_stats[priority]
+            stats[0] += 1
+            stats[1] += waited
+            stats[2] = max(stats[2], waited)
+
+    def acquire(
+        self,
+        api_id: str = "",
+        tokens: float = 1.0,
+        timeout: Optional[float] = None,
+        priority: Optional[Union[int, str]] = None,
+    ) -> bool:
+        """토큰 획득까지 블로킹 대기
+
+        Args:
+            priority: 요청 등급 (None이면 request_priority() 컨텍스트 값)
+
+        Returns:
+            획득 성공 여부 (timeout 초과 시 False)
+        """
+        level = current_priority() if priority is None else parse_priority(priority)
+        started = self._clock()
+        deadline = None if timeout is None else started + timeout
+        wait = self._try_acquire(api_id, tokens, level)
+        if wait <= 0:
+            self._record_wait(level, 0.0)
+            return True
+
+        self._set_waiting(level, 1)
+        try:
+            while True:
+                if deadline is not None:
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        return False
+                    wait = min(wait, remaining)
+                time.sleep(wait)
+                wait = self._try_acquire(api_id, tokens, level)
+                if wait <= 0:
+                    self._record_wait(level, self._clock() - started)
+                    return True
+        finally:
+            self._set_waiting(level, -1)
+
+    async def acquire_async(
+        self,
+        api_id: str = "",
+        tokens: float = 1.0,
+        timeout: Optional[float] = None,
+        priority: Optional[Union[int, str]] = None,
+    ) -> bool:
+        """토큰 획득까지 비동기 대기 (이벤트 루프를 막지 않음)"""
+        level = current_priority() if priority is None else parse_priority(priority)
+        started = self._clock()
+        deadline = None if timeout is None else started + timeout
+        wait = self._try_acquire(api_id, tokens, level)
+        if wait <= 0:
+            self._record_wait(level, 0.0)
+            return True
+
+        self._set_waiting(level, 1)
+        try:
+            while True:
+                if deadline is not None:
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        return False
+                    wait = min(wait, remaining)
+                await asyncio.sleep(wait)
+                wait = self._try_acquire(api_id, tokens, level)
+                if wait <= 0:
+                    self._record_wait(level, self._clock() - started)
+                    return True
+        finally:
+            self._set_waiting(level, -1)
+
+    def set_rate(self, rate: float) -> None:
+        """전역 충전 속도 변경"""
+        with self._lock:
+            self._global.set_rate(rate)
+            shared = self._shared
+        if shared is not None:
+            try:
+                shared.set_rate(rate)
+            except OSError as e:
+                logger.debug(f"호스트 공용 Rate 갱신 실패: {e}")
+
+    def set_api_limit(self, api_id: str, rate: float, burst: float = 1.0) -> None:
+        """api-id별 하위 예산 설정/변경"""
+        with self._lock:
+            bucket = self._api_buckets.get(api_id)
+            if bucket is None:
+                self._api_buckets[api_id] = TokenBucket(rate, burst, self._clock)
+            else:
+                bucket.set_rate(rate)
+                bucket.capacity = max(1.0, float(burst))
+
+    def snapshot(self) -> Dict[str, float]:
+        """현재 설정 요약 (로그/헬스체크용)"""
+        with self._lock:
+            data = {"global": self._global.rate}
+            for api_id, bucket in self._api_buckets.items():
+                data[api_id] = bucket.rate
+            return data
+
+    # ========================================
+    # 등급별 대기시간 통계
+    # ========================================
+    def wait_stats(self) -> Dict[str, Dict[str, float]]:
+        """{'critical': {'count', 'avg_ms', 'max_ms', 'waiting'}, ...}"""
+        with self._lock:
+            result = {}
+            for level, name in PRIORITY_NAMES.items():
+                count, total, peak = self._wait_stats[level]
+                result[name] = {
+                    "count": int(count),
+                    "avg_ms": round(total / count * 1000, 1) if count else 0.0,
+                    "max_ms": round(peak * 1000, 1),
+                    "waiting": self._waiting[level],
+                }
+            return result
+
+    def format_wait_stats(self) -> str:
+        """로그용 요약: 'critical 120회 평균 3ms/최대 40ms | ...'"""
+        parts = [
+            f"{name} {s['count']}회 평균 {s['avg_ms']:.0f}ms/최대 {s['max_ms']:.0f}ms"
+            for name, s in self.wait_stats().items()
+            if s["count"]
+        ]
+        return " | ".join(parts) if parts else "호출 없음"
+
+    def reset_wait_stats(self) -> None:
+        with self._lock:
+            self._wait_stats = [[0, 0.0, 0.0] for _ in PRIORITY_NAMES]
+
+
+# ============================================================
+# 설정 파싱 / 싱글톤
+# ============================================================
+def parse_api_limits(spec: str) -> Dict[str, Tuple[float, float]]:
+    """'ka10081:5/2,ka10001:4' → {'ka10081': (5.0, 2.0), 'ka10001': (4.0, 1.0)}"""
+    limits: Dict[str, Tuple[float, float]] = {}
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part or ":" not in part:
+            continue
+        api_id, value = part.split(":", 1)
+        try:
+            if "/" in value:
+                rate_str, burst_str = value.split("/", 1)
+                limits[api_id.strip()] = (float(rate_str), float(burst_str))
+            else:
+                limits[api_id.strip()] = (float(value), 1.0)
+        except ValueError:
+            logger.warning(f"api-id별 Rate Limit 설정 무시: {part}")
+    return limits
+
+
+_limiter_instance: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """프로세스 공용 키움 Rate Limiter (모든 KiwoomRestClient가 공유)"""
+    global _limiter_instance
+    if _limiter_instance is None:
+        with _limiter_lock:
+            if _limiter_instance is None:
+                cfg = settings.kiwoom
+                shared = None
+                if cfg.host_rate_limit:
+                    # 상한: 지정값, 없으면 설정 속도 (적응형이 더 올려도 호스트 합계는 이 값 이내)
+                    host_max = cfg.host_rate_per_sec or cfg.rate_per_sec
+                    shared = HostTokenBucket(max_rate=host_max, burst=cfg.rate_burst)
+                _limiter_instance = RateLimiter(
+                    rate=cfg.rate_per_sec,
+                    burst=cfg.rate_burst,
+                    api_limits=parse_api_limits(cfg.api_rate_limits),
+                    shared=shared,
+                )
+                logger.debug(
+                    f"Rate Limiter 초기화: {cfg.rate_per_sec:.1f}회/초, 버스트 {cfg.rate_burst}"
+                )
+    return _limiter_instance
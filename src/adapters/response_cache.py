@@ -0,0 +1,177 @@
+"""
+키움 API 응답 캐시 (프로세스 공용 TTL + LRU)
+
+책임:
+- (tr_id, 정규화된 body) 키로 원본 응답(dict) 캐시
+- tr_id별 TTL (설정에 없는 tr_id는 캐시하지 않음)
+- 최대 항목 수 초과 시 LRU 제거
+- tr_id별 hit/miss/evict 카운터
+
+참고:
+- ka10081 요청 body에는 조회 개수가 없으므로(응답 페이지를 받아 잘라 씀)
+  30봉 요청과 120봉 요청이 같은 키를 공유한다. 즉, 120봉 조회 후의
+  30봉 조회는 캐시된 페이지에서 바로 응답된다.
+- 캐시된 응답은 읽기 전용으로 취급한다 (호출자는 수정하지 말 것).
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheCounter:
+    """tr_id별 캐시 통계"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """TTL + LRU 응답 캐시 (스레드 안전)"""
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 2000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttls: Dict[str, float] = dict(ttls or {})
+        self.max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key → (expires_at, value)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._counters: Dict[str, CacheCounter] = {}
+
+    @staticmethod
+    def make_key(tr_id: str, body: Optional[Dict]) -> Tuple[str, str]:
+        """(tr_id, 정규화된 body) 키"""
+        normalized = json.dumps(body or {}, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return (tr_id, normalized)
+
+    def is_cacheable(self, tr_id: str) -> bool:
+        return self.ttls.get(tr_id, 0) > 0
+
+    def _counter(self, tr_id: str) -> CacheCounter:
+        counter = self._counters.get(tr_id)
+        if counter is None:
+            counter = self._counters[tr_id] = CacheCounter()
+        return counter
+
+    def get(self, tr_id: str, body: Optional[Dict]) -> Optional[Any]:
+        """캐시 조회 (없거나 만료면 None)"""
+        if not self.is_cacheable(tr_id):
+            return None
+        key = self.make_key(tr_id, body)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self._counter(tr_id).hits += 1
+                    return value
+                del self._entries[key]
+            self._counter(tr_id).misses += 1
+            return None
+
+    def contains(self, tr_id: str, body: Optional[Dict]) -> bool:
+        """만료되지 않은 항목이 있는지 (카운터/LRU 순서는 건드리지 않음)"""
+        if not self.is_cacheable(tr_id):
+            return False
+        with self._lock:
+            entry = self._entries.get(self.make_key(tr_id, body))
+            return entry is not None and entry[0] > self._clock()
+
+    def put(self, tr_id: str, body: Optional[Dict], value: Any) -> None:
+        """캐시 저장 (TTL 미설정 tr_id는 무시)"""
+        ttl = self.ttls.get(tr_id, 0)
+        if ttl <= 0:
+            return
+        key = self.make_key(tr_id, body)
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                old_key, _ = self._entries.popitem(last=False)
+                self._counter(old_key[0]).evictions += 1
+
+    def invalidate(self, tr_id: Optional[str] = None) -> None:
+        """전체 또는 tr_id 단위 무효화"""
+        with self._lock:
+            if tr_id is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] == tr_id]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """tr_id별 통계"""
+        with self._lock:
+            return {
+                tr_id: {
+                    "hits": c.hits,
+                    "misses": c.misses,
+                    "evictions": c.evictions,
+                    "hit_ratio": round(c.hit_ratio, 3),
+                }
+                for tr_id, c in self._counters.items()
+            }
+
+    def format_stats(self) -> str:
+        """로그용 한 줄 요약"""
+        parts = [
+            f"{tr_id} {s['hits']}/{s['hits'] + s['misses']} ({s['hit_ratio']:.0%})"
+            for tr_id, s in sorted(self.stats().items())
+        ]
+        return ", ".join(parts) if parts else "기록 없음"
+
+
+def parse_ttls(spec: str) -> Dict[str, float]:
+    """'ka10081:120,ka10001:10' → {'ka10081': 120.0, 'ka10001': 10.0}"""
+    ttls: Dict[str, float] = {}
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if ":" not in part:
+            continue
+        tr_id, ttl = part.split(":", 1)
+        try:
+            ttls[tr_id.strip()] = float(ttl)
+        except ValueError:
+            logger.warning(f"캐시 TTL 설정 무시: {part}")
+    return ttls
+
+
+_cache_instance: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """프로세스 공용 응답 캐시"""
+    global _cache_instance
+    if _cache_instance is None:
+        with _cache_lock:
+            if _cache_instance is None:
+                cfg = settings.kiwoom
+                _cache_instance = ResponseCache(
+                    ttls=parse_ttls(cfg.cache_ttls),
+                    max_entries=cfg.cache_max_entries,
+                )
+    return _cache_instance
@@ -0,0 +1,337 @@
+"""
+실행별 원본 입력 스냅샷 (오프라인 재채점용)
+
+책임:
+- 스크리닝 1회가 점수 계산에 쓴 입력을 그대로 보관
+  (수집된 StockData 일봉/현재가/거래대금, 랭킹 시세 payload, 거래원 anomaly, ka10025 매물대 행)
+- 일봉은 날짜 기준 BLOCK_DAYS일 블록으로 나눠 내용 해시(sha256) 객체로 저장
+  → 같은 블록(프리뷰/메인, 전날 실행의 과거분)은 한 번만 저장
+- 실행마다 runs/<run_id>.json.gz 매니페스트 1개 (객체 해시 + 기록된 결과)
+  한 번 쓴 매니페스트/객체는 덮어쓰지 않는다
+- 저장 때 KEEP_DAYS보다 오래된 실행 삭제 + 남은 매니페스트가 참조하지 않는 객체 삭제
+
+data/run_snapshots/ (DB_PATH와 같은 폴더)
+    objects/ab/cdef...   zlib 압축 객체 (파일명 = 원본 바이트 sha256)
+    runs/<run_id>.json.gz
+
+재채점/비교는 src.services.replay_service가 한다.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from dataclasses import asdict, dataclass, field, is_dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from src.config.settings import settings
+from src.domain.models import StockData
+from src.domain.price_series import PRICE_COLUMNS, PriceSeries
+from src.domain.strategy_scoring import SCORE_FIELDS
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+BLOCK_DAYS = 16  # 일봉 블록 크기 (1970-01-01 기준 일수로 정렬 → 실행이 달라도 경계가 같음)
+
+_INT_COLUMNS = ("dates",) + PRICE_COLUMNS
+
+
+def _encode_block(series: PriceSeries) -> bytes:
+    """시계열 블록 → 결정적 바이트 (봉 수 + int64 6열 + float64 거래대금, little-endian)"""
+    parts = [np.array([len(series)], dtype="<i8").tobytes()]
+    for name in _INT_COLUMNS:
+        parts.append(np.ascontiguousarray(getattr(series, name), dtype="<i8").tobytes())
+    parts.append(np.ascontiguousarray(series.trading_value, dtype="<f8").tobytes())
+    return b"".join(parts)
+
+
+def _decode_block(data: bytes) -> List[np.ndarray]:
+    n = int(np.frombuffer(data, dtype="<i8", count=1)[0])
+    ints = np.frombuffer(data, dtype="<i8", count=len(_INT_COLUMNS) * n, offset=8)
+    ints = ints.reshape(len(_INT_COLUMNS), n)
+    trading_value = np.frombuffer(data, dtype="<f8", count=n, offset=8 + ints.nbytes)
+    return [ints[i] for i in range(len(_INT_COLUMNS))] + [trading_value]
+
+
+def _canonical_json(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def score_records(scores: Sequence) -> List[Dict]:
+    """최종 순위의 StockScoreV5 목록 → 기록용 dict (순위/총점/항목 점수/거래원/매물대 표시값)"""
+    records = []
+    for score in scores:
+        detail = score.score_detail
+        records.append({
+            "code": score.stock_code,
+            "name": score.stock_name,
+            "rank": score.rank,
+            "total": score.score_total,
+            "trading_value": score.trading_value,
+            "scores": {name: getattr(detail, name) for name in SCORE_FIELDS},
+            "broker_anomaly": detail.raw_broker_anomaly,
+            "vp": {
+                "score": detail.raw_vp_score,
+                "above_pct": detail.raw_vp_above_pct,
+                "below_pct": detail.raw_vp_below_pct,
+                "tag": detail.raw_vp_tag,
+                "meta": getattr(detail, "raw_vp_meta", ""),  # 동적 속성 (매물대 단계에서 설정)
+            },
+        })
+    return records
+
+
+@dataclass
+class RunSnapshot:
+    """스크리닝 1회의 점수 입력 + 기록된 결과"""
+    run_id: str
+    run_type: str                       # main / preview
+    screen_date: date
+    universe: List[str]                 # 유니버스 종목코드 (동점 순서 기준)
+    stocks: List[StockData]             # 수집 통과 종목 (점수 계산 입력)
+    quotes: Dict[str, Dict] = field(default_factory=dict)        # 랭킹 API 시세 payload
+    broker_applied: bool = False        # 거래원 점수 반영 여부 (프리뷰/생략 시 False)
+    broker_anomaly: Dict[str, int] = field(default_factory=dict)  # 이상감지 종목 anomaly_score
+    vp_rows: Dict[str, List[Dict]] = field(default_factory=dict)  # 키움 매물대(ka10025) 종목 행
+    results: List[Dict] = field(default_factory=list)            # score_records (최종 순위)
+    config: Dict[str, Any] = field(default_factory=dict)         # top_n/vectorized/vp 조건 등
+
+
+class RunSnapshotStore:
+    """내용 주소 객체 + 실행별 매니페스트 저장소"""
+
+    SNAPSHOT_DIR = settings.database.path.parent / "run_snapshots"
+    KEEP_DAYS = 30        # run_id 날짜가 이보다 오래된 실행은 저장 때 삭제
+    OBJECT_GRACE_SEC = 3600  # 최근에 쓰거나 재사용한 객체는 참조가 없어도 보존 (다른 프로세스 저장 중)
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root is not None else self.SNAPSHOT_DIR
+        self._lock = threading.Lock()
+        self.objects_written = 0
+        self.objects_reused = 0
+        self.bytes_written = 0
+
+    # ---------------- 객체 ----------------
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / digest[2:]
+
+    def put_object(self, data: bytes) -> str:
+        """바이트 저장 (이미 있으면 재사용) → sha256 hex"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if path.exists():
+            try:
+                os.utime(path)  # 재사용 표시 → 정리 유예 (OBJECT_GRACE_SEC)
+            except OSError:
+                pass
+            with self._lock:
+                self.objects_reused += 1
+            return digest
+        packed = zlib.compress(data, 6)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(packed)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self.objects_written += 1
+            self.bytes_written += len(packed)
+        return digest
+
+    def get_object(self, digest: str) -> bytes:
+        with open(self._object_path(digest), "rb") as f:
+            data = zlib.decompress(f.read())
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"스냅샷 객체 손상: {digest}")
+        return data
+
+    def put_series(self, series: PriceSeries) -> List[str]:
+        """일봉 시계열 → BLOCK_DAYS일 블록 객체 해시 목록 (시간순)"""
+        if len(series) == 0:
+            return []
+        block_ids = np.asarray(series.dates) // BLOCK_DAYS
+        bounds = [0] + (np.flatnonzero(np.diff(block_ids)) + 1).tolist() + [len(series)]
+        return [
+            self.put_object(_encode_block(series[start:end]))
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ]
+
+    def get_series(self, digests: Sequence[str]) -> PriceSeries:
+        if not digests:
+            return PriceSeries.empty()
+        blocks = [_decode_block(self.get_object(d)) for d in digests]
+        return PriceSeries(*(np.concatenate(columns) for columns in zip(*blocks)))
+
+    def put_json(self, obj: Any) -> str:
+        return self.put_object(_canonical_json(obj))
+
+    def get_json(self, digest: str) -> Any:
+        return json.loads(self.get_object(digest).decode("utf-8"))
+
+    # ---------------- 실행 ----------------
+
+    def _run_path(self, run_id: str) -> Path:
+        return self.root / "runs" / f"{run_id}.json.gz"
+
+    def save(self, snapshot: RunSnapshot) -> Dict[str, int]:
+        """스냅샷 저장 (같은 run_id가 이미 있으면 FileExistsError) + 오래된 실행 정리
+
+        Returns:
+            {"stocks", "objects_written", "objects_reused", "bytes_written",
+             "runs_pruned", "objects_pruned"} - 이번 저장분
+        """
+        path = self._run_path(snapshot.run_id)
+        if path.exists():
+            raise FileExistsError(f"스냅샷이 이미 있음: {snapshot.run_id}")
+        before = (self.objects_written, self.objects_reused, self.bytes_written)
+
+        stocks = [
+            {
+                "code": stock.code,
+                "name": stock.name,
+                "current_price": stock.current_price,
+                "trading_value": stock.trading_value,
+                "market_cap": stock.market_cap,
+                "blocks": self.put_series(stock.price_series),
+            }
+            for stock in snapshot.stocks
+        ]
+        manifest = {
+            "version": SNAPSHOT_VERSION,
+            "run_id": snapshot.run_id,
+            "run_type": snapshot.run_type,
+            "screen_date": snapshot.screen_date.isoformat(),
+            "config": snapshot.config,
+            "universe": snapshot.universe,
+            "stocks": stocks,
+            "quotes": {
+                code: asdict(quote) if is_dataclass(quote) else quote
+                for code, quote in snapshot.quotes.items()
+            },
+            "broker": {"applied": snapshot.broker_applied, "anomaly": snapshot.broker_anomaly},
+            "vp_rows": {code: self.put_json(rows) for code, rows in snapshot.vp_rows.items()},
+            "results": snapshot.results,
+        }
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = gzip.compress(_canonical_json(manifest), 6)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self.bytes_written += len(data)
+        stats = {
+            "stocks": len(stocks),
+            "objects_written": self.objects_written - before[0],
+            "objects_reused": self.objects_reused - before[1],
+            "bytes_written": self.bytes_written - before[2],
+        }
+        stats["runs_pruned"], stats["objects_pruned"] = self._prune(snapshot.screen_date)
+        return stats
+
+    def _read_manifest(self, run_id: str) -> Dict:
+        with gzip.open(self._run_path(run_id), "rb") as f:
+            return json.loads(f.read().decode("utf-8"))
+
+    def _prune(self, day: date) -> Tuple[int, int]:
+        """day - KEEP_DAYS 이전 실행 삭제 → 남은 실행이 참조하지 않는 객체 삭제
+
+        Returns:
+            (삭제한 실행 수, 삭제한 객체 수) - 삭제한 실행이 없으면 객체는 훑지 않음
+        """
+        oldest = f"{day - timedelta(days=self.KEEP_DAYS):%Y%m%d}"
+        runs_pruned = 0
+        for run_id in self.list_runs():
+            if run_id[:8] < oldest:
+                try:
+                    self._run_path(run_id).unlink()
+                    runs_pruned += 1
+                except OSError:
+                    pass
+        if not runs_pruned:
+            return 0, 0
+
+        referenced: Set[str] = set()
+        for run_id in self.list_runs():
+            try:
+                manifest = self._read_manifest(run_id)
+            except Exception as e:
+                # 읽지 못한 매니페스트가 있으면 참조를 알 수 없으므로 객체 정리 생략
+                logger.warning(f"실행 스냅샷 정리 생략 ({run_id} 읽기 실패): {e}")
+                return runs_pruned, 0
+            for item in manifest.get("stocks", []):
+                referenced.update(item["blocks"])
+            referenced.update(manifest.get("vp_rows", {}).values())
+
+        cutoff = time.time() - self.OBJECT_GRACE_SEC
+        objects_pruned = 0
+        for path in (self.root / "objects").glob("*/*"):
+            digest = path.parent.name + path.name
+            try:
+                if digest not in referenced and path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    objects_pruned += 1
+            except OSError:
+                pass
+        return runs_pruned, objects_pruned
+
+    def load(self, run_id: str) -> RunSnapshot:
+        """run_id 스냅샷 복원 (없으면 FileNotFoundError)"""
+        manifest = self._read_manifest(run_id)
+        if manifest.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"지원하지 않는 스냅샷 버전: {manifest.get('version')}")
+
+        stocks = []
+        for item in manifest["stocks"]:
+            series = self.get_series(item["blocks"])
+            stocks.append(StockData(
+                code=item["code"], name=item["name"], daily_prices=series,
+                current_price=item["current_price"], trading_value=item["trading_value"],
+                market_cap=item["market_cap"], series=series,
+            ))
+        broker = manifest.get("broker", {})
+        return RunSnapshot(
+            run_id=manifest["run_id"],
+            run_type=manifest["run_type"],
+            screen_date=date.fromisoformat(manifest["screen_date"]),
+            universe=manifest["universe"],
+            stocks=stocks,
+            quotes=manifest.get("quotes", {}),
+            broker_applied=broker.get("applied", False),
+            broker_anomaly=broker.get("anomaly", {}),
+            vp_rows={code: self.get_json(d) for code, d in manifest.get("vp_rows", {}).items()},
+            results=manifest.get("results", []),
+            config=manifest.get("config", {}),
+        )
+
+    def list_runs(self) -> List[str]:
+        """저장된 run_id (최신순)"""
+        try:
+            paths = (self.root / "runs").glob("*.json.gz")
+            return sorted((p.name[:-len(".json.gz")] for p in paths), reverse=True)
+        except OSError:
+            return []
+
+
+_store_instance: Optional[RunSnapshotStore] = None
+_store_lock = threading.Lock()
+
+
+def get_run_snapshot_store() -> RunSnapshotStore:
+    """프로세스 공용 실행 스냅샷 저장소"""
+    global _store_instance
+    if _store_instance is None:
+        with _store_lock:
+            if _store_instance is None:
+                _store_instance = RunSnapshotStore()
+    return _store_instance
@@ -0,0 +1,184 @@
+"""
+키움 API 동일 요청 병합 (single-flight)
+
+책임:
+- 같은 키((endpoint, tr_id, body, 우선순위))의 요청이 이미 진행 중이면 새 HTTP 호출 없이
+  첫 호출의 결과(또는 예외)를 함께 받음
+  (우선순위가 다르면 합치지 않음 → critical 호출이 background 리더의 토큰 대기에 묶이지 않음)
+- 스레드(do)와 asyncio(do_async) 양쪽 지원
+- tr_id별 실제 호출/병합 횟수 카운터
+
+응답 캐시(response_cache.py)는 "끝난" 응답을 재사용하고, single-flight는
+"진행 중인" 요청을 합친다. TTL이 없는 tr_id(ka10014 등)도 병합 대상이다.
+병합된 응답 dict는 여러 호출자가 공유하므로 읽기 전용으로 취급한다.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FlightCounter:
+    """tr_id별 병합 통계"""
+    calls: int = 0       # 실제 실행 (리더)
+    coalesced: int = 0   # 진행 중인 호출에 합류
+
+
+class SingleFlight:
+    """진행 중인 동일 요청 병합 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._async_calls: Dict[Tuple[int, Hashable], asyncio.Future] = {}
+        self._counters: Dict[str, FlightCounter] = {}
+
+    @staticmethod
+    def make_key(
+        endpoint: str,
+        tr_id: str,
+        body: Optional[Dict],
+        extra_headers: Optional[Dict[str, str]] = None,
+        priority: Optional[int] = None,
+    ) -> Tuple[str, str, str, Tuple, Optional[int]]:
+        """(endpoint, tr_id, 정규화된 body, 요청별 헤더, 요청 우선순위) 키"""
+        normalized = json.dumps(body or {}, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return (endpoint, tr_id, normalized, tuple(sorted((extra_headers or {}).items())), priority)
+
+    def _counter(self, label: str) -> FlightCounter:
+        counter = self._counters.get(label)
+        if counter is None:
+            counter = self._counters[label] = FlightCounter()
+        return counter
+
+    # ========================================
+    # 스레드
+    # ========================================
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Any],
+        label: str = "",
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """key의 호출이 진행 중이면 그 결과를 기다리고, 아니면 fn() 실행
+
+        Args:
+            label: 카운터 이름 (보통 tr_id)
+            timeout: 합류한 호출자의 최대 대기 (초과 시 concurrent.futures.TimeoutError)
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self._counter(label).calls += 1
+            else:
+                self._counter(label).coalesced += 1
+
+        if not leader:
+            return future.result(timeout=timeout)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: Hashable) -> None:
+        # 결과를 알리기 전에 제거 → 이후 도착한 요청은 새로 실행 (오래된 결과 공유 방지)
+        with self._lock:
+            self._calls.pop(key, None)
+
+    # ========================================
+    # asyncio
+    # ========================================
+    async def do_async(
+        self,
+        key: Hashable,
+        coro_fn: Callable[[], Awaitable[Any]],
+        label: str = "",
+    ) -> Any:
+        """do()의 asyncio 버전 (같은 이벤트 루프 안에서 병합)"""
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        with self._lock:
+            future = self._async_calls.get(loop_key)
+            leader = future is None
+            if leader:
+                future = self._async_calls[loop_key] = loop.create_future()
+                self._counter(label).calls += 1
+            else:
+                self._counter(label).coalesced += 1
+
+        if not leader:
+            # 합류한 쪽이 취소돼도 공유 future는 유지
+            return await asyncio.shield(future)
+
+        try:
+            result = await coro_fn()
+        except asyncio.CancelledError:
+            self._finish_async(loop_key)
+            future.cancel()
+            raise
+        except BaseException as e:
+            self._finish_async(loop_key)
+            future.set_exception(e)
+            future.exception()  # 합류자가 없을 때 'never retrieved' 경고 방지
+            raise
+        self._finish_async(loop_key)
+        future.set_result(result)
+        return result
+
+    def _finish_async(self, loop_key: Tuple[int, Hashable]) -> None:
+        with self._lock:
+            self._async_calls.pop(loop_key, None)
+
+    # ========================================
+    # 통계
+    # ========================================
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """tr_id별 {'calls', 'coalesced'}"""
+        with self._lock:
+            return {
+                label: {"calls": c.calls, "coalesced": c.coalesced}
+                for label, c in self._counters.items()
+            }
+
+    def format_stats(self) -> str:
+        """로그용 한 줄 요약 (병합이 있었던 tr_id만)"""
+        parts = [
+            f"{label} {s['coalesced']}건 병합/{s['calls']}회 호출"
+            for label, s in sorted(self.stats().items())
+            if s["coalesced"]
+        ]
+        return ", ".join(parts) if parts else "병합 없음"
+
+
+_instance: Optional[SingleFlight] = None
+_instance_lock = threading.Lock()
+
+
+def get_single_flight() -> Optional[SingleFlight]:
+    """프로세스 공용 single-flight (KIWOOM_SINGLE_FLIGHT=false면 None)"""
+    global _instance
+    if not settings.kiwoom.single_flight:
+        return None
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = SingleFlight()
+    return _instance
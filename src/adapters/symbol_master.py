@@ -0,0 +1,206 @@
+"""
+종목 마스터 (stock_mapping.csv 메모리 인덱스)
+
+책임:
+- stock_mapping.csv를 프로세스당 한 번 읽어 종목코드 → SymbolInfo(이름/업종/시장/제외 여부) 인덱스 구성
+  (종목명·업종 조회마다 CSV 전체를 다시 훑지 않음)
+- CSV mtime/크기가 바뀌면 다음 조회 때 다시 로드
+- .cache/symbol_master.pickle 스냅샷으로 다른 프로세스의 재로드를 빠르게
+  (스냅샷은 원본 CSV의 경로/mtime/크기가 같을 때만 사용)
+
+제외 여부는 utils.stock_filters.is_eligible_universe_stock(이름 기반) 결과를 미리 계산해 둔다.
+"""
+
+import csv
+import logging
+import os
+import pickle
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from src.config.app_config import MAPPING_FILE
+from src.config.settings import CACHE_DIR
+from src.utils.stock_filters import is_eligible_universe_stock
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+_CODE_COLUMNS = ("code", "stock_code")
+_NAME_COLUMNS = ("name", "stock_name")
+
+
+@dataclass(frozen=True)
+class SymbolInfo:
+    """종목 마스터 한 줄"""
+    code: str
+    name: str
+    sector: str = ""
+    market: str = ""
+    excluded: bool = False
+    exclude_reason: str = ""
+
+
+def _pick(row: Dict[str, str], columns: Tuple[str, ...]) -> str:
+    for column in columns:
+        value = row.get(column)
+        if value:
+            return value.strip()
+    return ""
+
+
+def parse_mapping_file(path: Path) -> Dict[str, SymbolInfo]:
+    """stock_mapping.csv → {code: SymbolInfo} (컬럼명 대소문자/stock_code 별칭 허용)"""
+    symbols: Dict[str, SymbolInfo] = {}
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        for raw in reader:
+            row = {str(k).strip().lower(): (v or "") for k, v in raw.items() if k is not None}
+            code = _pick(row, _CODE_COLUMNS)
+            if not code:
+                continue
+            code = code.zfill(6)
+            name = _pick(row, _NAME_COLUMNS)
+            eligible, reason = is_eligible_universe_stock(code, name or None)
+            symbols[code] = SymbolInfo(
+                code=code,
+                name=name,
+                sector=row.get("sector", "").strip(),
+                market=row.get("market", "").strip(),
+                excluded=not eligible,
+                exclude_reason=reason,
+            )
+    return symbols
+
+
+class SymbolMaster:
+    """지연 로드되는 종목 마스터 (스레드 안전)"""
+
+    SNAPSHOT_PATH = CACHE_DIR / "symbol_master.pickle"
+
+    def __init__(self, mapping_file: Optional[Path] = None, snapshot_path: Optional[Path] = None):
+        self.mapping_file = Path(mapping_file) if mapping_file is not None else MAPPING_FILE
+        self.snapshot_path = Path(snapshot_path) if snapshot_path is not None else self.SNAPSHOT_PATH
+        self._lock = threading.Lock()
+        self._symbols: Dict[str, SymbolInfo] = {}
+        self._signature: Optional[Tuple[str, int, int]] = None
+        self._missing_logged = False
+        self.loads = 0  # CSV 파싱 횟수 (스냅샷 사용은 제외)
+
+    def _source_signature(self) -> Optional[Tuple[str, int, int]]:
+        try:
+            stat = self.mapping_file.stat()
+        except OSError:
+            return None
+        return (str(self.mapping_file.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    def _ensure_loaded(self) -> Dict[str, SymbolInfo]:
+        """CSV가 바뀌었으면 다시 로드 (조회마다 stat 한 번)"""
+        signature = self._source_signature()
+        with self._lock:
+            if signature == self._signature:
+                return self._symbols
+            if signature is None:
+                if not self._missing_logged:
+                    logger.warning(f"stock_mapping.csv 없음: {self.mapping_file}")
+                    self._missing_logged = True
+                self._symbols, self._signature = {}, None
+                return self._symbols
+            self._missing_logged = False
+            symbols = self._read_snapshot(signature)
+            if symbols is None:
+                try:
+                    symbols = parse_mapping_file(self.mapping_file)
+                except Exception as e:
+                    logger.error(f"stock_mapping.csv 로드 실패: {e}")
+                    symbols = {}
+                else:
+                    self.loads += 1
+                    logger.info(f"종목 마스터 로드: {len(symbols)}종목 ({self.mapping_file.name})")
+                    self._write_snapshot(signature, symbols)
+            self._symbols, self._signature = symbols, signature
+            return self._symbols
+
+    def _read_snapshot(self, signature: Tuple[str, int, int]) -> Optional[Dict[str, SymbolInfo]]:
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                data = pickle.load(f)
+        except (OSError, EOFError):
+            return None
+        except Exception as e:
+            logger.debug(f"종목 마스터 스냅샷 로드 실패: {e}")
+            return None
+        if data.get("version") != SNAPSHOT_VERSION or tuple(data.get("source", ())) != signature:
+            return None
+        return {
+            code: SymbolInfo(code, *fields)
+            for code, fields in data.get("symbols", {}).items()
+        }
+
+    def _write_snapshot(self, signature: Tuple[str, int, int], symbols: Dict[str, SymbolInfo]) -> None:
+        payload = {
+            "version": SNAPSHOT_VERSION,
+            "source": signature,
+            "symbols": {
+                code: (s.name, s.sector, s.market, s.excluded, s.exclude_reason)
+                for code, s in symbols.items()
+            },
+        }
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.snapshot_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.snapshot_path)
+        except Exception as e:
+            logger.debug(f"종목 마스터 스냅샷 저장 실패: {e}")
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+
+    def get(self, code: str) -> Optional[SymbolInfo]:
+        return self._ensure_loaded().get(str(code).zfill(6))
+
+    def name(self, code: str, default: Optional[str] = None) -> Optional[str]:
+        info = self.get(code)
+        return info.name if info and info.name else default
+
+    def sector(self, code: str, default: Optional[str] = None) -> Optional[str]:
+        info = self.get(code)
+        return info.sector if info and info.sector else default
+
+    def is_excluded(self, code: str) -> bool:
+        """ETF/스팩/우선주 등 제외 대상 여부 (마스터에 없는 종목은 False)"""
+        info = self.get(code)
+        return bool(info and info.excluded)
+
+    def names(self) -> Dict[str, str]:
+        """{code: name} (이름 있는 종목만, 복사본)"""
+        return {c: s.name for c, s in self._ensure_loaded().items() if s.name}
+
+    def sectors(self) -> Dict[str, str]:
+        """{code: sector} (업종 있는 종목만, 복사본)"""
+        return {c: s.sector for c, s in self._ensure_loaded().items() if s.sector}
+
+    def __iter__(self) -> Iterator[SymbolInfo]:
+        return iter(list(self._ensure_loaded().values()))
+
+    def __len__(self) -> int:
+        return len(self._ensure_loaded())
+
+
+_master_instance: Optional[SymbolMaster] = None
+_master_lock = threading.Lock()
+
+
+def get_symbol_master() -> SymbolMaster:
+    """프로세스 공용 종목 마스터"""
+    global _master_instance
+    if _master_instance is None:
+        with _master_lock:
+            if _master_instance is None:
+                _master_instance = SymbolMaster()
+    return _master_instance
@@ -0,0 +1,155 @@
+"""
+키움 매물대(ka10025) 당일 캐시
+
+책임:
+- ka10025 시장 전체 응답을 종목별 행으로 나눠 (code, cycle, bands, cur_entry) 키로 보관
+  (종목마다 전체 목록을 훑지 않고 바로 조회)
+- 조건(cycle/bands/cur_entry)별 완료 여부 기록 → 목록에 없는 종목도 "조회했음"으로 구분
+- .cache/volume_profile/YYYYMMDD.json 파일로 유지
+  (12:30 프리뷰, 15:00 메인, 대시보드 종목 분석 페이지가 같은 거래일 결과를 재사용)
+
+채우는 쪽은 KiwoomRestClient.get_volume_profile_rows (시장별 연속조회 동시 실행).
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.config.settings import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+VpKey = Tuple[int, int, int]  # (cycle, bands, cur_entry)
+
+
+def _key_text(key: VpKey) -> str:
+    return "/".join(str(v) for v in key)
+
+
+class VolumeProfileCache:
+    """거래일 범위의 종목별 ka10025 행 (스레드 안전)"""
+
+    CACHE_DIR = CACHE_DIR / "volume_profile"
+    KEEP_DAYS = 3  # 이보다 오래된 파일은 저장 때 삭제
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else self.CACHE_DIR
+        self._lock = threading.Lock()
+        self._day: Optional[date] = None
+        self._sets: Dict[str, Dict[str, List[dict]]] = {}  # key_text → {code: rows}
+        self._file_mtime: Optional[float] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, day: date) -> Path:
+        return self.cache_dir / f"{day:%Y%m%d}.json"
+
+    def _ensure_day(self, day: date) -> None:
+        """기준일이 바뀌면 비우고, 파일이 갱신됐으면 다시 로드 (lock 보유 상태)"""
+        if self._day != day:
+            self._day = day
+            self._sets = {}
+            self._file_mtime = None
+        path = self._path(day)
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return
+        if mtime == self._file_mtime:
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for key_text, codes in data.get("sets", {}).items():
+                self._sets.setdefault(key_text, codes)
+        except Exception as e:
+            logger.debug(f"매물대 캐시 로드 실패 ({path.name}): {e}")
+        self._file_mtime = mtime
+
+    def has(self, day: date, key: VpKey) -> bool:
+        """해당 조건의 시장 전체 조회가 끝나 있는지"""
+        with self._lock:
+            self._ensure_day(day)
+            return _key_text(key) in self._sets
+
+    def get(self, code: str, day: date, key: VpKey) -> Optional[List[dict]]:
+        """종목 행 (조건 미조회면 None, 조회했지만 목록에 없으면 [])"""
+        with self._lock:
+            self._ensure_day(day)
+            codes = self._sets.get(_key_text(key))
+            if codes is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return codes.get(code, [])
+
+    def put(self, day: date, key: VpKey, rows_by_code: Dict[str, List[dict]]) -> None:
+        """조건 하나의 시장 전체 결과 저장 + 파일 기록"""
+        with self._lock:
+            self._ensure_day(day)
+            self._sets[_key_text(key)] = rows_by_code
+            self._write(day)
+
+    def _write(self, day: date) -> None:
+        path = self._path(day)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"date": day.isoformat(), "sets": self._sets},
+                    f, ensure_ascii=False, separators=(",", ":"),
+                )
+            os.replace(tmp_path, path)
+            self._file_mtime = path.stat().st_mtime
+        except Exception as e:
+            logger.warning(f"매물대 캐시 저장 실패: {e}")
+            return
+        oldest = f"{day - timedelta(days=self.KEEP_DAYS):%Y%m%d}"
+        for old in self.cache_dir.glob("*.json"):
+            if old.stem < oldest:
+                try:
+                    old.unlink()
+                except OSError:
+                    pass
+
+    def format_stats(self) -> str:
+        total = self.hits + self.misses
+        ratio = self.hits / total if total else 0.0
+        return f"hit {self.hits}/{total} ({ratio:.0%})"
+
+
+def load_cached_rows(code: str, key: VpKey, cache_dir: Optional[Path] = None) -> Optional[List[dict]]:
+    """가장 최근 거래일 파일에서 종목 행 조회 (API 호출 없음, 대시보드용)"""
+    base = Path(cache_dir) if cache_dir is not None else VolumeProfileCache.CACHE_DIR
+    try:
+        files = sorted(base.glob("*.json"), reverse=True)
+    except OSError:
+        return None
+    for path in files:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                codes = json.load(f).get("sets", {}).get(_key_text(key))
+        except Exception:
+            continue
+        if codes is not None:
+            return codes.get(code, [])
+    return None
+
+
+_vp_cache_instance: Optional[VolumeProfileCache] = None
+_vp_cache_lock = threading.Lock()
+
+
+def get_volume_profile_cache() -> VolumeProfileCache:
+    """프로세스 공용 매물대 캐시"""
+    global _vp_cache_instance
+    if _vp_cache_instance is None:
+        with _vp_cache_lock:
+            if _vp_cache_instance is None:
+                _vp_cache_instance = VolumeProfileCache()
+    return _vp_cache_instance
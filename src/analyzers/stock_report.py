@@ -11,7 +11,8 @@ from typing import List, Optional, Tuple
 import pandas as pd
 from src.config.app_config import OHLCV_FULL_DIR, OHLCV_DIR
 from src.config.backfill_config import get_backfill_config
-from src.domain.models import DailyPrice, StockData
+from src.domain.models import StockData
+from src.domain.price_series import PriceSeries
 from src.domain.score_calculator import ScoreCalculatorV5
 from src.services.backfill.data_loader import load_single_ohlcv
 from src.services.account_service import get_holdings_watchlist
@@ -88,18 +89,6 @@ def _load_ohlcv_df(code: str) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
     return None, None
 
 
-def _to_daily_prices(df: pd.DataFrame) -> List[DailyPrice]:
-    prices: List[DailyPrice] = []
-    for _, row in df.iterrows():
-        prices.append(DailyPrice(
-            date=row["date"].date(), open=int(row["open"]),
-            high=int(row["high"]), low=int(row["low"]),
-            close=int(row["close"]), volume=int(row["volume"]),
-            trading_value=float(row.get("trading_value", 0.0)),
-        ))
-    return prices
-
-
 def _calc_tv(last_row: pd.Series) -> float:
     tv = float(last_row.get("trading_value", 0.0))
     return tv if tv > 0 else (float(last_row["close"]) * float(last_row["volume"])) / 1e8
@@ -924,7 +913,7 @@ def generate_stock_report(stock_code: str, full: bool = False) -> StockReportRes
     score_obj = None
     if df is not None:
         try:
-            prices = _to_daily_prices(df)
+            prices = PriceSeries.from_dataframe(df)
             last = df.iloc[-1]; tv2 = _calc_tv(last)
             stock = StockData(code=code, name=code, daily_prices=prices,
                              current_price=int(last["close"]), trading_value=tv2)
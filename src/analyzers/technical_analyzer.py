@@ -5,11 +5,11 @@ CCI/RSI + MACD + 볼린저밴드 + MA 배열을 요약합니다.
 """
 
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional
 
 import pandas as pd
 
-from src.domain.models import DailyPrice
+from src.domain.price_series import PriceSeries
 from src.domain.indicators import calculate_cci, calculate_rsi
 
 
@@ -32,23 +32,6 @@ class TechnicalSummary:
     note: str = ""
 
 
-def _to_daily_prices(df: pd.DataFrame) -> List[DailyPrice]:
-    prices: List[DailyPrice] = []
-    for _, row in df.iterrows():
-        prices.append(
-            DailyPrice(
-                date=row["date"].date(),
-                open=int(row["open"]),
-                high=int(row["high"]),
-                low=int(row["low"]),
-                close=int(row["close"]),
-                volume=int(row["volume"]),
-                trading_value=float(row.get("trading_value", 0.0)),
-            )
-        )
-    return prices
-
-
 def analyze_technical(df: pd.DataFrame) -> TechnicalSummary:
     if df is None or df.empty or len(df) < 20:
         return TechnicalSummary(
@@ -75,7 +58,7 @@ def analyze_technical(df: pd.DataFrame) -> TechnicalSummary:
     prev_close = float(close.iloc[-2]) if len(close) > 1 else 0.0
     change_pct = ((last_close - prev_close) / prev_close * 100.0) if prev_close > 0 else 0.0
 
-    prices = _to_daily_prices(df)
+    prices = PriceSeries.from_dataframe(df)
     cci_values = calculate_cci(prices, period=14)
     rsi_values = calculate_rsi(prices, period=14)
     cci = cci_values[-1] if cci_values else None
@@ -327,3 +327,22 @@ def run_pipeline(days: int = 20) -> None:
     print("=" * 60)
     for name, status in steps:
         print(f"  - {name}: {status}")
+
+
+def run_replay_cli(run_id: str) -> None:
+    """실행 스냅샷 재채점 + 기록 결과 비교 (API 호출 없음)"""
+    from src.adapters.run_snapshot import get_run_snapshot_store
+    from src.services.replay_service import format_replay, replay_run
+
+    store = get_run_snapshot_store()
+    try:
+        result = replay_run(run_id, store)
+    except FileNotFoundError:
+        print(f"\n❌ 스냅샷 없음: {run_id}")
+        recent = store.list_runs()[:10]
+        if recent:
+            print("   최근 실행:")
+            for rid in recent:
+                print(f"   - {rid}")
+        return
+    print("\n" + format_replay(result))
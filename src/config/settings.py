@@ -19,6 +19,12 @@ BASE_DIR = Path(__file__).resolve().parent.parent.parent
 # .env 파일 로드
 load_dotenv(BASE_DIR / ".env")
 
+# 런타임 캐시/상태 파일 폴더 (토큰, rate 상태, 일봉/매물대 캐시 등)
+CACHE_DIR = Path(os.getenv("CACHE_DIR", str(BASE_DIR / ".cache")))
+
+# 키움 호출 속도 기본값 (API_CALL_INTERVAL 초 간격 = KIWOOM_RATE_PER_SEC 기본값의 역수)
+DEFAULT_API_CALL_INTERVAL = 0.12  # 초당 약 8.3회
+
 
 @dataclass
 class KiwoomSettings:
@@ -28,6 +34,32 @@ class KiwoomSettings:
     base_url: str = "https://api.kiwoom.com"
     use_mock: bool = False  # True면 모의투자 도메인 사용
     
+    # Rate Limit (토큰 버킷, 모든 클라이언트 공유)
+    rate_per_sec: float = 1.0 / DEFAULT_API_CALL_INTERVAL  # 전역 초당 호출 수
+    rate_burst: int = 2            # 버스트 허용량
+    api_rate_limits: str = ""      # api-id별 하위 예산 ("ka10081:5/2,ka10001:4")
+    host_rate_limit: bool = True   # 같은 PC의 모든 프로세스가 .cache/ 공용 버킷을 나눠 씀
+    host_rate_per_sec: float = 0.0  # 호스트 전체 상한 (0이면 rate_per_sec)
+    
+    # 적응형 Rate 제어 (AIMD: 정상 응답 시 가산 증가, 429/5xx 시 배수 감소)
+    adaptive_rate: bool = True
+    adaptive_min_rate: float = 1.0        # 하한 (초당)
+    adaptive_max_rate: float = 0.0        # 상한 (초당, 0이면 rate_per_sec)
+    adaptive_above_base: bool = False     # True일 때만 상한이 rate_per_sec를 넘을 수 있음
+    adaptive_increase: float = 0.5        # 가산 증가폭 (초당)
+    adaptive_decrease: float = 0.5        # 감소 배수
+    adaptive_latency_target: float = 1.5  # 이 값(초)보다 느린 응답은 증가 보류
+    
+    # 응답 캐시 (프로세스 공용 TTL/LRU)
+    cache_ttls: str = "ka10081:120,ka10001:10"  # tr_id별 TTL(초), 미설정 tr_id는 캐시 안 함
+    cache_max_entries: int = 2000
+    single_flight: bool = True  # 진행 중인 동일 요청(endpoint, tr_id, body, 우선순위) 병합
+    token_refresh_lead_sec: float = 3600.0  # 만료 이 시간(초) 전에 백그라운드 재발급
+    
+    # 증분 일봉 (로컬 ohlcv_kiwoom + 누락분만 API)
+    incremental_daily: bool = True
+    warm_daily_cache: bool = True  # 같은 거래일 이전 실행의 과거분 재사용 (.cache/daily_history)
+    
     def __post_init__(self):
         # Streamlit Cloud 등 대시보드 전용 모드에서는 API 키 불필요
         if os.getenv("DASHBOARD_ONLY", "").lower() == "true" or os.getenv("STREAMLIT_SERVER_HEADLESS", "").lower() == "true":
@@ -38,6 +70,15 @@ class KiwoomSettings:
         # 모의투자 도메인 적용
         if self.use_mock:
             self.base_url = "https://mockapi.kiwoom.com"
+    
+    @property
+    def adaptive_ceiling(self) -> float:
+        """적응형 실효 상한 (초당)
+        
+        미설정이면 rate_per_sec. rate_per_sec보다 큰 상한은 adaptive_above_base=True일 때만 쓴다.
+        """
+        ceiling = self.adaptive_max_rate if self.adaptive_max_rate > 0 else self.rate_per_sec
+        return ceiling if self.adaptive_above_base else min(ceiling, self.rate_per_sec)
 
 
 @dataclass
@@ -88,7 +129,27 @@ class ScreeningSettings:
     top_n_count: int = 5  # TOP N 종목 수 (기본 5)
     
     # Rate Limit (안정성 우선)
-    api_call_interval: float = 0.12  # 초당 8회
+    api_call_interval: float = DEFAULT_API_CALL_INTERVAL
+    collect_workers: int = 4         # 데이터 수집 동시 요청 수 (1이면 순차)
+    universe_target: int = 0         # 랭킹별 등락률 통과 종목이 이 수에 이르면 연속조회 중단 (0=끝까지)
+    
+    # 시간 예산 (마감 임박 시 저우선 단계 생략/축소)
+    run_budget_sec: int = 900        # 실행 시작부터의 예산 (0=무제한)
+    deadline_main: str = "15:20"     # 메인 스크리닝 절대 마감 (빈 값=미사용)
+    deadline_reserve_sec: int = 60   # DB 저장/알림 발송용 예비시간
+    
+    # 키움 API 텔레메트리 (실행별 api_metrics 테이블 저장)
+    save_api_metrics: bool = True
+    
+    # NumPy 배치 점수 계산 (스칼라 경로와 결과 동일, 실시간/백필/--check 공통)
+    vectorized_scoring: bool = False
+    
+    # 섀도 점수 전략 (같은 항목 점수로 K개 가중치 평가, 빈 값=미사용)
+    # "no_broker:broker=0;momentum:change=1.5,volume=1.5" (strategy_scoring 참고)
+    shadow_strategies: str = ""
+    
+    # 실행별 원본 입력 스냅샷 (data/run_snapshots, --replay로 오프라인 재채점)
+    save_run_snapshot: bool = True
 
 
 @dataclass
@@ -136,6 +197,14 @@ class VolumeProfileSettings:
     endpoint: str = ""             # ??? ? ?? ??? ??
 
 
+@dataclass
+class HttpSettings:
+    """외부 HTTP 호출 커넥션 풀 설정 (Kiwoom/DART/Naver/Discord 공용)"""
+    pool_default: int = 4          # 호스트별 기본 keep-alive 커넥션 수
+    pool_sizes: str = ""           # 호스트별 오버라이드 ("api.kiwoom.com:10,opendart.fss.or.kr:4")
+    pool_block: bool = False       # 풀이 가득 찼을 때 대기 여부 (False면 임시 커넥션 생성)
+    connect_retries: int = 2       # 연결 단계 재시도 (요청 전송 전 실패만 재시도)
+
 
 @dataclass
 class Settings:
@@ -149,6 +218,7 @@ class Settings:
     schedule: ScheduleSettings       # 🆕 v8.0
     broker: BrokerSettings           # 🆕 v8.0
     vp: VolumeProfileSettings        # v9.0
+    http: HttpSettings               # 커넥션 풀
     
     # 로깅
     log_level: str = "INFO"
@@ -163,11 +233,30 @@ def load_settings() -> Settings:
     """환경 변수에서 설정 로드"""
     
     # 키움 설정 (메인 브로커)
+    api_call_interval = float(os.getenv("API_CALL_INTERVAL", str(DEFAULT_API_CALL_INTERVAL)))
     kiwoom = KiwoomSettings(
         app_key=os.getenv("KIWOOM_APPKEY", "").strip('"'),
         secret_key=os.getenv("KIWOOM_SECRETKEY", "").strip('"'),
         base_url=os.getenv("KIWOOM_BASE_URL", "https://api.kiwoom.com"),
         use_mock=os.getenv("KIWOOM_USE_MOCK", "false").lower() == "true",
+        rate_per_sec=float(os.getenv("KIWOOM_RATE_PER_SEC", str(1.0 / max(0.01, api_call_interval)))),
+        rate_burst=int(os.getenv("KIWOOM_RATE_BURST", "2")),
+        api_rate_limits=os.getenv("KIWOOM_API_RATE_LIMITS", "").strip(),
+        host_rate_limit=os.getenv("KIWOOM_HOST_RATE_LIMIT", "true").lower() == "true",
+        host_rate_per_sec=float(os.getenv("KIWOOM_HOST_RATE_PER_SEC", "0")),
+        adaptive_rate=os.getenv("KIWOOM_ADAPTIVE_RATE", "true").lower() == "true",
+        adaptive_min_rate=float(os.getenv("KIWOOM_ADAPTIVE_MIN_RATE", "1.0")),
+        adaptive_max_rate=float(os.getenv("KIWOOM_ADAPTIVE_MAX_RATE", "0")),
+        adaptive_above_base=os.getenv("KIWOOM_ADAPTIVE_ABOVE_BASE", "false").lower() == "true",
+        adaptive_increase=float(os.getenv("KIWOOM_ADAPTIVE_INCREASE", "0.5")),
+        adaptive_decrease=float(os.getenv("KIWOOM_ADAPTIVE_DECREASE", "0.5")),
+        adaptive_latency_target=float(os.getenv("KIWOOM_ADAPTIVE_LATENCY_TARGET", "1.5")),
+        cache_ttls=os.getenv("KIWOOM_CACHE_TTLS", "ka10081:120,ka10001:10").strip(),
+        cache_max_entries=int(os.getenv("KIWOOM_CACHE_MAX_ENTRIES", "2000")),
+        single_flight=os.getenv("KIWOOM_SINGLE_FLIGHT", "true").lower() == "true",
+        token_refresh_lead_sec=float(os.getenv("KIWOOM_TOKEN_REFRESH_LEAD_SEC", "3600")),
+        incremental_daily=os.getenv("KIWOOM_INCREMENTAL_DAILY", "true").lower() == "true",
+        warm_daily_cache=os.getenv("KIWOOM_WARM_DAILY_CACHE", "true").lower() == "true",
     )
     
     # Discord 설정 (DASHBOARD_ONLY면 자동 비활성화)
@@ -205,7 +294,16 @@ def load_settings() -> Settings:
         screening_time_preview=os.getenv("SCREENING_TIME_1", "12:30"),
         learning_time=os.getenv("LEARNING_TIME", "16:00"),
         top_n_count=int(os.getenv("TOP_N_COUNT", "5")),
-        api_call_interval=float(os.getenv("API_CALL_INTERVAL", "0.12")),
+        api_call_interval=api_call_interval,
+        collect_workers=int(os.getenv("COLLECT_WORKERS", "4")),
+        universe_target=int(os.getenv("UNIVERSE_TARGET", "0")),
+        run_budget_sec=int(os.getenv("SCREENING_BUDGET_SEC", "900")),
+        deadline_main=os.getenv("SCREENING_DEADLINE_MAIN", "15:20").strip(),
+        deadline_reserve_sec=int(os.getenv("SCREENING_DEADLINE_RESERVE_SEC", "60")),
+        save_api_metrics=os.getenv("SAVE_API_METRICS", "true").lower() == "true",
+        vectorized_scoring=os.getenv("VECTORIZED_SCORING", "false").lower() == "true",
+        shadow_strategies=os.getenv("SHADOW_STRATEGIES", ""),
+        save_run_snapshot=os.getenv("SAVE_RUN_SNAPSHOT", "true").lower() == "true",
     )
     
     # AI 설정
@@ -249,6 +347,14 @@ def load_settings() -> Settings:
         endpoint=os.getenv("VP_ENDPOINT", "").strip(),
     )
     
+    # 커넥션 풀 설정
+    http = HttpSettings(
+        pool_default=int(os.getenv("HTTP_POOL_DEFAULT", "4")),
+        pool_sizes=os.getenv("HTTP_POOL_SIZES", "api.kiwoom.com:10,mockapi.kiwoom.com:10").strip(),
+        pool_block=os.getenv("HTTP_POOL_BLOCK", "false").lower() == "true",
+        connect_retries=int(os.getenv("HTTP_CONNECT_RETRIES", "2")),
+    )
+    
     return Settings(
         kiwoom=kiwoom,
         discord=discord,
@@ -259,6 +365,7 @@ def load_settings() -> Settings:
         schedule=schedule,
         broker=broker,
         vp=vp,
+        http=http,
         log_level=os.getenv("LOG_LEVEL", "INFO"),
         log_path=Path(os.getenv("LOG_PATH", str(BASE_DIR / "logs" / "screener.log"))),
     )
@@ -91,6 +91,20 @@ def validate_kiwoom_settings(result: ValidationResult):
             f"KIWOOM_BASE_URL 형식 오류 - https://로 시작해야 합니다: {settings.kiwoom.base_url}"
         )
     
+    # 적응형 상한이 기본 속도보다 높으면 명시적 허용 필요
+    kiwoom = settings.kiwoom
+    if kiwoom.adaptive_rate and kiwoom.adaptive_max_rate > kiwoom.rate_per_sec:
+        if kiwoom.adaptive_above_base:
+            result.add_warning(
+                f"KIWOOM_ADAPTIVE_ABOVE_BASE=true - 적응형 상한 {kiwoom.adaptive_max_rate:.1f}/s가 "
+                f"기본 속도 {kiwoom.rate_per_sec:.1f}/s를 넘습니다 (429 증가 주의)."
+            )
+        else:
+            result.add_warning(
+                f"KIWOOM_ADAPTIVE_MAX_RATE {kiwoom.adaptive_max_rate:.1f}/s 무시 - "
+                f"KIWOOM_ADAPTIVE_ABOVE_BASE=true가 아니면 상한은 {kiwoom.rate_per_sec:.1f}/s입니다."
+            )
+    
     # 모의투자 모드 알림
     if settings.kiwoom.use_mock:
         result.add_warning(
@@ -0,0 +1,296 @@
+"""
+배치 점수 계산 (NumPy, ScoreCalculatorV5와 비트 단위 동일)
+
+책임:
+- N종목 × T봉 가격 블록(PriceBlock)에서 원시값/핵심점수/보너스/위험태그/총점을 한 번에 계산
+- 종목마다 리스트 슬라이싱으로 CCI/RSI/MA20을 다시 계산하던 스칼라 경로의 대체 (opt-in)
+
+동일성 원칙:
+- 부동소수 합은 스칼라 경로의 sum()과 같은 순서로 누적 (np.sum의 pairwise 합 미사용,
+  Python 3.12+는 sum()의 Neumaier 보정합까지 재현)
+- 정수 합(MA20/거래량)은 int64로 정확히 구한 뒤 한 번만 나눈다 (int / int 와 같은 반올림)
+- round(x, 1)은 np.round와 경계에서 다를 수 있어 indicators.round1(경계 근처만 파이썬 round)로 마무리
+- 구간별 점수는 calc_*_score의 분기 순서를 np.select로 그대로 옮김
+
+블록은 오른쪽 정렬(최신 봉이 마지막 열)이고 앞쪽은 0으로 채운다.
+0 패딩 봉은 양봉이 아니므로 연속양봉 계산이 자연스럽게 끊긴다.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.config.constants import CCI_PERIOD, MA20_PERIOD, MIN_DAILY_DATA_COUNT
+from src.domain.indicators import round1, sequential_sum_rows
+from src.domain.models import StockData
+from src.domain.price_series import PriceSeries
+
+RSI_PERIOD = 14
+VOLUME_PERIOD = 20
+NEUTRAL_BROKER_SCORE = 6.0
+
+
+class PriceBlock:
+    """N종목 × T봉 OHLCV 블록 (int64, 오른쪽 정렬)"""
+
+    __slots__ = ("open", "high", "low", "close", "volume", "lengths")
+
+    def __init__(
+        self,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        lengths: np.ndarray,
+    ):
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.lengths = lengths
+
+    @classmethod
+    def from_series(cls, series: Sequence[PriceSeries], bars: Optional[int] = None) -> "PriceBlock":
+        """PriceSeries 목록 → 블록 (bars가 있으면 종목마다 마지막 bars봉만)"""
+        lengths = np.array([len(s) for s in series], dtype=np.int64)
+        if bars is not None:
+            lengths = np.minimum(lengths, bars)
+        width = int(lengths.max()) if len(lengths) else 0
+        arrays = [np.zeros((len(series), width), dtype=np.int64) for _ in range(5)]
+        for i, s in enumerate(series):
+            n = int(lengths[i])
+            if n == 0:
+                continue
+            for target, source in zip(arrays, (s.open, s.high, s.low, s.close, s.volume)):
+                target[i, width - n:] = source[len(source) - n:]
+        return cls(*arrays, lengths)
+
+    @classmethod
+    def from_stocks(cls, stocks: Sequence[StockData]) -> "PriceBlock":
+        return cls.from_series([stock.price_series for stock in stocks])
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    @property
+    def width(self) -> int:
+        return self.close.shape[1]
+
+
+def _cci_at(tp: np.ndarray, end: int, period: int) -> np.ndarray:
+    """end 열(포함)에서 끝나는 CCI (calculate_cci 한 지점과 동일 연산)"""
+    window = tp[:, end - period + 1:end + 1]
+    sma = sequential_sum_rows(window) / period
+    mean_dev = sequential_sum_rows(np.abs(window - sma[:, None])) / period
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cci = (tp[:, end] - sma) / (0.015 * mean_dev)
+    return np.where(mean_dev == 0, 0.0, cci)
+
+
+def _ma_at(close: np.ndarray, end: int, period: int) -> np.ndarray:
+    """end 열(포함)에서 끝나는 단순이동평균 (정수 합 → 한 번 나눗셈)"""
+    return close[:, end - period + 1:end + 1].sum(axis=1) / period
+
+
+def _rsi_last(close: np.ndarray, period: int) -> np.ndarray:
+    """마지막 RSI (반올림 전)"""
+    changes = np.diff(close[:, -(period + 1):], axis=1)
+    gain_sum = np.where(changes > 0, changes, 0).sum(axis=1)
+    loss_sum = np.where(changes < 0, -changes, 0).sum(axis=1)
+    avg_gain = gain_sum / period
+    avg_loss = loss_sum / period
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / avg_loss
+        rsi = 100 - (100 / (1 + rs))
+    return np.where(avg_loss == 0, 100.0, rsi)
+
+
+def _trailing_bullish(open_: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """행별 마지막부터 연속 양봉 수"""
+    not_bull = ~(close > open_)[:, ::-1]
+    first_break = not_bull.argmax(axis=1)
+    return np.where(not_bull.any(axis=1), first_break, close.shape[1]).astype(np.int64)
+
+
+# ============================================================
+# 점수 함수 (calc_*_score와 같은 분기/연산 순서)
+# ============================================================
+
+def cci_scores(cci: np.ndarray) -> np.ndarray:
+    return np.select(
+        [cci < 0, (cci >= 160) & (cci <= 180), cci < 160, cci <= 220],
+        [
+            np.maximum(0, 4.33 + cci * 0.0433),
+            13.0,
+            np.maximum(4.33, 13 - (160 - cci) * 0.0542),
+            np.maximum(5.0, 13 - (cci - 180) * 0.15),
+        ],
+        np.maximum(0, 7.0 - (cci - 220) * 0.10),
+    )
+
+
+def change_scores(change: np.ndarray) -> np.ndarray:
+    return np.select(
+        [change < 0, change >= 25, (change >= 4) & (change <= 6), change < 4, change <= 8],
+        [
+            np.maximum(0, 4.33 + change * 0.433),
+            0.0,
+            13.0,
+            np.maximum(6.07, 13 - (4 - change) * 1.733),
+            np.maximum(7.0, 13 - (change - 6) * 2.0),
+        ],
+        np.maximum(0, 9.0 - (change - 8) * 0.75),
+    )
+
+
+def distance_scores(distance: np.ndarray, has_distance: np.ndarray) -> np.ndarray:
+    return np.select(
+        [~has_distance, distance < 0, (distance >= 2) & (distance <= 8), distance < 2, distance <= 10],
+        [
+            6.5,
+            np.maximum(0, 4.33 + distance * 0.433),
+            13.0,
+            np.maximum(8.67, 13 - (2 - distance) * 2.167),
+            np.maximum(6.0, 13 - (distance - 8) * 2.5),
+        ],
+        np.maximum(0, 8.0 - (distance - 10) * 1.0),
+    )
+
+
+def consec_scores(days: np.ndarray) -> np.ndarray:
+    return np.select(
+        [(days >= 2) & (days <= 3), days < 2],
+        [13.0, 6.07 + days * 3.47],
+        np.maximum(1.73, 13 - (days - 3) * 2.6),
+    )
+
+
+def volume_scores(ratio: np.ndarray) -> np.ndarray:
+    normalized = np.maximum(0, np.minimum(1, (ratio - 1) / 4))
+    return np.where(ratio < 1, 0.0, normalized * 13)
+
+
+def candle_scores(is_bullish: np.ndarray, lower_wick_ratio: np.ndarray) -> np.ndarray:
+    bullish = np.where(is_bullish, 1.0, 0.0)
+    lower = np.minimum(lower_wick_ratio / 3, 1.0)
+    return (bullish * 0.5 + lower * 0.5) * 13
+
+
+# ============================================================
+# 블록 계산
+# ============================================================
+
+def score_block(
+    block: PriceBlock,
+    broker_score: float = NEUTRAL_BROKER_SCORE,
+) -> Dict[str, np.ndarray]:
+    """블록 전체의 원시값/점수/보너스/총점 (열 이름 → 길이 N 배열)
+
+    valid가 False인 행(20봉 미만)은 다른 값이 의미 없다.
+    total과 rsi는 round(x, 1)과 같은 값으로 반올림되어 있다.
+    """
+    o, h, l, c, v = block.open, block.high, block.low, block.close, block.volume
+    n, width = c.shape
+    valid = block.lengths >= MIN_DAILY_DATA_COUNT
+    if n == 0 or width < MIN_DAILY_DATA_COUNT:
+        return {"valid": np.zeros(n, dtype=bool)}
+
+    last = width - 1
+    today_o, today_h, today_l, today_c, today_v = o[:, -1], h[:, -1], l[:, -1], c[:, -1], v[:, -1]
+    prev_c = c[:, -2]
+
+    # 원시값
+    tp = (h + l + c) / 3
+    cci = _cci_at(tp, last, CCI_PERIOD)
+    cci_prev = _cci_at(tp, last - 1, CCI_PERIOD)
+    rsi = _rsi_last(c, RSI_PERIOD)
+
+    ma20 = _ma_at(c, last, MA20_PERIOD)
+    has_ma3 = block.lengths >= MA20_PERIOD + 2
+    if width >= MA20_PERIOD + 2:
+        ma20_1 = _ma_at(c, last - 1, MA20_PERIOD)
+        ma20_2 = _ma_at(c, last - 2, MA20_PERIOD)
+    else:
+        ma20_1 = ma20_2 = np.zeros(n)
+
+    has_distance = ma20 > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        distance = np.where(has_distance, ((today_c - ma20) / ma20) * 100, 0.0)
+        change = np.where(
+            prev_c > 0,
+            ((today_c - prev_c) / prev_c) * 100,
+            np.where(today_o == 0, 0.0, ((today_c - today_o) / today_o) * 100),
+        )
+        volume_avg = v[:, -VOLUME_PERIOD:-1].sum(axis=1) / (VOLUME_PERIOD - 1)
+        volume_ratio = np.where(volume_avg == 0, 1.0, today_v / volume_avg)
+
+        body = np.abs(today_c - today_o)
+        upper_wick = today_h - np.maximum(today_o, today_c)
+        lower_wick = np.minimum(today_o, today_c) - today_l
+        upper_wick_ratio = np.where(body == 0, np.where(upper_wick > 0, 1.0, 0.0), upper_wick / body)
+        lower_wick_ratio = np.where(today_c > 0, lower_wick / today_c * 100, 0.0)
+
+    is_bullish = today_c > today_o
+    is_above_ma20 = (ma20 != 0) & (today_c > ma20)
+    consec = _trailing_bullish(o, c)
+
+    # 핵심 점수
+    cci_score = cci_scores(cci)
+    change_score = change_scores(change)
+    distance_score = distance_scores(distance, has_distance)
+    consec_score = consec_scores(consec)
+    volume_score = volume_scores(volume_ratio)
+    candle_score = candle_scores(is_bullish, lower_wick_ratio)
+    broker = np.full(n, float(broker_score))
+
+    # 보너스
+    is_cci_rising = cci > cci_prev
+    rise = cci - cci_prev
+    cci_rising_bonus = np.select(
+        [~is_cci_rising, rise > 20, rise > 10, rise > 5], [0.0, 3.0, 2.5, 2.0], 1.5,
+    )
+    is_ma20_3day_up = has_ma3 & (ma20 > ma20_1) & (ma20_1 > ma20_2)
+    ma20_3day_bonus = np.select(
+        [~has_ma3, is_ma20_3day_up, ma20 > ma20_1], [0.0, 3.0, 1.5], 0.0,
+    )
+    is_high_eq_close = (today_h == today_c) & is_bullish
+    not_high_eq_close_bonus = np.where(is_high_eq_close, 0.0, 3.0)
+
+    # 총점 (ScoreDetailV5.total과 같은 합산 순서)
+    base = cci_score + change_score + distance_score + consec_score + volume_score + candle_score + broker
+    bonus = cci_rising_bonus + ma20_3day_bonus + not_high_eq_close_bonus
+    raw_total = np.minimum(100.0, base + bonus)
+    total = np.array(round1(raw_total), dtype=np.float64)
+
+    return {
+        "valid": valid,
+        "cci": cci, "rsi": np.array(round1(rsi), dtype=np.float64), "ma20": ma20, "distance": distance, "has_distance": has_distance,
+        "change_rate": change, "consec_days": consec, "volume_ratio": volume_ratio,
+        "upper_wick_ratio": upper_wick_ratio, "lower_wick_ratio": lower_wick_ratio,
+        "is_bullish": is_bullish, "is_above_ma20": is_above_ma20,
+        "cci_score": cci_score, "change_score": change_score, "distance_score": distance_score,
+        "consec_score": consec_score, "volume_score": volume_score, "candle_score": candle_score,
+        "broker_score": broker,
+        "cci_rising_bonus": cci_rising_bonus, "is_cci_rising": is_cci_rising,
+        "ma20_3day_bonus": ma20_3day_bonus, "is_ma20_3day_up": is_ma20_3day_up,
+        "not_high_eq_close_bonus": not_high_eq_close_bonus, "is_high_eq_close": is_high_eq_close,
+        "total": total,
+        "volume": today_v,
+    }
+
+
+def risk_tags(cols: Dict[str, np.ndarray]) -> List[List[str]]:
+    """위험 태그 (calculate_single_score와 같은 문구/순서)"""
+    tags: List[List[str]] = [[] for _ in range(len(cols["valid"]))]
+    cci, distance, change = cols["cci"], cols["distance"], cols["change_rate"]
+    for i in np.flatnonzero(cci > 220).tolist():
+        tags[i].append(f"⚠️CCI과열({cci[i]:.0f})")
+    for i in np.flatnonzero(cols["has_distance"] & (distance > 10)).tolist():
+        tags[i].append(f"⚠️이격과대({distance[i]:.1f}%)")
+    for i in np.flatnonzero(change > 8).tolist():
+        tags[i].append(f"⚠️등락과대({change[i]:.1f}%)")
+    for i in np.flatnonzero(cols["is_high_eq_close"]).tolist():
+        tags[i].append("⚠️고가=종가")
+    return tags
@@ -7,13 +7,20 @@
 - 기울기 계산
 - 캔들 패턴 분석
 
+CCI/MA/RSI는 NumPy 롤링 커널이 기본이고, 윈도우마다 다시 합산하던 순수 파이썬
+구현은 *_reference로 남겨 테스트 오라클로 쓴다 (두 구현의 결과는 비트 단위 동일).
+
 의존성:
-- 없음 (순수 계산 로직)
+- numpy (순수 계산 로직)
 """
 
-from typing import List, Optional
+import sys
+from typing import List, Optional, Sequence
 from dataclasses import dataclass
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
 from src.domain.models import DailyPrice
 from src.config.constants import (
     CCI_PERIOD,
@@ -50,11 +57,11 @@ def calculate_mean_deviation(
     return sum(deviations) / len(deviations)
 
 
-def calculate_cci(
+def calculate_cci_reference(
     prices: List[DailyPrice],
     period: int = CCI_PERIOD,
 ) -> List[float]:
-    """CCI(Commodity Channel Index) 계산
+    """CCI(Commodity Channel Index) 계산 - 윈도우별 재합산 기준 구현
     
     CCI = (TP - SMA(TP)) / (0.015 × Mean Deviation)
     - TP: Typical Price = (High + Low + Close) / 3
@@ -96,11 +103,11 @@ def calculate_cci(
     return cci_values
 
 
-def calculate_ma(
+def calculate_ma_reference(
     prices: List[DailyPrice],
     period: int = MA20_PERIOD,
 ) -> List[float]:
-    """이동평균선(MA) 계산
+    """이동평균선(MA) 계산 - 윈도우별 재합산 기준 구현
     
     Args:
         prices: 일봉 데이터 리스트 (오래된 순)
@@ -123,11 +130,11 @@ def calculate_ma(
     return ma_values
 
 
-def calculate_rsi(
+def calculate_rsi_reference(
     prices: List[DailyPrice],
     period: int = 14,
 ) -> List[float]:
-    """RSI (Relative Strength Index) 계산
+    """RSI (Relative Strength Index) 계산 - 윈도우별 재합산 기준 구현
     
     RSI = 100 - (100 / (1 + RS))
     RS = 평균 상승폭 / 평균 하락폭
@@ -171,6 +178,121 @@ def calculate_rsi(
     return rsi_values
 
 
+# ============================================================
+# 롤링 커널 (기본 구현)
+# ============================================================
+
+_COMPENSATED_SUM = sys.version_info >= (3, 12)  # 내장 sum()이 float에 Neumaier 보정합을 쓰는 버전
+KERNEL_MIN_BARS = 60  # 이보다 짧은 List[DailyPrice]는 기준 구현이 더 빠름 (tools/bench_indicators.py)
+
+
+def sequential_sum_rows(columns: np.ndarray) -> np.ndarray:
+    """(m, k) 배열의 행별 합 - 내장 sum()과 같은 순서/보정으로 누적
+
+    np.sum(axis=1)은 pairwise 합이라 sum()과 마지막 비트가 다를 수 있다.
+    열 k개를 차례로 더하므로 연산량은 O(m·k)지만 호출은 k번의 벡터 연산이다.
+    """
+    total = columns[:, 0].astype(np.float64)
+    if not _COMPENSATED_SUM:
+        for j in range(1, columns.shape[1]):
+            total = total + columns[:, j]
+        return total
+    comp = np.zeros_like(total)
+    for j in range(1, columns.shape[1]):
+        x = columns[:, j]
+        t = total + x
+        comp += np.where(np.abs(total) >= np.abs(x), (total - t) + x, (x - t) + total)
+        total = t
+    return np.where((comp != 0) & np.isfinite(comp), total + comp, total)
+
+
+def round1(values: np.ndarray) -> List[float]:
+    """파이썬 round(x, 1)과 같은 결과의 벡터 반올림
+
+    np.round는 x*10의 반올림 오차 때문에 .x5 근처에서 round()와 다를 수 있어,
+    x*10이 반올림 경계(k+0.5)에 가까운 원소만 round()로 다시 계산한다.
+    """
+    scaled = values * 10
+    out = (np.rint(scaled) / 10).tolist()
+    with np.errstate(invalid="ignore"):
+        near_tie = ~(np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) >= 1e-6 * np.maximum(1.0, np.abs(scaled)))
+    for i in np.flatnonzero(near_tie).tolist():
+        out[i] = round(float(values[i]), 1)
+    return out
+
+
+def _use_reference(prices: Sequence[DailyPrice]) -> bool:
+    return isinstance(prices, list) and len(prices) < KERNEL_MIN_BARS
+
+
+def _column(prices: Sequence[DailyPrice], name: str) -> np.ndarray:
+    """가격 열 배열 (PriceSeries면 그대로, List[DailyPrice]면 변환)"""
+    values = getattr(prices, name, None)
+    if isinstance(values, np.ndarray):
+        return values
+    return np.array([getattr(p, name) for p in prices])
+
+
+def _window_sums(values: np.ndarray, period: int) -> np.ndarray:
+    """길이 period 윈도우 합 - 정수는 누적합 차분(O(n), 정확), 실수는 sum() 순서 재현"""
+    if values.dtype.kind in "iu":
+        csum = np.concatenate(([0], np.cumsum(values, dtype=np.int64)))
+        return csum[period:] - csum[:-period]
+    return sequential_sum_rows(sliding_window_view(values.astype(np.float64), period))
+
+
+def calculate_cci(
+    prices: Sequence[DailyPrice],
+    period: int = CCI_PERIOD,
+) -> List[float]:
+    """CCI 계산 (calculate_cci_reference와 같은 결과)
+
+    SMA와 평균편차는 슬라이딩 뷰에서 윈도우 단위로 구한다. 평균편차는 윈도우마다
+    SMA가 달라 누적합으로 줄일 수 없으므로 열 단위 벡터 누적(period회)으로 계산한다.
+    """
+    if len(prices) < period:
+        return []
+    if _use_reference(prices):
+        return calculate_cci_reference(prices, period)
+    tp = (_column(prices, "high") + _column(prices, "low") + _column(prices, "close")) / 3
+    windows = sliding_window_view(tp, period)
+    sma = sequential_sum_rows(windows) / period
+    mean_dev = sequential_sum_rows(np.abs(windows - sma[:, None])) / period
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cci = (tp[period - 1:] - sma) / (0.015 * mean_dev)
+    return np.where(mean_dev == 0, 0.0, cci).tolist()
+
+
+def calculate_ma(
+    prices: Sequence[DailyPrice],
+    period: int = MA20_PERIOD,
+) -> List[float]:
+    """이동평균선 계산 (calculate_ma_reference와 같은 결과, 정수 종가는 O(n) 누적합)"""
+    if len(prices) < period:
+        return []
+    if _use_reference(prices):
+        return calculate_ma_reference(prices, period)
+    return (_window_sums(_column(prices, "close"), period) / period).tolist()
+
+
+def calculate_rsi(
+    prices: Sequence[DailyPrice],
+    period: int = 14,
+) -> List[float]:
+    """RSI 계산 (calculate_rsi_reference와 같은 결과, 상승/하락폭 롤링 합)"""
+    if len(prices) < period + 1:
+        return []
+    if _use_reference(prices):
+        return calculate_rsi_reference(prices, period)
+    changes = np.diff(_column(prices, "close"))
+    zero = changes.dtype.type(0)
+    avg_gain = _window_sums(np.where(changes > 0, changes, zero), period) / period
+    avg_loss = _window_sums(np.where(changes < 0, -changes, zero), period) / period
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+    return round1(np.where(avg_loss == 0, 100.0, rsi))
+
+
 def calculate_slope(
     values: List[float],
     period: int = 5,
@@ -8,7 +8,7 @@
 
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict
 from enum import Enum
 
 
@@ -86,15 +86,47 @@ class CurrentPrice:
     market_cap: float = 0.0  # 시가총액 (억원)
 
 
+@dataclass
+class QuoteSnapshot:
+    """랭킹 API(ka10032/ka10030) 시세 스냅샷 - 유니버스 조회 시 함께 받은 값"""
+    code: str
+    price: int = 0
+    change_rate: float = 0.0  # 등락률 (%)
+    volume: int = 0  # 거래량 (주)
+    trading_value: float = 0.0  # 당일 거래대금 (억원)
+    market_cap: float = 0.0  # 시가총액 (억원) - 랭킹 API 미제공
+    
+    @classmethod
+    def from_rank(cls, item: Dict) -> "QuoteSnapshot":
+        """get_rank_universe 결과 dict → 스냅샷 (trading_value: 백만원 → 억원)"""
+        return cls(
+            code=str(item.get('code', '')).zfill(6),
+            price=int(item.get('current_price', 0) or 0),
+            change_rate=float(item.get('change_rate', 0.0) or 0.0),
+            volume=int(item.get('volume', 0) or 0),
+            trading_value=float(item.get('trading_value', 0) or 0) / 100,
+        )
+
+
 @dataclass
 class StockData:
     """종목 분석용 데이터"""
     code: str
     name: str
-    daily_prices: List[DailyPrice]  # 최근 N일 일봉 (오래된 순)
+    daily_prices: List[DailyPrice]  # 최근 N일 일봉 (오래된 순, PriceSeries도 가능)
     current_price: int
     trading_value: float  # 당일 거래대금 (억원)
     market_cap: float = 0.0  # 시가총액 (억원)
+    # 열 단위 시계열 (src.domain.price_series.PriceSeries) - 없으면 price_series가 생성
+    series: Optional[Any] = field(default=None, repr=False, compare=False)
+    
+    @property
+    def price_series(self):
+        """daily_prices의 PriceSeries (배열 기반 스코어러용)"""
+        if self.series is None:
+            from src.domain.price_series import PriceSeries
+            self.series = PriceSeries.from_daily_prices(self.daily_prices)
+        return self.series
     
     @property
     def today_change_rate(self) -> float:
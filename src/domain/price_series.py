@@ -0,0 +1,251 @@
+"""
+일봉 시계열 (열 단위 NumPy 배열)
+
+책임:
+- 날짜/OHLCV/거래대금을 종목당 연속 배열 7개로 보관 (행마다 객체를 만들지 않음)
+- 슬라이스는 배열 뷰로 O(1) (복사 없음)
+- 정수 인덱스/순회는 __slots__ 봉 뷰(PriceBar) - DailyPrice와 같은 속성을 제공
+- List[DailyPrice] / DataFrame과 상호 변환 (기존 API는 to_daily_prices() 뷰로 유지)
+
+날짜는 1970-01-01 기준 일수(int64), 가격/거래량은 int64, 거래대금은 float64(원).
+배열은 시간순(오래된 → 최신)이다.
+"""
+
+from datetime import date
+from typing import Any, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from src.domain.models import DailyPrice
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def day_number(d: date) -> int:
+    """date → 1970-01-01 기준 일수"""
+    return d.toordinal() - EPOCH_ORDINAL
+
+
+def from_day_number(n: int) -> date:
+    """1970-01-01 기준 일수 → date"""
+    return date.fromordinal(EPOCH_ORDINAL + int(n))
+
+
+def _int64(values: Any) -> np.ndarray:
+    """int64 배열 (이미 int64면 복사 없이 그대로)"""
+    return np.asarray(values, dtype=np.int64)
+
+
+class PriceBar:
+    """PriceSeries의 봉 하나 (시계열 + 위치만 보관하는 뷰)
+
+    DailyPrice와 같은 속성/프로퍼티를 제공한다. 값은 파이썬 int/float로 돌려주므로
+    기존 스칼라 계산(점수/지표)과 결과가 같다.
+    """
+
+    __slots__ = ("_series", "_index")
+
+    def __init__(self, series: "PriceSeries", index: int):
+        self._series = series
+        self._index = index
+
+    @property
+    def date(self) -> date:
+        return from_day_number(self._series.dates[self._index])
+
+    @property
+    def open(self) -> int:
+        return int(self._series.open[self._index])
+
+    @property
+    def high(self) -> int:
+        return int(self._series.high[self._index])
+
+    @property
+    def low(self) -> int:
+        return int(self._series.low[self._index])
+
+    @property
+    def close(self) -> int:
+        return int(self._series.close[self._index])
+
+    @property
+    def volume(self) -> int:
+        return int(self._series.volume[self._index])
+
+    @property
+    def trading_value(self) -> float:
+        return float(self._series.trading_value[self._index])
+
+    # 파생 값은 DailyPrice 정의를 그대로 사용
+    change_rate = DailyPrice.change_rate
+    is_bullish = DailyPrice.is_bullish
+    body_size = DailyPrice.body_size
+    upper_wick = DailyPrice.upper_wick
+    lower_wick = DailyPrice.lower_wick
+    upper_wick_ratio = DailyPrice.upper_wick_ratio
+
+    def to_daily_price(self) -> DailyPrice:
+        return DailyPrice(
+            date=self.date, open=self.open, high=self.high, low=self.low,
+            close=self.close, volume=self.volume, trading_value=self.trading_value,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (PriceBar, DailyPrice)):
+            return self.to_daily_price() == (
+                other.to_daily_price() if isinstance(other, PriceBar) else other
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"PriceBar(date={self.date!r}, open={self.open}, high={self.high}, "
+            f"low={self.low}, close={self.close}, volume={self.volume})"
+        )
+
+
+class PriceSeries:
+    """종목 하나의 일봉 시계열
+
+    List[DailyPrice] 자리에 그대로 넣을 수 있다 (len/인덱스/슬라이스/순회/reversed).
+    """
+
+    __slots__ = ("dates", "open", "high", "low", "close", "volume", "trading_value")
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        trading_value: Optional[np.ndarray] = None,
+    ):
+        self.dates = dates
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.trading_value = (
+            np.zeros(len(dates), dtype=np.float64) if trading_value is None else trading_value
+        )
+
+    @classmethod
+    def empty(cls) -> "PriceSeries":
+        z = np.zeros(0, dtype=np.int64)
+        return cls(z, z, z, z, z, z, np.zeros(0, dtype=np.float64))
+
+    @classmethod
+    def from_daily_prices(cls, prices: Sequence[DailyPrice]) -> "PriceSeries":
+        """List[DailyPrice] → 시계열 (이미 PriceSeries면 그대로)"""
+        if isinstance(prices, PriceSeries):
+            return prices
+        if not prices:
+            return cls.empty()
+        return cls(
+            np.array([day_number(p.date) for p in prices], dtype=np.int64),
+            np.array([p.open for p in prices], dtype=np.int64),
+            np.array([p.high for p in prices], dtype=np.int64),
+            np.array([p.low for p in prices], dtype=np.int64),
+            np.array([p.close for p in prices], dtype=np.int64),
+            np.array([p.volume for p in prices], dtype=np.int64),
+            np.array([p.trading_value for p in prices], dtype=np.float64),
+        )
+
+    @classmethod
+    def concat(cls, parts: Sequence["PriceSeries"]) -> "PriceSeries":
+        """시계열 이어 붙이기 (앞 → 뒤 순서 그대로, 열마다 np.concatenate 1회)"""
+        parts = [p for p in parts if len(p)]
+        if not parts:
+            return cls.empty()
+        if len(parts) == 1:
+            return parts[0]
+        return cls(*(
+            np.concatenate([getattr(p, name) for p in parts]) for name in cls.__slots__
+        ))
+
+    @classmethod
+    def from_dataframe(cls, df: Any) -> "PriceSeries":
+        """OHLCV DataFrame(date/open/high/low/close/volume[/trading_value], 시간순) → 시계열
+
+        가격/거래량 열이 이미 int64면 복사 없이 DataFrame 배열을 그대로 참조한다.
+        날짜 열(datetime64/문자열/date)은 일수 배열로 한 번에 변환한다.
+        trading_value 열에 결측이 있으면 NaN으로 남는다.
+        """
+        if len(df) == 0:
+            return cls.empty()
+        dates = np.asarray(df["date"].to_numpy(), dtype="datetime64[D]").astype(np.int64)
+        columns = [df[name].to_numpy() for name in PRICE_COLUMNS]
+        trading_value = None
+        if "trading_value" in df.columns:
+            trading_value = np.asarray(df["trading_value"].to_numpy(), dtype=np.float64)
+
+        # 결측(NaN) 가격이 있는 행은 제외 (행 단위 변환에서 건너뛰던 것과 같음)
+        valid = np.ones(len(dates), dtype=bool)
+        for values in columns:
+            if values.dtype.kind == "f":
+                valid &= ~np.isnan(values)
+        if not valid.all():
+            dates, columns = dates[valid], [values[valid] for values in columns]
+            if trading_value is not None:
+                trading_value = trading_value[valid]
+        return cls(dates, *(_int64(values) for values in columns), trading_value)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[PriceBar, "PriceSeries"]:
+        """정수 → PriceBar, 슬라이스 → 배열 뷰 PriceSeries (복사 없음)"""
+        if isinstance(key, slice):
+            return PriceSeries(
+                self.dates[key], self.open[key], self.high[key], self.low[key],
+                self.close[key], self.volume[key], self.trading_value[key],
+            )
+        n = len(self.dates)
+        index = int(key)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("PriceSeries index out of range")
+        return PriceBar(self, index)
+
+    def __iter__(self) -> Iterator[PriceBar]:
+        return (PriceBar(self, i) for i in range(len(self.dates)))
+
+    def __reversed__(self) -> Iterator[PriceBar]:
+        return (PriceBar(self, i) for i in range(len(self.dates) - 1, -1, -1))
+
+    def tail(self, count: int) -> "PriceSeries":
+        """마지막 count봉 (배열 복사 없이 슬라이스)"""
+        if count >= len(self):
+            return self
+        return self[len(self) - max(0, count):]
+
+    def date_at(self, index: int) -> date:
+        return from_day_number(self.dates[index])
+
+    @property
+    def nbytes(self) -> int:
+        """배열 데이터 크기 (바이트, 뷰는 참조 범위만)"""
+        return sum(getattr(self, name).nbytes for name in self.__slots__)
+
+    def to_daily_prices(self) -> List[DailyPrice]:
+        """List[DailyPrice] 뷰 (기존 호출자 호환)"""
+        return [
+            DailyPrice(
+                date=date.fromordinal(EPOCH_ORDINAL + d),
+                open=o, high=h, low=l, close=c, volume=v, trading_value=tv,
+            )
+            for d, o, h, l, c, v, tv in zip(
+                self.dates.tolist(), self.open.tolist(), self.high.tolist(),
+                self.low.tolist(), self.close.tolist(), self.volume.tolist(),
+                self.trading_value.tolist(),
+            )
+        ]
@@ -530,12 +530,14 @@ def calculate_volume_ratio(prices: List[DailyPrice]) -> float:
 class ScoreCalculatorV5:
     """점수 계산기 v8.0 - 7핵심 지표 점수제 (100점 만점)"""
     
-    def __init__(self, weights: Optional[Weights] = None):
+    def __init__(self, weights: Optional[Weights] = None, vectorized: bool = False):
         """
         Args:
             weights: v5에서는 사용하지 않음 (고정 가중치)
+            vectorized: True면 여러 종목을 NumPy 배치로 계산 (batch_scorer, 결과 동일)
         """
         self.weights = weights  # 레거시 호환
+        self.vectorized = vectorized
     
     def calculate_single_score(
         self,
@@ -677,16 +679,84 @@ class ScoreCalculatorV5:
             risk_tags=risk_tags,
         )
     
+    def calculate_each(
+        self,
+        stocks: List[StockData],
+    ) -> List[Optional[StockScoreV5]]:
+        """종목별 점수 (입력 순서 유지, 데이터 부족 종목은 None)"""
+        if self.vectorized:
+            return self.calculate_batch(stocks)
+        return [self.calculate_single_score(stock) for stock in stocks]
+    
+    def calculate_batch(
+        self,
+        stocks: List[StockData],
+        broker_score: float = 6.0,
+    ) -> List[Optional[StockScoreV5]]:
+        """NumPy 배치 점수 계산 - calculate_single_score와 비트 단위 동일한 결과"""
+        from src.domain.batch_scorer import PriceBlock, risk_tags, score_block
+        
+        if not stocks:
+            return []
+        cols = score_block(PriceBlock.from_stocks(stocks), broker_score=broker_score)
+        valid = cols["valid"].tolist()
+        results: List[Optional[StockScoreV5]] = [None] * len(stocks)
+        if not any(valid):
+            for stock in stocks:
+                logger.warning(f"데이터 부족: {stock.code} ({stock.name})")
+            return results
+        
+        c = {key: arr.tolist() for key, arr in cols.items()}
+        tags = risk_tags(cols)
+        for i, stock in enumerate(stocks):
+            if not valid[i]:
+                logger.warning(f"데이터 부족: {stock.code} ({stock.name})")
+                continue
+            detail = ScoreDetailV5(
+                cci_score=c["cci_score"][i],
+                change_score=c["change_score"][i],
+                distance_score=c["distance_score"][i],
+                consec_score=c["consec_score"][i],
+                volume_score=c["volume_score"][i],
+                candle_score=c["candle_score"][i],
+                broker_score=broker_score,
+                cci_rising_bonus=c["cci_rising_bonus"][i],
+                ma20_3day_bonus=c["ma20_3day_bonus"][i],
+                not_high_eq_close_bonus=c["not_high_eq_close_bonus"][i],
+                raw_cci=c["cci"][i],
+                raw_change_rate=c["change_rate"][i],
+                raw_distance=c["distance"][i],
+                raw_consec_days=c["consec_days"][i],
+                raw_volume_ratio=c["volume_ratio"][i],
+                raw_upper_wick_ratio=c["upper_wick_ratio"][i],
+                is_cci_rising=c["is_cci_rising"][i],
+                is_ma20_3day_up=c["is_ma20_3day_up"][i],
+                is_high_eq_close=c["is_high_eq_close"][i],
+                raw_ma20=c["ma20"][i],
+                is_above_ma20=c["is_above_ma20"][i],
+                is_bullish=c["is_bullish"][i],
+                raw_rsi=c["rsi"][i],
+            )
+            results[i] = StockScoreV5(
+                stock_code=stock.code,
+                stock_name=stock.name,
+                current_price=stock.current_price,
+                change_rate=c["change_rate"][i],
+                trading_value=stock.trading_value,
+                score_detail=detail,
+                score_total=c["total"][i],
+                market_cap=getattr(stock, 'market_cap', 0.0),
+                volume=c["volume"][i],
+                risk_tags=tags[i],
+            )
+        return results
+    
     def calculate_scores(
         self,
         stocks: List[StockData],
     ) -> List[StockScoreV5]:
         """여러 종목 점수 계산"""
-        scores = []
-        for stock in stocks:
-            score = self.calculate_single_score(stock)
-            if score:
-                scores.append(score)
+        scores = [score for score in self.calculate_each(stocks) if score]
         
         # 점수 높은 순 정렬
         scores.sort(key=lambda x: (-x.score_total, -x.trading_value))
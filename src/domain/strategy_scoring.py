@@ -0,0 +1,230 @@
+"""
+다중 점수 전략 (섀도 평가)
+
+책임:
+- 한 번 계산한 항목별 점수(ScoreDetailV5)를 (N, 10) 행렬로 모아 공유
+- 항목별 배수만 다른 K개 점수 전략을 같은 행렬 위에서 평가 (API 호출/지표 재계산 없음)
+- 전략별 순위 목록 + 기준 전략 대비 TOP N 겹침 통계
+
+전략 설정은 SHADOW_STRATEGIES 환경 변수 한 줄로 지정한다.
+    "no_broker:broker=0;momentum:change=1.5,volume=1.5,consec=0.5"
+항목명: cci, change, distance, consec, volume, candle, broker,
+        cci_rising, ma20_3day, not_high_eq_close (지정 안 한 항목은 1.0)
+
+배수가 모두 1.0인 전략은 ScoreDetailV5.total과 비트 단위로 같은 총점을 낸다
+(같은 덧셈 순서 + round1).
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.domain.indicators import round1
+
+logger = logging.getLogger(__name__)
+
+# 항목 별칭 → ScoreDetailV5 필드 (total 덧셈 순서 그대로)
+CORE_ITEMS = {
+    "cci": "cci_score",
+    "change": "change_score",
+    "distance": "distance_score",
+    "consec": "consec_score",
+    "volume": "volume_score",
+    "candle": "candle_score",
+    "broker": "broker_score",
+}
+BONUS_ITEMS = {
+    "cci_rising": "cci_rising_bonus",
+    "ma20_3day": "ma20_3day_bonus",
+    "not_high_eq_close": "not_high_eq_close_bonus",
+}
+SCORE_ITEMS = {**CORE_ITEMS, **BONUS_ITEMS}
+SCORE_FIELDS = tuple(SCORE_ITEMS.values())
+
+BASELINE_NAME = "baseline"
+
+
+@dataclass
+class ScoringStrategy:
+    """점수 전략 (항목별 배수)"""
+    name: str
+    weights: Dict[str, float] = field(default_factory=dict)  # 항목 별칭 → 배수 (없으면 1.0)
+
+    def weight(self, item: str) -> float:
+        return self.weights.get(item, 1.0)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {item: self.weight(item) for item in SCORE_ITEMS}
+
+
+def parse_strategies(spec: str) -> List[ScoringStrategy]:
+    """'no_broker:broker=0;momentum:change=1.5,volume=1.5' → 전략 목록
+
+    형식이 틀린 전략/항목은 경고 후 건너뛴다.
+    """
+    strategies: List[ScoringStrategy] = []
+    for part in (spec or "").split(";"):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, body = part.partition(":")
+        name = name.strip()
+        if not name or name == BASELINE_NAME or any(s.name == name for s in strategies):
+            logger.warning(f"점수 전략 설정 무시 (이름 누락/중복): {part}")
+            continue
+        weights: Dict[str, float] = {}
+        for item_spec in body.split(","):
+            item_spec = item_spec.strip()
+            if not item_spec:
+                continue
+            item, _, value = item_spec.partition("=")
+            item = item.strip()
+            try:
+                if item not in SCORE_ITEMS:
+                    raise ValueError(item)
+                weights[item] = float(value)
+            except ValueError:
+                logger.warning(f"점수 전략 항목 무시: {name} {item_spec}")
+        strategies.append(ScoringStrategy(name, weights))
+    return strategies
+
+
+def score_matrix(details: Sequence) -> np.ndarray:
+    """ScoreDetailV5 목록 → (N, 10) 항목별 점수 행렬 (열 순서 SCORE_FIELDS)"""
+    if not details:
+        return np.zeros((0, len(SCORE_FIELDS)), dtype=np.float64)
+    return np.array(
+        [[getattr(d, name) for name in SCORE_FIELDS] for d in details],
+        dtype=np.float64,
+    )
+
+
+def strategy_totals(matrix: np.ndarray, strategy: ScoringStrategy) -> List[float]:
+    """전략 하나의 총점 (ScoreDetailV5.total과 같은 식: round(min(100, 핵심합 + 보너스합), 1))"""
+    columns = [
+        matrix[:, i] * strategy.weight(item) for i, item in enumerate(SCORE_ITEMS)
+    ]
+    n_core = len(CORE_ITEMS)
+    base = columns[0]
+    for column in columns[1:n_core]:
+        base = base + column
+    bonus = columns[n_core]
+    for column in columns[n_core + 1:]:
+        bonus = bonus + column
+    return round1(np.minimum(100.0, base + bonus))
+
+
+@dataclass
+class StrategyRanking:
+    """전략 하나의 순위 목록"""
+    strategy: ScoringStrategy
+    codes: List[str]     # 순위순 종목코드
+    totals: List[float]  # codes와 같은 순서의 총점
+
+    def top(self, n: int) -> List[str]:
+        return self.codes[:n]
+
+
+@dataclass
+class MultiStrategyResult:
+    """K개 전략 순위 + 기준(첫 번째) 전략 대비 겹침 통계"""
+    rankings: List[StrategyRanking]
+    top_n: int
+
+    @property
+    def baseline(self) -> StrategyRanking:
+        return self.rankings[0]
+
+    def compare(self) -> List[Dict]:
+        """기준 대비 전략별 TOP N 겹침/진입/탈락 + 전체 순위 상관(스피어만)"""
+        base = self.baseline
+        base_top = base.top(self.top_n)
+        base_pos = {code: i for i, code in enumerate(base.codes)}
+        rows = []
+        for ranking in self.rankings[1:]:
+            top = ranking.top(self.top_n)
+            union = set(base_top) | set(top)
+            overlap = len(set(base_top) & set(top))
+            rows.append({
+                "strategy": ranking.strategy.name,
+                "overlap": overlap,
+                "jaccard": round(overlap / len(union), 3) if union else 1.0,
+                "entered": [c for c in top if c not in base_top],
+                "dropped": [c for c in base_top if c not in top],
+                "rank_corr": _rank_correlation(base_pos, ranking.codes),
+            })
+        return rows
+
+    def format_summary(self) -> str:
+        parts = []
+        for row in self.compare():
+            corr = "-" if row["rank_corr"] is None else f"{row['rank_corr']:.3f}"
+            parts.append(f"{row['strategy']} TOP{self.top_n} 겹침 {row['overlap']}/{self.top_n} (ρ={corr})")
+        return ", ".join(parts) if parts else "비교 전략 없음"
+
+    def to_dict(self) -> Dict:
+        return {
+            "top_n": self.top_n,
+            "strategies": [
+                {
+                    "name": r.strategy.name,
+                    "weights": r.strategy.to_dict(),
+                    "top": [
+                        {"code": code, "score": total}
+                        for code, total in zip(r.top(self.top_n), r.totals)
+                    ],
+                }
+                for r in self.rankings
+            ],
+            "compare": self.compare(),
+        }
+
+
+def _rank_correlation(base_pos: Dict[str, int], codes: List[str]) -> Optional[float]:
+    """같은 종목 집합의 두 순위 사이 스피어만 상관 (2종목 미만이면 None)"""
+    n = len(codes)
+    if n < 2:
+        return None
+    d = np.array([base_pos[code] - i for i, code in enumerate(codes)], dtype=np.float64)
+    return round(float(1 - 6 * (d * d).sum() / (n * (n * n - 1))), 4)
+
+
+def rank_strategies(
+    codes: Sequence[str],
+    trading_values: Sequence[float],
+    totals_by_strategy: Sequence,
+    top_n: int,
+) -> MultiStrategyResult:
+    """[(전략, 총점 목록)] → 전략별 순위 (정렬 기준은 실시간과 같은 (-총점, -거래대금), 동점은 입력 순서)"""
+    tv = np.asarray(trading_values, dtype=np.float64)
+    rankings = []
+    for strategy, totals in totals_by_strategy:
+        scores = np.asarray(totals, dtype=np.float64)
+        order = np.lexsort((-tv, -scores)).tolist() if len(scores) else []
+        rankings.append(StrategyRanking(
+            strategy=strategy,
+            codes=[codes[i] for i in order],
+            totals=[float(scores[i]) for i in order],
+        ))
+    return MultiStrategyResult(rankings=rankings, top_n=top_n)
+
+
+def evaluate_strategies(
+    scores: Sequence,
+    strategies: Sequence[ScoringStrategy],
+    top_n: int,
+) -> MultiStrategyResult:
+    """StockScoreV5 목록(이미 계산된 항목 점수) 위에서 기준 + K개 전략 평가
+
+    기준 전략(배수 1.0)의 순위는 scores를 실시간과 같은 키로 정렬한 순서와 같다.
+    """
+    matrix = score_matrix([s.score_detail for s in scores])
+    every = [ScoringStrategy(BASELINE_NAME)] + list(strategies)
+    return rank_strategies(
+        [s.stock_code for s in scores],
+        [s.trading_value for s in scores],
+        [(strategy, strategy_totals(matrix, strategy)) for strategy in every],
+        top_n,
+    )
@@ -393,6 +393,57 @@ CREATE TABLE IF NOT EXISTS tv200_snapshot (
 CREATE INDEX IF NOT EXISTS idx_tv200_snapshot_date ON tv200_snapshot(screen_date);
 """
 
+# 키움 API 텔레메트리: 스크리닝 실행별 (단계, api-id) 집계
+MIGRATIONS_API_METRICS = """
+CREATE TABLE IF NOT EXISTS api_metrics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    run_type TEXT NOT NULL DEFAULT 'main',
+    run_date DATE NOT NULL,
+    stage TEXT NOT NULL DEFAULT '',
+    api_id TEXT NOT NULL,
+    calls INTEGER DEFAULT 0,
+    retries INTEGER DEFAULT 0,
+    status_429 INTEGER DEFAULT 0,
+    status_5xx INTEGER DEFAULT 0,
+    timeouts INTEGER DEFAULT 0,
+    network_errors INTEGER DEFAULT 0,
+    circuit_trips INTEGER DEFAULT 0,
+    bytes INTEGER DEFAULT 0,
+    latency_avg_ms REAL DEFAULT 0,
+    p50_ms REAL DEFAULT 0,
+    p95_ms REAL DEFAULT 0,
+    p99_ms REAL DEFAULT 0,
+    max_ms REAL DEFAULT 0,
+    histogram_json TEXT DEFAULT '[]',
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(run_id, stage, api_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_api_metrics_date ON api_metrics(run_date);
+CREATE INDEX IF NOT EXISTS idx_api_metrics_run ON api_metrics(run_id);
+"""
+
+# 섀도 점수 전략: 실행별 전략 TOP N (같은 항목 점수, 가중치만 다름)
+MIGRATIONS_SHADOW_SCORES = """
+CREATE TABLE IF NOT EXISTS shadow_scores (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    run_type TEXT NOT NULL DEFAULT 'main',
+    run_date DATE NOT NULL,
+    strategy TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    stock_code TEXT NOT NULL,
+    score REAL NOT NULL,
+    weights_json TEXT DEFAULT '{}',
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(run_id, strategy, rank)
+);
+
+CREATE INDEX IF NOT EXISTS idx_shadow_scores_date ON shadow_scores(run_date);
+CREATE INDEX IF NOT EXISTS idx_shadow_scores_run ON shadow_scores(run_id);
+"""
+
 MIGRATIONS_V6 = """
 -- closing_top5_history: TOP5 20일 추적 마스터 테이블
 CREATE TABLE IF NOT EXISTS closing_top5_history (
@@ -676,6 +727,12 @@ class Database:
         # v10.0 마이그레이션 (공매도/지지저항)
         self.run_migration_v10_short_sr()
         
+        # 키움 API 텔레메트리
+        self.run_migration_api_metrics()
+        
+        # 섀도 점수 전략
+        self.run_migration_shadow_scores()
+        
         logger.info("데이터베이스 초기화 완료")
     
     def run_migrations(self):
@@ -1050,6 +1107,24 @@ class Database:
             logger.error(f"v10.0 마이그레이션 실패: {e}")
             return False
     
+    def run_migration_api_metrics(self):
+        """키움 API 텔레메트리 테이블 (api_metrics)"""
+        try:
+            self.execute_script(MIGRATIONS_API_METRICS)
+            return True
+        except Exception as e:
+            logger.error(f"api_metrics 마이그레이션 실패: {e}")
+            return False
+    
+    def run_migration_shadow_scores(self):
+        """섀도 점수 전략 테이블 (shadow_scores)"""
+        try:
+            self.execute_script(MIGRATIONS_SHADOW_SCORES)
+            return True
+        except Exception as e:
+            logger.error(f"shadow_scores 마이그레이션 실패: {e}")
+            return False
+    
     def update_next_day_is_top3(self):
         """기존 next_day_results 데이터의 is_top3 값 업데이트"""
         try:
@@ -0,0 +1,117 @@
+"""
+repo_metrics: ApiMetricsRepository (키움 API 텔레메트리)
+"""
+
+import json
+import logging
+from datetime import date
+from typing import Dict, List, Optional
+
+from src.infrastructure.database import get_database
+
+logger = logging.getLogger(__name__)
+
+
+class ApiMetricsRepository:
+    """실행별 api-id 텔레메트리 저장/조회"""
+
+    def __init__(self):
+        self.db = get_database()
+        self.db.run_migration_api_metrics()
+
+    def save_run(
+        self,
+        run_id: str,
+        run_type: str,
+        run_date: date,
+        rows: List[Dict],
+    ) -> int:
+        """실행 하나의 (stage, api_id)별 행 저장 (같은 run_id는 덮어씀)
+
+        rows: {'stage', 'api_id', 'buckets', ApiStats.to_row() 필드...}
+        """
+        if not rows:
+            return 0
+        params = [
+            (
+                run_id, run_type, run_date.isoformat(), r.get("stage", ""), r["api_id"],
+                r.get("calls", 0), r.get("retries", 0), r.get("status_429", 0),
+                r.get("status_5xx", 0), r.get("timeouts", 0), r.get("network_errors", 0),
+                r.get("circuit_trips", 0), r.get("bytes", 0), r.get("latency_avg_ms", 0.0),
+                r.get("p50_ms", 0.0), r.get("p95_ms", 0.0), r.get("p99_ms", 0.0),
+                r.get("max_ms", 0.0), json.dumps(r.get("buckets", [])),
+            )
+            for r in rows
+        ]
+        try:
+            self.db.execute_many("""
+                INSERT INTO api_metrics
+                    (run_id, run_type, run_date, stage, api_id,
+                     calls, retries, status_429, status_5xx, timeouts, network_errors,
+                     circuit_trips, bytes, latency_avg_ms, p50_ms, p95_ms, p99_ms,
+                     max_ms, histogram_json)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(run_id, stage, api_id) DO UPDATE SET
+                    calls=excluded.calls,
+                    retries=excluded.retries,
+                    status_429=excluded.status_429,
+                    status_5xx=excluded.status_5xx,
+                    timeouts=excluded.timeouts,
+                    network_errors=excluded.network_errors,
+                    circuit_trips=excluded.circuit_trips,
+                    bytes=excluded.bytes,
+                    latency_avg_ms=excluded.latency_avg_ms,
+                    p50_ms=excluded.p50_ms,
+                    p95_ms=excluded.p95_ms,
+                    p99_ms=excluded.p99_ms,
+                    max_ms=excluded.max_ms,
+                    histogram_json=excluded.histogram_json
+            """, params)
+            return len(params)
+        except Exception as e:
+            logger.error(f"api_metrics 저장 실패: {e}")
+            return 0
+
+    def get_runs(self, limit: int = 30) -> List[Dict]:
+        """최근 실행 목록 (실행별 합계)"""
+        rows = self.db.fetch_all("""
+            SELECT run_id, run_type, run_date, MIN(created_at) AS created_at,
+                   SUM(calls) AS calls, SUM(retries) AS retries,
+                   SUM(status_429) AS status_429, SUM(status_5xx) AS status_5xx,
+                   SUM(timeouts + network_errors) AS failures,
+                   SUM(circuit_trips) AS circuit_trips, SUM(bytes) AS bytes
+            FROM api_metrics
+            GROUP BY run_id
+            ORDER BY MIN(created_at) DESC, run_id DESC
+            LIMIT ?
+        """, (limit,))
+        return [dict(r) for r in rows]
+
+    def get_run(self, run_id: str) -> List[Dict]:
+        """실행 하나의 (stage, api_id)별 행"""
+        rows = self.db.fetch_all(
+            "SELECT * FROM api_metrics WHERE run_id = ? ORDER BY stage, api_id",
+            (run_id,)
+        )
+        return [dict(r) for r in rows]
+
+    def get_trend(self, api_id: str, days: int = 30, run_type: Optional[str] = None) -> List[Dict]:
+        """api_id의 실행별 지연/오류 추이 (단계 합산, 백분위는 단계 중 최대)"""
+        sql = """
+            SELECT run_id, run_date, run_type,
+                   SUM(calls) AS calls, MAX(p50_ms) AS p50_ms, MAX(p95_ms) AS p95_ms,
+                   MAX(p99_ms) AS p99_ms, SUM(status_429) AS status_429,
+                   SUM(status_5xx) AS status_5xx, SUM(retries) AS retries
+            FROM api_metrics
+            WHERE api_id = ? AND run_date >= date('now', ? || ' days')
+        """
+        params: list = [api_id, f"-{days}"]
+        if run_type:
+            sql += " AND run_type = ?"
+            params.append(run_type)
+        sql += " GROUP BY run_id ORDER BY MIN(created_at)"
+        return [dict(r) for r in self.db.fetch_all(sql, tuple(params))]
+
+
+def get_api_metrics_repository() -> ApiMetricsRepository:
+    return ApiMetricsRepository()
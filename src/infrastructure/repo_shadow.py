@@ -0,0 +1,78 @@
+"""
+repo_shadow: ShadowScoreRepository (섀도 점수 전략 TOP N)
+"""
+
+import json
+import logging
+from datetime import date
+from typing import Dict, List
+
+from src.infrastructure.database import get_database
+
+logger = logging.getLogger(__name__)
+
+
+class ShadowScoreRepository:
+    """실행별 점수 전략 TOP N 저장/조회"""
+
+    def __init__(self):
+        self.db = get_database()
+        self.db.run_migration_shadow_scores()
+
+    def save_run(
+        self,
+        run_id: str,
+        run_type: str,
+        run_date: date,
+        result: Dict,
+    ) -> int:
+        """실행 하나의 전략별 TOP N 저장 (같은 run_id는 덮어씀)
+
+        result: MultiStrategyResult.to_dict()
+        """
+        params = [
+            (
+                run_id, run_type, run_date.isoformat(), strategy["name"], rank,
+                item["code"], item["score"], json.dumps(strategy["weights"]),
+            )
+            for strategy in result.get("strategies", [])
+            for rank, item in enumerate(strategy["top"], 1)
+        ]
+        if not params:
+            return 0
+        try:
+            self.db.execute_many("""
+                INSERT INTO shadow_scores
+                    (run_id, run_type, run_date, strategy, rank, stock_code, score, weights_json)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(run_id, strategy, rank) DO UPDATE SET
+                    stock_code=excluded.stock_code,
+                    score=excluded.score,
+                    weights_json=excluded.weights_json
+            """, params)
+            return len(params)
+        except Exception as e:
+            logger.error(f"shadow_scores 저장 실패: {e}")
+            return 0
+
+    def get_run(self, run_id: str) -> List[Dict]:
+        """실행 하나의 전략별 TOP N 행"""
+        rows = self.db.fetch_all(
+            "SELECT * FROM shadow_scores WHERE run_id = ? ORDER BY strategy, rank",
+            (run_id,)
+        )
+        return [dict(r) for r in rows]
+
+    def get_strategy_picks(self, strategy: str, days: int = 30) -> List[Dict]:
+        """전략의 일자별 TOP N 이력 (성과 비교용, 메인 실행만)"""
+        rows = self.db.fetch_all("""
+            SELECT run_id, run_date, rank, stock_code, score
+            FROM shadow_scores
+            WHERE strategy = ? AND run_type = 'main' AND run_date >= date('now', ? || ' days')
+            ORDER BY run_date, run_id, rank
+        """, (strategy, f"-{days}"))
+        return [dict(r) for r in rows]
+
+
+def get_shadow_score_repository() -> ShadowScoreRepository:
+    return ShadowScoreRepository()
@@ -7,6 +7,8 @@ repository.py - 호환성 레이어 (re-export)
 - repo_nomad.py: NomadCandidatesRepository, NomadNewsRepository
 - repo_signals.py: BrokerSignalRepository, PullbackRepository
 - repo_company.py: CompanyProfileRepository, TV200SnapshotRepository
+- repo_metrics.py: ApiMetricsRepository
+- repo_shadow.py: ShadowScoreRepository
 """
 
 # --- Screening ---
@@ -48,3 +50,15 @@ from src.infrastructure.repo_company import (  # noqa: F401
     get_company_profile_repository,
     get_tv200_snapshot_repository,
 )
+
+# --- API Telemetry ---
+from src.infrastructure.repo_metrics import (  # noqa: F401
+    ApiMetricsRepository,
+    get_api_metrics_repository,
+)
+
+# --- Shadow Scoring ---
+from src.infrastructure.repo_shadow import (  # noqa: F401
+    ShadowScoreRepository,
+    get_shadow_score_repository,
+)
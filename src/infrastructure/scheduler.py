@@ -44,6 +44,7 @@ from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED
 
 from src.config.settings import settings
+from src.adapters.rate_limiter import PRIORITY_BACKGROUND, with_priority
 from src.services.data_updater import run_data_update, update_global_data
 from src.utils.market_calendar import is_market_open, HOLIDAYS_KR
 
@@ -124,6 +125,9 @@ class ScreenerScheduler:
             hour: 실행 시각 (시)
             minute: 실행 시각 (분)
             check_market_day: 장 운영일 체크 여부
+        
+        키움 호출 우선순위는 작업 함수 쪽 @with_priority로 정한다
+        (스케줄러/CLI/대시보드 어디서 실행해도 같은 등급).
         """
         # 장 운영일 체크 래퍼
         if check_market_day:
@@ -405,6 +409,7 @@ class ScreenerScheduler:
             from src.services.account_service import sync_holdings_watchlist
             from src.services.holdings_analysis_service import generate_holdings_reports
 
+            @with_priority(PRIORITY_BACKGROUND)
             def _holdings_sync_and_analyze():
                 # 1단계: 계좌 동기화 + 매매일지 자동 기록
                 result = sync_holdings_watchlist()
@@ -552,7 +557,15 @@ class ScreenerScheduler:
                 logger.info(f"  - {job.id}: 다음 실행 {next_time}")
             except Exception as e:
                 logger.info(f"  - {job.id}: 등록됨 (다음 실행 시간 계산 불가)")
-        
+
+        # 키움 토큰 사전 갱신 (스크리닝 중 au10001 발급 대기 방지)
+        if settings.kiwoom.app_key:
+            try:
+                from src.adapters.kiwoom_rest_client import get_kiwoom_client
+                get_kiwoom_client().start_token_refresher()
+            except Exception as e:
+                logger.warning(f"키움 토큰 사전 갱신 시작 실패: {e}")
+
         try:
             self.scheduler.start()
         except KeyboardInterrupt:
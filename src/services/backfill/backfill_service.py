@@ -14,6 +14,7 @@ v6.3.2 변경사항:
 import logging
 from datetime import date, timedelta
 from typing import List, Optional, Dict, Tuple
+import numpy as np
 import pandas as pd
 
 from src.config.backfill_config import BackfillConfig, get_backfill_config
@@ -38,6 +39,9 @@ from src.infrastructure.repository import (
 
 logger = logging.getLogger(__name__)
 
+# 섀도 점수 전략 열 이름 접두사 (_calculate_daily_scores 결과)
+SHADOW_PREFIX = "shadow_"
+
 
 class HistoricalBackfillService:
     """과거 데이터 백필 서비스"""
@@ -140,10 +144,13 @@ class HistoricalBackfillService:
             점수 DataFrame
         """
         from src.domain.models import DailyPrice, StockData
-        from src.domain.score_calculator import ScoreCalculatorV5
+        from src.domain.score_calculator import ScoreCalculatorV5, get_grade
+        from src.domain.strategy_scoring import parse_strategies, score_matrix, strategy_totals
         from src.config.constants import MIN_DAILY_DATA_COUNT
+        from src.config.settings import settings
         
-        calculator = ScoreCalculatorV5()
+        calculator = ScoreCalculatorV5(vectorized=settings.screening.vectorized_scoring)
+        shadow_strategies = parse_strategies(settings.screening.shadow_strategies)
         
         # v6.3.3: 글로벌 조정값 계산 (해당 날짜 기준)
         global_adjustment = self._get_global_adjustment(trade_date)
@@ -162,6 +169,7 @@ class HistoricalBackfillService:
             target_codes = set(self.ohlcv_data.keys())
         
         results = []
+        candidates = []  # (code, name, sector, today_row, trading_value, stock_data)
         
         # 실시간과 동일한 룩백 길이 (MIN_DAILY_DATA_COUNT + 10 = 30봉)
         lookback_days = MIN_DAILY_DATA_COUNT + 10
@@ -189,8 +197,8 @@ class HistoricalBackfillService:
                 # 실시간과 동일하게 최근 30봉만 사용
                 df_recent = df_until.tail(lookback_days)
                 
-                # DataFrame → List[DailyPrice] 변환
-                daily_prices = self._convert_to_daily_prices(df_recent)
+                # DataFrame → PriceSeries 변환 (List[DailyPrice]와 같은 인터페이스)
+                daily_prices = self._to_price_series(df_recent)
                 
                 if len(daily_prices) < MIN_DAILY_DATA_COUNT:
                     continue
@@ -212,44 +220,56 @@ class HistoricalBackfillService:
                     current_price=int(today_row['close']),
                     trading_value=trading_value,
                 )
-                
-                # 🔥 핵심: ScoreCalculatorV5로 점수 계산 (실시간과 100% 동일)
-                score_result = calculator.calculate_single_score(stock_data)
-                
-                if score_result is None:
-                    continue
-                
-                # 글로벌 조정 적용
-                final_score = min(100.0, score_result.score_total + global_adjustment)
-                
-                # 등급 재계산 (글로벌 조정 반영)
-                from src.domain.score_calculator import get_grade
-                grade = get_grade(final_score)
-                
-                results.append({
-                    'date': trade_date,
-                    'code': code,
-                    'name': name,
-                    'close': int(today_row['close']),
-                    'change_rate': score_result.change_rate,
-                    'trading_value': trading_value,
-                    'volume': int(today_row['volume']),
-                    'score': final_score,
-                    'grade': grade.value,
-                    # ScoreCalculatorV5에서 계산된 지표값 사용
-                    'cci': score_result.score_detail.raw_cci,
-                    'rsi': score_result.score_detail.raw_rsi,  # v6.5: RSI 저장
-                    'disparity_20': score_result.score_detail.raw_distance,
-                    'consecutive_up': score_result.score_detail.raw_consec_days,
-                    'volume_ratio_5': score_result.score_detail.raw_volume_ratio,
-                    # v6.5.2: sector 추가
-                    'sector': sector,
-                })
+                candidates.append((code, name, sector, today_row, trading_value, stock_data))
                 
             except Exception as e:
                 logger.debug(f"점수 계산 실패 {code}: {e}")
                 continue
         
+        # 🔥 핵심: ScoreCalculatorV5로 점수 계산 (실시간과 100% 동일, 배치 계산도 결과 동일)
+        score_results = calculator.calculate_each([c[-1] for c in candidates])
+        scored = [(c, r) for c, r in zip(candidates, score_results) if r is not None]
+        
+        # 섀도 점수 전략: 같은 항목 점수로 전략별 총점 (글로벌 조정은 동일하게 적용)
+        shadow_totals = {}
+        if shadow_strategies and scored:
+            matrix = score_matrix([r.score_detail for _, r in scored])
+            shadow_totals = {
+                SHADOW_PREFIX + strategy.name: strategy_totals(matrix, strategy)
+                for strategy in shadow_strategies
+            }
+        
+        for i, ((code, name, sector, today_row, trading_value, _), score_result) in enumerate(scored):
+            # 글로벌 조정 적용
+            final_score = min(100.0, score_result.score_total + global_adjustment)
+            
+            # 등급 재계산 (글로벌 조정 반영)
+            grade = get_grade(final_score)
+            
+            results.append({
+                'date': trade_date,
+                'code': code,
+                'name': name,
+                'close': int(today_row['close']),
+                'change_rate': score_result.change_rate,
+                'trading_value': trading_value,
+                'volume': int(today_row['volume']),
+                'score': final_score,
+                'grade': grade.value,
+                # ScoreCalculatorV5에서 계산된 지표값 사용
+                'cci': score_result.score_detail.raw_cci,
+                'rsi': score_result.score_detail.raw_rsi,  # v6.5: RSI 저장
+                'disparity_20': score_result.score_detail.raw_distance,
+                'consecutive_up': score_result.score_detail.raw_consec_days,
+                'volume_ratio_5': score_result.score_detail.raw_volume_ratio,
+                # v6.5.2: sector 추가
+                'sector': sector,
+                **{
+                    column: min(100.0, totals[i] + global_adjustment)
+                    for column, totals in shadow_totals.items()
+                },
+            })
+        
         df_result = pd.DataFrame(results)
         
         if len(df_result) > 0:
@@ -310,49 +330,44 @@ class HistoricalBackfillService:
             logger.debug(f"TV200 스냅샷 조회 실패 {trade_date}: {e}")
             return None
     
-    def _convert_to_daily_prices(self, df: pd.DataFrame) -> List:
-        """DataFrame을 List[DailyPrice]로 변환 (v6.3.2)
+    def _compare_shadow_strategies(self, trade_date: date, df_scores: pd.DataFrame, stats: Dict) -> None:
+        """섀도 전략 점수 열(shadow_*)로 TOP5 겹침 집계 (기준 = score 열)"""
+        from src.domain.strategy_scoring import BASELINE_NAME, ScoringStrategy, rank_strategies
+        
+        columns = [c for c in df_scores.columns if c.startswith(SHADOW_PREFIX)]
+        if not columns:
+            return
+        shadow = rank_strategies(
+            df_scores['code'].tolist(),
+            df_scores['trading_value'].tolist(),
+            [(ScoringStrategy(BASELINE_NAME), df_scores['score'].tolist())] + [
+                (ScoringStrategy(c[len(SHADOW_PREFIX):]), df_scores[c].tolist()) for c in columns
+            ],
+            top_n=5,
+        )
+        logger.info(f"[{trade_date}] 섀도 전략: {shadow.format_summary()}")
+        overlap = stats.setdefault('shadow_overlap', {})
+        for row in shadow.compare():
+            overlap[row['strategy']] = overlap.get(row['strategy'], 0) + row['overlap']
+    
+    def _to_price_series(self, df: pd.DataFrame):
+        """DataFrame을 PriceSeries로 변환 (v6.3.2)
         
-        실시간 kis_client.get_daily_prices()와 동일한 형태로 변환
+        실시간 kis_client.get_daily_prices()와 같은 값 (스코어러에는 List[DailyPrice]와 동일).
+        가격 열은 복사 없이 참조하고, 결측 행은 제외한다.
         
         Args:
             df: OHLCV DataFrame (오래된 순 정렬)
             
         Returns:
-            List[DailyPrice]
+            PriceSeries
         """
-        from src.domain.models import DailyPrice
-        
-        daily_prices = []
-        
-        for _, row in df.iterrows():
-            try:
-                # 날짜 변환
-                row_date = row['date']
-                if isinstance(row_date, pd.Timestamp):
-                    row_date = row_date.date()
-                elif isinstance(row_date, str):
-                    row_date = pd.to_datetime(row_date).date()
-                
-                # 거래대금 계산
-                trading_value = row['close'] * row['volume']  # 원 단위
-                
-                daily_price = DailyPrice(
-                    date=row_date,
-                    open=int(row['open']),
-                    high=int(row['high']),
-                    low=int(row['low']),
-                    close=int(row['close']),
-                    volume=int(row['volume']),
-                    trading_value=trading_value,
-                )
-                daily_prices.append(daily_price)
-                
-            except Exception as e:
-                logger.debug(f"DailyPrice 변환 실패: {e}")
-                continue
+        from src.domain.price_series import PriceSeries
         
-        return daily_prices
+        series = PriceSeries.from_dataframe(df)
+        # 거래대금 = 종가 × 거래량 (원 단위)
+        series.trading_value = (series.close * series.volume).astype(np.float64)
+        return series
     
     def _get_global_adjustment(self, trade_date: date) -> int:
         """해당 날짜의 글로벌 조정값 계산 (v6.3.3)
@@ -477,6 +492,7 @@ class HistoricalBackfillService:
             # TOP5 추출 (점수 기준 정렬)
             df_scores = df_scores.sort_values('score', ascending=False)
             top5 = df_scores.head(5)
+            self._compare_shadow_strategies(trade_date, df_scores, stats)
             
             for rank, (_, row) in enumerate(top5.iterrows(), 1):
                 if dry_run:
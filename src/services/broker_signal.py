@@ -332,8 +332,11 @@ def _parse_int(val) -> int:
         return 0
 
 
-def _fetch_daily_brokers(client, stk_cd: str) -> Optional[dict]:
-    """ka10040: 당일주요거래원 Top5 조회"""
+def _fetch_daily_brokers(client, stk_cd: str, raise_errors: bool = False) -> Optional[dict]:
+    """ka10040: 당일주요거래원 Top5 조회
+    
+    raise_errors=True면 조회 실패를 None(=거래원 없음)으로 바꾸지 않고 예외로 올린다.
+    """
     try:
         data = client._request(
             "POST",
@@ -343,6 +346,8 @@ def _fetch_daily_brokers(client, stk_cd: str) -> Optional[dict]:
         )
         
         if not data or data.get("return_code", 0) != 0:
+            if raise_errors:
+                raise RuntimeError(f"ka10040 응답 오류: return_code={(data or {}).get('return_code')}")
             return None
         
         result = {
@@ -366,14 +371,30 @@ def _fetch_daily_brokers(client, stk_cd: str) -> Optional[dict]:
         return result
     except Exception as e:
         logger.debug(f"ka10040 실패 {stk_cd}: {e}")
+        if raise_errors:
+            raise
         return None
 
 
 # ── 메인 인터페이스 ──
 
+def fetch_broker_adjustment(client, code: str, raise_errors: bool = False) -> Optional[BrokerAdjustment]:
+    """단일 종목 ka10040 조회 + 분석 (이상 없음이면 None)
+    
+    조회 실패도 기본은 None. 선조회처럼 실패와 "이상 없음"을 구분해야 하면
+    raise_errors=True (실패한 종목은 결과에서 빠져 거래원 단계가 다시 조회한다).
+    """
+    broker_data = _fetch_daily_brokers(client, code, raise_errors=raise_errors)
+    if not broker_data:
+        return None
+    return BrokerAnalyzer.analyze(code, broker_data)
+
+
 def get_broker_adjustments(
     stock_codes: List[str],
     client=None,
+    deadline=None,
+    prefetched: Optional[Dict[str, Optional[BrokerAdjustment]]] = None,
 ) -> Dict[str, BrokerAdjustment]:
     """
     ClosingBell Top 후보에 대해 거래원 이상 점수를 계산한다.
@@ -381,12 +402,17 @@ def get_broker_adjustments(
     Args:
         stock_codes: 종목코드 리스트 (Top20 정도)
         client: KiwoomRestClient 인스턴스 (없으면 자동 생성)
+        deadline: 시간 예산 (src.utils.deadline.Deadline, 지나면 남은 종목 생략)
+        prefetched: 이미 조회한 종목의 결과 (값이 None이면 이상 없음, 다시 조회하지 않음)
     
     Returns:
         {종목코드: BrokerAdjustment} - 이상 감지된 종목만 포함
     """
     if not stock_codes:
         return {}
+    prefetched = prefetched or {}
+    if all(code in prefetched for code in stock_codes):
+        return {code: prefetched[code] for code in stock_codes if prefetched[code]}
     
     if client is None:
         try:
@@ -401,18 +427,25 @@ def get_broker_adjustments(
     
     logger.info(f"🔍 거래원 스캔 시작: {len(stock_codes)}개 종목")
     
-    for code in stock_codes:
-        broker_data = _fetch_daily_brokers(client, code)
-        if not broker_data:
-            continue
-        
-        adj = BrokerAnalyzer.analyze(code, broker_data)
+    reused = 0
+    for i, code in enumerate(stock_codes):
+        if code in prefetched:
+            adj = prefetched[code]
+            reused += 1
+        else:
+            if deadline is not None and deadline.expired():
+                deadline.cut("broker", f"거래원 스캔 {i}/{len(stock_codes)}개 후 중단")
+                break
+            adj = fetch_broker_adjustment(client, code)
         if adj:
             results[code] = adj
             logger.info(f"  ⚡ {code} → {adj.anomaly_score}점 (+{adj.bonus}) {adj.tag}")
     
     elapsed = time.time() - t0
-    logger.info(f"🔍 거래원 스캔 완료: {len(results)}/{len(stock_codes)}개 이상감지 ({elapsed:.1f}초)")
+    logger.info(
+        f"🔍 거래원 스캔 완료: {len(results)}/{len(stock_codes)}개 이상감지 "
+        f"(선조회 재사용 {reused}개, {elapsed:.1f}초)"
+    )
     
     return results
 
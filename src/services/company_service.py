@@ -46,8 +46,8 @@ from src.services.http_utils import urlopen_with_retry, redact_url, mask_text
 from html import unescape
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
-import pandas as pd
 
+from src.adapters.symbol_master import get_symbol_master
 from src.infrastructure.repository import get_nomad_candidates_repository
 
 logger = logging.getLogger(__name__)
@@ -55,30 +55,11 @@ logger = logging.getLogger(__name__)
 # 상수
 API_DELAY = 0.3  # 크롤링 간격 (초)
 BASE_URL = "https://finance.naver.com"
-from src.config.app_config import MAPPING_FILE as STOCK_MAPPING_PATH
 
-# 종목 매핑 캐시
-_stock_mapping_cache: Optional[Dict[str, str]] = None
 
 def get_sector_from_mapping(stock_code: str) -> Optional[str]:
-    """stock_mapping.csv에서 업종 조회"""
-    global _stock_mapping_cache
-    
-    if _stock_mapping_cache is None:
-        try:
-            if STOCK_MAPPING_PATH.exists():
-                df = pd.read_csv(STOCK_MAPPING_PATH, encoding='utf-8-sig')
-                df['code'] = df['code'].astype(str).str.zfill(6)
-                _stock_mapping_cache = dict(zip(df['code'], df['sector']))
-                logger.info(f"stock_mapping.csv 로드: {len(_stock_mapping_cache)}개 종목")
-            else:
-                _stock_mapping_cache = {}
-                logger.warning(f"stock_mapping.csv 없음: {STOCK_MAPPING_PATH}")
-        except Exception as e:
-            logger.error(f"stock_mapping.csv 로드 실패: {e}")
-            _stock_mapping_cache = {}
-    
-    return _stock_mapping_cache.get(stock_code.zfill(6))
+    """stock_mapping.csv(종목 마스터)에서 업종 조회"""
+    return get_symbol_master().sector(stock_code)
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
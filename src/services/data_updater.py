@@ -10,6 +10,7 @@ from typing import Optional, List
 import pandas as pd
 
 from src.adapters.kiwoom_rest_client import get_kiwoom_client
+from src.adapters.rate_limiter import PRIORITY_BACKGROUND, with_priority
 from src.utils.market_calendar import is_market_open
 
 logger = logging.getLogger(__name__)
@@ -152,6 +153,7 @@ def update_single_stock(code: str, last_date: date, today: date) -> bool:
         return False
 
 
+@with_priority(PRIORITY_BACKGROUND)
 def run_data_update(max_stocks: int = MAX_STOCKS_PER_RUN) -> dict:
     """OHLCV 데이터 자동 갱신"""
     print("=" * 50)
@@ -17,6 +17,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 from src.config.constants import get_top_n_count
+from src.adapters.rate_limiter import PRIORITY_BACKGROUND, submit_with_context, with_priority
 
 logger = logging.getLogger(__name__)
 
@@ -421,6 +422,7 @@ class EnrichmentService:
         
         return stock
     
+    @with_priority(PRIORITY_BACKGROUND)
     def enrich_top5(self, scores: List[Any], parallel: bool = True, max_stocks: int = None) -> List[EnrichedStock]:
         """TOP5 종목에 풀 정보 추가
         
@@ -451,7 +453,7 @@ class EnrichmentService:
             results = []
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 future_to_stock = {
-                    executor.submit(self.enrich_single, stock): stock
+                    submit_with_context(executor, self.enrich_single, stock): stock
                     for stock in enriched_stocks
                 }
                 
@@ -46,6 +46,24 @@ def run_healthcheck() -> Tuple[List[HealthcheckItem], bool]:
         except Exception as e:
             results.append(HealthcheckItem("Kiwoom", "FAIL", mask_text(str(e))[:120]))
 
+    # Kiwoom Rate (AIMD 실효 속도)
+    try:
+        from src.adapters.adaptive_rate import GLOBAL_KEY, get_rate_controller
+        controller = get_rate_controller()
+        if controller is None:
+            results.append(HealthcheckItem(
+                "KiwoomRate", "OK", f"고정 {settings.kiwoom.rate_per_sec:.1f}/s (적응형 꺼짐)"
+            ))
+        else:
+            snap = controller.snapshot()
+            throttled = sum(s["throttles"] for s in snap.values())
+            status = "WARN" if snap[GLOBAL_KEY]["rate"] <= controller.min_rate else "OK"
+            results.append(HealthcheckItem(
+                "KiwoomRate", status, f"{controller.format_rates()} (감소 {throttled}회)"[:120]
+            ))
+    except Exception as e:
+        results.append(HealthcheckItem("KiwoomRate", "WARN", mask_text(str(e))[:120]))
+
     # DART
     dart_key = os.getenv("DART_API_KEY", "")
     if not dart_key:
@@ -1,5 +1,8 @@
 """
 HTTP helper utilities with retry, timeout, and safe logging.
+
+All outbound calls share per-host keep-alive sessions
+(see src.utils.http_session.get_http_session).
 """
 
 import re
@@ -11,6 +14,34 @@ import requests
 from requests import Response
 import urllib.request
 
+# Pooled sessions live in src.utils (shared with the adapters); re-exported here.
+from src.utils.http_session import close_http_sessions, get_http_session, pool_size_for  # noqa: F401
+
+
+class _PooledUrlopenResponse:
+    """Minimal urlopen-style view over a requests.Response."""
+
+    def __init__(self, response: Response):
+        self._response = response
+        self.status = response.status_code
+        self.headers = response.headers
+
+    def getcode(self) -> int:
+        return self.status
+
+    def read(self) -> bytes:
+        return self._response.content
+
+    def close(self) -> None:
+        self._response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
 
 def redact_url(url: str) -> str:
     """Redact query values and webhook tokens in URLs."""
@@ -72,7 +103,7 @@ def request_with_retry(
     last_error = None
     for attempt in range(max_retries + 1):
         try:
-            response = requests.request(
+            response = get_http_session(url).request(
                 method=method,
                 url=url,
                 headers=headers,
@@ -114,10 +145,25 @@ def urlopen_with_retry(
     logger=None,
     context: str = "",
 ):
-    """urllib wrapper with exponential backoff and safe logging."""
+    """urllib-compatible wrapper with exponential backoff and safe logging.
+
+    urllib.request.Request objects are sent through the pooled session;
+    non-2xx responses raise like urlopen does.
+    """
     last_error = None
     for attempt in range(max_retries + 1):
         try:
+            if isinstance(req, urllib.request.Request):
+                url = req.full_url
+                response = get_http_session(url).request(
+                    method=req.get_method(),
+                    url=url,
+                    headers=dict(req.header_items()),
+                    data=req.data,
+                    timeout=timeout,
+                )
+                response.raise_for_status()
+                return _PooledUrlopenResponse(response)
             return urllib.request.urlopen(req, timeout=timeout)
         except Exception as exc:
             last_error = exc
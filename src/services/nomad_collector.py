@@ -34,7 +34,7 @@ VOLUME_EXPLOSION_THRESHOLD = 10_000_000  # 거래량천만 기준 (주)
 # OHLCV 데이터 경로
 from src.config.app_config import OHLCV_FULL_DIR
 OHLCV_DIR = OHLCV_FULL_DIR
-from src.config.app_config import MAPPING_FILE as STOCK_MAPPING_PATH
+from src.adapters.symbol_master import get_symbol_master
 
 # ETF 등 제외 패턴
 EXCLUDE_PATTERNS = [
@@ -45,19 +45,12 @@ EXCLUDE_PATTERNS = [
 
 
 def load_stock_mapping() -> Dict[str, str]:
-    """종목코드 → 종목명 매핑 로드"""
-    mapping = {}
-    
-    if STOCK_MAPPING_PATH.exists():
-        try:
-            df = pd.read_csv(STOCK_MAPPING_PATH, dtype={'code': str})
-            for _, row in df.iterrows():
-                code = str(row['code']).zfill(6)
-                mapping[code] = row['name']
-        except Exception as e:
-            logger.warning(f"stock_mapping.csv 로드 실패: {e}")
-    
-    return mapping
+    """종목코드 → 종목명 매핑 로드 (종목 마스터)"""
+    try:
+        return get_symbol_master().names()
+    except Exception as e:
+        logger.warning(f"stock_mapping.csv 로드 실패: {e}")
+        return {}
 
 
 def collect_nomad_candidates(target_date: date = None, force: bool = False) -> Dict:
@@ -13,13 +13,13 @@
 
 import logging
 import os
-import csv
 import json
 import time
 from pathlib import Path
 from datetime import date, datetime, timedelta
 from dataclasses import dataclass, field, asdict
 from src.config.settings import settings
+from src.adapters.rate_limiter import PRIORITY_BACKGROUND, PRIORITY_CRITICAL, with_priority
 from typing import List, Dict, Optional, Tuple
 
 import numpy as np
@@ -195,11 +195,8 @@ def _load_stock_names() -> Dict[str, str]:
     """종목 매핑 로드 (stock_mapping.csv → FDR 폴백)"""
     names = {}
     try:
-        from src.config.app_config import MAPPING_FILE
-        if MAPPING_FILE and MAPPING_FILE.exists():
-            with open(MAPPING_FILE, "r", encoding="utf-8-sig") as f:
-                for row in csv.DictReader(f):
-                    names[str(row.get("code", "")).zfill(6)] = row.get("name", "")
+        from src.adapters.symbol_master import get_symbol_master
+        names = get_symbol_master().names()
     except Exception:
         pass
 
@@ -946,11 +943,13 @@ def _notify_discord(signals: List[PullbackSignal]):
 # 스케줄러 엔트리포인트
 # ============================================================
 
+@with_priority(PRIORITY_BACKGROUND)
 def run_volume_spike_scan():
-    """스케줄러용: 거래량 폭발 스캔"""
+    """스케줄러용: 거래량 폭발 스캔 (키움 호출 후순위)"""
     return scan_volume_spikes()
 
 
+@with_priority(PRIORITY_CRITICAL)
 def run_pullback_scan():
-    """스케줄러용: 눌림목 시그널 스캔"""
+    """스케줄러용: 눌림목 시그널 스캔 (키움 호출 최우선)"""
     return scan_pullback_signals()
\ No newline at end of file
@@ -15,6 +15,7 @@ from typing import Dict, List, Optional
 
 import pandas as pd
 
+from src.adapters.rate_limiter import PRIORITY_BACKGROUND, with_priority
 from src.infrastructure.database import get_database
 from src.config.app_config import DATA_DIR
 
@@ -334,8 +335,9 @@ def get_pullback_detail(signal_id: int) -> List[Dict]:
 # 스케줄러 진입점
 # ============================================================
 
+@with_priority(PRIORITY_BACKGROUND)
 def run_pullback_tracking():
-    """스케줄러에서 호출하는 진입점"""
+    """스케줄러에서 호출하는 진입점 (키움 호출 후순위)"""
     try:
         result = update_pullback_tracking(tracking_days=5, lookback_days=10)
         logger.info(f"[pullback_tracker] {result}")
@@ -0,0 +1,177 @@
+"""
+실행 스냅샷 재채점 (python main.py --replay <run_id>)
+
+책임:
+- data/run_snapshots의 실행 스냅샷을 읽어 API 호출 없이 같은 입력으로 점수 재계산
+  (점수 → 유니버스 순서 동점 정렬 → 거래원 반영 → 매물대 표시값, 실시간과 같은 순서)
+- 재계산 결과와 스냅샷에 기록된 결과(순위/총점/항목 점수/매물대 점수) 비교
+
+로컬 CSV로 계산한 매물대 표시값은 입력 파일이 실행 뒤에 바뀌므로 기록값을 그대로 쓴다
+(키움 ka10025 행은 스냅샷에 있어 다시 계산한다).
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from src.adapters.run_snapshot import RunSnapshot, RunSnapshotStore, get_run_snapshot_store, score_records
+from src.domain.score_calculator import ScoreCalculatorV5, StockScoreV5
+from src.domain.volume_profile import calc_volume_profile_from_kiwoom
+from src.services.screening_pipeline import apply_broker_anomalies, finalize_scores
+
+logger = logging.getLogger(__name__)
+
+MAX_DIFF_LINES = 20
+
+
+@dataclass
+class ReplayResult:
+    """재채점 결과 + 기록 대비 차이"""
+    snapshot: RunSnapshot
+    scores: List[StockScoreV5]
+    top_n: int
+    load_ms: float
+    score_ms: float
+    diff: Dict = field(default_factory=dict)
+
+    @property
+    def identical(self) -> bool:
+        return self.diff.get("identical", False)
+
+
+def replay_scores(snapshot: RunSnapshot, calculator: Optional[ScoreCalculatorV5] = None) -> List[StockScoreV5]:
+    """스냅샷 입력으로 최종 순위 재계산 (ScreenerService._run_screening 점수 단계와 같은 순서)"""
+    if calculator is None:
+        calculator = ScoreCalculatorV5(vectorized=snapshot.config.get("vectorized", False))
+    order = {code: i for i, code in enumerate(snapshot.universe)}
+    scores = [score for score in calculator.calculate_each(snapshot.stocks) if score is not None]
+    finalize_scores(scores, order)
+    if snapshot.broker_applied:
+        apply_broker_anomalies(scores, snapshot.broker_anomaly)
+    _apply_volume_profiles(scores, snapshot)
+    return scores
+
+
+def _apply_volume_profiles(scores: List[StockScoreV5], snapshot: RunSnapshot) -> None:
+    """매물대 표시값: 키움 행이 있으면 재계산, 없으면 기록값 (총점에는 영향 없음)"""
+    recorded = {r["code"]: r.get("vp", {}) for r in snapshot.results}
+    vp_cfg = snapshot.config.get("vp", {})
+    for score in scores:
+        vp = recorded.get(score.stock_code)
+        if vp is None or score.score_detail is None:
+            continue
+        detail = score.score_detail
+        rows = snapshot.vp_rows.get(score.stock_code)
+        if rows is not None:
+            result = calc_volume_profile_from_kiwoom(
+                data={"prps_cnctr": rows}, current_price=score.current_price,
+                n_days=vp_cfg.get("cycle", 0), cur_entry=vp_cfg.get("cur_entry", 0),
+                stock_code=score.stock_code,
+            )
+            detail.raw_vp_score = result.score
+            detail.raw_vp_above_pct = result.above_pct
+            detail.raw_vp_below_pct = result.below_pct
+            detail.raw_vp_tag = result.tag
+        else:
+            detail.raw_vp_score = vp.get("score", detail.raw_vp_score)
+            detail.raw_vp_above_pct = vp.get("above_pct", 0.0)
+            detail.raw_vp_below_pct = vp.get("below_pct", 0.0)
+            detail.raw_vp_tag = vp.get("tag", "")
+        detail.raw_vp_meta = vp.get("meta", "")
+
+
+def _record_values(record: Dict) -> Dict[str, object]:
+    values = {"total": record["total"], "broker_anomaly": record.get("broker_anomaly", 0)}
+    values.update(record.get("scores", {}))
+    values["vp_score"] = record.get("vp", {}).get("score")
+    return values
+
+
+def diff_results(recorded: List[Dict], replayed: List[Dict], top_n: int) -> Dict:
+    """기록된 결과 vs 재계산 결과 (score_records 형식, 값은 정확히 같아야 동일)"""
+    recorded_by_code = {r["code"]: r for r in recorded}
+    replayed_by_code = {r["code"]: r for r in replayed}
+    rank_changes = []
+    value_changes = []
+    for record in recorded:
+        code = record["code"]
+        other = replayed_by_code.get(code)
+        if other is None:
+            continue
+        if record["rank"] != other["rank"]:
+            rank_changes.append({"code": code, "recorded": record["rank"], "replayed": other["rank"]})
+        replayed_values = _record_values(other)
+        for name, value in _record_values(record).items():
+            if replayed_values.get(name) != value:
+                value_changes.append({
+                    "code": code, "field": name, "recorded": value, "replayed": replayed_values.get(name),
+                })
+
+    recorded_top = [r["code"] for r in recorded[:top_n]]
+    replayed_top = [r["code"] for r in replayed[:top_n]]
+    diff = {
+        "recorded_top": recorded_top,
+        "replayed_top": replayed_top,
+        "entered": [c for c in replayed_top if c not in recorded_top],
+        "dropped": [c for c in recorded_top if c not in replayed_top],
+        "missing": [c for c in recorded_by_code if c not in replayed_by_code],
+        "extra": [c for c in replayed_by_code if c not in recorded_by_code],
+        "rank_changes": rank_changes,
+        "value_changes": value_changes,
+    }
+    diff["identical"] = not any(diff[k] for k in ("missing", "extra", "rank_changes", "value_changes"))
+    return diff
+
+
+def replay_run(run_id: str, store: Optional[RunSnapshotStore] = None) -> ReplayResult:
+    """run_id 스냅샷을 재채점하고 기록된 결과와 비교 (없으면 FileNotFoundError)"""
+    store = store or get_run_snapshot_store()
+    t0 = time.perf_counter()
+    snapshot = store.load(run_id)
+    t1 = time.perf_counter()
+    scores = replay_scores(snapshot)
+    t2 = time.perf_counter()
+    top_n = snapshot.config.get("top_n", 5)
+    return ReplayResult(
+        snapshot=snapshot,
+        scores=scores,
+        top_n=top_n,
+        load_ms=(t1 - t0) * 1000,
+        score_ms=(t2 - t1) * 1000,
+        diff=diff_results(snapshot.results, score_records(scores), top_n),
+    )
+
+
+def format_replay(result: ReplayResult) -> str:
+    """콘솔 출력용 요약"""
+    snapshot = result.snapshot
+    diff = result.diff
+    lines = [
+        f"🔁 재채점: {snapshot.run_id} ({snapshot.run_type}, {snapshot.screen_date})",
+        f"   종목 {len(snapshot.stocks)}개 → 점수 {len(result.scores)}개 "
+        f"(로드 {result.load_ms:.1f}ms, 재계산 {result.score_ms:.1f}ms)",
+        f"   거래원 반영: {'예' if snapshot.broker_applied else '아니오'}, "
+        f"키움 매물대 행: {len(snapshot.vp_rows)}종목",
+        f"   기록 TOP{result.top_n}:   {', '.join(diff['recorded_top']) or '-'}",
+        f"   재계산 TOP{result.top_n}: {', '.join(diff['replayed_top']) or '-'}",
+    ]
+    if result.identical:
+        lines.append("✅ 기록된 결과와 동일")
+        return "\n".join(lines)
+
+    lines.append(
+        f"⚠️ 차이: 순위 {len(diff['rank_changes'])}건, 값 {len(diff['value_changes'])}건, "
+        f"누락 {len(diff['missing'])}종목, 추가 {len(diff['extra'])}종목"
+    )
+    if diff["entered"] or diff["dropped"]:
+        lines.append(f"   TOP{result.top_n} 진입: {diff['entered']} / 탈락: {diff['dropped']}")
+    details = [
+        f"   {c['code']} 순위 {c['recorded']} → {c['replayed']}" for c in diff["rank_changes"]
+    ] + [
+        f"   {c['code']} {c['field']}: {c['recorded']!r} → {c['replayed']!r}" for c in diff["value_changes"]
+    ]
+    lines.extend(details[:MAX_DIFF_LINES])
+    if len(details) > MAX_DIFF_LINES:
+        lines.append(f"   ... 외 {len(details) - MAX_DIFF_LINES}건")
+    return "\n".join(lines)
@@ -24,32 +24,53 @@ v6.5 변경사항:
 import os
 import time
 import logging
-from datetime import date
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+from contextlib import contextmanager
+from datetime import date, datetime
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Callable, List, Optional, Dict, Iterator, Tuple
 
 from src.config.settings import settings
 from src.config.constants import get_top_n_count, MIN_DAILY_DATA_COUNT
-from src.config.app_config import MAPPING_FILE, OHLCV_FULL_DIR
+from src.config.app_config import OHLCV_FULL_DIR
 from src.utils.stock_filters import filter_universe_stocks
-from src.domain.models import StockData, StockInfo, StockScore, ScoreDetail, ScreeningResult, ScreeningStatus
+from src.utils.deadline import Deadline, deadline_scope
+from src.utils.market_calendar import last_trading_day
+from src.domain.models import (
+    StockData, StockInfo, StockScore, ScoreDetail, ScreeningResult, ScreeningStatus, QuoteSnapshot,
+)
 from src.domain.score_calculator import (
     ScoreCalculatorV5,
     StockScoreV5,
     format_discord_embed,
 )
+from src.domain.strategy_scoring import MultiStrategyResult, evaluate_strategies, parse_strategies
 from src.domain.volume_profile import (
     calc_volume_profile_from_csv,
     calc_volume_profile_from_kiwoom,
+    VolumeProfileResult,
     VP_SCORE_NEUTRAL,
 )
 from src.adapters.kiwoom_rest_client import get_kiwoom_client, KiwoomRestClient
+from src.adapters.response_cache import get_response_cache
+from src.adapters.daily_history_cache import get_daily_history_cache
+from src.adapters.volume_profile_cache import VpKey, get_volume_profile_cache
+from src.adapters.symbol_master import get_symbol_master
+from src.adapters.single_flight import get_single_flight
+from src.adapters.adaptive_rate import get_rate_controller
+from src.adapters.api_telemetry import ApiTelemetry, Snapshot, get_api_telemetry, telemetry_stage
+from src.adapters.rate_limiter import (
+    PRIORITY_CRITICAL, get_rate_limiter, submit_with_context, with_priority,
+)
 from src.adapters.discord_notifier import get_discord_notifier, DiscordNotifier
 from src.infrastructure.repository import (
     get_screening_repository,
     ScreeningRepository,
 )
 from src.services.sector_service import get_sector_service, SectorService
+from src.services.screening_pipeline import (
+    RunningTopK, SpeculativeEnricher, apply_broker_anomalies, finalize_scores,
+)
 from src.infrastructure.database import init_database
 
 logger = logging.getLogger(__name__)
@@ -76,6 +97,11 @@ MARKET_CAP_TIERS = [
 # 대기업 기준 시가총액 (1조원 = 10000억)
 LARGE_CAP_THRESHOLD = 10000
 
+# 수집 중 보강 선조회 대상 (실시간 상위 K, 거래원 스캔 Top20과 같은 수)
+SPECULATIVE_TOP_K = 20
+SCORE_BATCH_SIZE = 32  # VECTORIZED_SCORING 사용 시 수집 스트림을 이만큼 모아 배치 점수 계산
+VP_MARKET_KEY = "ka10025"  # 매물대 선조회 키 (시장 전체 연속조회 1회 → 당일 캐시)
+
 
 def get_market_cap_label(market_cap: float) -> str:
     """시가총액 라벨 반환 (점수 가산 없음)
@@ -118,6 +144,17 @@ def filter_by_cci(scores: list, limit: int = CCI_HARD_LIMIT) -> tuple:
 class ScreenerService:
     """스크리닝 서비스 v7.0 (키움 REST API 기반)"""
     
+    # 단계별 시간 예산 (전체 예산 대비 비율)
+    # 저우선 단계(거래원/매물대/시총)는 예산이 부족하면 생략하거나 축소한다.
+    STAGE_BUDGET = {
+        "universe": 0.10,
+        "collect": 0.55,
+        "broker": 0.10,
+        "vp": 0.10,
+        "quotes": 0.05,
+    }
+    LOW_PRIORITY_MIN_SEC = 20  # 저우선 단계를 시작하려면 남아 있어야 하는 시간
+    
     def __init__(
         self,
         broker_client: Optional[KiwoomRestClient] = None,
@@ -127,42 +164,92 @@ class ScreenerService:
         self.broker_client = broker_client or get_kiwoom_client()
         self.discord_notifier = discord_notifier or get_discord_notifier()
         self.screening_repo = screening_repo or get_screening_repository()
-        self.calculator = ScoreCalculatorV5()
+        self.calculator = ScoreCalculatorV5(vectorized=settings.screening.vectorized_scoring)
+        
+        # 랭킹 API 시세 스냅샷 (유니버스 조회 시 채움, 수집 단계에서 우선 사용)
+        self._quote_snapshots: Dict[str, QuoteSnapshot] = {}
+        self.quote_stats: Dict[str, int] = {}
+        
+        # 실행 스냅샷용 점수 입력 (실행마다 초기화)
+        self._collected: List[StockData] = []
+        self._broker_applied = False
         
         logger.info("ScreenerService 초기화 (키움 REST API)")
     
+    @with_priority(PRIORITY_CRITICAL)
     def run_screening(
         self,
         screen_time: str = "15:00",
         save_to_db: bool = True,
         send_alert: bool = True,
         is_preview: bool = False,
+        deadline: Optional[Deadline] = None,
+    ) -> Dict:
+        """스크리닝 실행
+        
+        Args:
+            deadline: 실행 시간 예산 (None이면 설정값으로 생성, 메인은 15:20 마감)
+        """
+        telemetry_start = get_api_telemetry().snapshot()
+        run_started = datetime.now()
+        run_id = self._run_id(run_started, is_preview)
+        try:
+            return self._run_screening(screen_time, save_to_db, send_alert, is_preview, deadline, run_id)
+        finally:
+            self._save_api_metrics(telemetry_start, run_id, run_started, is_preview)
+    
+    @staticmethod
+    def _run_id(run_started: datetime, is_preview: bool) -> str:
+        """실행 식별자 (api_metrics/shadow_scores 공통)"""
+        return f"{run_started:%Y%m%d-%H%M%S}-{'preview' if is_preview else 'main'}"
+    
+    def _run_screening(
+        self,
+        screen_time: str,
+        save_to_db: bool,
+        send_alert: bool,
+        is_preview: bool,
+        deadline: Optional[Deadline],
+        run_id: str = "",
     ) -> Dict:
-        """스크리닝 실행"""
         start_time = time.time()
         screen_date = date.today()
+        if deadline is None:
+            deadline = Deadline.for_run(is_preview=is_preview)
         
-        logger.info(f"스크리닝 시작: {screen_date} {screen_time}")
+        budget_text = "무제한" if deadline.unlimited else f"{deadline.remaining():.0f}초"
+        logger.info(f"스크리닝 시작: {screen_date} {screen_time} (시간 예산 {budget_text})")
         
+        speculative = self._start_speculation(is_preview, deadline)
+        self._collected = []
+        self._broker_applied = False
         try:
             # 1. 유니버스 조회
-            stocks = self._get_universe()
+            with telemetry_stage("universe"), \
+                    self._client_deadline(deadline.stage("universe", self.STAGE_BUDGET["universe"])):
+                stocks = self._get_universe()
             if not stocks:
                 return self._empty_result(screen_date, screen_time, start_time, 
                                          is_preview, "유니버스 비어있음")
             
             logger.info(f"유니버스: {len(stocks)}개")
             
-            # 2. 데이터 수집 (최소 하드필터만)
-            stock_data_list = self._collect_data(stocks)
-            if not stock_data_list:
+            # 2~3. 데이터 수집 (최소 하드필터만) + 점수 계산 (수집되는 대로)
+            daily_history = get_daily_history_cache()
+            history_start = daily_history.counters()
+            with telemetry_stage("collect"):
+                scores, collected_count = self._collect_and_score(
+                    stocks, deadline=deadline.stage("collect", self.STAGE_BUDGET["collect"]),
+                    on_enter=lambda code: self._speculate(speculative, code),
+                )
+            # 과거분 보관 → 같은 거래일 다음 실행(프리뷰 → 메인)은 당일 봉만 조회
+            daily_history.flush()
+            logger.info(f"일봉 과거분 캐시: {daily_history.format_stats(since=history_start)}")
+            if not collected_count:
                 return self._empty_result(screen_date, screen_time, start_time,
                                          is_preview, "수집된 종목 없음")
             
-            logger.info(f"데이터 수집: {len(stock_data_list)}개")
-            
-            # 3. 점수 계산
-            scores = self.calculator.calculate_scores(stock_data_list)
+            logger.info(f"데이터 수집: {collected_count}개")
             
             # v10.1: 하드필터 제거 (점수제에서 자연 반영)
             scores_filtered = scores
@@ -175,17 +262,42 @@ class ScreenerService:
             # v8.0: 거래원 스캔
             broker_adjustments = {}
             if not is_preview:
-                broker_adjustments = self._apply_broker_scores(scores_filtered, screen_date)
+                if deadline.allows(self.LOW_PRIORITY_MIN_SEC):
+                    with telemetry_stage("broker"):
+                        broker_adjustments = self._apply_broker_scores(
+                            scores_filtered, screen_date,
+                            deadline=deadline.stage("broker", self.STAGE_BUDGET["broker"]),
+                            speculative=speculative.get("broker"),
+                        )
+                else:
+                    deadline.cut("broker", "거래원 스캔(ka10040) 생략")
 
             # v9.0: 매물대(Volume Profile) 계산
-            self._calculate_volume_profiles(scores_filtered)
+            with telemetry_stage("vp"):
+                vp_deadline = deadline.stage("vp", self.STAGE_BUDGET["vp"])
+                self._await_speculative_vp(speculative.get("vp"), vp_deadline)
+                self._calculate_volume_profiles(scores_filtered, deadline=vp_deadline)
             
             # ★ P0-B: TOP_N_COUNT를 settings에서 가져오도록 통일
             top_n_count = get_top_n_count()
             
+            # 섀도 점수 전략 (확정된 항목 점수 재사용, 추가 API/지표 계산 없음)
+            shadow = self._evaluate_shadow_strategies(
+                scores_filtered, top_n_count, run_id, screen_date,
+                is_preview=is_preview, save=save_to_db,
+            )
+            
             # TOP5 선정 (필터링된 목록에서)
             top_n = self.calculator.select_top_n(scores_filtered, top_n_count)
             
+            # 랭킹 스냅샷에 없는 필드(시총)만 ka10001 일괄 조회 (표시용, TOP N 한정)
+            if deadline.allows(self.LOW_PRIORITY_MIN_SEC):
+                with telemetry_stage("quotes"), \
+                        self._client_deadline(deadline.stage("quotes", self.STAGE_BUDGET["quotes"])):
+                    self._fill_missing_quotes(top_n, collected_count=collected_count)
+            else:
+                deadline.cut("quotes", "TOP N 현재가(ka10001) 조회 생략")
+            
             # v6.2: 대기업 TOP5 별도 추출
             large_cap_top5 = [s for s in scores_filtered 
                             if getattr(s, '_market_cap', 0) >= LARGE_CAP_THRESHOLD][:top_n_count]
@@ -244,9 +356,13 @@ class ScreenerService:
                 "leading_sectors_text": leading_sectors_text,  # v6.3
                 "sector_stats": sector_stats,  # v6.3
                 "broker_adjustments": broker_adjustments,  # v7.1: 거래원 이상신호
+                "run_id": run_id,
+                "shadow_strategies": shadow.to_dict() if shadow else None,
             }
             
             # 4. DB 저장
+            result["quote_stats"] = dict(self.quote_stats)
+            result["cut_stages"] = deadline.cuts
             if save_to_db and not is_preview:
                 self._save_result(result)
             
@@ -254,10 +370,26 @@ class ScreenerService:
             if send_alert:
                 self._send_alert(result, is_preview)
             
+            # 실행 스냅샷은 알림 뒤에 저장 (재채점용이라 알림을 늦출 이유 없음)
+            result["run_snapshot"] = None
+            if save_to_db and run_id and settings.screening.save_run_snapshot:
+                result["run_snapshot"] = self._save_run_snapshot(
+                    run_id, screen_date, is_preview, stocks, scores_filtered,
+                    broker_adjustments, top_n_count,
+                )
+            
             # 6. 콘솔 출력
             logger.info(f"TOP5: {[s.stock_name for s in top_n]}")
             
             logger.info(f"스크리닝 완료: {execution_time:.1f}초")
+            logger.info(f"응답 캐시 hit: {get_response_cache().format_stats()}")
+            single_flight = get_single_flight()
+            if single_flight is not None:
+                logger.info(f"동일 요청 병합: {single_flight.format_stats()}")
+            rate_controller = get_rate_controller()
+            if rate_controller is not None:
+                logger.info(f"실효 호출 속도: {rate_controller.format_rates()}")
+            logger.info(f"등급별 호출 대기: {get_rate_limiter().format_wait_stats()}")
             return result
             
         except Exception as e:
@@ -273,6 +405,113 @@ class ScreenerService:
             
             return self._empty_result(screen_date, screen_time, start_time,
                                      is_preview, str(e))
+        finally:
+            for enricher in speculative.values():
+                enricher.close()
+    
+    def _save_api_metrics(
+        self,
+        telemetry_start: Snapshot,
+        run_id: str,
+        run_started: datetime,
+        is_preview: bool,
+    ) -> None:
+        """이번 실행의 (단계, api-id)별 텔레메트리 로그 + api_metrics 저장"""
+        try:
+            delta = get_api_telemetry().since(telemetry_start)
+            logger.info(f"API 텔레메트리: {ApiTelemetry.format_stats(delta)}")
+            if not delta or not settings.screening.save_api_metrics:
+                return
+            from src.infrastructure.repository import get_api_metrics_repository
+            
+            run_type = "preview" if is_preview else "main"
+            rows = [
+                {"stage": stage, "api_id": tr_id, "buckets": stats.buckets, **stats.to_row()}
+                for (stage, tr_id), stats in sorted(delta.items())
+            ]
+            get_api_metrics_repository().save_run(run_id, run_type, run_started.date(), rows)
+        except Exception as e:
+            logger.warning(f"API 텔레메트리 저장 실패 (무시): {e}")
+    
+    def _save_run_snapshot(
+        self,
+        run_id: str,
+        screen_date: date,
+        is_preview: bool,
+        stocks: List,
+        scores: List[StockScoreV5],
+        broker_adjustments: dict,
+        top_n: int,
+    ) -> Optional[Dict[str, int]]:
+        """점수 입력(수집 일봉/랭킹 시세/거래원/매물대 행) + 최종 순위를 실행 스냅샷으로 저장 (실패 무시)"""
+        try:
+            from src.adapters.run_snapshot import RunSnapshot, get_run_snapshot_store, score_records
+            vp_cache = get_volume_profile_cache()
+            vp_day = last_trading_day()
+            vp_key = self._vp_key()
+            vp_rows = {}
+            for score in scores:
+                if score.score_detail is not None and getattr(score.score_detail, "raw_vp_meta", "").startswith("kiwoom/"):
+                    rows = vp_cache.get(score.stock_code, vp_day, vp_key)
+                    if rows is not None:
+                        vp_rows[score.stock_code] = rows
+            
+            snapshot = RunSnapshot(
+                run_id=run_id,
+                run_type="preview" if is_preview else "main",
+                screen_date=screen_date,
+                universe=[stock.code for stock in stocks],
+                stocks=self._collected,
+                quotes=self._quote_snapshots,
+                broker_applied=self._broker_applied,
+                broker_anomaly={code: adj.anomaly_score for code, adj in broker_adjustments.items()},
+                vp_rows=vp_rows,
+                results=score_records(scores),
+                config={
+                    "top_n": top_n,
+                    "vectorized": self.calculator.vectorized,
+                    "vp": {"cycle": vp_key[0], "bands": vp_key[1], "cur_entry": vp_key[2]},
+                },
+            )
+            stats = get_run_snapshot_store().save(snapshot)
+            logger.info(
+                f"실행 스냅샷 저장: {run_id} ({stats['stocks']}종목, 객체 신규 {stats['objects_written']}"
+                f"/재사용 {stats['objects_reused']}, {stats['bytes_written'] / 1024:.1f}KB)"
+            )
+            if stats["runs_pruned"]:
+                logger.info(
+                    f"실행 스냅샷 정리: 실행 {stats['runs_pruned']}개, 객체 {stats['objects_pruned']}개 삭제"
+                )
+            return stats
+        except Exception as e:
+            logger.warning(f"실행 스냅샷 저장 실패 (무시): {e}")
+            return None
+    
+    def _evaluate_shadow_strategies(
+        self,
+        scores: list,
+        top_n: int,
+        run_id: str,
+        screen_date: date,
+        is_preview: bool,
+        save: bool,
+    ) -> Optional[MultiStrategyResult]:
+        """설정된 섀도 전략을 기준 전략과 함께 평가 + 로그/shadow_scores 저장 (실패 무시)"""
+        strategies = parse_strategies(settings.screening.shadow_strategies)
+        if not strategies or not scores:
+            return None
+        try:
+            shadow = evaluate_strategies(scores, strategies, top_n)
+            logger.info(f"섀도 전략: {shadow.format_summary()}")
+            if save and run_id:
+                from src.infrastructure.repository import get_shadow_score_repository
+                
+                run_type = "preview" if is_preview else "main"
+                get_shadow_score_repository().save_run(run_id, run_type, screen_date, shadow.to_dict())
+            return shadow
+        except Exception as e:
+            logger.warning(f"섀도 전략 평가 실패 (무시): {e}")
+            return None
     
     def _get_universe(self) -> List:
         """유니버스 조회 (키움 REST API 기반)
@@ -298,6 +537,7 @@ class ScreenerService:
         stocks = []
         names_dict = {}
         is_fallback = False
+        self._quote_snapshots = {}
         
         try:
             # 키움 REST API로 유니버스 조회
@@ -306,9 +546,15 @@ class ScreenerService:
                 min_change_rate=1.0,
                 max_change_rate=29.0,
                 volume_rank_limit=150,
+                target_count=settings.screening.universe_target or None,
             )
             
             if raw_stocks:
+                # 랭킹 응답의 현재가/등락률/거래대금 보관 (수집 단계 재사용)
+                self._quote_snapshots = {
+                    snap.code: snap for snap in (QuoteSnapshot.from_rank(s) for s in raw_stocks)
+                }
+                
                 # StockInfo 객체로 변환
                 stocks_before_filter = [
                     StockInfo(code=s['code'], name=s['name']) 
@@ -490,74 +736,279 @@ class ScreenerService:
         
         return today
     
-    def _collect_data(self, stocks: List) -> List[StockData]:
-        """데이터 수집 (최소 하드필터)"""
-        stock_data_list = []
+    @contextmanager
+    def _client_deadline(self, deadline: Optional[Deadline]):
+        """범위 안의 키움 호출에 시간 예산 적용 (현재 스레드/컨텍스트 한정, None이면 그대로)
         
-        for i, stock in enumerate(stocks):
-            try:
-                daily_prices = self.broker_client.get_daily_prices(
-                    stock.code,
-                    count=MIN_DAILY_DATA_COUNT + 10,
-                )
-                
-                if len(daily_prices) < MIN_DAILY_DATA_COUNT:
-                    continue
-                
-                today = daily_prices[-1]
-                yesterday = daily_prices[-2]
-                change_rate = ((today.close - yesterday.close) / yesterday.close) * 100
-                
-                # 하락종목 제외 (종가매매는 상승종목 대상)
-                if change_rate < 0:
-                    continue
-                
-                # 거래대금 계산 (여러 소스에서 시도)
-                trading_value = 0.0
-                market_cap = 0.0  # v6.5: 시총 추가
-                
-                # 1차: 일봉 데이터에서
-                if today.trading_value > 0:
-                    trading_value = today.trading_value / 100_000_000
-                
-                # 2차: 현재가 API에서 (거래대금 + 시총)
-                if trading_value <= 0 or market_cap <= 0:
-                    try:
-                        current_data = self.broker_client.get_current_price(stock.code)
-                        if current_data:
-                            if current_data.trading_value > 0 and trading_value <= 0:
-                                trading_value = current_data.trading_value / 100_000_000
-                            # v6.5: 시총 가져오기 (억원 단위)
-                            if hasattr(current_data, 'market_cap') and current_data.market_cap > 0:
-                                market_cap = current_data.market_cap
-                    except Exception as e:
-                        logger.debug(f"현재가 조회 실패: {stock.code} - {e}")
-                
-                # 3차: 조건검색 결과에서
-                if trading_value <= 0 and hasattr(stock, 'trading_value') and stock.trading_value > 0:
-                    trading_value = stock.trading_value
-                
-                # 4차: 거래량 × 종가로 추정
-                if trading_value <= 0 and today.volume > 0:
-                    trading_value = (today.volume * today.close) / 100_000_000
-                
-                stock_data = StockData(
-                    code=stock.code,
-                    name=stock.name,
-                    daily_prices=daily_prices,
-                    current_price=today.close,
-                    trading_value=trading_value,
-                    market_cap=market_cap,  # v6.5: 시총 전달
-                )
-                stock_data_list.append(stock_data)
-                
+        공용 클라이언트를 같이 쓰는 다른 스레드에는 영향이 없고,
+        submit_with_context로 넘긴 작업에는 이어진다.
+        """
+        if deadline is None:
+            yield
+            return
+        with deadline_scope(deadline):
+            yield
+    
+    def _collect_data(self, stocks: List, deadline: Optional[Deadline] = None) -> List[StockData]:
+        """데이터 수집 (최소 하드필터)
+        
+        COLLECT_WORKERS > 1이면 스레드 풀로 N건을 동시에 요청한다.
+        (동시 요청 수와 무관하게 초당 호출 수는 공용 Rate Limiter가 제한)
+        결과는 유니버스 순서로 되돌려 정렬 안정성을 유지한다.
+        deadline이 지나면 남은 종목은 수집하지 않는다 (cut_stages에 기록).
+        """
+        order = {stock.code: i for i, stock in enumerate(stocks)}
+        stock_data_list = list(self._iter_collected(stocks, deadline=deadline))
+        stock_data_list.sort(key=lambda sd: order.get(sd.code, len(order)))
+        return stock_data_list
+    
+    def _iter_collected(self, stocks: List, deadline: Optional[Deadline] = None) -> Iterator[StockData]:
+        """수집 결과를 끝나는 대로 yield (COLLECT_WORKERS <= 1이면 유니버스 순서로 한 건씩)"""
+        workers = settings.screening.collect_workers
+        if workers > 1 and len(stocks) > 1:
+            yield from self.iter_collect_data(stocks, max_workers=workers, deadline=deadline)
+            return
+        with self._client_deadline(deadline):
+            for i, stock in enumerate(stocks):
+                if deadline is not None and deadline.expired():
+                    deadline.cut("collect", f"{i}/{len(stocks)}개 수집 후 중단")
+                    break
+                stock_data = self._collect_one_safe(stock)
+                if stock_data is not None:
+                    yield stock_data
                 if (i + 1) % 20 == 0:
                     logger.info(f"진행: {i + 1}/{len(stocks)}")
-                    
+    
+    def _collect_and_score(
+        self,
+        stocks: List,
+        deadline: Optional[Deadline] = None,
+        on_enter: Optional[Callable[[str], None]] = None,
+        top_k: int = SPECULATIVE_TOP_K,
+    ) -> Tuple[List[StockScoreV5], int]:
+        """수집 → 점수 스트리밍
+        
+        종목마다 일봉이 도착하는 즉시 점수를 계산하고 실시간 상위 top_k를 유지한다.
+        상위 top_k에 새로 들어온 종목은 on_enter(code)로 알린다 (보강 선조회용).
+        배치 점수 계산(vectorized) 사용 시 SCORE_BATCH_SIZE개씩 모아 계산한다.
+        최종 정렬/순위는 calculate_scores와 같다 (동점은 유니버스 순서).
+        
+        Returns:
+            (정렬된 점수 리스트, 수집 통과 종목 수)
+        """
+        order = {stock.code: i for i, stock in enumerate(stocks)}
+        top = RunningTopK(top_k)
+        scores = []
+        collected_count = 0
+        batch_size = SCORE_BATCH_SIZE if self.calculator.vectorized else 1
+        pending = []
+        
+        def score_pending():
+            for score in self.calculator.calculate_each(pending):
+                if not score:
+                    continue
+                scores.append(score)
+                if top.push(score) and on_enter is not None:
+                    on_enter(score.stock_code)
+            pending.clear()
+        
+        for stock_data in self._iter_collected(stocks, deadline=deadline):
+            collected_count += 1
+            self._collected.append(stock_data)
+            pending.append(stock_data)
+            if len(pending) >= batch_size:
+                score_pending()
+        score_pending()
+        
+        finalize_scores(scores, order)
+        logger.info(f"점수 계산 완료: {len(scores)}개 종목 (수집과 동시 진행)")
+        return scores, collected_count
+    
+    def _start_speculation(
+        self,
+        is_preview: bool,
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, SpeculativeEnricher]:
+        """상위 종목 보강 선조회 준비 (거래원: 메인만, 매물대: 키움 사용 시)
+        
+        선조회는 실행 전체 예산(deadline)으로 돈다 (제출 시점의 수집 단계 예산을 물려받지 않음).
+        """
+        speculative: Dict[str, SpeculativeEnricher] = {}
+        if not is_preview:
+            try:
+                from src.services.broker_signal import fetch_broker_adjustment
+                client = get_kiwoom_client()
+                speculative["broker"] = SpeculativeEnricher(
+                    # 실패는 예외로 → results()에서 빠지고 거래원 단계가 다시 조회
+                    lambda code: fetch_broker_adjustment(client, code, raise_errors=True),
+                    name="broker", max_tasks=SPECULATIVE_TOP_K * 2, deadline=deadline,
+                )
             except Exception as e:
-                logger.debug(f"수집 실패: {stock.code} - {e}")
+                logger.debug(f"거래원 선조회 비활성: {e}")
+        vp_client = self._vp_kiwoom_client()
+        if vp_client is not None:
+            speculative["vp"] = SpeculativeEnricher(
+                lambda _key: self._load_vp_rows(vp_client),
+                name="vp", max_workers=1, max_tasks=1, deadline=deadline,
+            )
+        return speculative
+    
+    @staticmethod
+    def _speculate(speculative: Dict[str, SpeculativeEnricher], code: str) -> None:
+        """상위 K 진입 종목 선조회 (매물대는 시장 전체 1회라 첫 진입 때만)"""
+        if "broker" in speculative:
+            speculative["broker"].submit(code)
+        if "vp" in speculative:
+            speculative["vp"].submit(VP_MARKET_KEY)
+    
+    def _await_speculative_vp(
+        self,
+        enricher: Optional[SpeculativeEnricher],
+        deadline: Optional[Deadline] = None,
+    ) -> None:
+        """진행 중인 매물대 선조회(당일 캐시 채우기)가 끝나길 기다림 (중복 조회 방지)"""
+        if enricher is None:
+            return
+        timeout = None if deadline is None or deadline.unlimited else max(0.0, deadline.remaining())
+        enricher.results([VP_MARKET_KEY], timeout=timeout)
+    
+    def iter_collect_data(
+        self,
+        stocks: List,
+        max_workers: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Iterator[StockData]:
+        """동시 수집 - 완료되는 순서대로 StockData를 yield
         
-        return stock_data_list
+        Args:
+            stocks: 유니버스 (StockInfo 리스트)
+            max_workers: 동시 요청 수 (기본 settings.screening.collect_workers)
+            deadline: 시간 예산 (지나면 대기 중인 종목은 취소)
+        """
+        workers = max(1, max_workers or settings.screening.collect_workers)
+        timeout = None if deadline is None or deadline.unlimited else max(0.0, deadline.remaining())
+        done = 0
+        with self._client_deadline(deadline), \
+                ThreadPoolExecutor(max_workers=workers, thread_name_prefix="collect") as executor:
+            futures = [submit_with_context(executor, self._collect_one_safe, stock) for stock in stocks]
+            try:
+                for future in as_completed(futures, timeout=timeout):
+                    done += 1
+                    stock_data = future.result()
+                    if done % 20 == 0:
+                        logger.info(f"진행: {done}/{len(stocks)}")
+                    if stock_data is not None:
+                        yield stock_data
+            except FuturesTimeout:
+                for future in futures:
+                    future.cancel()
+                deadline.cut("collect", f"{done}/{len(stocks)}개 수집 후 중단")
+    
+    def _collect_one_safe(self, stock) -> Optional[StockData]:
+        """단일 종목 수집 (실패 시 None, 로그만 남김)"""
+        try:
+            return self._collect_one(stock)
+        except Exception as e:
+            logger.debug(f"수집 실패: {stock.code} - {e}")
+            return None
+    
+    def _collect_one(self, stock) -> Optional[StockData]:
+        """단일 종목 수집 (하드필터 탈락 시 None)"""
+        series = None
+        if hasattr(self.broker_client, 'get_daily_series'):
+            # 열 단위 시계열을 그대로 사용 (인덱스/슬라이스/순회는 봉 뷰, DailyPrice 객체 생성 없음)
+            series = self.broker_client.get_daily_series(
+                stock.code,
+                count=MIN_DAILY_DATA_COUNT + 10,
+            )
+            if len(series) < MIN_DAILY_DATA_COUNT:
+                return None
+            daily_prices = series
+        else:
+            daily_prices = self.broker_client.get_daily_prices(
+                stock.code,
+                count=MIN_DAILY_DATA_COUNT + 10,
+            )
+        
+        if len(daily_prices) < MIN_DAILY_DATA_COUNT:
+            return None
+        
+        today = daily_prices[-1]
+        yesterday = daily_prices[-2]
+        change_rate = ((today.close - yesterday.close) / yesterday.close) * 100
+        
+        # 하락종목 제외 (종가매매는 상승종목 대상)
+        if change_rate < 0:
+            return None
+        
+        # 거래대금 계산 (여러 소스에서 시도)
+        trading_value = 0.0
+        market_cap = 0.0  # v6.5: 시총 추가 (랭킹 미제공 → TOP N만 일괄 조회)
+        snapshot = self._quote_snapshots.get(stock.code)
+        
+        # 1차: 일봉 데이터에서
+        if today.trading_value > 0:
+            trading_value = today.trading_value / 100_000_000
+        
+        # 2차: 랭킹 API 스냅샷에서 (ka10032/ka10030, 추가 호출 없음)
+        if trading_value <= 0 and snapshot is not None and snapshot.trading_value > 0:
+            trading_value = snapshot.trading_value
+        if snapshot is not None and snapshot.market_cap > 0:
+            market_cap = snapshot.market_cap
+        
+        # 3차: 조건검색 결과에서
+        if trading_value <= 0 and hasattr(stock, 'trading_value') and stock.trading_value > 0:
+            trading_value = stock.trading_value
+        
+        # 4차: 거래량 × 종가로 추정
+        # (ka10001은 거래대금을 제공하지 않으므로 거래대금 용도로는 호출하지 않음)
+        if trading_value <= 0 and today.volume > 0:
+            trading_value = (today.volume * today.close) / 100_000_000
+        
+        return StockData(
+            code=stock.code,
+            name=stock.name,
+            daily_prices=daily_prices,
+            current_price=today.close,
+            trading_value=trading_value,
+            market_cap=market_cap,  # v6.5: 시총 전달
+            series=series,
+        )
+    
+    def _fill_missing_quotes(self, scores: list, collected_count: int = 0) -> None:
+        """랭킹 스냅샷에 없는 필드(시가총액)만 ka10001로 일괄 조회
+        
+        이전에는 수집 단계에서 통과 종목마다 ka10001을 1회씩 호출했다.
+        시총은 TOP N 표시에만 쓰이므로 해당 종목만, 한 번의 병렬 패스로 조회한다.
+        """
+        targets = [s for s in scores if getattr(s, 'market_cap', 0) <= 0]
+        
+        def _fetch(score):
+            try:
+                return score, self.broker_client.get_current_price(score.stock_code)
+            except Exception as e:
+                logger.debug(f"현재가 조회 실패: {score.stock_code} - {e}")
+                return score, None
+        
+        calls = 0
+        if targets:
+            workers = max(1, min(settings.screening.collect_workers, len(targets)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="quote") as executor:
+                futures = [submit_with_context(executor, _fetch, score) for score in targets]
+                for future in futures:
+                    score, current = future.result()
+                    calls += 1
+                    if current is not None and getattr(current, 'market_cap', 0) > 0:
+                        score.market_cap = current.market_cap
+        
+        self.quote_stats = {
+            "ka10001_calls": calls,
+            "ka10001_avoided": max(0, collected_count - calls),
+            "rank_snapshots": len(self._quote_snapshots),
+        }
+        logger.info(
+            f"ka10001 호출 {calls}회 (랭킹 스냅샷 재사용으로 {self.quote_stats['ka10001_avoided']}회 절감)"
+        )
     
     def _load_market_cap_info(self, scores: list) -> dict:
         """v6.2: 시가총액 정보 로드 (점수 가산 없음, 대기업 표시용)
@@ -603,36 +1054,15 @@ class ScreenerService:
             return stats
     
     def _load_sector_mapping(self) -> Dict[str, str]:
-        """v6.3: stock_mapping.csv에서 종목코드 → 섹터 매핑 로드"""
+        """v6.3: 종목 마스터(stock_mapping.csv)에서 종목코드 → 섹터 매핑"""
         try:
-            import pandas as pd
-            from pathlib import Path
-            
-            # stock_mapping.csv 경로
-            mapping_paths = [
-                MAPPING_FILE,  # from app_config
-                Path("data/stock_mapping.csv"),
-                Path(__file__).parent.parent.parent / "data" / "stock_mapping.csv",
-            ]
-            
-            for path in mapping_paths:
-                if path.exists():
-                    df = pd.read_csv(path, encoding='utf-8-sig')
-                    df.columns = df.columns.str.lower()
-                    
-                    if 'code' in df.columns and 'sector' in df.columns:
-                        # 코드 6자리 패딩
-                        df['code'] = df['code'].astype(str).str.zfill(6)
-                        mapping = dict(zip(df['code'], df['sector']))
-                        logger.debug(f"섹터 매핑 로드: {len(mapping)}종목 from {path}")
-                        return mapping
-            
-            logger.warning("stock_mapping.csv를 찾을 수 없음")
-            return {}
-            
+            mapping = get_symbol_master().sectors()
         except Exception as e:
             logger.warning(f"섹터 매핑 로드 실패: {e}")
             return {}
+        if not mapping:
+            logger.warning("stock_mapping.csv 섹터 정보 없음")
+        return mapping
     
     def _empty_result(self, screen_date, screen_time, start_time, 
                       is_preview, error_msg) -> Dict:
@@ -850,30 +1280,37 @@ class ScreenerService:
             logger.warning(f"대기업 알림 실패: {e}")
     
 
-    def _apply_broker_scores(self, scores_filtered: list, screen_date) -> dict:
-        """거래원 스캔 + 점수 반영 + DB 저장"""
+    def _apply_broker_scores(
+        self,
+        scores_filtered: list,
+        screen_date,
+        deadline: Optional[Deadline] = None,
+        speculative: Optional[SpeculativeEnricher] = None,
+    ) -> dict:
+        """거래원 스캔 + 점수 반영 + DB 저장
+        
+        speculative: 수집 중 선조회한 결과 (Top20에 남은 종목만 재사용, 나머지는 버림)
+        """
         try:
-            from src.services.broker_signal import (
-                get_broker_adjustments, calc_broker_score, BROKER_SCORE_NEUTRAL
-            )
-            codes_top20 = [s.stock_code for s in scores_filtered[:20]]
-            broker_adjustments = get_broker_adjustments(codes_top20)
-            
-            # 점수 반영
-            for score in scores_filtered:
-                adj = broker_adjustments.get(score.stock_code)
-                if adj:
-                    score.score_detail.broker_score = calc_broker_score(adj.anomaly_score)
-                    score.score_detail.raw_broker_anomaly = adj.anomaly_score
-                else:
-                    score.score_detail.broker_score = BROKER_SCORE_NEUTRAL
-                    score.score_detail.raw_broker_anomaly = 0
-                score.score_total = score.score_detail.total
+            from src.services.broker_signal import get_broker_adjustments, calc_broker_score
+            codes_top20 = [s.stock_code for s in scores_filtered[:SPECULATIVE_TOP_K]]
+            prefetched = {}
+            if speculative is not None:
+                timeout = None if deadline is None or deadline.unlimited else max(0.0, deadline.remaining())
+                prefetched = speculative.results(codes_top20, timeout=timeout)
+                logger.info(
+                    f"거래원 선조회: {speculative.submitted}개 중 Top20 재사용 {len(prefetched)}개"
+                )
+            with self._client_deadline(deadline):
+                broker_adjustments = get_broker_adjustments(
+                    codes_top20, deadline=deadline, prefetched=prefetched,
+                )
             
-            # 재정렬
-            scores_filtered.sort(key=lambda x: (-x.score_total, -x.trading_value))
-            for i, s in enumerate(scores_filtered, 1):
-                s.rank = i
+            # 점수 반영 + 재정렬
+            apply_broker_anomalies(scores_filtered, {
+                code: adj.anomaly_score for code, adj in broker_adjustments.items()
+            })
+            self._broker_applied = True
             
             # DB 저장
             if broker_adjustments:
@@ -919,18 +1356,67 @@ class ScreenerService:
     def _resolve_stock_name(self, code: str) -> str:
         """종목코드로 종목명 조회"""
         try:
-            if MAPPING_FILE and MAPPING_FILE.exists():
-                import csv
-                with open(MAPPING_FILE, "r", encoding="utf-8") as f:
-                    for row in csv.DictReader(f):
-                        if str(row.get("code", "")).zfill(6) == code:
-                            return row.get("name", code)
+            return get_symbol_master().name(code, code)
         except Exception:
-            pass
-        return code
+            return code
     
-    def _calculate_volume_profiles(self, scores_filtered: list):
-        """매물대(Volume Profile) 계산"""
+    def _vp_kiwoom_client(self):
+        """매물대 키움 조회용 클라이언트 (VP_SOURCE가 local이거나 대시보드 전용이면 None)"""
+        if settings.vp.source not in {"auto", "kiwoom"}:
+            return None
+        if os.getenv("DASHBOARD_ONLY", "").lower() == "true":
+            return None
+        try:
+            return get_kiwoom_client()
+        except Exception as e:
+            logger.warning(f"[매물대] 키움 클라이언트 로드 실패: {e}")
+            return None
+    
+    @staticmethod
+    def _vp_key() -> VpKey:
+        vp_cfg = settings.vp
+        return (vp_cfg.cycle, vp_cfg.bands, vp_cfg.cur_entry)
+    
+    def _load_vp_rows(self, kiwoom_client, deadline: Optional[Deadline] = None) -> bool:
+        """ka10025 연속조회 결과를 당일 매물대 캐시에 채움 (이미 있으면 호출 없음)
+        
+        Returns:
+            캐시 사용 가능 여부 (조회 결과가 비어 있으면 False)
+        """
+        cache = get_volume_profile_cache()
+        day = last_trading_day()
+        key = self._vp_key()
+        if cache.has(day, key):
+            return True
+        vp_cfg = settings.vp
+        with self._client_deadline(deadline):
+            rows_by_code = kiwoom_client.get_volume_profile_rows(
+                cycle_tp=str(vp_cfg.cycle),
+                prpscnt=str(vp_cfg.bands),
+                cur_prc_entry=str(vp_cfg.cur_entry),
+                prps_cnctr_rt=str(vp_cfg.concentration_rate),
+                stex_tp=str(vp_cfg.stex_tp),
+                tr_id=str(vp_cfg.api_id),
+                mrkt_tp=str(vp_cfg.market),
+                trde_qty_tp=str(vp_cfg.trde_qty_tp),
+            )
+        if not rows_by_code:
+            return False
+        cache.put(day, key, rows_by_code)
+        logger.info(f"[매물대] ka10025 {len(rows_by_code)}종목 캐시 저장")
+        return True
+    
+    def _calculate_volume_profiles(
+        self,
+        scores_filtered: list,
+        deadline: Optional[Deadline] = None,
+    ):
+        """매물대(Volume Profile) 계산
+        
+        키움 매물대는 (code, cycle, bands, cur_entry)별 당일 캐시에서 읽는다
+        (없으면 ka10025를 시장별로 동시에 연속조회해 채움, 같은 거래일의 다음 실행은 재사용).
+        deadline이 지나 있으면 키움 조회 없이 로컬 CSV 계산으로 축소한다.
+        """
         try:
             logger.info("[매물대] Volume Profile 계산 시작...")
             vp_count = 0
@@ -938,16 +1424,20 @@ class ScreenerService:
             use_kiwoom = (vp_cfg.source in {"auto", "kiwoom"})
             use_local = (vp_cfg.source in {"auto", "local"})
             
-            kiwoom_client = None
-            kiwoom_available = True
-            if use_kiwoom and os.getenv("DASHBOARD_ONLY", "").lower() != "true":
-                try:
-                    kiwoom_client = get_kiwoom_client()
-                except Exception as e:
-                    logger.warning(f"[매물대] 키움 클라이언트 로드 실패: {e}")
-                    kiwoom_available = False
+            kiwoom_client = self._vp_kiwoom_client() if use_kiwoom else None
+            kiwoom_available = False
+            if kiwoom_client is not None:
+                if deadline is not None and deadline.expired():
+                    deadline.cut("vp", "키움 매물대 생략, 로컬 CSV로 대체")
+                else:
+                    try:
+                        kiwoom_available = self._load_vp_rows(kiwoom_client, deadline)
+                    except Exception as e:
+                        logger.warning(f"[매물대] ka10025 조회 실패: {e}")
+            vp_cache = get_volume_profile_cache()
+            vp_day = last_trading_day()
+            vp_key = self._vp_key()
             
-            vp_data_cache = None
             vp_error_count = 0
             for score in scores_filtered:
                 code = score.stock_code
@@ -956,29 +1446,12 @@ class ScreenerService:
                     vp_result = None
                     vp_meta = ""
                     
-                    # 키움 API
-                    if use_kiwoom and kiwoom_client and kiwoom_available:
+                    # 키움 API (당일 캐시)
+                    if kiwoom_available:
                         try:
-                            if vp_data_cache is None:
-                                data = kiwoom_client.get_volume_profile(
-                                    stock_code=code,
-                                    cycle_tp=str(vp_cfg.cycle),
-                                    prpscnt=str(vp_cfg.bands),
-                                    cur_prc_entry=str(vp_cfg.cur_entry),
-                                    trde_qty_tp=str(vp_cfg.trde_qty_tp),
-                                    tr_id=str(vp_cfg.api_id),
-                                )
-                                if isinstance(data, dict) and not any(
-                                    isinstance(v, list) and v for v in data.values()
-                                ):
-                                    kiwoom_available = False
-                                    data = {}
-                                vp_data_cache = data
-                            else:
-                                data = vp_data_cache
-                            
+                            rows = vp_cache.get(code, vp_day, vp_key) or []
                             vp_result = calc_volume_profile_from_kiwoom(
-                                data=data, current_price=price,
+                                data={"prps_cnctr": rows}, current_price=price,
                                 n_days=vp_cfg.cycle, cur_entry=vp_cfg.cur_entry,
                                 stock_code=code,
                             )
@@ -0,0 +1,165 @@
+"""
+수집 → 점수 스트리밍 파이프라인
+
+책임:
+- 수집이 끝난 종목(StockData)을 바로 점수 계산 (전체 수집 완료를 기다리지 않음)
+- 실시간 상위 K개(RunningTopK) 유지 → 새로 진입한 종목 통지
+- 상위 K 진입 종목의 보강 조회(거래원 ka10040 등)를 수집과 겹쳐 선조회
+  (SpeculativeEnricher, 최종 상위 K에 남은 종목 결과만 사용)
+
+최종 순위는 배치 계산(ScoreCalculatorV5.calculate_scores)과 같다:
+(-score_total, -trading_value) 정렬, 동점은 유니버스 순서.
+"""
+
+import heapq
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Generic, List, Optional, Set, Tuple, TypeVar
+
+from src.adapters.api_telemetry import telemetry_stage
+from src.adapters.rate_limiter import PRIORITY_NORMAL, request_priority, submit_with_context
+from src.utils.deadline import Deadline, deadline_scope
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def rank_key(score) -> Tuple[float, float]:
+    """높을수록 좋은 순위 키 (calculate_scores 정렬과 같은 기준)"""
+    return (score.score_total, score.trading_value)
+
+
+class RunningTopK:
+    """실시간 상위 K개 (최소 힙)
+
+    push()는 종목이 상위 K에 새로 들어오면 True를 돌려준다.
+    동점은 먼저 들어온 종목이 남는다 (들어온 순서가 유니버스 순서와 다를 수 있어
+    최종 순위는 finalize_scores로 다시 정한다).
+    """
+
+    def __init__(self, k: int = 20):
+        self.k = k
+        self._heap: List[Tuple[Tuple[float, float], int, str]] = []
+        self._seq = 0
+
+    def push(self, score) -> bool:
+        self._seq += 1
+        item = (rank_key(score), -self._seq, score.stock_code)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, item)
+            return True
+        if item > self._heap[0]:
+            heapq.heapreplace(self._heap, item)
+            return True
+        return False
+
+    def codes(self) -> Set[str]:
+        return {code for _, _, code in self._heap}
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+def finalize_scores(scores: List, order: Dict[str, int]) -> List:
+    """스트리밍으로 모은 점수를 배치 계산과 같은 순서로 정렬 + 순위 부여"""
+    scores.sort(key=lambda s: (-s.score_total, -s.trading_value, order.get(s.stock_code, len(order))))
+    for i, score in enumerate(scores, 1):
+        score.rank = i
+    return scores
+
+
+def apply_broker_anomalies(scores: List, anomalies: Dict[str, int]) -> List:
+    """거래원 anomaly_score → 거래원 점수 반영 + 재정렬/순위 (이상감지 없는 종목은 중립 점수)
+
+    실시간 스크리닝과 스냅샷 재채점(--replay)이 같은 식을 쓴다.
+    """
+    from src.services.broker_signal import BROKER_SCORE_NEUTRAL, calc_broker_score
+
+    for score in scores:
+        anomaly = anomalies.get(score.stock_code)
+        if anomaly is not None:
+            score.score_detail.broker_score = calc_broker_score(anomaly)
+            score.score_detail.raw_broker_anomaly = anomaly
+        else:
+            score.score_detail.broker_score = BROKER_SCORE_NEUTRAL
+            score.score_detail.raw_broker_anomaly = 0
+        score.score_total = score.score_detail.total
+    scores.sort(key=lambda x: (-x.score_total, -x.trading_value))
+    for i, score in enumerate(scores, 1):
+        score.rank = i
+    return scores
+
+
+class SpeculativeEnricher(Generic[T]):
+    """상위 K 진입 종목의 보강 조회를 미리 시작
+
+    조회는 PRIORITY_NORMAL로 보내 수집(critical)보다 뒤에 토큰을 받고,
+    텔레메트리는 name 단계로 집계한다 (수집 단계 호출과 섞이지 않음).
+    시간 예산은 deadline을 쓴다 (submit 시점의 단계 예산을 물려받지 않음, None이면 무제한).
+    max_tasks를 넘는 선조회는 하지 않는다 (순위가 크게 흔들리는 날의 낭비 상한).
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], T],
+        name: str = "speculative",
+        max_workers: int = 2,
+        max_tasks: int = 40,
+        deadline: Optional[Deadline] = None,
+    ):
+        self._fetch = fetch
+        self.name = name
+        self.max_tasks = max_tasks
+        self._deadline = deadline
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _run(self, code: str) -> T:
+        with request_priority(PRIORITY_NORMAL), telemetry_stage(self.name), deadline_scope(self._deadline):
+            return self._fetch(code)
+
+    def submit(self, code: str) -> bool:
+        """선조회 시작 (이미 시작했거나 상한에 도달하면 False)"""
+        with self._lock:
+            if self._closed or code in self._futures or len(self._futures) >= self.max_tasks:
+                return False
+            self._futures[code] = submit_with_context(self._executor, self._run, code)
+            return True
+
+    def results(self, codes: List[str], timeout: Optional[float] = None) -> Dict[str, T]:
+        """codes 중 선조회한 종목의 결과 (timeout 안에 끝나지 않았거나 실패한 종목은 제외)
+
+        나머지 대기 중인 선조회는 취소한다.
+        """
+        wanted = set(codes)
+        with self._lock:
+            targets = {c: f for c, f in self._futures.items() if c in wanted}
+            for code, future in self._futures.items():
+                if code not in wanted:
+                    future.cancel()
+        if targets:
+            wait(list(targets.values()), timeout=timeout)
+
+        results: Dict[str, T] = {}
+        for code, future in targets.items():
+            if not future.done() or future.cancelled():
+                continue
+            try:
+                results[code] = future.result()
+            except Exception as e:
+                logger.debug(f"선조회 실패 ({self.name}): {code} - {e}")
+        return results
+
+    @property
+    def submitted(self) -> int:
+        return len(self._futures)
+
+    def close(self) -> None:
+        """남은 선조회 취소 + 스레드 정리"""
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -14,6 +14,7 @@ import logging
 from datetime import date, datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 
+from src.adapters.rate_limiter import PRIORITY_BACKGROUND, with_priority
 from src.domain.short_selling import (
     ShortSellingDaily, StockLendingDaily, ShortSellingScore
 )
@@ -208,6 +209,7 @@ def analyze_short_selling(
     return score
 
 
+@with_priority(PRIORITY_BACKGROUND)
 def fetch_and_analyze(
     stock_code: str,
     kiwoom_client,
@@ -252,6 +254,7 @@ def fetch_and_analyze(
     return analyze_short_selling(stock_code, short_data, lending_data)
 
 
+@with_priority(PRIORITY_BACKGROUND)
 def batch_analyze(
     stock_codes: List[str],
     kiwoom_client,
@@ -0,0 +1,155 @@
+"""
+실행 단위 시간 예산 (Deadline)
+
+책임:
+- 스크리닝 1회의 마감 시각 관리 (monotonic 기준)
+- 단계별 예산 분할 (stage): 전체 예산의 일정 비율, 단 상위 마감과 알림용 예비시간을 넘지 않음
+- 잘린(생략/축소된) 단계 기록 → 결과 dict의 cut_stages
+- 현재 실행 흐름(contextvars)의 시간 예산: deadline_scope / current_deadline
+  (스레드·호출자별로 분리, 스레드 풀에는 rate_limiter.submit_with_context로 전달)
+
+사용:
+    deadline = Deadline.for_run(is_preview=False)
+    collect = deadline.stage("collect", 0.55)
+    if collect.expired():
+        deadline.cut("collect", "예산 소진")
+    with deadline_scope(collect):
+        ...  # 이 범위의 키움 호출은 collect 예산 적용
+"""
+
+import contextvars
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Deadline:
+    """마감 시각 + 단계별 예산 (하위 단계는 잘림 기록을 공유)"""
+
+    def __init__(
+        self,
+        budget_sec: Optional[float] = None,
+        reserve_sec: float = 0.0,
+        name: str = "run",
+        clock: Callable[[], float] = time.monotonic,
+        _parent: Optional["Deadline"] = None,
+    ):
+        self.name = name
+        self._clock = clock
+        self.started = clock()
+        self.budget_sec = math.inf if budget_sec is None else max(0.0, float(budget_sec))
+        self.expires_at = self.started + self.budget_sec
+        self.reserve_sec = max(0.0, float(reserve_sec))
+        self._root = _parent._root if _parent is not None else self
+        if _parent is None:
+            self._cuts: List[Dict] = []
+            self._lock = threading.Lock()
+
+    @classmethod
+    def for_run(cls, is_preview: bool = False, now: Optional[datetime] = None) -> "Deadline":
+        """설정 기반 실행 예산
+
+        - SCREENING_BUDGET_SEC: 실행 시작부터의 예산 (0이면 무제한)
+        - SCREENING_DEADLINE_MAIN: 메인 스크리닝의 절대 마감 시각 (HH:MM, 더 이른 쪽 적용)
+        """
+        cfg = settings.screening
+        budget = float(cfg.run_budget_sec) if cfg.run_budget_sec > 0 else None
+        if not is_preview and cfg.deadline_main:
+            now = now or datetime.now()
+            try:
+                hh, mm = (int(x) for x in cfg.deadline_main.split(":"))
+                until = (now.replace(hour=hh, minute=mm, second=0, microsecond=0) - now).total_seconds()
+                if until > 0:
+                    budget = until if budget is None else min(budget, until)
+            except ValueError:
+                logger.warning(f"마감 시각 형식 오류 (HH:MM): {cfg.deadline_main}")
+        return cls(budget_sec=budget, reserve_sec=cfg.deadline_reserve_sec)
+
+    # ========================================
+    # 조회
+    # ========================================
+    @property
+    def unlimited(self) -> bool:
+        return math.isinf(self.expires_at)
+
+    def remaining(self) -> float:
+        """남은 시간 (초, 무제한이면 inf)"""
+        return self.expires_at - self._clock()
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def allows(self, seconds: float) -> bool:
+        """seconds 만큼의 작업을 시작해도 되는지 (예비시간 제외)"""
+        return self.remaining() - self.reserve_sec >= seconds
+
+    # ========================================
+    # 단계 분할
+    # ========================================
+    def stage(self, name: str, share: float) -> "Deadline":
+        """전체 예산의 share 비율을 쓰는 하위 단계
+
+        하위 단계 마감 = min(지금 + 예산×share, 상위 마감 - 예비시간)
+        """
+        child = Deadline(name=name, clock=self._clock, _parent=self)
+        if self.unlimited:
+            return child
+        slice_end = child.started + self.budget_sec * max(0.0, share)
+        child.expires_at = min(slice_end, self.expires_at - self.reserve_sec)
+        child.budget_sec = max(0.0, child.expires_at - child.started)
+        return child
+
+    # ========================================
+    # 잘린 단계 기록
+    # ========================================
+    def cut(self, stage: str, reason: str) -> None:
+        """단계 생략/축소 기록"""
+        root = self._root
+        with root._lock:
+            root._cuts.append({
+                "stage": stage,
+                "reason": reason,
+                "remaining_sec": None if root.unlimited else round(root.remaining(), 1),
+            })
+        logger.warning(f"⏱️ 시간 예산 부족 - {stage}: {reason}")
+
+    @property
+    def cuts(self) -> List[Dict]:
+        root = self._root
+        with root._lock:
+            return list(root._cuts)
+
+    @property
+    def cut_stages(self) -> List[str]:
+        return [c["stage"] for c in self.cuts]
+
+
+# ============================================================
+# 현재 실행 흐름의 시간 예산
+# ============================================================
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "kiwoom_request_deadline", default=None,
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """현재 컨텍스트의 시간 예산 (없으면 None)"""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """범위 안의 키움 호출에 시간 예산 적용 (중첩 시 안쪽이 우선, None이면 예산 해제)"""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
@@ -0,0 +1,55 @@
+"""
+프로세스 간 파일 잠금 (posix: fcntl.flock / Windows: msvcrt.locking)
+
+사용:
+    with file_lock(BASE_DIR / ".cache" / "kiwoom_token.lock"):
+        ...  # 같은 PC의 다른 프로세스와 배타 구간
+
+같은 프로세스의 스레드끼리는 잠금이 보장되지 않으므로 threading.Lock과 함께 쓴다.
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+# Windows는 바이트 범위 잠금 → 파일 앞 1바이트를 잠금 영역으로 사용
+_LOCK_BYTES = 1
+
+
+def lock_fd(fd: int, length: int = _LOCK_BYTES) -> None:
+    """fd 배타 잠금 (획득까지 대기)"""
+    if os.name == "nt":
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, length)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+def unlock_fd(fd: int, length: int = _LOCK_BYTES) -> None:
+    if os.name == "nt":
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, length)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """잠금 파일 기반 배타 구간"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(str(path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        lock_fd(fd)
+        try:
+            yield
+        finally:
+            unlock_fd(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,97 @@
+"""
+호스트별 keep-alive HTTP 세션 풀
+
+책임:
+- 호스트마다 requests.Session 1개를 프로세스 전체가 공유 (스레드 안전, 처음 쓸 때 생성)
+- 호스트별 연결 풀 크기 (HTTP_POOL_SIZES, 미설정 호스트는 HTTP_POOL_DEFAULT)
+- 요청을 보내기 전 연결 실패만 재시도 (상태 코드 재시도는 호출자 몫)
+
+어댑터(키움/디스코드)와 서비스(src.services.http_utils 재노출)가 같은 풀을 쓴다.
+"""
+
+import threading
+from typing import Dict
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config.settings import settings
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _parse_pool_sizes(spec: str) -> Dict[str, int]:
+    """'api.kiwoom.com:10,opendart.fss.or.kr:4' → {host: size}"""
+    sizes: Dict[str, int] = {}
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if ":" not in part:
+            continue
+        host, size = part.rsplit(":", 1)
+        try:
+            sizes[host.strip().lower()] = max(1, int(size))
+        except ValueError:
+            continue
+    return sizes
+
+
+def _host_of(url: str) -> str:
+    parsed = urlparse(url if "://" in url else f"https://{url}")
+    return (parsed.hostname or "").lower()
+
+
+def pool_size_for(host: str) -> int:
+    """호스트의 keep-alive 연결 풀 크기 (설정값)"""
+    cfg = settings.http
+    return _parse_pool_sizes(cfg.pool_sizes).get(host.lower(), max(1, cfg.pool_default))
+
+
+def _build_session(host: str) -> requests.Session:
+    cfg = settings.http
+    size = pool_size_for(host)
+    # 요청 전송 전 실패만 재시도
+    # (429/5xx 처리는 API마다 달라 상태 코드 재시도는 호출자에 둔다)
+    retry = Retry(
+        total=cfg.connect_retries,
+        connect=cfg.connect_retries,
+        read=0,
+        status=0,
+        other=0,
+        backoff_factor=0.2,
+        allowed_methods=None,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=size,
+        pool_block=cfg.pool_block,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_http_session(url: str) -> requests.Session:
+    """URL 호스트의 공용 keep-alive 세션"""
+    host = _host_of(url)
+    session = _sessions.get(host)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(host)
+            if session is None:
+                session = _build_session(host)
+                _sessions[host] = session
+    return session
+
+
+def close_http_sessions() -> None:
+    """풀의 모든 세션 종료 (종료 시/벤치마크용)"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
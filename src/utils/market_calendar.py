@@ -7,7 +7,7 @@ v8.0 - 중복 제거: scheduler.py, data_updater.py에서 공유
     from src.utils.market_calendar import is_market_open
 """
 
-from datetime import date
+from datetime import date, timedelta
 from typing import Optional
 
 
@@ -73,3 +73,12 @@ def is_market_open(check_date: Optional[date] = None) -> bool:
         return False
     
     return True
+
+
+def last_trading_day(check_date: Optional[date] = None) -> date:
+    """check_date가 휴장일이면 직전 거래일 (기본: 오늘)"""
+    if check_date is None:
+        check_date = date.today()
+    while not is_market_open(check_date):
+        check_date -= timedelta(days=1)
+    return check_date
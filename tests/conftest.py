@@ -0,0 +1,260 @@
+"""
+pytest 공용 설정 + 테스트 대역(fake) 픽스처
+
+책임:
+- src 모듈 import 전에 테스트 환경 변수 설정
+  (DB/캐시/로그를 임시 폴더로 → data/screener.db, .cache/ 운영 파일을 건드리지 않음)
+- 테스트 세션이 끝나면 임시 폴더 삭제
+- 여러 테스트가 같이 쓰는 대역: 수동 시계, HTTP 응답/세션, 키움 클라이언트 생성,
+  스크리너용 가짜 클라이언트/서비스/유니버스, 무작위 일봉 생성기
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# settings는 import 시점에 환경 변수를 한 번 읽는다 → 어떤 테스트 모듈보다 먼저 설정
+assert "src.config.settings" not in sys.modules, "conftest보다 먼저 src.config.settings가 로드됨"
+
+TEST_HOME = Path(tempfile.mkdtemp(prefix="closingbell-tests-"))
+os.environ["DB_PATH"] = str(TEST_HOME / "data" / "screener.db")
+os.environ["CACHE_DIR"] = str(TEST_HOME / ".cache")
+os.environ["LOG_PATH"] = str(TEST_HOME / "logs" / "screener.log")
+os.environ["DASHBOARD_ONLY"] = "true"
+os.environ["DISCORD_ENABLED"] = "false"
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(TEST_HOME, ignore_errors=True)
+
+
+class FakeClock:
+    """직접 진행시키는 시계 (clock.now += 초)"""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeResponse:
+    """requests.Response 대역 (status_code/headers/content/json만)"""
+
+    def __init__(self, data=None, status_code=200, headers=None, content=b"{}"):
+        self.status_code = status_code
+        self._data = data if data is not None else {}
+        self.headers = headers or {}
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+class FakeSession:
+    """키움 POST 대역
+
+    handler(tr_id, body, headers) → FakeResponse 또는 응답 dict (dict면 200 응답으로 감쌈).
+    요청은 calls [(tr_id, body)]와 timeouts에 기록한다 (스레드 안전).
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+        self.timeouts = []
+        self._lock = threading.Lock()
+
+    def post(self, url, headers=None, json=None, timeout=None):
+        headers = headers or {}
+        tr_id = headers.get("api-id")
+        with self._lock:
+            self.calls.append((tr_id, json))
+            self.timeouts.append(timeout)
+        result = self.handler(tr_id, json, headers)
+        return result if isinstance(result, FakeResponse) else FakeResponse(result)
+
+    @property
+    def tr_ids(self):
+        return [tr_id for tr_id, _ in self.calls]
+
+
+class FakeKiwoom:
+    """스크리너 수집용 클라이언트 대역 (일봉/현재가만, 호출 수·동시 호출 수 기록)
+
+    prices_of(stock_code) → 일봉 목록 (예외를 던지면 그 종목 수집 실패)
+    """
+
+    def __init__(self, prices_of, delay: float = 0.0):
+        self.prices_of = prices_of
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = {"ka10081": 0, "ka10001": 0}
+        self._lock = threading.Lock()
+
+    def _enter(self, tr_id):
+        with self._lock:
+            self.calls[tr_id] += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _exit(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def get_daily_prices(self, stock_code, count=200):
+        self._enter("ka10081")
+        try:
+            time.sleep(self.delay)
+            return self.prices_of(stock_code)
+        finally:
+            self._exit()
+
+    def get_current_price(self, stock_code):
+        from src.domain.models import CurrentPrice
+
+        self._enter("ka10001")
+        try:
+            return CurrentPrice(
+                code=stock_code, price=0, change=0, change_rate=0.0,
+                trading_value=0.0, market_cap=1234.0,
+            )
+        finally:
+            self._exit()
+
+
+def random_daily_prices(
+    seed,
+    n: int,
+    start: date = date(2025, 1, 1),
+    closes=(900, 12_000, 310_000),
+    drift: float = 0.004,
+    volume=(1_000, 3_000_000),
+    trading_value: bool = False,
+    as_float: bool = False,
+    flat: float = 0.0,
+    high_eq_close: float = 0.0,
+    bad_open: float = 0.0,
+    zero_volume: float = 0.0,
+):
+    """무작위 보행 일봉 (시가/종가 가우시안 변동, 꼬리는 종가의 ~3% 이내)
+
+    seed: 정수 또는 random.Random (같은 rng를 넘기면 종목마다 이어서 생성)
+    trading_value: 거래대금 = 종가 × 거래량 (False면 0)
+    as_float: 가격을 소수로 (지표 커널의 float 입력 검증용)
+    경계값 확률: flat(보합, 몸통 0) / high_eq_close(위꼬리 0) / bad_open(시가 0) / zero_volume(거래량 0)
+    """
+    from src.domain.models import DailyPrice
+
+    rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+    prices = []
+    close = rng.choice(closes)
+    for i in range(n):
+        if flat and rng.random() < flat:
+            o = h = l = close
+        else:
+            o = max(1, int(close * (1 + rng.gauss(0, 0.02))))
+            close = max(1, int(o * (1 + rng.gauss(drift, 0.04))))
+            wick = max(1, close // 30)
+            h = max(o, close) + (0 if high_eq_close and rng.random() < high_eq_close else rng.randint(0, wick))
+            l = max(1, min(o, close) - rng.randint(0, wick))
+        if bad_open and rng.random() < bad_open:
+            o = 0
+        v = 0 if zero_volume and rng.random() < zero_volume else rng.randint(*volume)
+        c = close
+        if as_float:
+            o, h, l, c = o + 0.25, h + 0.5, l + 0.125, c + 0.1
+        prices.append(DailyPrice(
+            date=start + timedelta(days=i), open=o, high=h, low=l, close=c, volume=v,
+            trading_value=float(close * v) if trading_value else 0.0,
+        ))
+    return prices
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def fake_response():
+    """FakeResponse 생성자 (FakeResponse(data, status_code=..., headers=...))"""
+    return FakeResponse
+
+
+@pytest.fixture
+def fake_session():
+    """FakeSession 생성자 (fake_session(handler))"""
+    return FakeSession
+
+
+@pytest.fixture
+def make_kiwoom_client():
+    """세션만 바꾼 KiwoomRestClient 생성자 (토큰 발급 없음, rate 제한 사실상 없음)
+
+    make_kiwoom_client(session, **KiwoomRestClient 인자)
+    """
+    from src.adapters.kiwoom_rest_client import KiwoomRestClient
+    from src.adapters.rate_limiter import RateLimiter
+    from src.adapters.response_cache import ResponseCache
+
+    def make(session, **kwargs):
+        kwargs.setdefault("rate_limiter", RateLimiter(rate=1000, burst=100))
+        kwargs.setdefault("response_cache", ResponseCache(ttls={}))
+        client = KiwoomRestClient(**kwargs)
+        client._session = session
+        client._get_token = lambda: "token"
+        return client
+
+    return make
+
+
+@pytest.fixture
+def random_prices():
+    """random_daily_prices 생성기 (random_prices(seed, n, start=..., 경계값 확률...))"""
+    return random_daily_prices
+
+
+@pytest.fixture
+def fake_kiwoom():
+    """FakeKiwoom 생성자 (fake_kiwoom(prices_of, delay=...))"""
+    return FakeKiwoom
+
+
+@pytest.fixture
+def make_screener_service():
+    """알림/저장소 없는 ScreenerService 생성자 (make_screener_service(client=None))"""
+    from src.services.screener_service import ScreenerService
+
+    def make(client=None):
+        return ScreenerService(
+            broker_client=client if client is not None else object(),
+            discord_notifier=object(), screening_repo=object(),
+        )
+
+    return make
+
+
+@pytest.fixture
+def make_universe():
+    """000001..n 유니버스 생성자 (make_universe(n))"""
+    from src.domain.models import StockInfo
+
+    def make(n: int):
+        return [StockInfo(code=f"{i:06d}", name=f"종목{i}") for i in range(1, n + 1)]
+
+    return make
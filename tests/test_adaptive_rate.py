@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+적응형 Rate 제어(AIMD) 테스트
+
+실행:
+    python -m pytest tests/test_adaptive_rate.py -q
+"""
+
+from src.adapters.adaptive_rate import AdaptiveRateController, GLOBAL_KEY
+from src.adapters.rate_limiter import RateLimiter
+from src.config.settings import KiwoomSettings
+
+
+def make_controller(clock, tmp_path=None, rate=4.0, **kwargs):
+    limiter = RateLimiter(rate=rate, burst=1, clock=clock)
+    controller = AdaptiveRateController(
+        limiter, min_rate=1.0, max_rate=10.0, increase=1.0, decrease=0.5,
+        latency_target=1.0, state_path=(tmp_path / "rate.json") if tmp_path else None,
+        clock=clock, **kwargs,
+    )
+    return controller, limiter
+
+
+def test_additive_increase_after_clean_round(clock):
+    controller, limiter = make_controller(clock)
+
+    for _ in range(4):
+        controller.on_success("ka10081", latency=0.1)
+
+    assert controller.effective_rate("ka10081") == 5.0
+    assert limiter.rate == 5.0
+    assert limiter.snapshot()["ka10081"] == 5.0
+
+
+def test_ceiling_defaults_to_base_rate():
+    cfg = KiwoomSettings(app_key="", secret_key="", rate_per_sec=8.0)
+    assert cfg.adaptive_ceiling == 8.0
+
+    # 기본 속도보다 높은 상한은 명시적으로 허용해야 적용
+    cfg.adaptive_max_rate = 20.0
+    assert cfg.adaptive_ceiling == 8.0
+    cfg.adaptive_above_base = True
+    assert cfg.adaptive_ceiling == 20.0
+
+    cfg.adaptive_max_rate = 5.0
+    assert cfg.adaptive_ceiling == 5.0
+
+
+def test_slow_responses_hold_rate(clock):
+    controller, limiter = make_controller(clock)
+
+    for _ in range(10):
+        controller.on_success("ka10081", latency=2.0)
+
+    assert limiter.rate == 4.0
+
+
+def test_multiplicative_decrease_with_cooldown(clock):
+    controller, limiter = make_controller(clock)
+
+    controller.on_throttle("ka10081")
+    controller.on_throttle("ka10081")  # 같은 순간의 연속 429 → 1회만 감소
+    assert limiter.rate == 2.0
+    assert limiter.snapshot()["ka10081"] == 2.0
+
+    clock.now += 5
+    controller.on_throttle("ka10081")
+    controller.on_throttle("ka10081")
+    assert limiter.rate == 1.0  # 하한
+
+
+def test_state_persists_across_instances(tmp_path, clock):
+    controller, _ = make_controller(clock, tmp_path)
+    controller.on_throttle("ka10001", status_code=503)
+    assert (tmp_path / "rate.json").exists()
+
+    restored, limiter = make_controller(clock, tmp_path, rate=8.0)
+
+    assert restored.snapshot()["ka10001"]["rate"] == 2.0
+    assert restored.snapshot()[GLOBAL_KEY]["throttles"] == 1
+    assert limiter.rate == 2.0
+
+
+def test_client_reports_429_and_success(monkeypatch, clock, fake_response, fake_session, make_kiwoom_client):
+    controller, limiter = make_controller(clock)
+    responses = [fake_response(status_code=429), fake_response({"return_code": 0})]
+    session = fake_session(lambda tr_id, body, headers: responses.pop(0))
+    client = make_kiwoom_client(session, rate_limiter=limiter, rate_controller=controller)
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr("src.adapters.kiwoom_rest_client.time.sleep", fake_sleep)
+
+    data = client._request("POST", "/api/dostk/stkinfo", "ka10001", {"stk_cd": "005930"})
+
+    assert data == {"return_code": 0}
+    assert client.get_effective_rate("ka10001") == 2.0
+    # 재시도 대기는 감소된 속도 기준 (기존 지수 백오프 1초보다 짧음)
+    assert sleeps[0] == 0.5
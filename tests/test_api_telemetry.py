@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+키움 API 텔레메트리 테스트 (가짜 세션)
+
+실행:
+    python -m pytest tests/test_api_telemetry.py -q
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from src.adapters.api_telemetry import ApiStats, ApiTelemetry, telemetry_stage
+from src.adapters.rate_limiter import submit_with_context
+from src.domain.models import ScreenerError
+from src.infrastructure.database import Database
+from src.infrastructure import repo_metrics
+
+
+@pytest.fixture
+def scripted_session(fake_session, fake_response):
+    """상태코드 목록을 순서대로 돌려주는 세션 (응답 100바이트)"""
+    def make(statuses):
+        statuses = list(statuses)
+        return fake_session(lambda tr_id, body, headers: fake_response(
+            {"return_code": 0}, status_code=statuses.pop(0) if statuses else 200, content=b"x" * 100,
+        ))
+    return make
+
+
+def test_percentiles_from_histogram():
+    stats = ApiStats()
+    for ms in [5] * 50 + [40] * 45 + [900] * 5:
+        stats.add_latency(ms / 1000)
+
+    assert stats.percentile_ms(0.50) <= 10
+    assert 20 < stats.percentile_ms(0.95) <= 50
+    assert 750 < stats.percentile_ms(0.99) <= 900
+    assert stats.percentile_ms(1.0) == pytest.approx(900)
+
+
+def test_since_returns_run_delta():
+    telemetry = ApiTelemetry()
+    telemetry.record_response("ka10081", 200, 0.01)
+    start = telemetry.snapshot()
+    telemetry.record_response("ka10081", 429, 0.02, retry=True)
+    telemetry.record_response("ka10001", 200, 0.03, nbytes=10)
+
+    delta = telemetry.since(start)
+
+    assert delta[("", "ka10081")].calls == 1
+    assert delta[("", "ka10081")].status_429 == 1
+    assert delta[("", "ka10081")].retries == 1
+    assert delta[("", "ka10001")].bytes == 10
+
+
+def test_since_max_excludes_earlier_spike():
+    telemetry = ApiTelemetry()
+    with telemetry_stage("collect"):
+        telemetry.record_response("ka10081", 200, 12.0)  # 프리뷰 실행의 지연
+        start = telemetry.snapshot()
+        for _ in range(100):
+            telemetry.record_response("ka10081", 200, 0.04)
+
+    row = telemetry.since(start)[("collect", "ka10081")].to_row()
+
+    assert row["max_ms"] == 50.0  # 증가분 최고 구간(20~50ms) 상한
+    assert row["p99_ms"] <= 50.0
+    assert telemetry.snapshot()[("collect", "ka10081")].latency_max == 12.0
+
+
+def test_stage_follows_worker_threads():
+    telemetry = ApiTelemetry()
+    with telemetry_stage("collect"), ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [
+            submit_with_context(pool, telemetry.record_response, "ka10081", 200, 0.01)
+            for _ in range(3)
+        ]
+        for f in futures:
+            f.result()
+    telemetry.record_response("ka10081", 200, 0.01)
+
+    snap = telemetry.snapshot()
+    assert snap[("collect", "ka10081")].calls == 3
+    assert snap[("", "ka10081")].calls == 1
+
+
+def test_client_records_retries_and_circuit_trip(monkeypatch, scripted_session, make_kiwoom_client):
+    monkeypatch.setattr("src.adapters.kiwoom_rest_client.time.sleep", lambda s: None)
+    telemetry = ApiTelemetry()
+    client = make_kiwoom_client(scripted_session([429, 200]), telemetry=telemetry)
+
+    client._request("POST", "/api/dostk/stkinfo", "ka10001", {"stk_cd": "005930"})
+
+    stats = telemetry.snapshot()[("", "ka10001")]
+    assert (stats.calls, stats.retries, stats.status_429, stats.bytes) == (2, 1, 1, 200)
+
+    # 5xx로 재시도 소진 3번 → 임계값(3)에서 차단 1회
+    client._session = scripted_session([503] * 9)
+    for i in range(3):
+        with pytest.raises(ScreenerError):
+            client._request("POST", "/api/dostk/stkinfo", "ka10001", {"stk_cd": f"00000{i}"})
+
+    stats = telemetry.snapshot()[("", "ka10001")]
+    assert stats.status_5xx == 9
+    assert stats.circuit_trips == 1
+
+
+def test_repository_round_trip(tmp_path, monkeypatch):
+    db = Database(tmp_path / "metrics.db")
+    monkeypatch.setattr(repo_metrics, "get_database", lambda: db)
+    repo = repo_metrics.get_api_metrics_repository()
+
+    stats = ApiStats()
+    stats.calls = 3
+    stats.status_429 = 1
+    for ms in (5, 15, 60):
+        stats.add_latency(ms / 1000)
+    row = {"stage": "collect", "api_id": "ka10081", "buckets": stats.buckets, **stats.to_row()}
+
+    assert repo.save_run("20261016-150000-main", "main", date(2026, 10, 16), [row]) == 1
+    assert repo.save_run("20261016-150000-main", "main", date(2026, 10, 16), [row]) == 1
+
+    runs = repo.get_runs()
+    assert len(runs) == 1 and runs[0]["calls"] == 3 and runs[0]["status_429"] == 1
+    saved = repo.get_run("20261016-150000-main")
+    assert saved[0]["stage"] == "collect" and saved[0]["p99_ms"] == row["p99_ms"]
+    db.close()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+배치 점수 계산(batch_scorer) ↔ ScoreCalculatorV5 스칼라 경로 동일성 테스트
+
+실행:
+    python -m pytest tests/test_batch_scorer.py -q
+"""
+
+import random
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from src.domain.models import StockData
+from src.domain.score_calculator import ScoreCalculatorV5
+
+
+def edge_prices(random_prices, rng: random.Random, n: int):
+    """경계값(보합/고가=종가/거래량 0/시가 0)이 자주 나오는 무작위 일봉"""
+    return random_prices(
+        rng, n, closes=(800, 5_000, 52_300, 410_000), volume=(1_000, 5_000_000),
+        flat=0.05, high_eq_close=0.15, bad_open=0.01, zero_volume=0.03,
+    )
+
+
+def make_stock(code: str, prices) -> StockData:
+    return StockData(
+        code=code, name=f"종목{code}", daily_prices=prices,
+        current_price=prices[-1].close if prices else 0, trading_value=100.0,
+    )
+
+
+def assert_same(scalar, batch):
+    assert len(scalar) == len(batch)
+    for expected, actual in zip(scalar, batch):
+        if expected is None:
+            assert actual is None
+            continue
+        assert actual is not None, expected.stock_code
+        assert asdict(actual) == asdict(expected), expected.stock_code
+        # -0.0/0.0까지 같은 비트
+        assert repr(actual.score_total) == repr(expected.score_total)
+
+
+def test_random_series_match_scalar_path(random_prices):
+    rng = random.Random(20261016)
+    stocks = [make_stock(f"{i:06d}", edge_prices(random_prices, rng, rng.randint(15, 45))) for i in range(3000)]
+    calculator = ScoreCalculatorV5()
+
+    scalar = [calculator.calculate_single_score(s) for s in stocks]
+    batch = calculator.calculate_batch(stocks)
+
+    assert sum(s is None for s in scalar) > 0  # 20봉 미만 종목 포함
+    assert_same(scalar, batch)
+
+
+def test_simulated_market_series_match():
+    from src.adapters.kiwoom_simulator import SimulatedMarket
+
+    market = SimulatedMarket(universe_size=400, bars=60, seed=7)
+    stocks = [make_stock(code, market.daily_bars(code)[-30:]) for code in market.codes]
+    calculator = ScoreCalculatorV5()
+
+    assert_same([calculator.calculate_single_score(s) for s in stocks], calculator.calculate_batch(stocks))
+
+
+def test_local_ohlcv_series_match():
+    from src.config.app_config import OHLCV_FULL_DIR
+
+    files = sorted(Path(OHLCV_FULL_DIR).glob("*.csv"))[:500] if OHLCV_FULL_DIR else []
+    if not files:
+        pytest.skip("로컬 OHLCV CSV 없음")
+    from src.adapters.ohlcv_store import load_tail_bars
+
+    stocks = []
+    for path in files:
+        prices = load_tail_bars(path, 60)
+        for end in (len(prices), len(prices) - 7):
+            if end >= 20:
+                stocks.append(make_stock(path.stem.lstrip("A"), prices[max(0, end - 30):end]))
+    calculator = ScoreCalculatorV5()
+
+    assert_same([calculator.calculate_single_score(s) for s in stocks], calculator.calculate_batch(stocks))
+
+
+def test_vectorized_calculator_ranks_identically(random_prices):
+    rng = random.Random(3)
+    stocks = [make_stock(f"{i:06d}", edge_prices(random_prices, rng, 30)) for i in range(200)]
+
+    scalar = ScoreCalculatorV5().calculate_scores(stocks)
+    vectorized = ScoreCalculatorV5(vectorized=True).calculate_scores(stocks)
+
+    assert [(s.stock_code, s.rank, s.score_total) for s in vectorized] == \
+        [(s.stock_code, s.rank, s.score_total) for s in scalar]
+    assert ScoreCalculatorV5(vectorized=True).calculate_scores([]) == []
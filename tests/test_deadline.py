@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+실행 시간 예산(Deadline) 테스트
+
+실행:
+    python -m pytest tests/test_deadline.py -q
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from src.adapters.kiwoom_rest_client import KiwoomErrorCode
+from src.adapters.rate_limiter import submit_with_context
+from src.config.settings import settings
+from src.domain.models import ScreenerError
+from src.utils.deadline import Deadline, current_deadline, deadline_scope
+
+
+def test_stage_slices_respect_reserve_and_parent(clock):
+    run = Deadline(budget_sec=100, reserve_sec=10, clock=clock)
+
+    collect = run.stage("collect", 0.5)
+    assert collect.remaining() == 50
+
+    clock.now += 60
+    vp = run.stage("vp", 0.5)
+    # 남은 40초 중 예비 10초는 제외
+    assert vp.remaining() == 30
+    assert run.allows(20) and not run.allows(35)
+
+
+def test_cuts_are_shared_with_stages(clock):
+    run = Deadline(budget_sec=10, clock=clock)
+    run.stage("vp", 0.1).cut("vp", "로컬 대체")
+    run.cut("broker", "생략")
+
+    assert run.cut_stages == ["vp", "broker"]
+    assert run.cuts[0]["remaining_sec"] == 10
+
+
+def test_for_run_caps_main_at_absolute_deadline(monkeypatch):
+    monkeypatch.setattr(settings.screening, "run_budget_sec", 900)
+    monkeypatch.setattr(settings.screening, "deadline_main", "15:20")
+
+    main = Deadline.for_run(is_preview=False, now=datetime(2026, 1, 9, 15, 10))
+    preview = Deadline.for_run(is_preview=True, now=datetime(2026, 1, 9, 15, 10))
+
+    assert 595 <= main.remaining() <= 600
+    assert 895 <= preview.remaining() <= 900
+
+
+def test_unlimited_budget():
+    run = Deadline()
+    assert run.unlimited and not run.expired()
+    assert run.stage("collect", 0.5).unlimited
+
+
+@pytest.fixture
+def status_session(fake_session, fake_response):
+    """항상 같은 상태코드를 돌려주는 세션"""
+    return lambda status_code: fake_session(
+        lambda tr_id, body, headers: fake_response({"return_code": 0}, status_code=status_code)
+    )
+
+
+def test_client_skips_retry_when_budget_short(status_session, make_kiwoom_client):
+    session = status_session(503)
+    client = make_kiwoom_client(session)
+
+    with client.deadline_scope(Deadline(budget_sec=0.5)):
+        with pytest.raises(ScreenerError) as exc:
+            client._request("POST", "/api/dostk/stkinfo", "ka10001", {"stk_cd": "005930"})
+
+    assert exc.value.code == KiwoomErrorCode.API_ERROR
+    assert len(session.calls) == 1  # 1초 백오프가 남은 예산보다 길어 재시도 안 함
+    assert session.timeouts[0] <= 0.5
+
+
+def test_client_rejects_requests_after_deadline(status_session, make_kiwoom_client):
+    session = status_session(200)
+    client = make_kiwoom_client(session)
+
+    with client.deadline_scope(Deadline(budget_sec=0)):
+        with pytest.raises(ScreenerError) as exc:
+            client._request("POST", "/api/dostk/stkinfo", "ka10001", {"stk_cd": "005930"})
+    assert exc.value.code == KiwoomErrorCode.DEADLINE_EXCEEDED
+    assert len(session.calls) == 0
+
+    # 범위 밖에서는 예산 없음
+    client._request("POST", "/api/dostk/stkinfo", "ka10001", {"stk_cd": "005930"})
+    assert len(session.calls) == 1
+
+
+def test_deadline_is_scoped_to_caller_context(status_session, make_kiwoom_client):
+    session = status_session(200)
+    client = make_kiwoom_client(session)
+
+    def fetch():
+        client._request("POST", "/api/dostk/stkinfo", "ka10001", {"stk_cd": "005930"})
+        return current_deadline()
+
+    expired = Deadline(budget_sec=0, name="collect")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with client.deadline_scope(expired):
+            # 공용 클라이언트를 쓰는 다른 스레드(스케줄러/대시보드 등)에는 적용 안 됨
+            assert executor.submit(fetch).result() is None
+            # submit_with_context로 넘긴 작업에는 이어짐
+            with pytest.raises(ScreenerError) as exc:
+                submit_with_context(executor, fetch).result()
+    assert exc.value.code == KiwoomErrorCode.DEADLINE_EXCEEDED
+    assert len(session.calls) == 1
+
+
+def test_nested_scopes_restore_per_context():
+    run, stage = Deadline(name="run"), Deadline(name="stage")
+    with deadline_scope(run):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # 다른 스레드의 범위 진입/종료가 이 컨텍스트 값을 바꾸지 않음
+            def other():
+                with deadline_scope(stage):
+                    return current_deadline()
+            assert executor.submit(other).result() is stage
+        assert current_deadline() is run
+        with deadline_scope(None):
+            assert current_deadline() is None
+        assert current_deadline() is run
+    assert current_deadline() is None
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+호스트 공용 Rate 버킷 (프로세스 간 공유) 테스트
+
+여러 프로세스가 같은 파일 버킷을 쓸 때 합산 호출 속도가
+설정 상한(rate × 구간 + 버스트)을 넘지 않는지 확인한다.
+
+실행:
+    python -m pytest tests/test_host_rate.py -q
+"""
+
+import multiprocessing
+import time
+from pathlib import Path
+
+from src.adapters.host_rate import HostTokenBucket
+from src.adapters.rate_limiter import RateLimiter
+
+HOST_RATE = 40.0
+HOST_BURST = 2
+WORKERS = 4
+RUN_SEC = 1.5
+
+
+def _worker(path, barrier, results):
+    """프로세스별 RateLimiter (로컬 상한은 넉넉하게) → 호출 시각 목록"""
+    limiter = RateLimiter(
+        rate=1000, burst=10,
+        shared=HostTokenBucket(max_rate=HOST_RATE, burst=HOST_BURST, path=Path(path)),
+    )
+    barrier.wait()  # 모든 프로세스 임포트 완료 후 동시에 시작
+    stop_at = time.time() + RUN_SEC
+    stamps = []
+    while True:
+        now = time.time()
+        if now >= stop_at:
+            break
+        if limiter.acquire("ka10081", timeout=stop_at - now):
+            stamps.append(time.time())
+    results.put(stamps)
+
+
+def _max_in_window(stamps, window):
+    stamps = sorted(stamps)
+    best, lo = 0, 0
+    for hi, t in enumerate(stamps):
+        while t - stamps[lo] > window:
+            lo += 1
+        best = max(best, hi - lo + 1)
+    return best
+
+
+def test_aggregate_rate_across_processes(tmp_path):
+    path = str(tmp_path / "bucket.bin")
+    ctx = multiprocessing.get_context("spawn")  # Windows와 같은 방식
+    barrier = ctx.Barrier(WORKERS)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(path, barrier, results)) for _ in range(WORKERS)]
+    for p in procs:
+        p.start()
+    per_process = [results.get(timeout=60) for _ in procs]
+    for p in procs:
+        p.join(timeout=10)
+
+    stamps = [t for s in per_process for t in s]
+    # 모든 프로세스가 실제로 경쟁했는지
+    assert all(len(s) > 0 for s in per_process)
+    # 1초 구간 최대 호출 수 ≤ rate × 1초 + 버스트 (+기록 지연 1회 여유)
+    assert _max_in_window(stamps, 1.0) <= HOST_RATE + HOST_BURST + 1
+    # 전체 구간도 상한 이내, 그러면서 예산은 거의 다 사용
+    assert len(stamps) <= HOST_RATE * RUN_SEC + HOST_BURST + 1
+    assert len(stamps) >= HOST_RATE * RUN_SEC * 0.7
+
+
+def test_rate_changes_are_shared_and_capped(tmp_path, clock):
+    clock.now = 1_000.0
+    path = tmp_path / "bucket.bin"
+    a = HostTokenBucket(max_rate=10, burst=1, path=path, clock=clock)
+    b = HostTokenBucket(max_rate=10, burst=1, path=path, clock=clock)
+
+    assert a.take() == 0
+    # b는 a가 쓴 토큰을 본다
+    assert b.take() == 0.1
+
+    a.set_rate(2)
+    assert b.rate == 2
+    assert b.take() == 0.5
+
+    b.set_rate(50)  # 감소 유지 시간 안의 증가는 무시
+    assert a.rate == 2
+
+    clock.now += HostTokenBucket.DECREASE_HOLD
+    b.set_rate(50)  # 상한 적용
+    assert a.rate == 10
+    assert a.take() == 0
+
+
+def test_concurrent_decreases_keep_lowest(tmp_path, clock):
+    clock.now = 1_000.0
+    path = tmp_path / "bucket.bin"
+    a = HostTokenBucket(max_rate=10, burst=1, path=path, clock=clock)
+    b = HostTokenBucket(max_rate=10, burst=1, path=path, clock=clock)
+
+    # 두 프로세스가 거의 동시에 감소 → 나중 기록(6)이 아니라 더 낮은 값(4)이 남음
+    a.set_rate(4)
+    clock.now += 0.5
+    b.set_rate(6)
+    assert a.rate == b.rate == 4
+
+    # 유지 시간 안의 추가 감소는 적용되고 유지 시간이 다시 시작됨
+    b.set_rate(3)
+    clock.now += HostTokenBucket.DECREASE_HOLD - 0.1
+    a.set_rate(5)
+    assert b.rate == 3
+
+    clock.now += 0.2
+    a.set_rate(5)
+    assert b.rate == 5
+
+
+def test_limiter_propagates_rate_to_shared_bucket(tmp_path):
+    shared = HostTokenBucket(max_rate=20, burst=1, path=tmp_path / "bucket.bin")
+    limiter = RateLimiter(rate=1000, burst=5, shared=shared)
+
+    assert limiter.try_acquire()
+    # 로컬 버킷은 여유가 있어도 공용 버킷이 비면 대기 (로컬 토큰도 쓰지 않음)
+    assert not limiter.try_acquire()
+
+    limiter.set_rate(4)
+    assert shared.rate == 4
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+롤링 지표 커널 ↔ 기준 구현(*_reference) 동일성 테스트
+
+실행:
+    python -m pytest tests/test_indicators.py -q
+"""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from src.domain.indicators import (
+    calculate_cci, calculate_cci_reference,
+    calculate_ma, calculate_ma_reference,
+    calculate_rsi, calculate_rsi_reference,
+)
+from src.domain.models import DailyPrice
+from src.domain.price_series import PriceSeries
+
+PAIRS = [
+    (calculate_cci, calculate_cci_reference, 14),
+    (calculate_ma, calculate_ma_reference, 20),
+    (calculate_ma, calculate_ma_reference, 5),
+    (calculate_rsi, calculate_rsi_reference, 14),
+]
+
+
+def make_prices(random_prices, rng: random.Random, n: int, as_float: bool = False):
+    """보합 구간(평균편차 0)이 섞인 무작위 일봉"""
+    return random_prices(
+        rng, n, start=date(2020, 1, 1), drift=0.0, volume=(1000, 1000), flat=0.1, as_float=as_float,
+    )
+
+
+def same_bits(a, b):
+    return len(a) == len(b) and all(repr(x) == repr(y) for x, y in zip(a, b))
+
+
+@pytest.mark.parametrize("fast, reference, period", PAIRS)
+def test_kernels_match_reference(random_prices, fast, reference, period):
+    rng = random.Random(period)
+    for n in [0, period - 1, period, period + 1, 30, 250, 600]:
+        for as_float in (False, True):
+            prices = make_prices(random_prices, rng, n, as_float)
+            expected = reference(prices, period=period)
+            assert same_bits(fast(prices, period=period), expected), (n, as_float)
+            if not as_float:  # PriceSeries는 짧은 시계열도 항상 커널 경로
+                series = PriceSeries.from_daily_prices(prices)
+                assert same_bits(fast(series, period=period), expected), (n, "series")
+
+
+def test_flat_window_gives_zero_cci():
+    prices = [DailyPrice(date=date(2020, 1, 1) + timedelta(days=i), open=100, high=101, low=99,
+                         close=100, volume=1) for i in range(20)]
+    assert calculate_cci(prices) == [0.0] * 7
+    assert calculate_rsi(prices) == [100.0] * 6
+
+
+def test_price_series_input(random_prices):
+    prices = make_prices(random_prices, random.Random(5), 80)
+    series = PriceSeries.from_daily_prices(prices)
+
+    assert same_bits(calculate_cci(series), calculate_cci_reference(prices))
+    assert same_bits(calculate_ma(series, 20), calculate_ma_reference(prices, 20))
+    assert same_bits(calculate_rsi(series), calculate_rsi_reference(prices))
+
+
+def test_round1_matches_builtin_round():
+    import numpy as np
+    from src.domain.indicators import round1
+
+    rng = random.Random(11)
+    values = [rng.uniform(-100, 100) for _ in range(20000)]
+    values += [k / 100 for k in range(-10000, 10001, 5)]      # x.x5 경계
+    values += [k / 20 + d for k in range(2000) for d in (1e-15, -1e-15)]
+    values += [0.0, -0.0, 0.05, 0.15, 0.25, 2.675, 1e12 + 0.05]
+
+    expected = [round(v, 1) for v in values]
+    assert [repr(v) for v in round1(np.array(values))] == [repr(v) for v in expected]
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+키움 응답 캐시 테스트
+
+실행:
+    python -m pytest tests/test_kiwoom_cache.py -q
+"""
+
+from datetime import date, timedelta
+
+from src.adapters.response_cache import ResponseCache, parse_ttls
+
+
+def chart_payload(n: int):
+    rows = []
+    for i in range(n):
+        day = date(2025, 6, 1) + timedelta(days=i)
+        rows.append({
+            "dt": day.strftime("%Y%m%d"), "open_pric": "+1000", "high_pric": "1100",
+            "low_pric": "900", "cur_prc": "-1050", "trde_qty": "1,000",
+        })
+    rows.reverse()  # 최신순
+    return {"return_code": 0, "stk_dt_pole_chart_qry": rows}
+
+
+def test_ttl_expiry_and_counters(clock):
+    cache = ResponseCache(ttls={"ka10081": 10}, clock=clock)
+
+    assert cache.get("ka10081", {"stk_cd": "005930"}) is None
+    cache.put("ka10081", {"stk_cd": "005930"}, {"v": 1})
+    assert cache.get("ka10081", {"stk_cd": "005930"}) == {"v": 1}
+
+    clock.now += 11
+    assert cache.get("ka10081", {"stk_cd": "005930"}) is None
+    assert cache.stats()["ka10081"] == {"hits": 1, "misses": 2, "evictions": 0, "hit_ratio": 0.333}
+
+
+def test_uncached_tr_id_is_ignored():
+    cache = ResponseCache(ttls={"ka10081": 10})
+    cache.put("ka10040", {"stk_cd": "005930"}, {"v": 1})
+    assert cache.get("ka10040", {"stk_cd": "005930"}) is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    cache = ResponseCache(ttls={"ka10001": 60}, max_entries=2)
+    cache.put("ka10001", {"stk_cd": "A"}, 1)
+    cache.put("ka10001", {"stk_cd": "B"}, 2)
+    cache.get("ka10001", {"stk_cd": "A"})  # A 최근 사용
+    cache.put("ka10001", {"stk_cd": "C"}, 3)
+
+    assert cache.get("ka10001", {"stk_cd": "B"}) is None
+    assert cache.get("ka10001", {"stk_cd": "A"}) == 1
+    assert cache.stats()["ka10001"]["evictions"] == 1
+
+
+def test_key_ignores_body_order():
+    assert ResponseCache.make_key("x", {"a": 1, "b": 2}) == ResponseCache.make_key("x", {"b": 2, "a": 1})
+
+
+def test_short_request_served_from_long_payload(fake_session, make_kiwoom_client):
+    payload = chart_payload(120)
+    session = fake_session(lambda tr_id, body, headers: payload)
+    client = make_kiwoom_client(session, response_cache=ResponseCache(ttls={"ka10081": 60}))
+
+    long_prices = client.get_daily_prices("005930", count=120)
+    short_prices = client.get_daily_prices("005930", count=30)
+
+    assert len(session.calls) == 1
+    assert len(long_prices) == 120 and len(short_prices) == 30
+    assert short_prices == long_prices[-30:]
+    assert short_prices[-1].close == 1050
+
+
+def test_parse_ttls():
+    assert parse_ttls("ka10081:120, ka10001:10,bad") == {"ka10081": 120.0, "ka10001": 10.0}
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+ka10081 열 단위 파서 / PriceSeries 테스트
+
+실행:
+    python -m pytest tests/test_kiwoom_chart.py -q
+"""
+
+import random
+from datetime import date, datetime, timedelta
+
+from src.adapters.kiwoom_chart import parse_daily_chart
+from src.domain.models import DailyPrice
+from src.domain.price_series import PriceSeries
+
+
+def reference_parse(rows):
+    """기존 행 단위 파서 (DailyPrice 리스트, 시간순)"""
+    def to_int(v):
+        try:
+            return int(str(v).replace(',', '').replace('+', '').replace('-', '').strip())
+        except (ValueError, TypeError):
+            return 0
+
+    prices = []
+    for item in rows:
+        try:
+            dt_str = item.get('dt', '').strip()
+            if not dt_str:
+                continue
+            prices.append(DailyPrice(
+                date=datetime.strptime(dt_str, '%Y%m%d').date(),
+                open=to_int(item.get('open_pric', '0')),
+                high=to_int(item.get('high_pric', '0')),
+                low=to_int(item.get('low_pric', '0')),
+                close=to_int(item.get('cur_prc', '0')),
+                volume=to_int(item.get('trde_qty', '0')),
+            ))
+        except (ValueError, TypeError):
+            continue
+    prices.reverse()
+    return prices
+
+
+def random_rows(n, seed=7):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        close = rng.randint(500, 900_000)
+        sign = rng.choice(["+", "-", ""])
+        rows.append({
+            "dt": (date(2026, 3, 31) - timedelta(days=i)).strftime("%Y%m%d"),
+            "open_pric": f"{sign}{close - 10:,}",
+            "high_pric": f"+{close + 50}",
+            "low_pric": f"-{close - 50}",
+            "cur_prc": f"{sign}{close}",
+            "trde_qty": str(rng.randint(0, 10_000_000)),
+        })
+    return rows
+
+
+def test_matches_reference_parser():
+    rows = random_rows(600)
+
+    assert parse_daily_chart(rows).to_daily_prices() == reference_parse(rows)
+
+
+def test_malformed_values_fall_back_to_row_parser():
+    rows = random_rows(30)
+    rows[3]["trde_qty"] = "n/a"       # → 0
+    rows[5]["dt"] = "20260230"        # 없는 날짜 → 행 제외
+    rows[7]["dt"] = ""                # 날짜 없음 → 행 제외
+    rows[9]["high_pric"] = None       # → 0
+
+    assert parse_daily_chart(rows).to_daily_prices() == reference_parse(rows)
+
+
+def test_series_arrays_and_tail():
+    rows = random_rows(50)
+    series = parse_daily_chart(rows)
+
+    assert len(series) == 50
+    assert series.dates.dtype.name == "int64" and series.close.dtype.name == "int64"
+    assert list(series.dates) == sorted(series.dates)
+    assert series.date_at(-1) == date(2026, 3, 31)
+
+    tail = series.tail(20)
+    assert len(tail) == 20
+    assert tail.to_daily_prices() == series.to_daily_prices()[-20:]
+    assert PriceSeries.from_daily_prices(tail.to_daily_prices()).close.tolist() == tail.close.tolist()
+
+
+def test_empty_rows():
+    assert len(parse_daily_chart([])) == 0
+    assert parse_daily_chart([{"dt": ""}]).to_daily_prices() == []
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+증분 일봉 조회 테스트 (로컬 OHLCV + 누락분만 API)
+
+실행:
+    python -m pytest tests/test_kiwoom_incremental.py -q
+"""
+
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+import src.adapters.kiwoom_rest_client as kiwoom_module
+import src.config.app_config as app_config
+from src.adapters.daily_history_cache import DailyHistoryCache
+from src.domain.models import DailyPrice
+from src.domain.price_series import PriceSeries
+from src.utils.market_calendar import is_market_open
+
+TODAY = date(2026, 1, 9)  # 금요일
+
+
+def trading_days(end: date, n: int):
+    days, d = [], end
+    while len(days) < n:
+        if is_market_open(d):
+            days.append(d)
+        d -= timedelta(days=1)
+    return list(reversed(days))
+
+
+def write_csv(path: Path, days, close_of=lambda i: 1000 + i):
+    lines = ["date,open,high,low,close,volume"]
+    for i, d in enumerate(days):
+        c = close_of(i)
+        lines.append(f"{d.isoformat()},{c - 5},{c + 10},{c - 10},{c},{1000 + i}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def chart(days, close_of):
+    rows = [{
+        "dt": d.strftime("%Y%m%d"), "open_pric": str(close_of(i) - 5),
+        "high_pric": str(close_of(i) + 10), "low_pric": str(close_of(i) - 10),
+        "cur_prc": f"+{close_of(i)}", "trde_qty": str(1000 + i),
+    } for i, d in enumerate(days)]
+    rows.reverse()
+    return {"return_code": 0, "stk_dt_pole_chart_qry": rows}
+
+
+class FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return datetime(TODAY.year, TODAY.month, TODAY.day, 15, 0)
+
+
+@pytest.fixture
+def make_client(monkeypatch, tmp_path, fake_session, make_kiwoom_client):
+    """tr_id별 고정 응답(routes) 클라이언트 (로컬 OHLCV = tmp_path, 오늘 = TODAY 15:00)"""
+    monkeypatch.setattr(app_config, "OHLCV_DIR", tmp_path)
+    monkeypatch.setattr(kiwoom_module, "datetime", FixedDatetime)
+
+    def make(routes, daily_history=None):
+        return make_kiwoom_client(
+            fake_session(lambda tr_id, body, headers: routes[tr_id]),
+            daily_history=daily_history if daily_history is not None else DailyHistoryCache(tmp_path / "history"),
+        )
+    return make
+
+
+def test_only_today_missing_uses_single_quote_call(make_client, tmp_path):
+    days = trading_days(TODAY, 40)
+    write_csv(tmp_path / "005930.csv", days[:-1])
+    prev_close = 1000 + 38
+    client = make_client({
+        "ka10001": {
+            "return_code": 0, "base_pric": str(prev_close), "open_pric": "+1040",
+            "high_pric": "+1060", "low_pric": "1035", "cur_prc": "+1055", "trde_qty": "5,000",
+        },
+    })
+
+    prices = client.get_daily_prices("005930", count=30)
+
+    assert client._session.tr_ids == ["ka10001"]
+    assert len(prices) == 30
+    assert prices[-1].date == TODAY and prices[-1].close == 1055 and prices[-1].volume == 5000
+    assert prices[-2].close == prev_close
+
+
+def test_adjusted_base_price_triggers_full_fetch(make_client, tmp_path):
+    days = trading_days(TODAY, 40)
+    write_csv(tmp_path / "005930.csv", days[:-1])
+    client = make_client({
+        "ka10001": {
+            "return_code": 0, "base_pric": "519", "open_pric": "520",
+            "high_pric": "530", "low_pric": "515", "cur_prc": "525", "trde_qty": "1",
+        },
+        "ka10081": chart(days, lambda i: 500 + i),
+    })
+
+    prices = client.get_daily_prices("005930", count=30)
+
+    assert client._session.tr_ids == ["ka10001", "ka10081"]
+    assert prices[-1].close == 539 and prices[0].close == 510
+
+
+def test_multi_day_gap_merges_tail(make_client, tmp_path):
+    days = trading_days(TODAY, 40)
+    write_csv(tmp_path / "005930.csv", days[:-4])
+    client = make_client({"ka10081": chart(days, lambda i: 1000 + i)})
+
+    prices = client.get_daily_prices("005930", count=30)
+
+    assert client._session.tr_ids == ["ka10081"]
+    assert [p.date for p in prices] == days[-30:]
+    assert [p.close for p in prices] == [1000 + i for i in range(10, 40)]
+
+
+def test_overlap_mismatch_uses_full_page(make_client, tmp_path):
+    days = trading_days(TODAY, 40)
+    write_csv(tmp_path / "005930.csv", days[:-4], close_of=lambda i: 2000 + i)
+    client = make_client({"ka10081": chart(days, lambda i: 1000 + i)})
+
+    prices = client.get_daily_prices("005930", count=30)
+
+    assert [p.close for p in prices] == [1000 + i for i in range(10, 40)]
+
+
+def test_no_local_file_falls_back_to_full(make_client, tmp_path):
+    days = trading_days(TODAY, 40)
+    client = make_client({"ka10081": chart(days, lambda i: 1000 + i)})
+
+    prices = client.get_daily_prices("005930", count=30)
+
+    assert client._session.tr_ids == ["ka10081"]
+    assert len(prices) == 30
+
+
+@pytest.mark.parametrize("local_slice", [
+    slice(-5, -1),   # 당일만 누락 (4봉)
+    slice(-4, None),  # 당일까지 있음 (4봉)
+    slice(-9, -4),   # 여러 봉 누락 (5봉)
+])
+def test_short_local_file_falls_back_to_full(make_client, tmp_path, local_slice):
+    days = trading_days(TODAY, 40)
+    start = range(len(days))[local_slice][0]
+    write_csv(tmp_path / "005930.csv", days[local_slice], close_of=lambda i: 1000 + start + i)
+    client = make_client({"ka10081": chart(days, lambda i: 1000 + i)})
+
+    prices = client.get_daily_prices("005930", count=30)
+
+    assert "ka10001" not in client._session.tr_ids
+    assert [p.date for p in prices] == days[-30:]
+
+
+def test_preview_history_warms_main_run(make_client, tmp_path):
+    days = trading_days(TODAY, 40)
+    quote = {
+        "return_code": 0, "base_pric": "1038", "open_pric": "+1040",
+        "high_pric": "+1060", "low_pric": "1035", "cur_prc": "+1055", "trde_qty": "5,000",
+    }
+    routes = {"ka10081": chart(days, lambda i: 1000 + i), "ka10001": quote}
+
+    # 프리뷰: 로컬 CSV 없음 → 전체 조회, 과거분(당일 장중 봉 제외) 보관 후 파일 저장
+    preview = make_client(routes)
+    preview.get_daily_prices("005930", count=30)
+    assert preview._daily_history.flush() == 1
+
+    # 메인(다른 프로세스 가정): 파일에서 과거분 로드 → ka10001 1회
+    main_cache = DailyHistoryCache(tmp_path / "history")
+    main = make_client(routes, daily_history=main_cache)
+    prices = main.get_daily_prices("005930", count=30)
+
+    assert main._session.tr_ids == ["ka10001"]
+    assert [p.date for p in prices] == days[-30:]
+    assert prices[-1].close == 1055 and prices[-2].close == 1038
+    assert (main_cache.hits, main_cache.misses) == (1, 0)
+
+
+def test_warm_history_dropped_on_adjusted_price(make_client, tmp_path):
+    days = trading_days(TODAY, 40)
+    cache = DailyHistoryCache(tmp_path / "history")
+    cache.put("005930", TODAY, [
+        DailyPrice(date=d, open=1, high=1, low=1, close=1000 + i, volume=1)
+        for i, d in enumerate(days)
+    ])
+    client = make_client({
+        "ka10001": {
+            "return_code": 0, "base_pric": "519", "open_pric": "520",
+            "high_pric": "530", "low_pric": "515", "cur_prc": "525", "trde_qty": "1",
+        },
+        "ka10081": chart(days, lambda i: 500 + i),
+    }, daily_history=cache)
+
+    prices = client.get_daily_prices("005930", count=30)
+
+    assert client._session.tr_ids == ["ka10001", "ka10081"]
+    assert prices[-1].close == 539
+    # 전체 조회 결과로 과거분 교체
+    assert cache.get("005930", TODAY)[-1].close == 538
+
+
+def test_series_path_builds_no_daily_price(make_client, tmp_path, monkeypatch):
+    days = trading_days(TODAY, 40)
+    write_csv(tmp_path / "000660.csv", days[:-4])
+    quote = {
+        "return_code": 0, "base_pric": "1038", "open_pric": "+1040",
+        "high_pric": "+1060", "low_pric": "1035", "cur_prc": "+1055", "trde_qty": "5,000",
+    }
+    routes = {"ka10081": chart(days, lambda i: 1000 + i), "ka10001": quote}
+    preview = make_client(routes)
+
+    built = []
+    original_init = DailyPrice.__init__
+
+    def counting_init(self, *args, **kwargs):
+        built.append(1)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(DailyPrice, "__init__", counting_init)
+
+    # 전체 조회 / 로컬 증분 병합 → 과거분 보관 → 파일 → 다른 프로세스 워밍 + ka10001
+    full = preview.get_daily_series("005930", count=30)
+    merged = preview.get_daily_series("000660", count=30)
+    preview._daily_history.flush()
+    main = make_client(routes, daily_history=DailyHistoryCache(tmp_path / "history"))
+    warm = main.get_daily_series("005930", count=30)
+
+    assert built == []
+    assert main._session.tr_ids == ["ka10001"]
+    assert isinstance(warm, PriceSeries) and len(warm) == 30
+    assert warm.close.tolist()[-2:] == [1038, 1055]
+    assert full.close.tolist() == merged.close.tolist() == list(range(1010, 1040))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+랭킹 연속조회(ka10032/ka10030) 테스트 (가짜 세션)
+
+실행:
+    python -m pytest tests/test_kiwoom_rank_paging.py -q
+"""
+
+import threading
+import time
+
+import pytest
+
+LIST_KEYS = {"ka10032": "trde_prica_upper", "ka10030": "tdy_trde_qty_upper"}
+
+
+@pytest.fixture
+def rank_session(fake_session, fake_response):
+    """tr_id별 페이지 목록을 next-key로 넘겨주는 세션
+
+    rank_session(pages, delay=0.0, fail_once=None)
+    pages: tr_id → [[row, ...], ...], fail_once: (tr_id, page) 첫 시도만 500.
+    세션에는 requests [(tr_id, page)]와 max_in_flight가 기록된다.
+    """
+
+    def make(pages, delay=0.0, fail_once=None):
+        fail_once = set(fail_once or [])
+        state = {"in_flight": 0}
+        lock = threading.Lock()
+
+        def handler(tr_id, body, headers):
+            page = int(headers.get("next-key") or 0)
+            with lock:
+                session.requests.append((tr_id, page))
+                state["in_flight"] += 1
+                session.max_in_flight = max(session.max_in_flight, state["in_flight"])
+            try:
+                time.sleep(delay)
+                if (tr_id, page) in fail_once:
+                    fail_once.discard((tr_id, page))
+                    return fake_response(status_code=500)
+                has_next = page + 1 < len(pages[tr_id])
+                next_headers = {"cont-yn": "Y", "next-key": str(page + 1)} if has_next else {"cont-yn": "N"}
+                return fake_response({"return_code": 0, LIST_KEYS[tr_id]: pages[tr_id][page]}, headers=next_headers)
+            finally:
+                with lock:
+                    state["in_flight"] -= 1
+
+        session = fake_session(handler)
+        session.requests = []
+        session.max_in_flight = 0
+        return session
+
+    return make
+
+
+def rows(start, n, flu_rt="+5.00"):
+    return [{
+        "stk_cd": f"A{i:06d}", "stk_nm": f"종목{i}", "cur_prc": "+1000",
+        "flu_rt": flu_rt, "now_trde_qty": "100", "trde_qty": "100",
+        "trde_prica": str(100000 - i),
+    } for i in range(start, start + n)]
+
+
+def test_pages_follow_next_key_until_count(rank_session, make_kiwoom_client):
+    session = rank_session({"ka10032": [rows(1, 100), rows(101, 100), rows(201, 100)]})
+    client = make_kiwoom_client(session)
+
+    result = client.get_trading_value_rank(count=250)
+
+    assert len(result) == 250
+    assert result[-1]["rank"] == 250 and result[-1]["code"] == "000250"
+    assert session.requests == [("ka10032", 0), ("ka10032", 1), ("ka10032", 2)]
+
+
+def test_page_retry_on_server_error(monkeypatch, rank_session, make_kiwoom_client):
+    monkeypatch.setattr("src.adapters.kiwoom_rest_client.time.sleep", lambda s: None)
+    session = rank_session(
+        {"ka10030": [rows(1, 100), rows(101, 100)]},
+        fail_once=[("ka10030", 1)],
+    )
+    client = make_kiwoom_client(session)
+
+    result = client.get_volume_rank(count=150)
+
+    assert len(result) == 150
+    assert session.requests.count(("ka10030", 1)) == 2
+
+
+def test_universe_fetches_rankings_concurrently_and_stops_early(rank_session, make_kiwoom_client):
+    session = rank_session({
+        "ka10032": [rows(1, 100), rows(101, 100), rows(201, 100)],
+        "ka10030": [rows(1001, 100), rows(1101, 50)],
+    }, delay=0.02)
+    client = make_kiwoom_client(session)
+
+    stocks, names = client.get_rank_universe(target_count=80)
+
+    assert session.max_in_flight == 2
+    # 첫 페이지에서 이미 80개 이상 통과 → 2페이지부터 생략
+    assert ("ka10032", 1) not in session.requests
+    assert ("ka10030", 1) not in session.requests
+    assert len(stocks) == 200 and len(names) == 200
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+키움 로컬 시뮬레이터 테스트 (실제 HTTP, 127.0.0.1)
+
+실행:
+    python -m pytest tests/test_kiwoom_simulator.py -q
+"""
+
+import pytest
+
+from src.adapters.kiwoom_rest_client import KiwoomErrorCode, KiwoomRestClient, TokenManager
+from src.adapters.kiwoom_simulator import KiwoomSimulator, SimulatedMarket
+from src.adapters.rate_limiter import RateLimiter
+from src.adapters.response_cache import ResponseCache
+from src.domain.models import ScreenerError
+from src.utils.http_session import get_http_session
+
+
+@pytest.fixture
+def token_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(TokenManager, "CACHE_PATH", tmp_path / "kiwoom_token.json")
+    monkeypatch.setattr(TokenManager, "LOCK_PATH", tmp_path / "kiwoom_token.lock")
+
+
+def make_client(sim):
+    client = KiwoomRestClient(
+        rate_limiter=RateLimiter(rate=1000, burst=100),
+        response_cache=ResponseCache(ttls={}),
+    )
+    client.base_url = sim.base_url
+    client.app_key, client.secret_key = "key", "secret"
+    client._session = get_http_session(sim.base_url)
+    return client
+
+
+def test_rank_universe_pages_through_simulator(token_cache):
+    market = SimulatedMarket(universe_size=120, bars=40)
+    with KiwoomSimulator(market, page_size=50) as sim:
+        client = make_client(sim)
+        stocks = client.get_trading_value_rank(count=300)
+        calls = sim.stats()["calls"]
+
+    assert len(stocks) == 120
+    assert [s["rank"] for s in stocks] == list(range(1, 121))
+    values = [s["trading_value"] for s in stocks]
+    assert values == sorted(values, reverse=True)
+    assert calls == {"au10001": 1, "ka10032": 3}
+
+
+def test_daily_prices_match_market(token_cache):
+    market = SimulatedMarket(universe_size=3, bars=60)
+    code = market.codes[0]
+    with KiwoomSimulator(market) as sim:
+        prices = make_client(sim).get_daily_prices(code, count=30, incremental=False)
+
+    expected = market.daily_bars(code)[-30:]
+    assert [(p.date, p.close, p.volume) for p in prices] == \
+        [(p.date, p.close, p.volume) for p in expected]
+
+
+def test_current_price_uses_previous_close(token_cache):
+    market = SimulatedMarket(universe_size=3, bars=10)
+    code = market.codes[1]
+    with KiwoomSimulator(market) as sim:
+        price = make_client(sim).get_current_price(code)
+
+    quote = market.quote(code)
+    assert price.price == quote["bar"].close
+    assert price.change_rate == pytest.approx(quote["change_rate"])
+    assert price.market_cap == quote["market_cap"]
+
+
+def test_injected_5xx_exhausts_retries(token_cache, monkeypatch):
+    monkeypatch.setattr("src.adapters.kiwoom_rest_client.time.sleep", lambda s: None)
+    market = SimulatedMarket(universe_size=3, bars=10)
+    with KiwoomSimulator(market, error_5xx_rate=1.0) as sim:
+        client = make_client(sim)
+        client._get_token = lambda: "token"
+        with pytest.raises(ScreenerError) as exc:
+            client.get_current_price(market.codes[0])
+        stats = sim.stats()
+
+    assert exc.value.code == KiwoomErrorCode.API_ERROR
+    assert stats["injected"] == {"5xx": KiwoomRestClient.MAX_RETRIES + 1}
+
+
+def test_max_rps_returns_429(token_cache):
+    market = SimulatedMarket(universe_size=3, bars=10)
+    with KiwoomSimulator(market, max_rps=2) as sim:
+        statuses = [
+            sim.handle("/api/dostk/stkinfo", {"api-id": "ka10001", "authorization": "Bearer t"},
+                       {"stk_cd": market.codes[0]})[0]
+            for _ in range(4)
+        ]
+
+    assert statuses == [200, 200, 429, 429]
+    assert sim.stats()["throttled"] == {"ka10001": 2}
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+배열 기반 PriceSeries (슬라이스 뷰 / 봉 뷰 / DataFrame 변환) 테스트
+
+실행:
+    python -m pytest tests/test_price_series.py -q
+"""
+
+import random
+from dataclasses import asdict
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.domain.models import StockData
+from src.domain.price_series import PriceBar, PriceSeries
+from src.domain.score_calculator import ScoreCalculatorV5
+
+
+def make_prices(random_prices, rng, n: int):
+    """거래량 0·거래대금 포함 무작위 일봉 (DataFrame/봉 뷰 왕복 검증용)"""
+    return random_prices(
+        rng, n, start=date(2024, 1, 1), drift=0.003, volume=(0, 2_000_000), trading_value=True,
+    )
+
+
+def test_bar_view_matches_daily_price(random_prices):
+    prices = make_prices(random_prices, 1, 40)
+    series = PriceSeries.from_daily_prices(prices)
+
+    assert len(series) == 40
+    for bar, price in zip(series, prices):
+        assert isinstance(bar, PriceBar)
+        assert bar == price
+        for name in ("date", "open", "close", "volume", "trading_value", "change_rate",
+                     "is_bullish", "body_size", "upper_wick", "lower_wick", "upper_wick_ratio"):
+            assert repr(getattr(bar, name)) == repr(getattr(price, name)), name
+    assert [b.close for b in reversed(series)] == [p.close for p in reversed(prices)]
+    assert series[-1] == prices[-1] and series[-40] == prices[0]
+    with pytest.raises(IndexError):
+        series[40]
+    assert series.to_daily_prices() == prices
+
+
+def test_slices_are_views(random_prices):
+    prices = make_prices(random_prices, 2, 30)
+    series = PriceSeries.from_daily_prices(prices)
+
+    window = series[-20:]
+    assert isinstance(window, PriceSeries) and len(window) == 20
+    assert np.shares_memory(window.close, series.close)
+    assert window.to_daily_prices() == prices[-20:]
+    assert series[::-2].to_daily_prices() == prices[::-2]
+    assert series.tail(5).to_daily_prices() == prices[-5:]
+    assert len(series[50:]) == 0 and not series[50:]
+
+
+def test_from_dataframe_zero_copy_and_nan_rows(random_prices):
+    prices = make_prices(random_prices, 3, 25)
+    df = pd.DataFrame([asdict(p) for p in prices])
+    df["date"] = pd.to_datetime(df["date"])
+
+    series = PriceSeries.from_dataframe(df)
+    assert series.to_daily_prices() == prices
+    assert np.shares_memory(series.close, df["close"].to_numpy())
+
+    df.loc[3, "close"] = np.nan                     # 결측 행 제외
+    df["date"] = df["date"].dt.strftime("%Y-%m-%d")  # 문자열 날짜
+    series = PriceSeries.from_dataframe(df)
+    assert series.to_daily_prices() == prices[:3] + prices[4:]
+    assert len(PriceSeries.from_dataframe(df.iloc[:0])) == 0
+
+
+def test_scalar_scorer_accepts_series(random_prices):
+    rng = random.Random(4)
+    calculator = ScoreCalculatorV5()
+    for i in range(300):
+        prices = make_prices(random_prices, rng, rng.randint(15, 90))
+        as_list = StockData(code=f"{i:06d}", name="종목", daily_prices=prices,
+                            current_price=prices[-1].close, trading_value=100.0)
+        series = PriceSeries.from_daily_prices(prices)
+        as_series = StockData(code=f"{i:06d}", name="종목", daily_prices=series,
+                              current_price=prices[-1].close, trading_value=100.0)
+
+        expected = calculator.calculate_single_score(as_list)
+        actual = calculator.calculate_single_score(as_series)
+        assert as_series.price_series is series
+        if expected is None:
+            assert actual is None
+            continue
+        assert asdict(actual) == asdict(expected)
+        assert repr(actual.score_total) == repr(expected.score_total)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+키움 Rate Limiter 테스트
+
+실행:
+    python -m pytest tests/test_rate_limiter.py -q
+"""
+
+import asyncio
+import threading
+import time
+
+from src.adapters.rate_limiter import RateLimiter, TokenBucket, parse_api_limits
+
+
+def test_token_bucket_burst_and_refill(clock):
+    bucket = TokenBucket(rate=10, capacity=3, clock=clock)
+
+    for _ in range(3):
+        assert bucket.wait_time() == 0
+        bucket.consume()
+    assert bucket.wait_time() > 0
+
+    clock.now += 0.1  # 1토큰 충전
+    assert bucket.wait_time() == 0
+
+
+def test_api_sub_budget_limits_only_that_api(clock):
+    limiter = RateLimiter(rate=100, burst=10, api_limits={"ka10081": (1, 1)}, clock=clock)
+
+    assert limiter.try_acquire("ka10081")
+    assert not limiter.try_acquire("ka10081")
+    # 다른 api-id는 전역 예산만 사용
+    assert limiter.try_acquire("ka10001")
+
+
+def test_sub_budget_failure_does_not_consume_global(clock):
+    limiter = RateLimiter(rate=1, burst=2, api_limits={"ka10081": (1, 1)}, clock=clock)
+
+    assert limiter.try_acquire("ka10081")
+    assert not limiter.try_acquire("ka10081")
+    # 전역 버킷에는 1개가 남아 있어야 함
+    assert limiter.try_acquire("ka10001")
+
+
+def test_threads_never_exceed_rate():
+    rate, burst, calls = 50.0, 2, 40
+    limiter = RateLimiter(rate=rate, burst=burst)
+    stamps = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(calls // 4):
+            limiter.acquire("ka10081")
+            with lock:
+                stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    start = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.monotonic() - start
+
+    # (calls - burst) 개는 충전 속도 이상으로 빨리 나갈 수 없음
+    assert len(stamps) == calls
+    assert elapsed >= (calls - burst) / rate * 0.95
+
+
+def test_async_acquire():
+    limiter = RateLimiter(rate=100, burst=1)
+
+    async def run():
+        await asyncio.gather(*(limiter.acquire_async("ka10001") for _ in range(5)))
+
+    start = time.monotonic()
+    asyncio.run(run())
+    assert time.monotonic() - start >= 0.035
+
+
+def test_acquire_timeout():
+    limiter = RateLimiter(rate=1, burst=1)
+    assert limiter.acquire()
+    assert not limiter.acquire(timeout=0.01)
+
+
+def test_parse_api_limits():
+    assert parse_api_limits("ka10081:5/2, ka10001:4,bad") == {
+        "ka10081": (5.0, 2.0),
+        "ka10001": (4.0, 1.0),
+    }
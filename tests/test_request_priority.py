@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+키움 요청 우선순위 (critical > normal > background) 테스트
+
+실행:
+    python -m pytest tests/test_request_priority.py -q
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.adapters.rate_limiter import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_CRITICAL,
+    PRIORITY_NORMAL,
+    RateLimiter,
+    current_priority,
+    parse_priority,
+    request_priority,
+    submit_with_context,
+    with_priority,
+)
+
+
+def test_lower_class_yields_to_waiting_critical():
+    limiter = RateLimiter(rate=1000, burst=1)
+    # critical 대기자가 있는 동안 background는 토큰이 있어도 가져가지 않음
+    limiter._set_waiting(PRIORITY_CRITICAL, 1)
+    assert not limiter.try_acquire("ka10081", priority="background")
+    assert not limiter.try_acquire("ka10081", priority="normal")
+    assert limiter.try_acquire("ka10081", priority="critical")
+
+    limiter._set_waiting(PRIORITY_CRITICAL, -1)
+    time.sleep(0.01)
+    assert limiter.try_acquire("ka10081", priority="background")
+
+
+def test_critical_served_before_background_under_contention():
+    limiter = RateLimiter(rate=10, burst=1)
+    limiter.acquire("ka10081")  # 버킷 비움 → 이후 호출은 모두 대기
+    order = []
+    lock = threading.Lock()
+
+    def call(priority, tag):
+        with request_priority(priority):
+            limiter.acquire("ka10081")
+        with lock:
+            order.append(tag)
+
+    background = [threading.Thread(target=call, args=("background", f"bg{i}")) for i in range(3)]
+    for t in background:
+        t.start()
+    time.sleep(0.005)
+    critical = [threading.Thread(target=call, args=("critical", f"cr{i}")) for i in range(3)]
+    for t in critical:
+        t.start()
+    for t in background + critical:
+        t.join(timeout=5)
+
+    # background가 먼저 줄을 섰어도 다음 토큰들은 critical이 가져간다
+    assert [tag[:2] for tag in order] == ["cr"] * 3 + ["bg"] * 3
+
+    stats = limiter.wait_stats()
+    assert stats["critical"]["count"] == 3 and stats["background"]["count"] == 3
+    assert stats["critical"]["waiting"] == 0 and stats["background"]["waiting"] == 0
+    assert stats["background"]["avg_ms"] > stats["critical"]["avg_ms"]
+    assert "critical 3회" in limiter.format_wait_stats()
+
+
+def test_timeout_unregisters_waiter():
+    limiter = RateLimiter(rate=1, burst=1)
+    limiter.acquire()
+    assert not limiter.acquire(timeout=0.01, priority="critical")
+    assert limiter.wait_stats()["critical"]["waiting"] == 0
+    # 실패한 대기는 통계에 넣지 않음
+    assert limiter.wait_stats()["critical"]["count"] == 0
+
+
+def test_priority_context_and_propagation():
+    assert current_priority() == PRIORITY_NORMAL
+    assert parse_priority("Background") == PRIORITY_BACKGROUND
+    with pytest.raises(ValueError):
+        parse_priority("urgent")
+
+    @with_priority("background")
+    def enrich():
+        return current_priority()
+
+    with request_priority("critical"):
+        # 안쪽 범위가 우선 (스크리닝 중 Enrichment는 background)
+        assert enrich() == PRIORITY_BACKGROUND
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert submit_with_context(executor, current_priority).result() == PRIORITY_CRITICAL
+            # 일반 submit은 컨텍스트를 물려받지 않음
+            assert executor.submit(current_priority).result() == PRIORITY_NORMAL
+    assert current_priority() == PRIORITY_NORMAL
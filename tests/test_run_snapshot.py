@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+실행 스냅샷 저장(내용 주소 블록 중복 제거) + 재채점(--replay) 테스트
+
+실행:
+    python -m pytest tests/test_run_snapshot.py -q
+"""
+
+import random
+from datetime import date
+
+import numpy as np
+import pytest
+
+from src.adapters import run_snapshot
+from src.adapters.run_snapshot import RunSnapshot, RunSnapshotStore, score_records
+from src.domain.models import StockData, StockInfo
+from src.domain.price_series import PriceSeries
+from src.domain.score_calculator import ScoreCalculatorV5
+from src.services.replay_service import replay_run
+from src.services.screening_pipeline import apply_broker_anomalies, finalize_scores
+
+
+def make_prices(random_prices, rng, n: int, start: date = date(2026, 8, 1)):
+    return random_prices(rng, n, start=start, closes=(1_500, 9_000, 72_000), trading_value=True)
+
+
+def make_stocks(random_prices, seed: int = 3, n: int = 80):
+    rng = random.Random(seed)
+    stocks = []
+    for i in range(n):
+        prices = make_prices(random_prices, rng, rng.randint(25, 45))
+        daily = PriceSeries.from_daily_prices(prices) if i % 2 else prices
+        stocks.append(StockData(
+            code=f"{i:06d}", name=f"종목{i}", daily_prices=daily, current_price=prices[-1].close,
+            trading_value=float(rng.choice([150, 300, 300, 800])),
+        ))
+    return stocks
+
+
+def live_scores(stocks, universe, anomalies):
+    """실시간 점수 단계 (점수 → 유니버스 순서 동점 정렬 → 거래원 반영 → 매물대 표시값)"""
+    scores = [s for s in ScoreCalculatorV5().calculate_each(stocks) if s is not None]
+    finalize_scores(scores, {code: i for i, code in enumerate(universe)})
+    apply_broker_anomalies(scores, anomalies)
+    for score in scores[:10]:
+        score.score_detail.raw_vp_score = 9.0
+        score.score_detail.raw_vp_tag = "지지"
+        score.score_detail.raw_vp_meta = "local/60d/10b/cur0"
+    return scores
+
+
+def test_series_blocks_dedup(tmp_path, random_prices):
+    store = RunSnapshotStore(tmp_path)
+    prices = make_prices(random_prices, 1, 60)
+    series = PriceSeries.from_daily_prices(prices)
+
+    digests = store.put_series(series)
+    assert len(digests) > 1 and store.objects_written == len(set(digests))
+    restored = store.get_series(digests)
+    assert restored.to_daily_prices() == prices
+    assert restored.trading_value.tobytes() == series.trading_value.tobytes()
+
+    # 같은 시계열 재저장 → 전부 재사용, 하루 늘어난 시계열 → 마지막 블록만 새로 저장
+    written = store.objects_written
+    assert store.put_series(series) == digests
+    assert store.objects_written == written
+    next_day = make_prices(random_prices, 9, 1, date(2026, 9, 30))
+    longer = store.put_series(PriceSeries.from_daily_prices(prices + next_day))
+    assert longer[:-1] == digests[:-1]
+    assert store.objects_written == written + 1
+    assert store.get_series([]).to_daily_prices() == []
+
+
+def test_replay_round_trip(tmp_path, random_prices):
+    store = RunSnapshotStore(tmp_path)
+    stocks = make_stocks(random_prices)
+    universe = [s.code for s in reversed(stocks)]  # 수집 순서와 다른 유니버스 순서
+    anomalies = {stocks[3].code: 72, stocks[10].code: 40}
+    scores = live_scores(stocks, universe, anomalies)
+    snapshot = RunSnapshot(
+        run_id="20261016-150000-main", run_type="main", screen_date=date(2026, 10, 16),
+        universe=universe, stocks=stocks, broker_applied=True, broker_anomaly=anomalies,
+        results=score_records(scores), config={"top_n": 5, "vectorized": False},
+    )
+    stats = store.save(snapshot)
+    assert stats["stocks"] == len(stocks) and stats["objects_written"] > 0
+    with pytest.raises(FileExistsError):
+        store.save(snapshot)
+
+    result = replay_run("20261016-150000-main", store)
+    assert result.identical, result.diff
+    assert [s.stock_code for s in result.scores] == [s.stock_code for s in scores]
+    assert [repr(s.score_total) for s in result.scores] == [repr(s.score_total) for s in scores]
+
+    # 같은 입력의 두 번째 실행 → 일봉 블록 전부 재사용
+    tampered = score_records(scores)
+    tampered[0]["total"] -= 1.0
+    tampered[0]["rank"], tampered[1]["rank"] = tampered[1]["rank"], tampered[0]["rank"]
+    snapshot.run_id = "20261016-150500-main"
+    snapshot.results = tampered
+    stats = store.save(snapshot)
+    assert stats["objects_written"] == 0 and stats["objects_reused"] > 0
+    assert store.list_runs() == ["20261016-150500-main", "20261016-150000-main"]
+
+    diff = replay_run("20261016-150500-main", store).diff
+    assert not diff["identical"]
+    assert {c["code"] for c in diff["rank_changes"]} == {scores[0].stock_code, scores[1].stock_code}
+    assert [(c["code"], c["field"]) for c in diff["value_changes"]] == [(scores[0].stock_code, "total")]
+
+
+def test_screener_snapshot_stage(tmp_path, monkeypatch, make_screener_service, random_prices):
+    store = RunSnapshotStore(tmp_path)
+    monkeypatch.setattr(run_snapshot, "get_run_snapshot_store", lambda: store)
+    service = make_screener_service()
+
+    stocks = make_stocks(random_prices, seed=8, n=40)
+    universe = [StockInfo(code=s.code, name=s.name) for s in stocks]
+    scores = live_scores(stocks, [s.code for s in stocks], {})
+    service._collected = stocks
+    service._broker_applied = True
+
+    stats = service._save_run_snapshot(
+        "20261016-123000-preview", date(2026, 10, 16), True, universe, scores, {}, 5,
+    )
+    assert stats is not None and stats["stocks"] == 40
+    result = replay_run("20261016-123000-preview", store)
+    assert result.identical, result.diff
+    assert result.snapshot.run_type == "preview"
+    assert np.array_equal(result.snapshot.stocks[0].price_series.close, stocks[0].price_series.close)
+
+    # 같은 run_id 재저장은 실패를 경고로만 남김
+    assert service._save_run_snapshot(
+        "20261016-123000-preview", date(2026, 10, 16), True, universe, scores, {}, 5,
+    ) is None
+
+
+def test_prune_old_runs_and_unreferenced_objects(tmp_path, monkeypatch, random_prices):
+    store = RunSnapshotStore(tmp_path)
+    monkeypatch.setattr(store, "OBJECT_GRACE_SEC", 0)
+    stocks = make_stocks(random_prices, seed=5, n=6)
+
+    def snapshot(run_id, day, stocks):
+        return RunSnapshot(
+            run_id=run_id, run_type="main", screen_date=day,
+            universe=[s.code for s in stocks], stocks=stocks,
+        )
+
+    old = store.save(snapshot("20260901-150000-main", date(2026, 9, 1), stocks))
+    assert (old["runs_pruned"], old["objects_pruned"]) == (0, 0)
+    store.save(snapshot("20260920-150000-main", date(2026, 9, 20), stocks[:3]))
+    kept_blocks = {d for s in stocks[:3] for d in store.put_series(s.price_series)}
+
+    # 10/16 저장 → 9/1 실행 삭제, 9/1만 쓰던 블록 삭제 (9/20·10/16 공유 블록은 유지)
+    stats = store.save(snapshot("20261016-150000-main", date(2026, 10, 16), stocks[:2]))
+    assert stats["runs_pruned"] == 1 and stats["objects_pruned"] > 0
+    assert store.list_runs() == ["20261016-150000-main", "20260920-150000-main"]
+    remaining = {p.parent.name + p.name for p in (tmp_path / "objects").glob("*/*")}
+    assert remaining == kept_blocks
+    assert np.array_equal(
+        store.load("20260920-150000-main").stocks[2].price_series.close, stocks[2].price_series.close,
+    )
+
+    # 지울 실행이 없으면 객체도 그대로
+    stats = store.save(snapshot("20261016-153000-main", date(2026, 10, 16), stocks[:1]))
+    assert (stats["runs_pruned"], stats["objects_pruned"]) == (0, 0)
+
+
+def test_prune_keeps_recent_unreferenced_objects(tmp_path, random_prices):
+    store = RunSnapshotStore(tmp_path)
+    stocks = make_stocks(random_prices, seed=6, n=2)
+    store.save(RunSnapshot(
+        run_id="20260901-150000-main", run_type="main", screen_date=date(2026, 9, 1),
+        universe=[s.code for s in stocks], stocks=stocks,
+    ))
+    # 다른 프로세스가 저장 중일 수 있는 방금 쓴 객체는 유예 시간 동안 남김
+    stats = store.save(RunSnapshot(
+        run_id="20261016-150000-main", run_type="main", screen_date=date(2026, 10, 16),
+        universe=[], stocks=[],
+    ))
+    assert (stats["runs_pruned"], stats["objects_pruned"]) == (1, 0)
+    assert store.get_series(store.put_series(stocks[0].price_series)).to_daily_prices()
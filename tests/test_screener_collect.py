@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+ScreenerService 데이터 수집 테스트 (가짜 키움 클라이언트)
+
+실행:
+    python -m pytest tests/test_screener_collect.py -q
+"""
+
+from datetime import date, timedelta
+
+from src.domain.models import DailyPrice, QuoteSnapshot
+
+
+def make_prices(n: int = 30, start: int = 10000, step: int = 50):
+    base = date(2026, 1, 1)
+    prices = []
+    for i in range(n):
+        close = start + i * step
+        prices.append(DailyPrice(
+            date=base + timedelta(days=i),
+            open=close - 20, high=close + 30, low=close - 40,
+            close=close, volume=100000 + i,
+        ))
+    return prices
+
+
+def collect_prices(stock_code):
+    """000002 실패, 000003 데이터 부족, 000004 하락, 나머지 정상 상승"""
+    if stock_code == "000002":
+        raise RuntimeError("boom")
+    if stock_code == "000003":
+        return make_prices(n=5)
+    if stock_code == "000004":
+        return make_prices(step=-50)
+    return make_prices()
+
+
+def test_collect_sequential_filters_and_fallbacks(monkeypatch, fake_kiwoom, make_screener_service, make_universe):
+    from src.config.settings import settings
+    monkeypatch.setattr(settings.screening, "collect_workers", 1)
+
+    client = fake_kiwoom(collect_prices)
+    result = make_screener_service(client)._collect_data(make_universe(6))
+
+    assert [sd.code for sd in result] == ["000001", "000005", "000006"]
+    sd = result[0]
+    # 거래대금 폴백: 일봉/스냅샷 없음 → 거래량×종가 추정
+    today = sd.daily_prices[-1]
+    assert sd.trading_value == (today.volume * today.close) / 100_000_000
+    # 수집 단계에서는 ka10001을 호출하지 않음
+    assert client.calls["ka10001"] == 0
+    assert sd.market_cap == 0.0
+
+
+def test_collect_uses_rank_snapshot(monkeypatch, fake_kiwoom, make_screener_service, make_universe):
+    from src.config.settings import settings
+    monkeypatch.setattr(settings.screening, "collect_workers", 1)
+
+    client = fake_kiwoom(collect_prices)
+    service = make_screener_service(client)
+    service._quote_snapshots = {
+        "000001": QuoteSnapshot.from_rank({"code": "1", "trading_value": 52_300}),
+    }
+
+    result = service._collect_data(make_universe(1))
+
+    assert result[0].trading_value == 523.0
+    assert client.calls["ka10001"] == 0
+
+
+def test_fill_missing_quotes_only_for_top_n(fake_kiwoom, make_screener_service):
+    class Score:
+        def __init__(self, code, market_cap=0.0):
+            self.stock_code = code
+            self.market_cap = market_cap
+
+    client = fake_kiwoom(collect_prices)
+    service = make_screener_service(client)
+    top_n = [Score("000001"), Score("000005", market_cap=99.0), Score("000006")]
+
+    service._fill_missing_quotes(top_n, collected_count=40)
+
+    assert client.calls["ka10001"] == 2
+    assert [s.market_cap for s in top_n] == [1234.0, 99.0, 1234.0]
+    assert service.quote_stats["ka10001_calls"] == 2
+    assert service.quote_stats["ka10001_avoided"] == 38
+
+
+def test_collect_concurrent_keeps_universe_order(monkeypatch, fake_kiwoom, make_screener_service, make_universe):
+    from src.config.settings import settings
+    monkeypatch.setattr(settings.screening, "collect_workers", 4)
+
+    client = fake_kiwoom(collect_prices, delay=0.01)
+    service = make_screener_service(client)
+    universe = make_universe(20)
+
+    result = service._collect_data(universe)
+
+    expected = [s.code for s in universe if s.code not in {"000002", "000003", "000004"}]
+    assert [sd.code for sd in result] == expected
+    assert 1 < client.max_in_flight <= 4
+
+
+def test_iter_collect_yields_as_completed(fake_kiwoom, make_screener_service, make_universe):
+    client = fake_kiwoom(collect_prices, delay=0.005)
+    service = make_screener_service(client)
+
+    codes = {sd.code for sd in service.iter_collect_data(make_universe(8), max_workers=3)}
+
+    assert codes == {"000001", "000005", "000006", "000007", "000008"}
+
+
+def test_collect_stops_at_deadline(monkeypatch, fake_kiwoom, make_screener_service, make_universe):
+    from src.config.settings import settings
+    from src.utils.deadline import Deadline
+    monkeypatch.setattr(settings.screening, "collect_workers", 2)
+
+    client = fake_kiwoom(collect_prices, delay=0.05)
+    deadline = Deadline(budget_sec=0.12)
+
+    result = make_screener_service(client)._collect_data(make_universe(40), deadline=deadline)
+
+    assert len(result) < 37
+    assert deadline.cut_stages == ["collect"]
+    assert client.calls["ka10081"] < 40
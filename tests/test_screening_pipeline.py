@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+수집 → 점수 스트리밍 파이프라인 테스트 (가짜 키움 클라이언트)
+
+실행:
+    python -m pytest tests/test_screening_pipeline.py -q
+"""
+
+import threading
+from datetime import date, timedelta
+
+import pytest
+
+from src.domain.models import DailyPrice
+from src.services.screening_pipeline import RunningTopK, SpeculativeEnricher
+
+
+def make_prices(seed: int, n: int = 30):
+    """종목마다 다른 모양의 상승 시계열 (점수가 갈리도록)"""
+    base = date(2026, 1, 1)
+    prices = []
+    close = 10000
+    for i in range(n):
+        close += 20 + (seed * 37 + i * 11) % 90
+        prices.append(DailyPrice(
+            date=base + timedelta(days=i),
+            open=close - (seed % 5) * 10, high=close + 30 + seed % 7, low=close - 40,
+            close=close, volume=100000 + (seed * 997 + i * 131) % 50000,
+        ))
+    return prices
+
+
+class Score:
+    def __init__(self, code, total, tv=0.0):
+        self.stock_code = code
+        self.score_total = total
+        self.trading_value = tv
+
+
+@pytest.fixture
+def service(fake_kiwoom, make_screener_service):
+    # 일부 종목은 같은 시세 → 점수/거래대금 동점 (유니버스 순서 유지 확인)
+    return make_screener_service(fake_kiwoom(lambda code: make_prices(int(code) % 15)))
+
+
+def test_streaming_matches_batch_ranking(monkeypatch, make_universe, service):
+    from src.config.settings import settings
+    monkeypatch.setattr(settings.screening, "collect_workers", 4)
+
+    universe = make_universe(40)
+    entered = []
+
+    scores, collected = service._collect_and_score(universe, on_enter=entered.append, top_k=5)
+    batch = service.calculator.calculate_scores(service._collect_data(universe))
+
+    assert collected == 40
+    assert [(s.stock_code, s.rank, s.score_total) for s in scores] == \
+        [(s.stock_code, s.rank, s.score_total) for s in batch]
+    # 최종 상위 5는 모두 진입 통지를 받았음
+    assert {s.stock_code for s in scores[:5]} <= set(entered)
+
+
+def test_running_top_k_reports_entries():
+    top = RunningTopK(k=2)
+
+    assert top.push(Score("A", 50))
+    assert top.push(Score("B", 40))
+    assert not top.push(Score("C", 30))
+    assert top.push(Score("D", 45))      # B 탈락
+    assert not top.push(Score("E", 45))  # 동점은 먼저 들어온 종목 유지
+    assert top.codes() == {"A", "D"}
+
+
+def test_speculative_results_only_for_final_codes():
+    release = threading.Event()
+    fetched = []
+
+    def fetch(code):
+        fetched.append(code)
+        if code == "slow":
+            release.wait(1)
+        return f"adj-{code}"
+
+    enricher = SpeculativeEnricher(fetch, name="broker", max_workers=1, max_tasks=3)
+    try:
+        assert enricher.submit("A")
+        assert not enricher.submit("A")
+        assert enricher.submit("slow")
+        assert enricher.submit("B")
+        assert not enricher.submit("C")  # 상한
+
+        results = enricher.results(["A"], timeout=1)
+        release.set()
+    finally:
+        enricher.close()
+
+    assert results == {"A": "adj-A"}
+    assert "B" not in fetched  # Top에서 빠진 종목의 대기 중 선조회는 취소
+
+
+def test_broker_stage_reuses_speculative_results(monkeypatch, service):
+    from src.adapters import kiwoom_rest_client
+    from src.services import broker_signal
+
+    client = object()
+    calls = []
+
+    def fake_fetch(fetch_client, code, raise_errors=False):
+        assert fetch_client is client
+        calls.append(code)
+        return None
+
+    def speculative_fetch(code):
+        if code == "000002":
+            raise TimeoutError("ka10040")  # 실패한 선조회는 "이상 없음"으로 쓰지 않음
+        return None
+
+    # 실제 키움 클라이언트(토큰/rate 상태 파일) 대신 가짜
+    monkeypatch.setattr(kiwoom_rest_client, "get_kiwoom_client", lambda: client)
+    monkeypatch.setattr(broker_signal, "fetch_broker_adjustment", fake_fetch)
+    monkeypatch.setattr(service, "_save_broker_signals", lambda *a: None)
+    scores = [Score(f"{i:06d}", 100 - i, 1.0) for i in range(1, 4)]
+    for s in scores:
+        s.score_detail = type("Detail", (), {"total": 0})()
+
+    enricher = SpeculativeEnricher(speculative_fetch, name="broker")
+    enricher.submit("000001")
+    enricher.submit("000002")
+    try:
+        service._apply_broker_scores(scores, date(2026, 10, 16), speculative=enricher)
+    finally:
+        enricher.close()
+
+    assert calls == ["000002", "000003"]
+
+
+def test_speculative_broker_fetch_raises_on_failure():
+    from src.services.broker_signal import fetch_broker_adjustment
+
+    class FailingClient:
+        ENDPOINTS = {"rank_info": "/api/dostk/rkinfo"}
+
+        def __init__(self, response=None):
+            self.response = response
+
+        def _request(self, method, endpoint, tr_id, body=None):
+            if self.response is None:
+                raise TimeoutError("ka10040")
+            return self.response
+
+    # 기본: 실패도 None (기존 호출자), 선조회: 실패를 예외로 구분
+    assert fetch_broker_adjustment(FailingClient(), "005930") is None
+    with pytest.raises(TimeoutError):
+        fetch_broker_adjustment(FailingClient(), "005930", raise_errors=True)
+    with pytest.raises(RuntimeError):
+        fetch_broker_adjustment(FailingClient({"return_code": 1}), "005930", raise_errors=True)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+동일 요청 병합 (single-flight) 테스트
+
+실행:
+    python -m pytest tests/test_single_flight.py -q
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+
+import pytest
+from requests.exceptions import Timeout
+
+from src.adapters.kiwoom_rest_client import KiwoomErrorCode
+from src.adapters.rate_limiter import request_priority
+from src.adapters.single_flight import SingleFlight
+from src.domain.models import ScreenerError
+
+
+@pytest.fixture
+def slow_session(fake_session):
+    """응답이 느린 세션 (slow_session(delay=0.1, error=None), 요청 body는 session.calls)"""
+
+    def make(delay=0.1, error=None):
+        def handler(tr_id, body, headers):
+            time.sleep(delay)
+            if error is not None:
+                raise error
+            return {"return_code": 0, "echo": dict(body)}
+
+        return fake_session(handler)
+
+    return make
+
+
+def _fetch(client, code):
+    return client._request("POST", "/api/dostk/shsa", "ka10014", {"stk_cd": code})
+
+
+def test_concurrent_identical_requests_share_one_call(slow_session, make_kiwoom_client):
+    session = slow_session()
+    flight = SingleFlight()
+    client = make_kiwoom_client(session, single_flight=flight)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = [executor.submit(_fetch, client, "005930") for _ in range(5)]
+        other = executor.submit(_fetch, client, "000660")
+        results = [f.result() for f in futures]
+
+    assert len(session.calls) == 2  # 005930 1회 + 000660 1회
+    assert all(r is results[0] for r in results)
+    assert other.result()["echo"] == {"stk_cd": "000660"}
+    assert flight.stats()["ka10014"] == {"calls": 2, "coalesced": 4}
+    assert "ka10014 4건 병합" in flight.format_stats()
+
+    # 끝난 요청은 다시 보냄 (캐시 역할은 하지 않음)
+    _fetch(client, "005930")
+    assert len(session.calls) == 3
+
+
+def test_different_priorities_are_not_coalesced(slow_session, make_kiwoom_client):
+    session = slow_session()
+    flight = SingleFlight()
+    client = make_kiwoom_client(session, single_flight=flight)
+
+    def fetch(priority):
+        with request_priority(priority):
+            return _fetch(client, "005930")
+
+    # background 리더의 토큰 대기/응답에 critical 호출이 묶이지 않음, 같은 등급끼리는 병합
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(fetch, p) for p in ("background", "background", "critical", "critical")]
+        [f.result() for f in futures]
+
+    assert len(session.calls) == 2
+    assert flight.stats()["ka10014"] == {"calls": 2, "coalesced": 2}
+
+
+def test_leader_error_is_shared(slow_session, make_kiwoom_client):
+    session = slow_session(error=Timeout("slow"))
+    client = make_kiwoom_client(session, single_flight=SingleFlight())
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(_fetch, client, "005930") for _ in range(3)]
+        errors = []
+        for f in futures:
+            with pytest.raises(ScreenerError) as exc:
+                f.result()
+            errors.append(exc.value.code)
+
+    assert errors == [KiwoomErrorCode.TIMEOUT_ERROR] * 3
+    assert len(session.calls) == 1
+
+
+def test_follower_timeout():
+    flight = SingleFlight()
+    release = threading.Event()
+    leader = threading.Thread(target=flight.do, args=("k", release.wait))
+    leader.start()
+    time.sleep(0.02)
+
+    with pytest.raises(FuturesTimeout):
+        flight.do("k", lambda: "unused", timeout=0.01)
+    release.set()
+    leader.join(timeout=5)
+
+
+def test_async_requests_coalesce():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"value": 1}
+
+    async def main():
+        return await asyncio.gather(*[flight.do_async("k", fetch, label="ka10081") for _ in range(4)])
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert flight.stats()["ka10081"] == {"calls": 1, "coalesced": 3}
+
+
+def test_client_request_async(slow_session, make_kiwoom_client):
+    session = slow_session(delay=0.05)
+    client = make_kiwoom_client(session, single_flight=SingleFlight())
+
+    async def main():
+        return await asyncio.gather(*[
+            client.request_async("POST", "/api/dostk/shsa", "ka10014", {"stk_cd": "005930"})
+            for _ in range(3)
+        ])
+
+    results = asyncio.run(main())
+    assert len(session.calls) == 1
+    assert results[0]["echo"] == {"stk_cd": "005930"}
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+다중 점수 전략(섀도 평가) 테스트
+
+실행:
+    python -m pytest tests/test_strategy_scoring.py -q
+"""
+
+import random
+from dataclasses import replace
+from datetime import date
+
+from src.domain.models import StockData
+from src.domain.score_calculator import ScoreCalculatorV5
+from src.domain.strategy_scoring import (
+    BASELINE_NAME, ScoringStrategy, evaluate_strategies, parse_strategies, score_matrix, strategy_totals,
+)
+from src.infrastructure import repo_shadow
+from src.infrastructure.database import Database
+
+
+def make_scores(random_prices, seed: int = 11, n: int = 300):
+    rng = random.Random(seed)
+    stocks = []
+    for i in range(n):
+        prices = random_prices(rng, 30, start=date(2025, 3, 1), closes=(1_200, 8_000, 64_000))
+        stocks.append(StockData(
+            code=f"{i:06d}", name=f"종목{i}", daily_prices=prices,
+            current_price=prices[-1].close, trading_value=float(rng.choice([100, 250, 400])),
+        ))
+    scores = ScoreCalculatorV5().calculate_scores(stocks)
+    for s in scores:  # 거래원 점수가 종목마다 다른 경우
+        s.score_detail.broker_score = rng.choice([0.0, 6.0, 6.5, 13.0])
+        s.score_total = s.score_detail.total
+    scores.sort(key=lambda x: (-x.score_total, -x.trading_value))
+    return scores
+
+
+def test_parse_strategies():
+    strategies = parse_strategies(
+        " no_broker:broker=0 ; momentum:change=1.5,volume=1.5,bogus=2,consec=x ;baseline:cci=2; no_broker:cci=1; :cci=1"
+    )
+
+    assert [s.name for s in strategies] == ["no_broker", "momentum"]
+    assert strategies[0].weights == {"broker": 0.0}
+    assert strategies[1].weights == {"change": 1.5, "volume": 1.5}
+    assert strategies[1].weight("cci") == 1.0
+    assert parse_strategies("") == []
+
+
+def test_baseline_matches_score_total_bits(random_prices):
+    scores = make_scores(random_prices)
+    totals = strategy_totals(score_matrix([s.score_detail for s in scores]), ScoringStrategy(BASELINE_NAME))
+
+    assert [repr(t) for t in totals] == [repr(s.score_total) for s in scores]
+
+
+def test_weighted_totals_and_rankings(random_prices):
+    scores = make_scores(random_prices, seed=5)
+    no_broker = ScoringStrategy("no_broker", {"broker": 0.0})
+    result = evaluate_strategies(scores, [no_broker, ScoringStrategy("same")], top_n=5)
+
+    # 기준 순위 = 실시간 정렬 순서
+    assert result.baseline.codes == [s.stock_code for s in scores]
+    # 배수 0 = 해당 항목을 0점으로 둔 것과 같음
+    expected = {s.stock_code: replace(s.score_detail, broker_score=0.0).total for s in scores}
+    ranking = result.rankings[1]
+    assert all(expected[c] == t for c, t in zip(ranking.codes, ranking.totals))
+    assert ranking.totals == sorted(ranking.totals, reverse=True)
+
+    compare = {row["strategy"]: row for row in result.compare()}
+    same = compare["same"]
+    assert same["overlap"] == 5 and same["jaccard"] == 1.0 and same["rank_corr"] == 1.0
+    moved = compare["no_broker"]
+    assert moved["overlap"] == 5 - len(moved["dropped"]) and len(moved["entered"]) == len(moved["dropped"])
+    assert set(moved["entered"]) <= set(ranking.top(5))
+
+    data = result.to_dict()
+    assert [s["name"] for s in data["strategies"]] == [BASELINE_NAME, "no_broker", "same"]
+    assert len(data["strategies"][1]["top"]) == 5
+    assert "겹침" in result.format_summary()
+
+
+def test_repository_round_trip(tmp_path, monkeypatch, random_prices):
+    db = Database(tmp_path / "shadow.db")
+    monkeypatch.setattr(repo_shadow, "get_database", lambda: db)
+    repo = repo_shadow.get_shadow_score_repository()
+
+    scores = make_scores(random_prices, n=40)
+    result = evaluate_strategies(scores, parse_strategies("no_broker:broker=0"), top_n=5).to_dict()
+    assert repo.save_run("20261016-150000-main", "main", date(2026, 10, 16), result) == 10
+    assert repo.save_run("20261016-150000-main", "main", date(2026, 10, 16), result) == 10
+
+    rows = repo.get_run("20261016-150000-main")
+    assert len(rows) == 10
+    picks = [r["stock_code"] for r in rows if r["strategy"] == "no_broker"]
+    assert picks == [item["code"] for item in result["strategies"][1]["top"]]
+    db.close()
+
+
+def test_screener_shadow_stage(monkeypatch, make_screener_service, random_prices):
+    from src.config.settings import settings
+
+    service = make_screener_service()
+    scores = make_scores(random_prices, n=60)
+
+    monkeypatch.setattr(settings.screening, "shadow_strategies", "")
+    assert service._evaluate_shadow_strategies(scores, 5, "rid", date(2026, 10, 16), False, save=False) is None
+
+    monkeypatch.setattr(settings.screening, "shadow_strategies", "no_broker:broker=0")
+    shadow = service._evaluate_shadow_strategies(scores, 5, "rid", date(2026, 10, 16), False, save=False)
+    assert shadow.baseline.top(5) == [s.stock_code for s in scores[:5]]
+    assert [r.strategy.name for r in shadow.rankings] == [BASELINE_NAME, "no_broker"]
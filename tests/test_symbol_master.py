@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+종목 마스터(stock_mapping.csv 인덱스) 테스트
+
+실행:
+    python -m pytest tests/test_symbol_master.py -q
+"""
+
+import os
+from pathlib import Path
+
+from src.adapters import symbol_master
+from src.adapters.symbol_master import SymbolMaster
+
+CSV_TEXT = (
+    "﻿code,name,market,sector\n"
+    "5930,삼성전자,KOSPI,반도체\n"
+    "069500,KODEX 200,KOSPI,\n"
+    "035720,카카오,KOSPI,인터넷\n"
+)
+
+
+def write_mapping(path: Path, text: str = CSV_TEXT, mtime_ns: int = None) -> Path:
+    path.write_text(text, encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+def test_lookup_fields_and_exclusion(tmp_path):
+    master = SymbolMaster(write_mapping(tmp_path / "map.csv"), tmp_path / "snap.pickle")
+
+    info = master.get("005930")
+    assert (info.name, info.market, info.sector) == ("삼성전자", "KOSPI", "반도체")
+    assert master.name("035720") == "카카오"
+    assert master.name("999999", "999999") == "999999"
+    assert master.is_excluded("069500") and not master.is_excluded("005930")
+    assert master.sectors() == {"005930": "반도체", "035720": "인터넷"}
+    assert len(master) == 3 and master.loads == 1
+
+
+def test_reloads_when_csv_changes(tmp_path):
+    path = write_mapping(tmp_path / "map.csv", mtime_ns=1_700_000_000_000_000_000)
+    master = SymbolMaster(path, tmp_path / "snap.pickle")
+    assert master.name("035720") == "카카오"
+    master.name("005930")
+    assert master.loads == 1  # 변경 없으면 재파싱 없음
+
+    write_mapping(path, CSV_TEXT.replace("카카오", "카카오(신)"), mtime_ns=1_700_000_001_000_000_000)
+
+    assert master.name("035720") == "카카오(신)"
+    assert master.loads == 2
+
+
+def test_snapshot_skips_csv_parse(tmp_path, monkeypatch):
+    path = write_mapping(tmp_path / "map.csv")
+    snapshot = tmp_path / "snap.pickle"
+    assert len(SymbolMaster(path, snapshot)) == 3
+
+    def fail(_):
+        raise AssertionError("CSV를 다시 파싱함")
+
+    monkeypatch.setattr(symbol_master, "parse_mapping_file", fail)
+    master = SymbolMaster(path, snapshot)
+
+    assert master.get("069500").excluded
+    assert master.name("005930") == "삼성전자"
+    assert master.loads == 0
+
+
+def test_missing_file_is_empty(tmp_path):
+    master = SymbolMaster(tmp_path / "none.csv", tmp_path / "snap.pickle")
+
+    assert master.get("005930") is None
+    assert master.names() == {}
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+키움 토큰 캐시 / 사전 갱신 테스트
+
+실행:
+    python -m pytest tests/test_token_refresh.py -q
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.adapters.kiwoom_rest_client import TokenManager, TokenRefresher
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(TokenManager, "CACHE_PATH", tmp_path / "kiwoom_token.json")
+    monkeypatch.setattr(TokenManager, "LOCK_PATH", tmp_path / "kiwoom_token.lock")
+    return TokenManager()
+
+
+def expires_in(seconds):
+    return (datetime.now() + timedelta(seconds=seconds)).strftime("%Y%m%d%H%M%S")
+
+
+class Issuer:
+    """발급 횟수를 세는 가짜 au10001"""
+
+    def __init__(self, lifetime=86400, delay=0.0):
+        self.lifetime = lifetime
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls += 1
+            return f"token-{self.calls}", expires_in(self.lifetime)
+
+
+def test_memory_hit_does_no_file_io(manager, monkeypatch):
+    manager.save_token("abc", expires_in(86400))
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("파일을 읽으면 안 됨")
+
+    monkeypatch.setattr("builtins.open", fail_open)
+    monkeypatch.setattr(Path, "stat", fail_open)
+    assert manager.get_cached_token().token == "abc"
+
+
+def test_file_published_atomically_and_shared(manager):
+    manager.save_token("abc", expires_in(86400))
+    assert not manager.CACHE_PATH.with_suffix(".tmp").exists()
+
+    other = TokenManager()  # 다른 프로세스 역할
+    assert other.get_cached_token().token == "abc"
+
+    # 다른 쪽이 재발급하면 만료된 메모리 캐시 대신 새 파일을 읽음
+    manager._memory_cache = None
+    other.save_token("def", expires_in(86400))
+    assert manager.get_cached_token().token == "def"
+
+
+def test_concurrent_callers_issue_once(manager):
+    issuer = Issuer(delay=0.05)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tokens = list(executor.map(lambda _: manager.issue(issuer).token, range(8)))
+
+    assert issuer.calls == 1 and manager.issued_count == 1
+    assert set(tokens) == {"token-1"}
+
+
+def test_refresher_renews_before_expiry(manager):
+    manager.save_token("old", expires_in(1800))
+    issuer = Issuer()
+    refresher = TokenRefresher(manager, issuer, lead_sec=3600, retry_sec=5)
+
+    # 만료 30분 전 < lead 1시간 → 즉시 갱신, 다음 확인은 새 토큰 만료 1시간 전
+    wait = refresher.refresh_once()
+    assert manager.get_cached_token().token == "token-1"
+    assert 86400 - 3600 - 5 <= wait <= 86400 - 3600
+    # 아직 갱신 구간이 아니면 발급 안 함
+    refresher.refresh_once()
+    assert issuer.calls == 1
+
+
+def test_refresher_retries_on_failure(manager):
+    def broken():
+        raise RuntimeError("au10001 down")
+
+    refresher = TokenRefresher(manager, broken, lead_sec=3600, retry_sec=7)
+    assert refresher.refresh_once() == 7
+    assert manager.get_cached_token() is None
+
+
+def test_refresher_thread_publishes_token(manager):
+    issuer = Issuer()
+    refresher = TokenRefresher(manager, issuer, lead_sec=60)
+    refresher.start()
+    try:
+        for _ in range(100):
+            if manager.get_cached_token() is not None:
+                break
+            time.sleep(0.01)
+        assert manager.get_cached_token().token == "token-1"
+    finally:
+        refresher.stop()
+    assert not refresher.running
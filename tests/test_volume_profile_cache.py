@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+키움 매물대(ka10025) 당일 캐시 테스트 (시뮬레이터 + 임시 디렉토리)
+
+실행:
+    python -m pytest tests/test_volume_profile_cache.py -q
+"""
+
+from datetime import date
+
+import pytest
+
+from src.adapters import volume_profile_cache
+from src.adapters.kiwoom_rest_client import KiwoomRestClient, TokenManager
+from src.adapters.kiwoom_simulator import KiwoomSimulator, SimulatedMarket
+from src.adapters.rate_limiter import RateLimiter
+from src.adapters.response_cache import ResponseCache
+from src.adapters.volume_profile_cache import VolumeProfileCache, load_cached_rows
+from src.utils.http_session import get_http_session
+
+DAY = date(2026, 10, 16)
+
+
+@pytest.fixture
+def sim_client(tmp_path, monkeypatch):
+    monkeypatch.setattr(TokenManager, "CACHE_PATH", tmp_path / "kiwoom_token.json")
+    monkeypatch.setattr(TokenManager, "LOCK_PATH", tmp_path / "kiwoom_token.lock")
+    market = SimulatedMarket(universe_size=12, bars=60)
+    with KiwoomSimulator(market, page_size=25) as sim:
+        client = KiwoomRestClient(
+            rate_limiter=RateLimiter(rate=1000, burst=100),
+            response_cache=ResponseCache(ttls={}),
+        )
+        client.base_url = sim.base_url
+        client.app_key, client.secret_key = "key", "secret"
+        client._session = get_http_session(sim.base_url)
+        yield market, sim, client
+
+
+def test_rows_page_through_both_markets(sim_client):
+    market, sim, client = sim_client
+
+    rows_by_code = client.get_volume_profile_rows(cycle_tp="50", prpscnt="5")
+
+    assert sorted(rows_by_code) == sorted(market.codes)
+    assert all(len(rows) == 5 for rows in rows_by_code.values())
+    # 시장별 6종목 × 5행 = 30행 → 25행 페이지 2개씩
+    assert sim.stats()["calls"]["ka10025"] == 4
+
+
+def test_cache_persists_for_trading_day(tmp_path):
+    rows = {"000001": [{"stk_cd": "000001", "prps_pric_strt": "100", "prps_pric_end": "110"}]}
+    VolumeProfileCache(tmp_path).put(DAY, (100, 10, 0), rows)
+
+    cache = VolumeProfileCache(tmp_path)
+    assert cache.has(DAY, (100, 10, 0))
+    assert cache.get("000001", DAY, (100, 10, 0)) == rows["000001"]
+    assert cache.get("000002", DAY, (100, 10, 0)) == []    # 조회했지만 목록에 없음
+    assert cache.get("000001", DAY, (50, 10, 0)) is None   # 다른 조건은 미조회
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert load_cached_rows("000001", (100, 10, 0), tmp_path) == rows["000001"]
+
+
+def test_screener_reuses_cache_between_runs(sim_client, tmp_path, monkeypatch, make_screener_service):
+    from src.config.settings import settings
+
+    market, sim, client = sim_client
+    monkeypatch.setattr(VolumeProfileCache, "CACHE_DIR", tmp_path / "vp")
+    monkeypatch.setattr(volume_profile_cache, "_vp_cache_instance", None)
+    monkeypatch.setattr(settings.vp, "source", "kiwoom")
+    monkeypatch.setattr(settings.vp, "cycle", 50)
+    monkeypatch.setattr(settings.vp, "bands", 5)
+
+    service = make_screener_service(client)
+    monkeypatch.setattr(service, "_vp_kiwoom_client", lambda: client)
+
+    class Score:
+        def __init__(self, code):
+            self.stock_code = code
+            self.current_price = market.daily_bars(code)[-1].close
+            self.score_detail = type("Detail", (), {})()
+
+    for _ in range(2):
+        scores = [Score(code) for code in market.codes[:4]]
+        service._calculate_volume_profiles(scores)
+
+    assert sim.stats()["calls"]["ka10025"] == 4
+    assert all(s.score_detail.raw_vp_meta.startswith("kiwoom/50d/5b") for s in scores)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""HTTP 커넥션 풀 벤치마크 (로컬 스텁 서버)
+
+매 호출 새 연결(requests.post) vs 호스트별 keep-alive 세션(get_http_session)
+의 초당 처리량을 비교합니다. 외부 네트워크는 사용하지 않습니다.
+
+사용:
+    python tools/bench_http_pool.py                 # 기본 500회, 1스레드
+    python tools/bench_http_pool.py --calls 2000 --threads 8
+    python tools/bench_http_pool.py --tls           # 자체서명 TLS (openssl 필요)
+"""
+
+import argparse
+import json
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# 프로젝트 루트
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+os.environ.setdefault("DASHBOARD_ONLY", "true")
+
+import requests
+import urllib3
+
+from src.services.http_utils import get_http_session, close_http_sessions
+
+PAYLOAD = json.dumps({"return_code": 0, "stk_dt_pole_chart_qry": [{"dt": "20260102"}] * 30}).encode()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 허용
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_server(use_tls: bool):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    scheme = "http"
+    if use_tls:
+        tmp = tempfile.mkdtemp()
+        cert, key = os.path.join(tmp, "cert.pem"), os.path.join(tmp, "key.pem")
+        subprocess.run(
+            ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+             "-subj", "/CN=127.0.0.1", "-keyout", key, "-out", cert],
+            check=True, capture_output=True,
+        )
+        ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        ctx.load_cert_chain(cert, key)
+        server.socket = ctx.wrap_socket(server.socket, server_side=True)
+        scheme = "https"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    return server, f"{scheme}://{host}:{port}/api/dostk/chart"
+
+
+def _run(label: str, send, calls: int, threads: int) -> float:
+    body = {"stk_cd": "005930", "base_dt": "20260102", "upd_stkpc_tp": "1"}
+    start = time.perf_counter()
+    if threads <= 1:
+        for _ in range(calls):
+            send(body)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(lambda _: send(body), range(calls)))
+    elapsed = time.perf_counter() - start
+    rps = calls / elapsed
+    print(f"  {label:<28} {calls:>6}회  {elapsed:7.2f}초  {rps:9.1f} req/s")
+    return rps
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP 커넥션 풀 벤치마크")
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--tls", action="store_true", help="자체서명 TLS 서버 사용")
+    args = parser.parse_args()
+
+    urllib3.disable_warnings()
+    server, url = _start_server(args.tls)
+    verify = not args.tls
+
+    print("=" * 60)
+    print(f"🔌 HTTP 풀 벤치마크: {url} (threads={args.threads})")
+    print("=" * 60)
+
+    before = _run(
+        "before: requests.post",
+        lambda body: requests.post(url, json=body, timeout=10, verify=verify).content,
+        args.calls, args.threads,
+    )
+    session = get_http_session(url)
+    after = _run(
+        "after: pooled session",
+        lambda body: session.post(url, json=body, timeout=10, verify=verify).content,
+        args.calls, args.threads,
+    )
+
+    print("-" * 60)
+    print(f"  개선: {after / before:.2f}x")
+
+    close_http_sessions()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
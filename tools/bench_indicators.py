@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""지표 계산 마이크로벤치마크 (롤링 커널 vs 기준 구현)
+
+CCI(14)/MA20/RSI(14)를 30/250/2,500봉에서 호출당 평균 시간으로 비교합니다.
+입력은 List[DailyPrice]와 PriceSeries 두 가지로 측정합니다 (PriceSeries는 변환 비용 없음).
+결과가 기준 구현과 비트 단위로 같은지도 함께 확인합니다.
+
+사용:
+    python tools/bench_indicators.py
+    python tools/bench_indicators.py --bars 30 250 2500 10000 --repeat 200
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# 프로젝트 루트
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+os.environ.setdefault("DASHBOARD_ONLY", "true")
+
+from src.domain.indicators import (  # noqa: E402
+    calculate_cci, calculate_cci_reference,
+    calculate_ma, calculate_ma_reference,
+    calculate_rsi, calculate_rsi_reference,
+)
+from src.domain.models import DailyPrice  # noqa: E402
+from src.domain.price_series import PriceSeries  # noqa: E402
+
+CASES = [
+    ("CCI14", calculate_cci, calculate_cci_reference, 14),
+    ("MA20", calculate_ma, calculate_ma_reference, 20),
+    ("RSI14", calculate_rsi, calculate_rsi_reference, 14),
+]
+
+
+def make_prices(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    prices = []
+    close = 50_000
+    for i in range(n):
+        o = max(1, int(close * (1 + rng.gauss(0, 0.01))))
+        close = max(1, int(o * (1 + rng.gauss(0.0005, 0.02))))
+        prices.append(DailyPrice(
+            date=date(2000, 1, 1) + timedelta(days=i), open=o,
+            high=max(o, close) + rng.randint(0, 300), low=max(1, min(o, close) - rng.randint(0, 300)),
+            close=close, volume=rng.randint(10_000, 1_000_000),
+        ))
+    return prices
+
+
+def per_call_us(fn, prices, period: int, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(prices, period=period)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지표 계산 마이크로벤치마크")
+    parser.add_argument("--bars", type=int, nargs="+", default=[30, 250, 2500])
+    parser.add_argument("--repeat", type=int, default=0, help="반복 횟수 (0=봉 수에 맞춰 자동)")
+    args = parser.parse_args()
+
+    print(f"{'지표':<6} {'봉':>6} {'기준(µs)':>10} {'커널(µs)':>10} {'PriceSeries(µs)':>16} {'배속':>6}  동일")
+    print("-" * 66)
+    for bars in args.bars:
+        prices = make_prices(bars)
+        series = PriceSeries.from_daily_prices(prices)
+        repeat = args.repeat or max(5, 30_000 // bars)
+        for name, fast, reference, period in CASES:
+            ref_us = per_call_us(reference, prices, period, max(3, repeat // 5))
+            fast_us = per_call_us(fast, prices, period, repeat)
+            series_us = per_call_us(fast, series, period, repeat)
+            same = [repr(v) for v in fast(prices, period=period)] == \
+                [repr(v) for v in reference(prices, period=period)]
+            print(f"{name:<6} {bars:>6} {ref_us:>10.1f} {fast_us:>10.1f} {series_us:>16.1f} "
+                  f"{ref_us / series_us:>5.1f}x  {'✓' if same else '✗'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""일봉 보관 메모리 벤치마크 (List[DailyPrice] vs PriceSeries)
+
+종목 N개 × 봉 M개 유니버스를 두 형태로 만들어 tracemalloc으로 잰 할당 크기를
+봉당 바이트로 비교합니다. 기본값은 2,500종목 × 750봉(약 3년)입니다.
+슬라이스(최근 30봉 뷰)와 봉 뷰 순회 비용도 함께 출력합니다.
+
+사용:
+    python tools/bench_price_series.py
+    python tools/bench_price_series.py --codes 500 --bars 250
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+os.environ.setdefault("DASHBOARD_ONLY", "true")
+
+from src.domain.price_series import PriceSeries, day_number  # noqa: E402
+
+
+def make_series(rng: np.random.Generator, bars: int) -> PriceSeries:
+    """무작위 일봉 시계열 (배열을 새로 할당)"""
+    start = day_number(date(2023, 1, 2))
+    walk = rng.uniform(1_000, 300_000) * np.cumprod(1 + rng.normal(0, 0.02, bars))
+    close = np.maximum(1, walk).astype(np.int64)
+    open_ = np.maximum(1, close * (1 + rng.normal(0, 0.01, bars))).astype(np.int64)
+    high = np.maximum(open_, close) + rng.integers(0, 500, bars)
+    low = np.maximum(1, np.minimum(open_, close) - rng.integers(0, 500, bars))
+    volume = rng.integers(1_000, 5_000_000, bars)
+    return PriceSeries(
+        np.arange(start, start + bars, dtype=np.int64), open_, high, low, close, volume,
+        (close * volume).astype(np.float64),
+    )
+
+
+def traced_bytes(build):
+    """build()가 만든 객체를 살려 둔 채 잰 순증 할당 바이트"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일봉 보관 메모리 벤치마크")
+    parser.add_argument("--codes", type=int, default=2500)
+    parser.add_argument("--bars", type=int, default=750)
+    args = parser.parse_args()
+
+    total_bars = args.codes * args.bars
+    rng = np.random.default_rng(7)
+    source = [make_series(rng, args.bars) for _ in range(args.codes)]
+
+    lists, list_bytes = traced_bytes(lambda: [s.to_daily_prices() for s in source])
+    series, series_bytes = traced_bytes(
+        lambda: [PriceSeries(*(getattr(s, name).copy() for name in PriceSeries.__slots__)) for s in source]
+    )
+    del source
+
+    print(f"유니버스: {args.codes:,}종목 × {args.bars:,}봉 = {total_bars:,}봉")
+    print(f"{'형태':<18} {'전체(MB)':>10} {'봉당(B)':>9}")
+    print("-" * 40)
+    print(f"{'List[DailyPrice]':<18} {list_bytes / 2**20:>10.1f} {list_bytes / total_bars:>9.1f}")
+    print(f"{'PriceSeries':<18} {series_bytes / 2**20:>10.1f} {series_bytes / total_bars:>9.1f}")
+    print(f"→ {list_bytes / series_bytes:.1f}배 절감 (배열 데이터 7열 × 8B = 56B/봉)")
+
+    # 최근 30봉 윈도우: 리스트 슬라이스(복사) vs 배열 뷰
+    repeat = 20
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for prices in lists:
+            prices[-30:]
+    list_slice_us = (time.perf_counter() - t0) / (repeat * len(lists)) * 1e6
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for s in series:
+            s[-30:]
+    view_us = (time.perf_counter() - t0) / (repeat * len(series)) * 1e6
+    print(f"\n최근 30봉 슬라이스: 리스트 {list_slice_us:.2f}µs, 배열 뷰 {view_us:.2f}µs (봉 수와 무관)")
+
+    sample = series[0]
+    assert sample.to_daily_prices() == lists[0]
+    t0 = time.perf_counter()
+    sum(bar.close for bar in sample)
+    bar_us = (time.perf_counter() - t0) / len(sample) * 1e6
+    print(f"봉 뷰 순회: {bar_us:.2f}µs/봉 (레거시 호출자용)")
+
+
+if __name__ == "__main__":
+    main()
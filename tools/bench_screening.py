@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""스크리닝 end-to-end 벤치마크 (로컬 키움 시뮬레이터)
+
+ScreenerService.run_screening을 키움 시뮬레이터에 붙여 실행하고
+벽시계 시간과 api-id별 호출 수를 출력합니다. 외부 네트워크, 운영 DB,
+운영 토큰 캐시(.cache/)는 사용하지 않습니다 (임시 디렉토리 사용).
+
+사용:
+    python tools/bench_screening.py                          # 프리뷰 + 메인, 지연 20ms
+    python tools/bench_screening.py --mode main --latency-ms 50 --jitter-ms 30
+    python tools/bench_screening.py --rate-429 0.05 --rate-5xx 0.01 --max-rps 20
+    python tools/bench_screening.py --ohlcv-dir data/ohlcv --universe 500
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+_TMP = Path(tempfile.mkdtemp(prefix="closingbell_bench_"))
+
+
+def _configure_env(args) -> None:
+    """settings 로드 전 환경 변수 (운영 자원과 분리)"""
+    os.environ["KIWOOM_APPKEY"] = "sim-appkey"
+    os.environ["KIWOOM_SECRETKEY"] = "sim-secretkey"
+    os.environ["DISCORD_ENABLED"] = "false"
+    os.environ["DB_PATH"] = str(_TMP / "bench.db")
+    os.environ["KIWOOM_HOST_RATE_LIMIT"] = "false"  # 운영 프로세스와 예산을 나누지 않음
+    os.environ["SCREENING_BUDGET_SEC"] = "0"
+    os.environ["KIWOOM_INCREMENTAL_DAILY"] = "true" if args.incremental else "false"
+    if args.rate is not None:
+        os.environ["KIWOOM_RATE_PER_SEC"] = str(args.rate)
+    if args.workers is not None:
+        os.environ["COLLECT_WORKERS"] = str(args.workers)
+
+
+def _format_calls(calls: dict) -> str:
+    return ", ".join(f"{k}={v}" for k, v in sorted(calls.items())) or "-"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스크리닝 end-to-end 벤치마크 (키움 시뮬레이터)")
+    parser.add_argument("--mode", choices=["preview", "main", "both"], default="both")
+    parser.add_argument("--universe", type=int, default=300, help="시뮬레이터 종목 수")
+    parser.add_argument("--ohlcv-dir", type=Path, default=None, help="CSV 디렉토리 (없으면 합성 시세)")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0, help="429 주입 확률 (0~1)")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="5xx 주입 확률 (0~1)")
+    parser.add_argument("--max-rps", type=float, default=0.0, help="서버측 초당 상한 (0이면 없음)")
+    parser.add_argument("--rate", type=float, default=None, help="클라이언트 초당 호출 수 (KIWOOM_RATE_PER_SEC)")
+    parser.add_argument("--workers", type=int, default=None, help="COLLECT_WORKERS")
+    parser.add_argument("--incremental", action="store_true", help="로컬 OHLCV 증분 일봉 사용")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("-v", "--verbose", action="store_true", help="스크리닝 로그 출력")
+    args = parser.parse_args()
+
+    _configure_env(args)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+
+    from src.config.settings import settings
+    from src.adapters.daily_history_cache import DailyHistoryCache, get_daily_history_cache
+    from src.adapters.kiwoom_rest_client import TokenManager
+    from src.adapters.kiwoom_simulator import KiwoomSimulator, SimulatedMarket
+    from src.adapters.response_cache import get_response_cache
+    from src.adapters.volume_profile_cache import VolumeProfileCache
+    from src.infrastructure.database import init_database
+    from src.services.http_utils import close_http_sessions
+    from src.utils.deadline import Deadline
+
+    # 토큰 캐시도 임시 디렉토리로 (운영 토큰을 덮어쓰지 않음)
+    TokenManager.CACHE_PATH = _TMP / "kiwoom_token.json"
+    TokenManager.LOCK_PATH = _TMP / "kiwoom_token.lock"
+    DailyHistoryCache.CACHE_DIR = _TMP / "daily_history"
+    VolumeProfileCache.CACHE_DIR = _TMP / "volume_profile"
+
+    market = SimulatedMarket(universe_size=args.universe, seed=args.seed, ohlcv_dir=args.ohlcv_dir)
+    sim = KiwoomSimulator(
+        market, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_429_rate=args.rate_429, error_5xx_rate=args.rate_5xx,
+        max_rps=args.max_rps, seed=args.seed,
+    ).start()
+    settings.kiwoom.base_url = sim.base_url
+
+    from src.services.screener_service import ScreenerService
+
+    init_database()
+    service = ScreenerService()
+
+    print("=" * 72)
+    print(f"🧪 스크리닝 벤치마크: {sim.base_url}")
+    print(
+        f"   종목 {len(market.codes)}개, 지연 {args.latency_ms:.0f}±{args.jitter_ms:.0f}ms, "
+        f"429 {args.rate_429:.0%}, 5xx {args.rate_5xx:.0%}, "
+        f"서버 상한 {args.max_rps or '-'}/s, 클라이언트 {settings.kiwoom.rate_per_sec:.1f}/s, "
+        f"workers {settings.screening.collect_workers}"
+    )
+    print("=" * 72)
+
+    runs = ["preview", "main"] if args.mode == "both" else [args.mode]
+    try:
+        for mode in runs:
+            is_preview = mode == "preview"
+            if not is_preview and len(runs) > 1:
+                # 실제 메인은 프리뷰 2시간 뒤 → 응답 캐시(TTL)는 만료, 일봉 과거분 캐시만 남음
+                get_response_cache().invalidate()
+            sim.reset_stats()
+            history_start = get_daily_history_cache().counters()
+            started = time.perf_counter()
+            result = service.run_screening(
+                screen_time="12:30" if is_preview else "15:00",
+                save_to_db=False,
+                send_alert=False,
+                is_preview=is_preview,
+                deadline=Deadline(),
+            )
+            elapsed = time.perf_counter() - started
+            stats = sim.stats()
+            total = sum(stats["calls"].values())
+            print(f"\n[{mode}] {result['status']}  {elapsed:7.2f}초  "
+                  f"분석 {result['total_count']}개  TOP {len(result['top_n'])}개")
+            print(f"  호출 {total}회 ({total / elapsed:.1f} req/s): {_format_calls(stats['calls'])}")
+            print(f"  주입 오류: {_format_calls(stats['injected'])}  "
+                  f"상한 초과 429: {_format_calls(stats['throttled'])}")
+            print(f"  응답 {stats['bytes'] / 1024:.0f} KB, 토큰 발급 {stats['tokens_issued']}회")
+            print(f"  응답 캐시: {get_response_cache().format_stats()}")
+            print(f"  일봉 과거분 캐시: {get_daily_history_cache().format_stats(since=history_start)}")
+            if result.get("cut_stages"):
+                print(f"  생략 단계: {result['cut_stages']}")
+    finally:
+        close_http_sessions()
+        sim.stop()
+
+
+if __name__ == "__main__":
+    main()